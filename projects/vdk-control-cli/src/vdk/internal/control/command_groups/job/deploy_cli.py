@@ -155,6 +155,16 @@ vdk deploy --update --job-version <job-version-here> -n example-job -t job-team
     "The reason will be shown in the commit message in the git repo where the jobs are stored. "
     "Make sure you surround the reason with double quotes to avoid errors.",
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Do not upload the job if its files have not changed since it was last deployed from this machine. "
+    "The job version deployed then is deployed again. "
+    "The content hashes of the job files are kept in the local VDK configuration folder. "
+    "The flag works only in combination with the create flag (--create). "
+    "The option is experimental.",
+)
 @cli_utils.rest_api_url_option()
 @cli_utils.output_option()
 @cli_utils.check_required_parameters
@@ -167,6 +177,7 @@ def deploy(
     job_path: Optional[str],
     operation: str,
     reason: Optional[str],
+    incremental: bool,
     rest_api_url: str,
     output: str,
 ):
@@ -179,7 +190,9 @@ def deploy(
             job_version = get_or_prompt("Job Version", job_version)
         if job_path:
             reason = get_or_prompt("Reason", reason)
-            return cmd.create(name, team, job_path, reason, vdk_version, enabled)
+            return cmd.create(
+                name, team, job_path, reason, vdk_version, enabled, incremental
+            )
         else:
             return cmd.update(name, team, enabled, job_version, vdk_version)
     if operation == DeployOperation.REMOVE.value:
@@ -195,4 +208,6 @@ def deploy(
         default_name = os.path.basename(job_path)
         name = get_or_prompt("Job Name", name, default_name)
         reason = get_or_prompt("Reason", reason)
-        return cmd.create(name, team, job_path, reason, vdk_version, enabled)
+        return cmd.create(
+            name, team, job_path, reason, vdk_version, enabled, incremental
+        )
@@ -14,11 +14,15 @@ from taurus_datajob_api import DataJobContacts
 from taurus_datajob_api import DataJobDeployment
 from taurus_datajob_api import DataJobSchedule
 from vdk.internal.control.configuration.defaults_config import load_default_team_name
+from vdk.internal.control.configuration.vdk_config import VDKConfig
+from vdk.internal.control.configuration.vdk_config import VDKConfigFolder
 from vdk.internal.control.exception.vdk_exception import VDKException
 from vdk.internal.control.job.job_archive import JobArchive
 from vdk.internal.control.job.job_config import JobConfig
+from vdk.internal.control.job.job_sources_manifest import JobSourcesManifest
 from vdk.internal.control.rest_lib.factory import ApiClientFactory
 from vdk.internal.control.rest_lib.rest_client_errors import ApiClientErrorDecorator
+from vdk.internal.control.rest_lib.sources_upload import upload_job_sources
 from vdk.internal.control.utils.cli_utils import get_or_prompt
 from vdk.internal.control.utils.output_printer import Printer
 from vdk.internal.control.utils.output_printer import PrinterJson
@@ -32,6 +36,7 @@ class JobDeploy:
     ARCHIVE_SUFFIX = "-archive"
 
     def __init__(self, rest_api_url: str, printer: Printer):
+        self.__rest_api_url = rest_api_url
         self.deploy_api = ApiClientFactory(rest_api_url).get_deploy_api()
         self.jobs_api = ApiClientFactory(rest_api_url).get_jobs_api()
         self.job_sources_api = ApiClientFactory(rest_api_url).get_jobs_sources_api()
@@ -97,14 +102,6 @@ class JobDeploy:
                 countermeasure="Use VDK CLI create command to create the job first.",
             ) from e
 
-    @staticmethod
-    def __archive_binary(job_archive_path: str) -> bytes:
-        log.debug(f"Read archive binary: {job_archive_path}")
-        with open(job_archive_path, "rb") as job_archive_file:
-            # Read the whole file at once
-            job_archive_binary = job_archive_file.read()
-            return job_archive_binary
-
     @staticmethod
     def __cleanup_archive(archive_path: str) -> None:
         try:
@@ -260,7 +257,13 @@ class JobDeploy:
         reason: str,
         vdk_version: Optional[str],
         enabled: Optional[bool],
+        incremental: bool = False,
     ) -> None:
+        """
+        Uploads the job and deploys the new job version.
+        If incremental is True, the job is not uploaded if it did not change since it was last deployed
+        from this machine and the same job version is deployed again.
+        """
         log.debug(
             f"Create Deployment of a job {name} of team {team} with local path {job_path} and reason {reason}"
         )
@@ -288,34 +291,61 @@ class JobDeploy:
                 f"Deploy Data Job with name {name} from directory {job_path} ... \n"
             )
 
+        manifest = None
+        job_version = None
+        if incremental:
+            manifest = JobSourcesManifest(
+                JobSourcesManifest.get_manifest_path(
+                    VDKConfigFolder(VDKConfig().local_config_folder).vdk_config_folder,
+                    self.__rest_api_url,
+                    team,
+                    name,
+                )
+            )
+            content_hash = manifest.compute_content_hash(job_path)
+            job_version = manifest.get_job_version(content_hash)
+            if job_version:
+                log.info(
+                    f"Data Job {name} has not changed since it was deployed as version {job_version}. "
+                    f"Skipping the upload of the job."
+                )
+
+        if not job_version:
+            job_version = self.__upload_job_sources(name, team, job_path, reason)
+            if manifest:
+                manifest.save(content_hash, job_version)
+
+        python_version = job_config.get_python_version()
+
+        self.__update_data_job_deploy_configuration(job_path, name, team)
+        self.update(
+            name,
+            team,
+            enabled,
+            job_version,
+            vdk_version,
+            python_version,
+        )
+
+    def __upload_job_sources(
+        self, name: str, team: str, job_path: str, reason: str
+    ) -> str:
         archive_path = self.__job_archive.archive_data_job(
             job_name=name, job_archive_path=job_path
         )
         try:
-            job_archive_binary = self.__archive_binary(archive_path)
-
             if isinstance(self.__printer, PrinterText):
                 log.info("Uploading the data job might take some time ...")
             with click_spinner.spinner(
                 disable=(isinstance(self.__printer, PrinterJson))
             ):
-                data_job_version = self.job_sources_api.sources_upload(
+                data_job_version = upload_job_sources(
+                    self.job_sources_api,
                     team_name=team,
                     job_name=name,
-                    body=job_archive_binary,
+                    archive_path=archive_path,
                     reason=reason,
                 )
-
-            python_version = job_config.get_python_version()
-
-            self.__update_data_job_deploy_configuration(job_path, name, team)
-            self.update(
-                name,
-                team,
-                enabled,
-                data_job_version.version_sha,
-                vdk_version,
-                python_version,
-            )
+            return data_job_version.version_sha
         finally:
             self.__cleanup_archive(archive_path=archive_path)
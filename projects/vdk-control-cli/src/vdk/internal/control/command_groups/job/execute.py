@@ -17,6 +17,7 @@ from taurus_datajob_api import DataJobExecutionLogs
 from taurus_datajob_api import DataJobExecutionRequest
 from vdk.internal.control.configuration.defaults_config import load_default_team_name
 from vdk.internal.control.exception.vdk_exception import VDKException
+from vdk.internal.control.rest_lib.execution_watcher import ExecutionWatcher
 from vdk.internal.control.rest_lib.factory import ApiClientFactory
 from vdk.internal.control.rest_lib.rest_client_errors import ApiClientErrorDecorator
 from vdk.internal.control.utils import cli_utils
@@ -43,7 +44,10 @@ class ExecuteOperation(Enum):
 
 class JobExecute:
     def __init__(self, rest_api_url: str):
-        self.__execution_api = ApiClientFactory(rest_api_url).get_execution_api()
+        api_client_factory = ApiClientFactory(rest_api_url)
+        self.__execution_api = api_client_factory.get_execution_api()
+        self.__response_cache = api_client_factory.get_response_cache()
+        self.__rest_api_url = rest_api_url
 
     @staticmethod
     def __model_executions(executions, output_format: OutputFormat) -> str:
@@ -130,9 +134,21 @@ class JobExecute:
 
     @ApiClientErrorDecorator()
     def list(self, name: str, team: str, output_format: OutputFormat) -> None:
-        executions: List[
-            DataJobExecution
-        ] = self.__execution_api.data_job_execution_list(team_name=team, job_name=name)
+        if self.__response_cache is None:
+            executions: List[
+                DataJobExecution
+            ] = self.__execution_api.data_job_execution_list(
+                team_name=team, job_name=name
+            )
+        else:
+            executions = self.__response_cache.fetch(
+                f"{self.__rest_api_url} data_job_execution_list {team} {name}",
+                lambda headers: self.__execution_api.data_job_execution_list_with_http_info(
+                    team_name=team, job_name=name, _headers=headers
+                ),
+                to_json=lambda result: [e.to_dict() for e in result],
+                from_json=lambda value: [DataJobExecution.from_dict(e) for e in value],
+            )
         self.__model_executions(executions, output_format)
 
     def __get_execution_to_log(
@@ -148,7 +164,7 @@ class JobExecute:
                 return None
             log.info(
                 "No execution id has been passed as argument. "
-                "We will print the logs of the last started execution."
+                "The last started execution will be used."
             )
             executions.sort(key=operator.attrgetter("start_time"), reverse=True)
             execution = executions[0]
@@ -182,6 +198,35 @@ class JobExecute:
             )
             click.echo(logs.logs)
 
+    @ApiClientErrorDecorator()
+    def wait(
+        self,
+        name: str,
+        team: str,
+        execution_id: str,
+        output_format: OutputFormat,
+        follow_logs: bool = False,
+    ) -> None:
+        execution = self.__get_execution_to_log(name, team, execution_id)
+        if not execution:
+            log.info("No executions found.")
+            return
+        if follow_logs and execution.logs_url:
+            log.info(f"The logs of the execution are at:\n{execution.logs_url}")
+            follow_logs = False
+
+        log.info(f"Waiting for execution with id {execution.id} to finish ...")
+        watcher = ExecutionWatcher(self.__execution_api, team, name, execution.id)
+        execution = watcher.wait(
+            on_logs=(lambda logs: click.echo(logs, nl=False)) if follow_logs else None
+        )
+        if output_format == OutputFormat.TEXT.value:
+            click.echo(
+                f"Execution {execution.id} of Data Job {name} finished with status {execution.status}."
+            )
+        else:
+            self.__model_executions([execution], output_format)
+
 
 # Below is the definition of the CLI API/UX users will be interacting
 # Above is the actual implementation of the operations
@@ -217,6 +262,10 @@ vdk execute --list -n example-job -t "Example Team"
 # We want to see the logs of the current execution that is running.
 vdk execute --logs -n example-job -t "Example Team" --execution-id example-job-1619094633811-cc49d
 
+\b
+# Wait for an execution to finish while printing its logs:
+vdk execute --wait --follow -n example-job -t "Example Team" --execution-id example-job-1619094633811-cc49d
+
 """,
 )
 @click.option("-n", "--name", type=click.STRING, help="The job name.")
@@ -239,12 +288,10 @@ vdk execute --logs -n example-job -t "Example Team" --execution-id example-job-1
 @click.option(
     "--wait",
     "operation",
-    hidden=True,
     flag_value=ExecuteOperation.WAIT.value,
-    help="Wait for current job execution (if any) to finish "
-    "(if specified execution id wait for execution with given id to finish)."
-    "Require --execution-id to be provided. "
-    "Should be printed when using vdk execute --start",
+    help="Wait for the last started job execution (if any) to finish "
+    "(if --execution-id is specified, wait for execution with given id to finish). "
+    "The execution is checked with increasing intervals up to 30 seconds.",
 )
 @click.option(
     "--cancel",
@@ -287,9 +334,16 @@ vdk execute --logs -n example-job -t "Example Team" --execution-id example-job-1
     "Those arguments will be passed to each step. "
     "Must be in valid JSON format",
 )
+@click.option(
+    "--follow",
+    is_flag=True,
+    default=False,
+    help="Used with --wait. Print the logs of the execution as they are written while waiting for it. "
+    "Only the new log lines are downloaded on each check.",
+)
 @cli_utils.check_required_parameters
 def execute(
-    name, team, execution_id, operation, rest_api_url, output, arguments
+    name, team, execution_id, operation, rest_api_url, output, arguments, follow
 ) -> None:
     cmd = JobExecute(rest_api_url)
     if operation == ExecuteOperation.START.value:
@@ -313,8 +367,7 @@ def execute(
         cmd.logs(name, team, execution_id)
     elif operation == ExecuteOperation.WAIT.value:
         name = get_or_prompt("Job Name", name)
-        # cmd.wait(name, team)
-        click.echo("Operation wait not implemented")
+        cmd.wait(name, team, execution_id, output, follow)
     else:
         click.echo(
             f"No execute operation specified. "
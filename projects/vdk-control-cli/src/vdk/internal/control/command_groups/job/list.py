@@ -2,10 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from enum import unique
 from typing import Dict
-from typing import List
 
 import click
 from taurus_datajob_api import DataJobQueryResponse
@@ -20,41 +20,78 @@ log = logging.getLogger(__name__)
 
 
 class JobList:
+    PAGE_SIZE = 100
+
     def __init__(self, rest_api_url: str):
-        self.jobs_api = ApiClientFactory(rest_api_url).get_jobs_api()
+        api_client_factory = ApiClientFactory(rest_api_url)
+        self.max_parallel_requests = max(
+            1, api_client_factory.vdk_config.http_max_parallel_requests
+        )
+        # so that the connections of the parallel requests are reused
+        api_client_factory.config.connection_pool_maxsize = max(
+            api_client_factory.config.connection_pool_maxsize,
+            self.max_parallel_requests,
+        )
+        self.jobs_api = api_client_factory.get_jobs_api()
+        self.response_cache = api_client_factory.get_response_cache()
+        self.rest_api_url = rest_api_url
 
     @ApiClientErrorDecorator()
     def list_jobs(
         self, team: str, jobs_for_all_teams: bool, more_details: int, output_format: str
     ):
-        has_more_jobs = True
-        page_number = 1
-        page_size = 100
-
-        jobs = []
-
-        while has_more_jobs:
-            response: DataJobQueryResponse = self.jobs_api.jobs_query(
-                query=self.build_jobs_query(
-                    page_number=page_number,
-                    page_size=page_size,
-                    team_name=team,
-                    show_all=jobs_for_all_teams,
-                    more_details=more_details,
-                ),
-                team_name=team,
+        def query_page(page_number: int) -> DataJobQueryResponse:
+            return self.query_jobs_page(
+                page_number, team, jobs_for_all_teams, more_details
             )
-            log.debug(f"Response: {response}")
-            next_page: List[Dict] = response.data.content
-            if next_page and len(next_page) > 0:
+
+        first_page = query_page(1)
+        jobs = list(first_page.data.content or [])
+        total_pages = first_page.data.total_pages
+        if total_pages is not None:
+            # the rest of the pages are fetched at the same time once the number of pages is known
+            if total_pages > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_parallel_requests, total_pages - 1)
+                ) as executor:
+                    for page in executor.map(query_page, range(2, total_pages + 1)):
+                        jobs.extend(page.data.content or [])
+        else:
+            # the server does not return the number of pages, so fetch them until a short page comes back
+            next_page = jobs
+            page_number = 1
+            while len(next_page) == self.PAGE_SIZE:
+                page_number += 1
+                next_page = query_page(page_number).data.content or []
                 jobs.extend(next_page)
-            if len(next_page) < page_size:
-                has_more_jobs = False
-            page_number += 1
 
         jobs = list(map(self.job_to_dict, jobs))
         output_printer.create_printer(output_format).print_table(jobs)
 
+    def query_jobs_page(
+        self, page_number: int, team: str, jobs_for_all_teams: bool, more_details: int
+    ) -> DataJobQueryResponse:
+        query = self.build_jobs_query(
+            page_number=page_number,
+            page_size=self.PAGE_SIZE,
+            team_name=team,
+            show_all=jobs_for_all_teams,
+            more_details=more_details,
+        )
+        if self.response_cache is None:
+            response = self.jobs_api.jobs_query(query=query, team_name=team)
+        else:
+            response = self.response_cache.fetch(
+                f"{self.rest_api_url} jobs_query {team} {query}",
+                lambda headers: self.jobs_api.jobs_query_with_http_info(
+                    query=query, team_name=team, _headers=headers
+                ),
+                to_json=lambda r: r.to_dict(),
+                from_json=DataJobQueryResponse.from_dict,
+            )
+        log.debug(f"Response: {response}")
+        return response
+
     @staticmethod
     def job_to_dict(job: Dict):
         # TODO: response model should come from open api client
@@ -131,14 +168,13 @@ class JobList:
                 ' { property: "jobName", sort: ASC }]'
             )
 
-        jobs_content = (
-            jobs_builder.start()
-            .add_return_new("jobs", arguments=arguments)
-            .add_return_new("content")
-        )
+        # only the fields used by job_to_dict are requested
+        jobs = jobs_builder.start().add_return_new("jobs", arguments=arguments)
+        jobs.add("totalPages")
+        jobs_content = jobs.add_return_new("content")
         jobs_content.add("jobName")
         jobs_config = jobs_content.add_return_new("config")
-        jobs_config.add("team").add("description")
+        jobs_config.add("team")
         jobs_config.add_return_new("schedule").add(
             "scheduleCron"
         )  # .add('nextRunEpochSeconds') not released, yet
@@ -157,9 +193,7 @@ class JobList:
             ).add("notifiedOnJobFailureUserError")
         if more_details >= 3:
             executions = jobs_deployments.add_return_new("executions")
-            executions.add("id").add("type").add("status").add("startTime").add(
-                "endTime"
-            ).add("opId").add("startedBy")
+            executions.add("type").add("status").add("startTime").add("startedBy")
 
         query = jobs_builder.build()
         log.debug("Jobs list (graphql) query: " + query)
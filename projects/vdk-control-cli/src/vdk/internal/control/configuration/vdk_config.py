@@ -119,6 +119,21 @@ class VDKConfig:
     def http_connection_pool_maxsize(self) -> int:
         return int(os.getenv("VDK_CONTROL_HTTP_CONNECTION_POOL_MAXSIZE", "2"))
 
+    @property
+    def http_response_cache_ttl_seconds(self) -> int:
+        """
+        How long the responses of listing operations (e.g. vdk list) are cached on disk and reused as they are.
+        After that they are revalidated with the server (if it supports ETag). 0 disables the cache.
+        """
+        return int(os.getenv("VDK_CONTROL_HTTP_RESPONSE_CACHE_TTL_SECONDS", "0"))
+
+    @property
+    def http_max_parallel_requests(self) -> int:
+        """
+        The maximum number of requests sent at the same time, e.g. for the pages of a listing.
+        """
+        return int(os.getenv("VDK_CONTROL_HTTP_MAX_PARALLEL_REQUESTS", "4"))
+
     @property
     def http_verify_ssl(self) -> bool:
         return os.getenv("VDK_CONTROL_HTTP_VERIFY_SSL", "True").lower() in (
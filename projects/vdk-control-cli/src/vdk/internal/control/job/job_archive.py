@@ -3,27 +3,66 @@
 import logging
 import os
 import shutil
+import zipfile
 
 from vdk.internal.control.exception.vdk_exception import VDKException
 
 
 log = logging.getLogger(__name__)
 
+# Files which are already compressed are stored in the archive as they are,
+# since compressing them again takes long (for large data files) and does not make them smaller.
+_COMPRESSED_FILE_EXTENSIONS = (
+    ".zip",
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".7z",
+    ".jar",
+    ".whl",
+    ".egg",
+    ".parquet",
+    ".orc",
+    ".avro",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+)
+
 
 class JobArchive:
     ZIP_ARCHIVE_TYPE = "zip"
 
     def archive_data_job(self, job_name, job_archive_path):
+        """
+        Archives the job directory into a zip file next to it (the same as shutil.make_archive would).
+        The files are written to the archive one by one, so the archive is never kept in memory.
+
+        :return: the path to the archive
+        """
         try:
             log.debug(f"Archive data job {job_name} into path {job_archive_path}")
             job_folder_base = os.path.dirname(job_archive_path)
-            job_content_folder = os.path.basename(job_archive_path)
-            return shutil.make_archive(
-                base_name=job_archive_path,
-                format=self.ZIP_ARCHIVE_TYPE,
-                root_dir=job_folder_base,
-                base_dir=job_content_folder,
-            )
+            archive_path = f"{job_archive_path}.{self.ZIP_ARCHIVE_TYPE}"
+            with zipfile.ZipFile(
+                archive_path, "w", compression=zipfile.ZIP_DEFLATED
+            ) as archive:
+                for dir_path, dir_names, file_names in os.walk(job_archive_path):
+                    dir_names.sort()
+                    archive_dir = os.path.relpath(dir_path, job_folder_base)
+                    archive.write(dir_path, archive_dir)
+                    for file_name in sorted(file_names):
+                        file_path = os.path.join(dir_path, file_name)
+                        if os.path.isfile(file_path):
+                            archive.write(
+                                file_path,
+                                os.path.join(archive_dir, file_name),
+                                compress_type=self.__get_compress_type(file_name),
+                            )
+            return archive_path
         except Exception as e:
             raise VDKException(
                 what=f"Cannot archive data job {job_name} as part of deployment.",
@@ -32,6 +71,12 @@ class JobArchive:
                 countermeasure="Make sure VDK CLI has proper permissions and the job exists in the folder",
             ) from e
 
+    @staticmethod
+    def __get_compress_type(file_name: str) -> int:
+        if file_name.lower().endswith(_COMPRESSED_FILE_EXTENSIONS):
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
     def unarchive_data_job(self, job_name, job_archive_path, job_directory):
         log.debug(
             f"Un-archive data job {job_name} from path {job_archive_path} into directory {job_directory}"
@@ -0,0 +1,133 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class JobSourcesManifest:
+    """
+    Keeps the content hashes of the files of a data job, as of its last deployment from this machine,
+    and the job version created by it.
+
+    The hash of a file is computed again only if its size or modification time changed.
+    If the content of the job is the same as the last time it was deployed,
+    the job version of the last deployment can be deployed again without uploading the job.
+    """
+
+    def __init__(self, manifest_path: str):
+        self._manifest_path = manifest_path
+        self._manifest = self.__load()
+        # relative path -> [size, modification time, hash] of the files of the job, as computed last
+        self._files: Dict[str, list] = {}
+
+    @staticmethod
+    def get_manifest_path(
+        config_folder: str, rest_api_url: str, team: str, job_name: str
+    ) -> str:
+        key = hashlib.sha256(f"{rest_api_url}\n{team}\n{job_name}".encode()).hexdigest()
+        return os.path.join(config_folder, "deploy-manifests", f"{key}.json")
+
+    def compute_content_hash(self, job_path: str) -> str:
+        """
+        Computes the hash of the content of the job directory (the relative paths and the content of its files).
+        The hashes of the files are kept, so that they can be saved with the job version after deployment.
+        """
+        files = self.__list_files(job_path)
+        known_files = self._manifest.get("files", {})
+        file_hashes: Dict[str, str] = {}
+        changed_files: List[str] = []
+        for relative_path, (size, mtime_ns) in files.items():
+            known = known_files.get(relative_path)
+            if known and known[0] == size and known[1] == mtime_ns:
+                file_hashes[relative_path] = known[2]
+            else:
+                changed_files.append(relative_path)
+        if changed_files:
+            log.debug(f"Computing the hashes of {len(changed_files)} changed files")
+            # hashlib releases the GIL while hashing, so large files are hashed in parallel
+            with ThreadPoolExecutor() as executor:
+                hashes = executor.map(
+                    _hash_file, [os.path.join(job_path, p) for p in changed_files]
+                )
+                file_hashes.update(zip(changed_files, hashes))
+
+        self._files = {
+            relative_path: [size, mtime_ns, file_hashes[relative_path]]
+            for relative_path, (size, mtime_ns) in files.items()
+        }
+        content_hash = hashlib.sha256()
+        for relative_path in sorted(file_hashes):
+            content_hash.update(
+                f"{relative_path}\0{file_hashes[relative_path]}\n".encode()
+            )
+        return content_hash.hexdigest()
+
+    def get_job_version(self, content_hash: str) -> Optional[str]:
+        """
+        :return: the job version of the last deployment if it had the same content, otherwise None
+        """
+        if self._manifest.get("content_hash") == content_hash:
+            return self._manifest.get("job_version")
+        return None
+
+    def save(self, content_hash: str, job_version: str) -> None:
+        """
+        Saves the hashes computed last with the job version created from them.
+        Failures are only logged, since the manifest only saves uploading the same job again.
+        """
+        self._manifest = dict(
+            content_hash=content_hash,
+            job_version=job_version,
+            files=self._files,
+        )
+        try:
+            os.makedirs(os.path.dirname(self._manifest_path), exist_ok=True)
+            temp_path = f"{self._manifest_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(self._manifest, f)
+            os.replace(temp_path, self._manifest_path)
+        except OSError as e:
+            log.warning(f"Could not save deploy manifest {self._manifest_path}: {e}")
+
+    def __load(self) -> dict:
+        try:
+            with open(self._manifest_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.debug(f"Could not read deploy manifest {self._manifest_path}: {e}")
+            return {}
+
+    @staticmethod
+    def __list_files(job_path: str) -> Dict[str, tuple]:
+        files = {}
+        for dir_path, _, file_names in os.walk(job_path):
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                if not os.path.isfile(file_path):
+                    continue
+                stat = os.stat(file_path)
+                relative_path = os.path.relpath(file_path, job_path).replace(
+                    os.sep, "/"
+                )
+                files[relative_path] = (stat.st_size, stat.st_mtime_ns)
+        return files
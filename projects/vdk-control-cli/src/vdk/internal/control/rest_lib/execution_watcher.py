@@ -0,0 +1,147 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from taurus_datajob_api import ApiException
+from taurus_datajob_api import DataJobExecution
+from taurus_datajob_api import DataJobsExecutionApi
+from vdk.internal.control.rest_lib.response_cache import HTTP_NOT_MODIFIED
+from vdk.internal.control.utils.polling import Backoff
+from vdk.internal.control.utils.polling import poll_until
+
+log = logging.getLogger(__name__)
+
+RUNNING_EXECUTION_STATUSES = ("submitted", "running")
+
+
+def is_execution_finished(execution: DataJobExecution) -> bool:
+    """
+    Checks if the execution has finished (i.e. it is neither submitted nor running).
+    """
+    return str(execution.status) not in RUNNING_EXECUTION_STATUSES
+
+
+class ExecutionWatcher:
+    """
+    Follows a single data job execution until it finishes.
+
+    The execution is read with conditional requests (If-None-Match with the ETag of the last response),
+    so the server can reply that it is not modified instead of sending it again.
+    The logs are followed by downloading only the last tail_lines of them on each poll
+    and keeping only the lines which were not seen before,
+    since the API does not support downloading the logs after a given offset.
+    """
+
+    def __init__(
+        self,
+        execution_api: DataJobsExecutionApi,
+        team_name: str,
+        job_name: str,
+        execution_id: str,
+        tail_lines: int = 1000,
+    ):
+        self._execution_api = execution_api
+        self._team_name = team_name
+        self._job_name = job_name
+        self._execution_id = execution_id
+        self._tail_lines = tail_lines
+        self._execution: Optional[DataJobExecution] = None
+        self._etag: Optional[str] = None
+        # the last (at most tail_lines) complete lines of the logs returned so far
+        self._seen_log_lines: Optional[List[str]] = None
+
+    def read_execution(self) -> DataJobExecution:
+        headers = {}
+        if self._execution is not None and self._etag:
+            headers["If-None-Match"] = self._etag
+        try:
+            response = self._execution_api.data_job_execution_read_with_http_info(
+                team_name=self._team_name,
+                job_name=self._job_name,
+                execution_id=self._execution_id,
+                _headers=headers,
+            )
+        except ApiException as e:
+            if self._execution is not None and e.status == HTTP_NOT_MODIFIED:
+                log.debug(f"Execution {self._execution_id} is not modified.")
+                return self._execution
+            raise
+        self._etag = (response.headers or {}).get("ETag")
+        self._execution = response.data
+        return self._execution
+
+    def read_new_logs(self, final: bool = False) -> str:
+        """
+        Returns the lines of the logs which were not returned by the previous calls.
+        The last line is returned only once it is complete (or if final is True),
+        since it may still be being written.
+        """
+        logs = self._execution_api.data_job_logs_download(
+            team_name=self._team_name,
+            job_name=self._job_name,
+            execution_id=self._execution_id,
+            tail_lines=None if self._seen_log_lines is None else self._tail_lines,
+        ).logs
+        lines = (logs or "").splitlines(keepends=True)
+        if not final and lines and not lines[-1].endswith("\n"):
+            lines.pop()
+        new_lines = lines[self.__count_seen_lines(lines) :]
+        self._seen_log_lines = ((self._seen_log_lines or []) + new_lines)[
+            -self._tail_lines :
+        ]
+        return "".join(new_lines)
+
+    def __count_seen_lines(self, lines: List[str]) -> int:
+        """
+        :return: how many lines at the beginning of lines are at the end of the already seen lines
+        """
+        seen = self._seen_log_lines
+        if not seen or not lines:
+            return 0
+        # the longest overlap starts at the earliest matching position
+        for start in range(max(0, len(seen) - len(lines)), len(seen)):
+            if seen[start] == lines[0] and seen[start:] == lines[: len(seen) - start]:
+                return len(seen) - start
+        log.debug(
+            "The logs do not continue the previously seen logs. "
+            f"More than {self._tail_lines} lines may have been written since the last poll."
+        )
+        return 0
+
+    def wait(
+        self,
+        timeout_seconds: Optional[float] = None,
+        backoff: Optional[Backoff] = None,
+        on_logs: Optional[Callable[[str], None]] = None,
+    ) -> DataJobExecution:
+        """
+        Waits for the execution to finish.
+
+        :param timeout_seconds: how long to wait; None waits until the execution finishes
+        :param backoff: the delays between the polls
+        :param on_logs: if set, the logs are followed and the new lines are passed to it on each poll
+        :return: the finished execution
+        :raises PollTimeoutError: if the execution does not finish in timeout_seconds
+        """
+
+        def check() -> DataJobExecution:
+            execution = self.read_execution()
+            if on_logs:
+                new_logs = self.read_new_logs(final=is_execution_finished(execution))
+                if new_logs:
+                    on_logs(new_logs)
+            return execution
+
+        return poll_until(
+            check,
+            is_execution_finished,
+            timeout_seconds,
+            backoff,
+            on_wait=lambda execution, delay: log.debug(
+                f"Execution {self._execution_id} is {execution.status}. "
+                f"Will check again in {delay:.1f} seconds."
+            ),
+        )
@@ -1,6 +1,8 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 import logging
+import os
+from typing import Optional
 
 from taurus_datajob_api import ApiClient
 from taurus_datajob_api import Configuration
@@ -13,6 +15,8 @@ from taurus_datajob_api import DataJobsServiceApi
 from taurus_datajob_api import DataJobsSourcesApi
 from urllib3 import Retry
 from vdk.internal.control.configuration.vdk_config import VDKConfig
+from vdk.internal.control.configuration.vdk_config import VDKConfigFolder
+from vdk.internal.control.rest_lib.response_cache import ResponseCache
 from vdk.plugin.control_api_auth.authentication import Authentication
 
 log = logging.getLogger(__name__)
@@ -46,6 +50,19 @@ class ApiClientFactory:
         # and each command will have short execution life even when multiple requests to API are made.
         self.config.access_token = auth.read_access_token()
 
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """
+        :return: the cache of API responses or None if caching is disabled
+        """
+        ttl_seconds = self.vdk_config.http_response_cache_ttl_seconds
+        if ttl_seconds <= 0:
+            return None
+        config_folder = VDKConfigFolder(self.vdk_config.local_config_folder)
+        return ResponseCache(
+            os.path.join(config_folder.vdk_config_folder, "response-cache"),
+            ttl_seconds,
+        )
+
     def _new_api_client(self):
         api_client = ApiClient(self.config)
         # We are setting X-OPID - this is send in telemetry and printed in logs on server side - make it easier
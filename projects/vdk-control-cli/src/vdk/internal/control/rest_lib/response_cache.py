@@ -0,0 +1,103 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+from taurus_datajob_api import ApiException
+from taurus_datajob_api import ApiResponse
+
+log = logging.getLogger(__name__)
+
+HTTP_NOT_MODIFIED = 304
+
+
+class ResponseCache:
+    """
+    Caches API responses in files for a short time, so that repeating an operation
+    (e.g. listing all jobs of a team) does not send all of its requests again.
+
+    A cached response is used as it is for ttl_seconds after it is received.
+    After that it is revalidated with a conditional request (If-None-Match with its ETag)
+    and used again if the server replies that it is not modified.
+    """
+
+    def __init__(self, cache_directory: str, ttl_seconds: int):
+        self._cache_directory = cache_directory
+        self._ttl_seconds = ttl_seconds
+
+    def fetch(
+        self,
+        key: str,
+        request: Callable[[Dict[str, str]], ApiResponse],
+        to_json: Callable[[Any], Any],
+        from_json: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Returns the cached data of the request with the key or sends the request.
+
+        :param key: identifies the request, e.g. the URL and the parameters of the request
+        :param request: sends the request with the additional headers passed to it and returns the response
+        :param to_json: converts the response data to JSON serializable value to be cached
+        :param from_json: converts the cached value back to the response data
+        """
+        cache_file = self._get_cache_file(key)
+        entry = self._read(cache_file)
+        if entry and time.time() - entry["time"] < self._ttl_seconds:
+            log.debug(f"Using cached response for {key}")
+            return from_json(entry["value"])
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        try:
+            response = request(headers)
+        except ApiException as e:
+            if entry and e.status == HTTP_NOT_MODIFIED:
+                log.debug(f"Cached response for {key} is not modified")
+                entry["time"] = time.time()
+                self._write(cache_file, entry)
+                return from_json(entry["value"])
+            raise
+        self._write(
+            cache_file,
+            dict(
+                time=time.time(),
+                etag=(response.headers or {}).get("ETag"),
+                value=to_json(response.data),
+            ),
+        )
+        return response.data
+
+    def _get_cache_file(self, key: str) -> str:
+        return os.path.join(
+            self._cache_directory, hashlib.sha256(key.encode()).hexdigest() + ".json"
+        )
+
+    @staticmethod
+    def _read(cache_file: str) -> Optional[dict]:
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.debug(f"Could not read cached response {cache_file}: {e}")
+            return None
+
+    @staticmethod
+    def _write(cache_file: str, entry: dict) -> None:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump(entry, f, default=str)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            log.debug(f"Could not cache response in {cache_file}: {e}")
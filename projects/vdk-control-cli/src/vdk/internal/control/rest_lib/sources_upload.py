@@ -0,0 +1,60 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import os
+from typing import Optional
+from urllib.parse import quote
+from urllib.parse import urlencode
+
+from taurus_datajob_api import ApiException
+from taurus_datajob_api import DataJobsSourcesApi
+from taurus_datajob_api import DataJobVersion
+from taurus_datajob_api.rest import RESTResponse
+
+log = logging.getLogger(__name__)
+
+
+def upload_job_sources(
+    sources_api: DataJobsSourcesApi,
+    team_name: str,
+    job_name: str,
+    archive_path: str,
+    reason: Optional[str] = None,
+) -> DataJobVersion:
+    """
+    Uploads the archive of a data job like DataJobsSourcesApi.sources_upload
+    but streams it from the file instead of reading the whole archive in memory first
+    (the generated client accepts only bytes as body).
+
+    :raises ApiException: if the request fails
+    """
+    api_client = sources_api.api_client
+    resource_path = (
+        f"/data-jobs/for-team/{quote(team_name, safe='')}"
+        f"/jobs/{quote(job_name, safe='')}/sources"
+    )
+    headers = dict(api_client.default_headers)
+    headers["Accept"] = "application/json"
+    headers["Content-Type"] = "application/octet-stream"
+    # without Content-Length the body would be sent with chunked transfer encoding
+    headers["Content-Length"] = str(os.path.getsize(archive_path))
+    query_params = [("reason", reason)] if reason is not None else []
+    api_client.update_params_for_auth(
+        headers, query_params, ["bearerAuth"], resource_path, "POST", None
+    )
+    url = api_client.configuration.host + resource_path
+    if query_params:
+        url += "?" + urlencode(query_params, quote_via=quote)
+
+    log.debug(f"Upload data job archive {archive_path} to {url}")
+    with open(archive_path, "rb") as archive:
+        # urllib3 rewinds the file if the request is retried
+        response = RESTResponse(
+            api_client.rest_client.pool_manager.request(
+                "POST", url, body=archive, headers=headers, preload_content=True
+            )
+        )
+    if not 200 <= response.status <= 299:
+        raise ApiException(http_resp=response)
+    response.data = response.data.decode("utf-8")
+    return api_client.deserialize(response, "DataJobVersion")
@@ -0,0 +1,101 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import random
+import time
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+from typing import TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Backoff:
+    """
+    Exponentially growing delays between polls of an operation, with jitter,
+    so that many clients waiting for the same operation do not poll the server at the same time.
+
+    The n-th delay is a random value between (1 - jitter) and 1 times
+    min(initial_delay_seconds * multiplier ** n, max_delay_seconds).
+    """
+
+    def __init__(
+        self,
+        initial_delay_seconds: float = 1,
+        max_delay_seconds: float = 30,
+        multiplier: float = 2,
+        jitter: float = 0.5,
+        random_func: Callable[[], float] = random.random,
+    ):
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"jitter must be between 0 and 1 but is {jitter}")
+        self._initial_delay_seconds = initial_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._multiplier = multiplier
+        self._jitter = jitter
+        self._random = random_func
+
+    def delays(self) -> Iterator[float]:
+        delay = self._initial_delay_seconds
+        while True:
+            capped_delay = min(delay, self._max_delay_seconds)
+            yield capped_delay * (1 - self._jitter * self._random())
+            delay = capped_delay * self._multiplier
+
+
+class PollTimeoutError(Exception):
+    """
+    Raised when the polled operation is not done before the timeout.
+    The last polled value is kept in the exception.
+    """
+
+    def __init__(self, message: str, last_value):
+        super().__init__(message)
+        self.last_value = last_value
+
+
+def poll_until(
+    check: Callable[[], T],
+    is_done: Callable[[T], bool],
+    timeout_seconds: Optional[float],
+    backoff: Optional[Backoff] = None,
+    on_wait: Optional[Callable[[T, float], None]] = None,
+    sleep: Optional[Callable[[float], None]] = None,
+    clock: Optional[Callable[[], float]] = None,
+) -> T:
+    """
+    Calls check until is_done returns True for its result, waiting between the calls as given by backoff.
+
+    :param check: polls the operation (e.g. reads the status of a job execution) and returns its state
+    :param is_done: returns True if the state returned by check is final
+    :param timeout_seconds: how long to wait for the operation; None waits without a limit
+    :param backoff: the delays between the polls; exponential from 1 to 30 seconds by default
+    :param on_wait: called with the last state and the delay before waiting for the next poll
+    :param sleep: waits for the given seconds; time.sleep by default
+    :param clock: returns the current time in seconds; time.monotonic by default
+    :return: the last state returned by check
+    :raises PollTimeoutError: if the operation is not done in timeout_seconds
+    """
+    sleep = sleep or time.sleep
+    clock = clock or time.monotonic
+    deadline = None if timeout_seconds is None else clock() + timeout_seconds
+    delays = (backoff or Backoff()).delays()
+    while True:
+        value = check()
+        if is_done(value):
+            return value
+        delay = next(delays)
+        if deadline is not None:
+            remaining = deadline - clock()
+            if remaining <= 0:
+                raise PollTimeoutError(
+                    f"The operation was not done in {timeout_seconds} seconds.", value
+                )
+            delay = min(delay, remaining)
+        if on_wait:
+            on_wait(value, delay)
+        log.debug(f"Waiting {delay:.1f} seconds before polling again.")
+        sleep(delay)
@@ -1,9 +1,13 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import io
 import json
 import os
+import shutil
+import zipfile
 from json import JSONDecodeError
 from typing import Tuple
+from unittest import mock
 
 from click.testing import CliRunner
 from py._path.local import LocalPath
@@ -35,6 +39,57 @@ def test_deploy(httpserver: PluginHTTPServer, tmpdir: LocalPath):
     assert posted_data["job_version"] is not None
 
 
+def test_deploy_streams_job_archive(httpserver: PluginHTTPServer, tmpdir: LocalPath):
+    _, deploy_args = prepare_new_deploy(httpserver)
+
+    runner = CliRunner()
+    result = runner.invoke(deploy, deploy_args)
+    test_utils.assert_click_status(result, 0)
+
+    upload_request = next(r for r, _ in httpserver.log if r.path.endswith("/sources"))
+    with zipfile.ZipFile(io.BytesIO(upload_request.data)) as archive:
+        assert "test-job/config.ini" in archive.namelist()
+        assert archive.testzip() is None
+
+
+def test_deploy_incremental(httpserver: PluginHTTPServer, tmpdir: LocalPath):
+    _, deploy_args = prepare_new_deploy(httpserver)
+    os.remove(f"{find_test_resource('test-job')}.zip")
+    job_path = os.path.join(tmpdir, "jobs", "test-job")
+    shutil.copytree(find_test_resource("test-job"), job_path)
+    deploy_args[deploy_args.index("-p") + 1] = job_path
+
+    def count_uploads():
+        return len([r for r, _ in httpserver.log if r.path.endswith("/sources")])
+
+    runner = CliRunner()
+    with mock.patch.dict(os.environ, {"VDK_BASE_CONFIG_FOLDER": str(tmpdir)}):
+        for _ in range(2):
+            result = runner.invoke(deploy, [*deploy_args, "--incremental"])
+            test_utils.assert_click_status(result, 0)
+        # the second deploy reuses the version of the first one
+        assert count_uploads() == 1
+        deployments = [
+            json.loads(r.data)
+            for r, _ in httpserver.log
+            if r.path.endswith("/deployments")
+        ]
+        assert [d["job_version"] for d in deployments] == [
+            "17012900f60461778c01ab24728807e70a5f2c87"
+        ] * 2
+
+        with open(os.path.join(job_path, "10_new_step.sql"), "w") as f:
+            f.write("select 1")
+        result = runner.invoke(deploy, [*deploy_args, "--incremental"])
+        test_utils.assert_click_status(result, 0)
+        assert count_uploads() == 2
+
+        # without --incremental the job is always uploaded
+        result = runner.invoke(deploy, deploy_args)
+        test_utils.assert_click_status(result, 0)
+        assert count_uploads() == 3
+
+
 def test_deploy_with_vdk_version_disable(
     httpserver: PluginHTTPServer, tmpdir: LocalPath
 ):
@@ -349,3 +349,81 @@ def test_execute_start_extra_arguments(httpserver: PluginHTTPServer, tmpdir: Loc
     assert (
         result.exit_code == 0
     ), f"Result exit code not 0. result output {result.output}, exc: {result.exc_info}"
+
+
+@patch("vdk.internal.control.utils.polling.time.sleep")
+def test_execute_wait_follow_logs(
+    mock_sleep, httpserver: PluginHTTPServer, tmpdir: LocalPath
+):
+    rest_api_url = httpserver.url_for("")
+    team_name = "test-team"
+    job_name = "test-job"
+    execution_uri = f"/data-jobs/for-team/{team_name}/jobs/{job_name}/executions/1"
+
+    def execution_response(status, etag):
+        execution = DataJobExecution(
+            id="1", job_name=job_name, status=status, deployment=DataJobDeployment()
+        )
+        return Response(
+            json.dumps(execution.to_dict()),
+            headers=dict(ETag=etag),
+            content_type="application/json",
+        )
+
+    execution_requests = []
+
+    def execution_handler(request):
+        execution_requests.append(request.headers.get("If-None-Match"))
+        if len(execution_requests) <= 2:
+            return execution_response("running", '"v1"')
+        if len(execution_requests) == 3:
+            return Response(status=304)
+        return execution_response("succeeded", '"v2"')
+
+    logs_requests = []
+    logs = [
+        "line1\nline2\npart",
+        "line1\nline2\npartial3\n",
+        "line2\npartial3\nline4",
+    ]
+
+    def logs_handler(request):
+        logs_requests.append(request.args.get("tail_lines"))
+        return Response(
+            json.dumps({"logs": logs[len(logs_requests) - 1]}),
+            content_type="application/json",
+        )
+
+    httpserver.expect_request(uri=execution_uri, method="GET").respond_with_handler(
+        execution_handler
+    )
+    httpserver.expect_request(
+        uri=f"{execution_uri}/logs", method="GET"
+    ).respond_with_handler(logs_handler)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        execute,
+        [
+            "-n",
+            job_name,
+            "-t",
+            team_name,
+            "-i",
+            "1",
+            "--wait",
+            "--follow",
+            "-u",
+            rest_api_url,
+        ],
+    )
+
+    test_utils.assert_click_status(result, 0)
+    assert result.output == (
+        "line1\nline2\npartial3\nline4"
+        "Execution 1 of Data Job test-job finished with status succeeded.\n"
+    )
+    # the first request reads the execution to wait for
+    assert execution_requests == [None, None, '"v1"', '"v1"']
+    assert logs_requests == [None, "1000", "1000"]
+    assert mock_sleep.call_count == 2
@@ -1,9 +1,12 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 import json
+import os
+import time
 from json import JSONDecodeError
 from typing import Any
 from typing import List
+from unittest import mock
 from urllib.parse import parse_qs
 
 from click.testing import CliRunner
@@ -13,10 +16,29 @@ from pytest_httpserver.pytest_plugin import PluginHTTPServer
 from vdk.internal import test_utils
 from vdk.internal.control.command_groups.job.list import list_command
 from vdk.internal.test_utils import assert_click_status
+from werkzeug import Response
 
 test_utils.disable_vdk_authentication()
 
 
+class ContainsQueryMatcher(QueryMatcher):
+    def __init__(self, substring: str):
+        self.__substring = substring
+
+    def get_comparing_values(self, request_query_string: bytes) -> tuple:
+        # Decode bytes to string if needed
+        if isinstance(request_query_string, bytes):
+            query_string_str = request_query_string.decode("utf-8")
+        else:
+            query_string_str = request_query_string
+
+        # Parse the query string
+        parsed_query = parse_qs(query_string_str)
+
+        # Convert to string to check substring (similar to original implementation)
+        return self.__substring in str(parsed_query), True
+
+
 def get_data_job_query_response(jobs: List[Any]):
     return dict(data=dict(content=jobs, errors=[]))
 
@@ -263,23 +285,6 @@ def test_list_with_multiple_pages(httpserver: PluginHTTPServer, tmpdir: LocalPat
     page1 = get_data_job_query_response(list(map(lambda j: job(j), range(1, 101))))
     page2 = get_data_job_query_response(list(map(lambda j: job(j), range(101, 121))))
 
-    class ContainsQueryMatcher(QueryMatcher):
-        def __init__(self, substring: str):
-            self.__substring = substring
-
-        def get_comparing_values(self, request_query_string: bytes) -> tuple:
-            # Decode bytes to string if needed
-            if isinstance(request_query_string, bytes):
-                query_string_str = request_query_string.decode("utf-8")
-            else:
-                query_string_str = request_query_string
-
-            # Parse the query string
-            parsed_query = parse_qs(query_string_str)
-
-            # Convert to string to check substring (similar to original implementation)
-            return self.__substring in str(parsed_query), True
-
     httpserver.expect_request(
         uri="/data-jobs/for-team/test-team/jobs",
         query_string=ContainsQueryMatcher("pageNumber: 1"),
@@ -299,3 +304,78 @@ def test_list_with_multiple_pages(httpserver: PluginHTTPServer, tmpdir: LocalPat
     assert (
         "test-job-1" in result.output and "test-job-120" in result.output
     ), f"expected data not found in output: {result.output}"
+
+
+def test_list_with_total_pages(httpserver: PluginHTTPServer, tmpdir: LocalPath):
+    rest_api_url = httpserver.url_for("")
+
+    def page(number: int):
+        jobs = [
+            {"jobName": f"test-job-{number}-{i}", "config": {"team": "test-team"}}
+            for i in range(100 if number < 3 else 7)
+        ]
+        return dict(data=dict(content=jobs, totalPages=3), errors=[])
+
+    for number in range(1, 4):
+        httpserver.expect_request(
+            uri="/data-jobs/for-team/test-team/jobs",
+            query_string=ContainsQueryMatcher(f"pageNumber: {number},"),
+        ).respond_with_json(page(number))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        list_command, ["-t", "test-team", "-u", rest_api_url, "-o", "json"]
+    )
+    assert_click_status(result, 0)
+
+    job_names = [job["job_name"] for job in json.loads(result.output)]
+    # the pages are printed in order even though they are fetched in parallel
+    assert job_names == [
+        f"test-job-{number}-{i}"
+        for number in range(1, 4)
+        for i in range(100 if number < 3 else 7)
+    ]
+    queries = [parse_qs(request.query_string.decode()) for request, _ in httpserver.log]
+    assert len(queries) == 3
+    assert all("totalPages" in query["query"][0] for query in queries)
+
+
+def test_list_with_response_cache(httpserver: PluginHTTPServer, tmpdir: LocalPath):
+    rest_api_url = httpserver.url_for("")
+    response = get_example_data_job_query_response()
+    httpserver.expect_request(
+        uri="/data-jobs/for-team/test-team/jobs",
+        headers={"If-None-Match": '"v1"'},
+    ).respond_with_response(Response(status=304))
+    httpserver.expect_request(
+        uri="/data-jobs/for-team/test-team/jobs"
+    ).respond_with_json(response, headers={"ETag": '"v1"'})
+
+    def list_jobs():
+        result = CliRunner().invoke(
+            list_command, ["-t", "test-team", "-u", rest_api_url, "-o", "json"]
+        )
+        assert_click_status(result, 0)
+        return [job["job_name"] for job in json.loads(result.output)]
+
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_BASE_CONFIG_FOLDER": str(tmpdir),
+            "VDK_CONTROL_HTTP_RESPONSE_CACHE_TTL_SECONDS": "60",
+        },
+    ):
+        expected_jobs = ["test-job", "test-job-2", "test-job-3"]
+        assert list_jobs() == expected_jobs
+        # the cached response is used without requests while it is fresh
+        assert list_jobs() == expected_jobs
+        assert len(httpserver.log) == 1
+
+        # after that it is revalidated
+        with mock.patch(
+            "vdk.internal.control.rest_lib.response_cache.time.time",
+            return_value=time.time() + 120,
+        ):
+            assert list_jobs() == expected_jobs
+        assert len(httpserver.log) == 2
+        assert httpserver.log[1][1].status_code == 304
@@ -0,0 +1,77 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+from vdk.internal.control.utils.polling import Backoff
+from vdk.internal.control.utils.polling import poll_until
+from vdk.internal.control.utils.polling import PollTimeoutError
+
+
+def _take(iterator, count):
+    return [next(iterator) for _ in range(count)]
+
+
+def test_backoff_grows_exponentially_up_to_max_delay():
+    backoff = Backoff(
+        initial_delay_seconds=1, max_delay_seconds=10, jitter=0.5, random_func=lambda: 0
+    )
+    assert _take(backoff.delays(), 6) == [1, 2, 4, 8, 10, 10]
+
+
+def test_backoff_jitter():
+    backoff = Backoff(
+        initial_delay_seconds=4, max_delay_seconds=4, jitter=0.5, random_func=lambda: 1
+    )
+    assert _take(backoff.delays(), 2) == [2, 2]
+
+    with pytest.raises(ValueError):
+        Backoff(jitter=2)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_poll_until_done():
+    clock = FakeClock()
+    states = iter(["submitted", "running", "running", "succeeded"])
+
+    result = poll_until(
+        lambda: next(states),
+        lambda state: state == "succeeded",
+        timeout_seconds=100,
+        backoff=Backoff(initial_delay_seconds=1, random_func=lambda: 0),
+        sleep=clock.sleep,
+        clock=clock.time,
+    )
+
+    assert result == "succeeded"
+    assert clock.sleeps == [1, 2, 4]
+
+
+def test_poll_until_timeout():
+    clock = FakeClock()
+    waits = []
+
+    with pytest.raises(PollTimeoutError) as exc_info:
+        poll_until(
+            lambda: "running",
+            lambda state: state == "succeeded",
+            timeout_seconds=5,
+            backoff=Backoff(initial_delay_seconds=2, random_func=lambda: 0),
+            on_wait=lambda state, delay: waits.append(delay),
+            sleep=clock.sleep,
+            clock=clock.time,
+        )
+
+    assert exc_info.value.last_value == "running"
+    # the last wait is shortened to the remaining time
+    assert waits == [2, 3]
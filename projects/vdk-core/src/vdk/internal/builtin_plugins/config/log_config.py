@@ -1,13 +1,17 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
-import logging
+import copy
+import logging.handlers
 import os
+import queue
 import re
 import socket
+import threading
 import types
 import warnings
 from sys import modules
 from typing import cast
+from typing import List
 
 from vdk.api.plugin.hook_markers import hookimpl
 from vdk.internal.builtin_plugins.config import vdk_config
@@ -67,6 +71,73 @@ def _parse_log_level_module(log_level_module):
         )
 
 
+class BackgroundLogHandler(logging.handlers.QueueHandler):
+    """
+    Passes log records through a queue to a background thread which formats them and
+    writes them to the given handlers. This way the thread which logs (e.g. runs queries or sends ingested data)
+    does not wait for formatting and writing the logs.
+
+    Filters set on this handler run in the logging thread (e.g. to add context known only there),
+    while filters set on the target handlers run in the background thread.
+    The queued records are written when the handler is closed (at the latest when the process exits).
+    """
+
+    def __init__(self, handlers: List[logging.Handler]):
+        super().__init__(queue.SimpleQueue())
+        self.target_handlers = handlers
+        self._listener = logging.handlers.QueueListener(
+            self.queue, *handlers, respect_handler_level=True
+        )
+        self._listener_lock = threading.Lock()
+        self._listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the QueueHandler, do not format the record here - only resolve the message
+        # since its arguments may change before the record is formatted in the background.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def flush(self) -> None:
+        """
+        Waits until the queued records are written.
+        """
+        with self._listener_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener.start()
+
+    def close(self) -> None:
+        with self._listener_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+        super().close()
+
+
+def flush_background_log_handlers() -> None:
+    """
+    Waits until the logs queued by the background handlers of the root logger are written.
+    """
+    for handler in list(logging.getLogger().handlers):
+        if isinstance(handler, BackgroundLogHandler):
+            handler.flush()
+
+
+def move_root_handlers_to_background() -> None:
+    """
+    Replaces the handlers of the root logger with a BackgroundLogHandler writing to them.
+    """
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    if not handlers or any(isinstance(h, BackgroundLogHandler) for h in handlers):
+        return
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(BackgroundLogHandler(handlers))
+
+
 def configure_initial_logging_before_anything():
     """
     Configure logging at the start of the app.
@@ -102,6 +173,7 @@ def configure_loggers(
     vdk_logging_level: str = "DEBUG",
     log_level_module: str = None,
     syslog_args: (str, int, str, bool) = ("localhost", 514, "UDP", False),
+    log_queue_enabled: bool = False,
 ) -> None:
     """
     Configure default logging configuration
@@ -112,6 +184,7 @@ def configure_loggers(
     :param vdk_logging_level: The level for vdk specific logs.
     :param log_level_module: The level for modules specific logs
     :param syslog_args: Arguments necessary for SysLog logging.
+    :param log_queue_enabled: If True, logs are formatted and written in a background thread.
     """
 
     import logging.config
@@ -192,6 +265,8 @@ def configure_loggers(
             "disable_existing_loggers": False,
         }
         logging.config.dictConfig(LOCAL)
+    if log_queue_enabled and "NONE" != log_config_type:
+        move_root_handlers_to_background()
     _set_already_configured()
 
 
@@ -262,6 +337,19 @@ class LoggingPlugin:
             description=f"Socket type for SysLog log forwarding connection. Currently possible values are {list(SYSLOG_SOCK_TYPE_VALUES_DICT.keys())}",
         )
 
+    @staticmethod
+    @hookimpl(hookwrapper=True)
+    def run_job(context: JobContext) -> None:
+        yield
+        # make sure the logs of the job are written when the job run completes
+        flush_background_log_handlers()
+
+    @staticmethod
+    @hookimpl(trylast=True)
+    def vdk_exit() -> None:
+        # make sure the logs written in the background are written before the CLI exits
+        flush_background_log_handlers()
+
     @hookimpl
     def initialize_job(self, context: JobContext) -> None:
         """
@@ -287,6 +375,9 @@ class LoggingPlugin:
             SYSLOG_SOCK_TYPE
         )
         syslog_enabled = context.core_context.configuration.get_value(SYSLOG_ENABLED)
+        log_queue_enabled = context.core_context.configuration.get_value(
+            vdk_config.LOG_QUEUE_ENABLED
+        )
         try:  # If logging initialization fails we want to attempt sending telemetry before exiting VDK
             if not context.core_context.configuration.get_value("use_structlog"):
                 configure_loggers(
@@ -301,6 +392,7 @@ class LoggingPlugin:
                         syslog_sock_type,
                         syslog_enabled,
                     ),
+                    log_queue_enabled=log_queue_enabled,
                 )
                 log = logging.getLogger(__name__)
                 log.debug(f"Initialized logging for log type {log_config_type}.")
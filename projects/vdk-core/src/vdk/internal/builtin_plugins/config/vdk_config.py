@@ -23,6 +23,11 @@ LOG_LEVEL_MODULE = "LOG_LEVEL_MODULE"
 LOG_STACK_TRACE_ON_EXIT = "LOG_STACK_TRACE_ON_EXIT"
 LOG_EXECUTION_RESULT = "LOG_EXECUTION_RESULT"
 LOG_EXCEPTION_FORMATTER = "LOG_EXCEPTION_FORMATTER"
+LOG_QUEUE_ENABLED = "LOG_QUEUE_ENABLED"
+LOG_QUERY_MAX_LENGTH = "LOG_QUERY_MAX_LENGTH"
+LOG_QUERY_SAMPLING_RATE = "LOG_QUERY_SAMPLING_RATE"
+SQL_STEP_MAX_PARALLEL_DATABASES = "SQL_STEP_MAX_PARALLEL_DATABASES"
+SQL_STEP_SPLIT_STATEMENTS = "SQL_STEP_SPLIT_STATEMENTS"
 WORKING_DIR = "WORKING_DIR"
 ATTEMPT_ID = "ATTEMPT_ID"
 EXECUTION_ID = "EXECUTION_ID"
@@ -113,6 +118,48 @@ class CoreConfigDefinitionPlugin:
             "Determines the exception format. Possible values are [pretty | plain]. Default is 'pretty'"
             "When set to pretty, it draws a box around VDK exceptions and add news lines and wrapping",
         )
+        config_builder.add(
+            LOG_QUEUE_ENABLED,
+            False,
+            True,
+            "If set to True, log records are passed through a queue to a background thread "
+            "which formats them and writes them to the log handlers (console, syslog). "
+            "This way logging does not slow down jobs which log a lot (e.g. run thousands of queries).",
+        )
+        config_builder.add(
+            LOG_QUERY_MAX_LENGTH,
+            10000,
+            True,
+            "The maximum number of characters of the text of executed queries which is logged. "
+            "Longer queries are truncated in the logs. Set to 0 to log the full query text.",
+        )
+        config_builder.add(
+            LOG_QUERY_SAMPLING_RATE,
+            1.0,
+            True,
+            "The fraction (between 0 and 1) of executed queries whose text is logged on INFO level. "
+            "The text of the rest of the queries is logged on DEBUG level.",
+        )
+        config_builder.add(
+            SQL_STEP_MAX_PARALLEL_DATABASES,
+            1,
+            True,
+            "The maximum number of databases in which the query of a SQL step is executed at the same time, "
+            "when the step lists several databases (with [database] lines). "
+            "By default (1), the query is executed in one database after another and the step stops at the first failure. "
+            "With a higher value the query is executed in all databases concurrently and the failures in each database "
+            "are reported together. The connections of the databases must be usable from other threads "
+            "(which is not the case for SQLite for example).",
+        )
+        config_builder.add(
+            SQL_STEP_SPLIT_STATEMENTS,
+            False,
+            True,
+            "If set to True, the SQL step files are split into statements (separated by semicolons) "
+            "which are executed one after another with the same cursor and timed separately. "
+            "Databases which declare support for multiple statements in one query get the whole file at once. "
+            "By default the whole file is sent to the database as a single query.",
+        )
 
         config_builder.add(JOB_GITHASH, "unknown")
         config_builder.add(
@@ -11,6 +11,7 @@ from vdk.internal.builtin_plugins.connection.execution_cursor import (
 )
 from vdk.internal.builtin_plugins.connection.execution_cursor import ExecutionCursor
 from vdk.internal.core.errors import PlatformServiceError
+from vdk.internal.plugin.plugin import PluginRegistry
 
 
 class DefaultConnectionHookImpl:
@@ -33,6 +34,72 @@ class DefaultConnectionHookImpl:
         return ExecuteOperationResult(native_result)
 
 
+class CompiledHookCaller:
+    """
+    Invokes the implementations of a hook resolved once (when created) instead of on each call.
+    The implementations are called in the same order and with the same arguments as pluggy would call them,
+    but without the pluggy dispatch overhead, which matters for hooks invoked for each query.
+    Hooks with wrappers or first result semantics are delegated to pluggy.
+    """
+
+    def __init__(self, hook_caller: Any):
+        self._hook_caller = hook_caller
+        self._hookimpls = hook_caller.get_hookimpls()
+        spec = getattr(hook_caller, "spec", None)
+        self._delegate = (spec is not None and spec.opts.get("firstresult")) or any(
+            impl.hookwrapper or getattr(impl, "wrapper", False)
+            for impl in self._hookimpls
+        )
+        # the distinct argument names lists of the implementations (usually just one)
+        self._argnames = []
+        # pluggy calls the last registered implementations first
+        self._calls = []
+        for impl in reversed(self._hookimpls):
+            if impl.argnames not in self._argnames:
+                self._argnames.append(impl.argnames)
+            self._calls.append((impl.function, self._argnames.index(impl.argnames)))
+
+    def get_hookimpls(self) -> list:
+        return self._hookimpls
+
+    def __call__(self, **kwargs) -> list:
+        if self._delegate:
+            return self._hook_caller(**kwargs)
+        args = []
+        for argnames in self._argnames:
+            args.append([kwargs[argname] for argname in argnames])
+        results = []
+        for function, args_index in self._calls:
+            result = function(*args[args_index])
+            if result is not None:
+                results.append(result)
+        return results
+
+
+class CompiledConnectionHooks:
+    """
+    ConnectionHookSpec relay in which the hooks invoked for each query are compiled (see CompiledHookCaller).
+    It must be recreated when the registered plugins change.
+    Any other hooks are invoked through the plugin registry hook relay.
+    """
+
+    COMPILED_HOOKS = [
+        "db_connection_validate_operation",
+        "db_connection_before_operation",
+        "db_connection_on_operation_failure",
+    ]
+
+    def __init__(self, hook_relay: Any):
+        self._hook_relay = hook_relay
+        for hook_name in self.COMPILED_HOOKS:
+            hook_caller = getattr(hook_relay, hook_name, None)
+            if hook_caller is not None:
+                setattr(self, hook_name, CompiledHookCaller(hook_caller))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._hook_relay, name)
+
+
 class ConnectionHookSpecFactory:
     """
     Class used to create properly initialized ConnectionHookSpec instance to use to execute the underlying hooks
@@ -40,6 +107,8 @@ class ConnectionHookSpecFactory:
 
     def __init__(self, plugin_registry: IPluginRegistry):
         self.__plugin_registry = plugin_registry
+        self.__connection_hook_spec = None
+        self.__plugins_version = None
 
     def get_connection_hook_spec(self) -> ConnectionHookSpec:
         """
@@ -49,13 +118,26 @@ class ConnectionHookSpecFactory:
         :return: ConnectionHookSpec
         """
         if self.__plugin_registry:
-            if not self.__plugin_registry.has_plugin(
-                DefaultConnectionHookImpl.__name__
-            ):
-                self.__plugin_registry.load_plugin_with_hooks_impl(
-                    DefaultConnectionHookImpl(), DefaultConnectionHookImpl.__name__
+            plugins_version = (
+                self.__plugin_registry.get_plugins_version()
+                if isinstance(self.__plugin_registry, PluginRegistry)
+                else None
+            )
+            # the hook implementations are resolved once and reused until the registered plugins change
+            if plugins_version is None or plugins_version != self.__plugins_version:
+                if not self.__plugin_registry.has_plugin(
+                    DefaultConnectionHookImpl.__name__
+                ):
+                    self.__plugin_registry.load_plugin_with_hooks_impl(
+                        DefaultConnectionHookImpl(), DefaultConnectionHookImpl.__name__
+                    )
+                    if plugins_version is not None:
+                        plugins_version = self.__plugin_registry.get_plugins_version()
+                self.__connection_hook_spec = CompiledConnectionHooks(
+                    self.__plugin_registry.hook()
                 )
-            return cast(ConnectionHookSpec, self.__plugin_registry.hook())
+                self.__plugins_version = plugins_version
+            return cast(ConnectionHookSpec, self.__connection_hook_spec)
         else:
             raise PlatformServiceError(
                 "Managed Cursor not initialized properly",
@@ -7,6 +7,8 @@ from typing import Union
 
 from vdk.api.plugin.plugin_input import IManagedConnectionRegistry
 from vdk.internal.builtin_plugins.config.vdk_config import DB_DEFAULT_TYPE
+from vdk.internal.builtin_plugins.config.vdk_config import LOG_QUERY_MAX_LENGTH
+from vdk.internal.builtin_plugins.config.vdk_config import LOG_QUERY_SAMPLING_RATE
 from vdk.internal.builtin_plugins.connection.connection_hooks import (
     ConnectionHookSpecFactory,
 )
@@ -16,6 +18,7 @@ from vdk.internal.builtin_plugins.connection.impl.wrapped_connection import (
 from vdk.internal.builtin_plugins.connection.managed_connection_base import (
     ManagedConnectionBase,
 )
+from vdk.internal.builtin_plugins.connection.managed_cursor import QueryLogging
 from vdk.internal.builtin_plugins.connection.pep249.interfaces import PEP249Connection
 from vdk.internal.core import errors
 from vdk.internal.core.config import Configuration
@@ -43,6 +46,11 @@ class ManagedConnectionRouter(IManagedConnectionRegistry):
         self._connection_builders: Dict[
             str, Callable[[], ManagedConnectionBase]
         ] = dict()
+        sampling_rate = cfg.get_value(LOG_QUERY_SAMPLING_RATE)
+        self._query_logging = QueryLogging(
+            int(cfg.get_value(LOG_QUERY_MAX_LENGTH) or 0),
+            1.0 if sampling_rate is None else float(sampling_rate),
+        )
 
     def add_open_connection_factory_method(
         self,
@@ -119,6 +127,7 @@ class ManagedConnectionRouter(IManagedConnectionRegistry):
             self.__cache_connection(dbtype, conn)
             if not conn._connection_hook_spec_factory:
                 conn._connection_hook_spec_factory = self._connection_hook_spec_factory
+            conn._query_logging = self._query_logging
         elif conn is None:
             errors.report_and_throw(
                 errors.VdkConfigurationError(
@@ -138,6 +147,7 @@ class ManagedConnectionRouter(IManagedConnectionRegistry):
                 self._connection_builders[dbtype],
                 self._connection_hook_spec_factory,
             )
+            wrapped_conn._query_logging = self._query_logging
             self.__cache_connection(dbtype, wrapped_conn)
 
         return self._connections[dbtype]
@@ -3,6 +3,7 @@
 import logging
 import types
 from abc import abstractmethod
+from timeit import default_timer as timer
 from types import TracebackType
 from typing import Any
 from typing import cast
@@ -23,7 +24,13 @@ from vdk.internal.builtin_plugins.connection.database_managed_connection import
     IDatabaseManagedConnection,
 )
 from vdk.internal.builtin_plugins.connection.managed_cursor import ManagedCursor
+from vdk.internal.builtin_plugins.connection.managed_cursor import QueryLogging
 from vdk.internal.builtin_plugins.connection.pep249.interfaces import PEP249Connection
+from vdk.internal.builtin_plugins.connection.sql_statements import DIALECT_ANSI
+from vdk.internal.builtin_plugins.connection.sql_statements import (
+    split_sql_statements,
+)
+from vdk.internal.builtin_plugins.connection.sql_statements import StatementResult
 from vdk.internal.builtin_plugins.run import job_input_error_classifier
 from vdk.internal.core import errors
 from vdk.internal.util.decorators import closing_noexcept_on_close
@@ -57,6 +64,7 @@ class ManagedConnectionBase(
         self._is_db_con_open: bool = db_con is not None
         self._db_con: Optional[PEP249Connection] = db_con
         self._connection_hook_spec_factory = connection_hook_spec_factory
+        self._query_logging = QueryLogging()
 
     def __getattr__(self, attr):
         """
@@ -120,49 +128,77 @@ class ManagedConnectionBase(
         """
         with closing_noexcept_on_close(self._cursor()) as cur:
             cur.execute(query)
+            return self._fetch_all(cur)
+
+    def execute_statements(self, sql: str) -> List[StatementResult]:
+        """
+        Execute a SQL script with one or more statements separated by semicolons.
+        The statements are executed one after another with execute_query (so its overrides, e.g. commits and retries,
+        apply to each of them) and each of them is timed.
+        If the database supports multiple statements in one query (see _supports_multiple_statements)
+        the script is sent as a single query instead and timed as a whole.
 
+        :return: the result of each statement (or of the whole script)
+        """
+        statements = split_sql_statements(sql, self._sql_dialect())
+        if self._supports_multiple_statements() and len(statements) > 1:
+            statements = (";\n".join(statements),)
+        results = []
+        for index, statement in enumerate(statements):
+            start = timer()
             try:
-                """
-                1. According to PEP 249 fetchall() should throw an exception when there is no result set
-                produced by cursor.execute() (say insert into table).
-                2. In pyodbc the cursor.rowcount property is always -1 => can rely upon.
-                3. In impyla there is a handy property cursor.has_result_set.
-                But it is not in PEP 249 and not supported by pyodbc implementation
-                4. The only solution found so far is to try/catch the fetchall() call
-                and swallow the exception in very narrow set of cases.
-                """
-                # TODO support for fetchmany
-                self._log.info("Fetching query result...")
-                res = cur.fetchall()
-            except Exception as e:
-                res = None
-                if str(e) in (
-                    "No results.  Previous SQL was not a query.",  # message in pyodbc
-                    "Trying to fetch results on an operation with no results.",  # message in impyla
-                    "no results to fetch",  # psycopg: ProgrammingError: no results to fetch
-                    "DPY-1003: the executed statement does not return rows",  # oracledb
-                ):
-                    self._log.debug(
-                        "Fetching all results from query SUCCEEDED. Query does not produce results (e.g. DROP TABLE)."
-                    )
+                result = self.execute_query(statement)
+            except Exception:
+                self._log.info(
+                    f"Statement {index + 1} of {len(statements)} failed after {timer() - start:.3f} seconds."
+                )
+                raise
+            results.append(StatementResult(statement, timer() - start, result))
+        return results
+
+    def _fetch_all(self, cur) -> List[List[Any]]:
+        try:
+            """
+            1. According to PEP 249 fetchall() should throw an exception when there is no result set
+            produced by cursor.execute() (say insert into table).
+            2. In pyodbc the cursor.rowcount property is always -1 => can rely upon.
+            3. In impyla there is a handy property cursor.has_result_set.
+            But it is not in PEP 249 and not supported by pyodbc implementation
+            4. The only solution found so far is to try/catch the fetchall() call
+            and swallow the exception in very narrow set of cases.
+            """
+            # TODO support for fetchmany
+            self._log.info("Fetching query result...")
+            res = cur.fetchall()
+        except Exception as e:
+            res = None
+            if str(e) in (
+                "No results.  Previous SQL was not a query.",  # message in pyodbc
+                "Trying to fetch results on an operation with no results.",  # message in impyla
+                "no results to fetch",  # psycopg: ProgrammingError: no results to fetch
+                "DPY-1003: the executed statement does not return rows",  # oracledb
+            ):
+                self._log.debug(
+                    "Fetching all results from query SUCCEEDED. Query does not produce results (e.g. DROP TABLE)."
+                )
+            else:
+                if job_input_error_classifier.is_user_error(e):
+                    blamee = errors.ResolvableBy.USER_ERROR
                 else:
-                    if job_input_error_classifier.is_user_error(e):
-                        blamee = errors.ResolvableBy.USER_ERROR
-                    else:
-                        blamee = errors.ResolvableBy.PLATFORM_ERROR
-                    self._log.error(
-                        "\n".join(
-                            [
-                                "Fetching all results from query FAILED.",
-                                errors.MSG_WHY_FROM_EXCEPTION(e),
-                            ]
-                        )
+                    blamee = errors.ResolvableBy.PLATFORM_ERROR
+                self._log.error(
+                    "\n".join(
+                        [
+                            "Fetching all results from query FAILED.",
+                            errors.MSG_WHY_FROM_EXCEPTION(e),
+                        ]
                     )
-                    errors.report(blamee, e)
-                    raise e
-            return cast(
-                List[List[Any]], res
-            )  # we return None in case of DML. This is not PEP249 compliant, but is more convenient
+                )
+                errors.report(blamee, e)
+                raise e
+        return cast(
+            List[List[Any]], res
+        )  # we return None in case of DML. This is not PEP249 compliant, but is more convenient
 
     def cursor(self, *args, **kwargs):
         if hasattr(self._db_con, "cursor"):
@@ -171,6 +207,7 @@ class ManagedConnectionBase(
                 self._log,
                 self._connection_hook_spec_factory,
                 self,
+                getattr(self, "_query_logging", None),
             )
         return super().cursor()
 
@@ -207,6 +244,20 @@ class ManagedConnectionBase(
         """
         raise NotImplementedError
 
+    def _sql_dialect(self) -> str:
+        """
+        The SQL dialect used to split scripts into statements (see sql_statements.split_sql_statements).
+        Inheritors can override it if the database quotes strings differently than ANSI SQL.
+        """
+        return DIALECT_ANSI
+
+    def _supports_multiple_statements(self) -> bool:
+        """
+        Inheritors can override it to return True if the database driver can execute
+        multiple statements separated by semicolons with a single cursor.execute call.
+        """
+        return False
+
     def _cursor(self):
         self.connect()
         return self.cursor()
@@ -1,7 +1,9 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 import logging
+import random
 import types
+from dataclasses import dataclass
 from datetime import timedelta
 from timeit import default_timer as timer
 from typing import Any
@@ -27,6 +29,32 @@ from vdk.internal.builtin_plugins.connection.recovery_cursor import RecoveryCurs
 from vdk.internal.core import errors
 
 
+@dataclass(frozen=True)
+class QueryLogging:
+    """
+    Controls how the text of executed queries is logged.
+    Logging the full text of thousands of (or very large) queries can slow down the job.
+    """
+
+    # the maximum number of characters of the query logged. 0 means no limit.
+    max_length: int = 0
+    # the fraction of queries whose text is logged on INFO level (the rest are logged on DEBUG level)
+    sampling_rate: float = 1.0
+
+    def get_level(self) -> int:
+        if self.sampling_rate >= 1 or random.random() < self.sampling_rate:
+            return logging.INFO
+        return logging.DEBUG
+
+    def truncate(self, query: str) -> str:
+        if 0 < self.max_length < len(query):
+            return (
+                f"{query[:self.max_length]}\n"
+                f"... (truncated {len(query) - self.max_length} more characters)"
+            )
+        return query
+
+
 class ManagedCursor(ProxyCursor):
     """
     PEP249 Managed Cursor. It takes and sits on the control and data path of SQL queries and client.
@@ -38,6 +66,7 @@ class ManagedCursor(ProxyCursor):
         log: logging.Logger = None,
         connection_hook_spec_factory: ConnectionHookSpecFactory = None,
         managed_database_connection: IDatabaseManagedConnection = None,
+        query_logging: QueryLogging = None,
     ):
         if not log:
             log = logging.getLogger(__name__)
@@ -49,6 +78,7 @@ class ManagedCursor(ProxyCursor):
             )
 
         self.__managed_database_connection = managed_database_connection
+        self.__query_logging = query_logging or QueryLogging()
 
     def __getattr__(self, attr):
         """
@@ -143,7 +173,10 @@ class ManagedCursor(ProxyCursor):
             )
 
         if decorate_operation:
-            self._log.debug("Decorating query:\n%s" % operation)
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug(
+                    "Decorating query:\n%s", self.__query_logging.truncate(operation)
+                )
             decoration_cursor = DecorationCursor(
                 self._cursor, self._log, managed_operation
             )
@@ -176,7 +209,10 @@ class ManagedCursor(ProxyCursor):
                 self.__connection_hook_spec.db_connection_validate_operation
             )
 
-        self._log.debug("Validating query:\n%s" % operation)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "Validating query:\n%s", self.__query_logging.truncate(operation)
+            )
         try:
             if hook_validate_operation:
                 hook_validate_operation(operation=operation, parameters=parameters)
@@ -198,7 +234,13 @@ class ManagedCursor(ProxyCursor):
             raise e
 
     def _execute_operation(self, managed_operation: ManagedOperation):
-        self._log.info("Executing query:\n%s" % managed_operation.get_operation())
+        level = self.__query_logging.get_level()
+        if self._log.isEnabledFor(level):
+            self._log.log(
+                level,
+                "Executing query:\n%s",
+                self.__query_logging.truncate(managed_operation.get_operation()),
+            )
         execution_cursor = ExecutionCursor(self._cursor, managed_operation, self._log)
 
         result = self.__managed_database_connection.db_connection_execute_operation(
@@ -214,9 +256,13 @@ class ManagedCursor(ProxyCursor):
             and self.__managed_database_connection.db_connection_after_operation
         ):
             try:
-                self._log.debug(
-                    "Executing after operation:\n%s" % managed_operation.get_operation()
-                )
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug(
+                        "Executing after operation:\n%s",
+                        self.__query_logging.truncate(
+                            managed_operation.get_operation()
+                        ),
+                    )
                 self.__managed_database_connection.db_connection_after_operation(
                     execution_cursor=execution_cursor
                 )
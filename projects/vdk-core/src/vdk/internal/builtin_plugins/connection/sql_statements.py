@@ -0,0 +1,89 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+"""
+Splitting SQL scripts into statements.
+
+Only the lexical structure of SQL is considered: statements are separated by semicolons
+which are not in comments, quoted strings, quoted identifiers or dollar-quoted blocks.
+Procedural blocks which contain semicolons without quoting them (e.g. BEGIN ... END) are not supported.
+"""
+import functools
+import re
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+DIALECT_ANSI = "ansi"
+# dollar-quoted strings, e.g. function bodies in $$ ... $$ or $body$ ... $body$
+DIALECT_POSTGRES = "postgres"
+# string literals with backslash escapes, e.g. 'It\'s'
+DIALECT_IMPALA = "impala"
+
+_DIALECTS_WITH_DOLLAR_QUOTES = (DIALECT_POSTGRES, "greenplum", "duckdb", "snowflake")
+_DIALECTS_WITH_BACKSLASH_ESCAPES = (DIALECT_IMPALA, "hive", "mysql", "spark")
+
+
+@dataclass
+class StatementResult:
+    """
+    The result of executing a SQL statement.
+    """
+
+    statement: str
+    # how long the statement took in seconds (including fetching its result)
+    duration: float
+    # the fetched rows or None if the statement does not produce results
+    result: Optional[Any] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_token_pattern(dialect: str) -> Pattern:
+    # unterminated comments and quotes extend to the end of the script
+    if dialect in _DIALECTS_WITH_BACKSLASH_ESCAPES:
+        single_quoted = r"'(?:[^'\\]|\\.|'')*'?"
+        double_quoted = r'"(?:[^"\\]|\\.|"")*"?'
+    else:
+        single_quoted = r"'(?:[^']|'')*'?"
+        double_quoted = r'"(?:[^"]|"")*"?'
+    quoted = [single_quoted, double_quoted, r"`[^`]*`?"]
+    if dialect in _DIALECTS_WITH_DOLLAR_QUOTES:
+        quoted.append(r"(?<![\w$])\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z)")
+    return re.compile(
+        r"(?P<comment>--[^\n]*|/\*.*?(?:\*/|\Z))"
+        rf"|(?P<quoted>{'|'.join(quoted)})"
+        r"|(?P<separator>;)",
+        re.DOTALL,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def split_sql_statements(sql: str, dialect: str = DIALECT_ANSI) -> Tuple[str, ...]:
+    """
+    Splits a SQL script into statements.
+    The statements are returned without the separating semicolons and the surrounding whitespace.
+    Statements which contain only comments are skipped.
+
+    :param sql: the SQL script
+    :param dialect: the SQL dialect, e.g. ansi, postgres or impala.
+        Unknown dialects are split as ansi SQL.
+    """
+    statements = []
+    start = 0
+    position = 0
+    has_code = False
+    for match in _get_token_pattern(dialect.lower()).finditer(sql):
+        if not has_code and sql[position : match.start()].strip():
+            has_code = True
+        position = match.end()
+        if match.lastgroup == "quoted":
+            has_code = True
+        elif match.lastgroup == "separator":
+            if has_code:
+                statements.append(sql[start : match.start()].strip())
+            start = position
+            has_code = False
+    if has_code or sql[position:].strip():
+        statements.append(sql[start:].strip())
+    return tuple(statements)
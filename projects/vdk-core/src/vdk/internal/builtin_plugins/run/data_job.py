@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import functools
 import logging
 import pathlib
 from dataclasses import dataclass
@@ -12,6 +13,10 @@ from vdk.api.job_input import IJobArguments
 from vdk.api.plugin.core_hook_spec import JobRunHookSpecs
 from vdk.api.plugin.hook_markers import hookimpl
 from vdk.internal.builtin_plugins.config.vdk_config import LOG_EXCEPTION_FORMATTER
+from vdk.internal.builtin_plugins.config.vdk_config import (
+    SQL_STEP_MAX_PARALLEL_DATABASES,
+)
+from vdk.internal.builtin_plugins.config.vdk_config import SQL_STEP_SPLIT_STATEMENTS
 from vdk.internal.builtin_plugins.run.execution_results import ExecutionResult
 from vdk.internal.builtin_plugins.run.execution_results import StepResult
 from vdk.internal.builtin_plugins.run.execution_state import ExecutionStateStoreKeys
@@ -79,6 +84,7 @@ class DataJobDefaultHookImplPlugin:
                 if step_executed
                 else ExecutionStatus.NOT_RUNNABLE
             )
+            details = step.details
         except SkipRemainingStepsException as e:
             status = ExecutionStatus.SKIP_REQUESTED
             details = errors.MSG_WHY_FROM_EXCEPTION(e)
@@ -88,6 +94,7 @@ class DataJobDefaultHookImplPlugin:
             )
         except Exception as e:
             status = ExecutionStatus.ERROR
+            details = step.details
             blamee = whom_to_blame(e, __file__, context.job_directory)
             exception = e
             errors.report(blamee, exception)
@@ -185,13 +192,26 @@ class DataJobDefaultHookImplPlugin:
 
         file_locator: JobFilesLocator = JobFilesLocator()
         script_files = file_locator.get_script_files(context.job_directory)
+        max_parallel_databases = int(
+            context.core_context.configuration.get_value(
+                SQL_STEP_MAX_PARALLEL_DATABASES
+            )
+            or 1
+        )
+        split_statements = bool(
+            context.core_context.configuration.get_value(SQL_STEP_SPLIT_STATEMENTS)
+        )
 
         for file_path in script_files:
             if file_path.name.lower().endswith(".sql"):
                 step = Step(
                     name=file_path.name,
                     type=TYPE_SQL,
-                    runner_func=StepFuncFactory.run_sql_step,
+                    runner_func=functools.partial(
+                        StepFuncFactory.run_sql_step,
+                        max_parallel_databases=max_parallel_databases,
+                        split_statements=split_statements,
+                    ),
                     file_path=file_path,
                     job_dir=context.job_directory,
                 )
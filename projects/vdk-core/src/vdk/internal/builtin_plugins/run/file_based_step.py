@@ -1,15 +1,25 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import functools
 import importlib.util
 import inspect
 import logging
 import pathlib
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from timeit import default_timer as timer
+from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from vdk.api.job_input import IJobInput
+from vdk.internal.builtin_plugins.connection.sql_statements import StatementResult
+from vdk.internal.builtin_plugins.run.job_input_error_classifier import whom_to_blame
 from vdk.internal.builtin_plugins.run.step import Step
 from vdk.internal.core import errors
 from vdk.internal.core.errors import SkipRemainingStepsException
@@ -23,8 +33,13 @@ TYPE_PYTHON = "python"
 class JobFilesLocator:
     """
     Locate the data job files that would be executed by us.
+    The files of a directory are cached until the directory is modified,
+    since the same directories (e.g. of templates) are often located many times in one run.
     """
 
+    # directory -> (modification time of the directory, script files)
+    _cache: Dict[pathlib.Path, Tuple[int, List[pathlib.Path]]] = {}
+
     def get_script_files(self, directory: pathlib.Path) -> List[pathlib.Path]:
         """Locates the files in a directory, that are supported for execution.
 
@@ -35,6 +50,11 @@ class JobFilesLocator:
         :rtype: :class:`.list`
 
         """
+        modification_time = directory.stat().st_mtime_ns
+        cached = JobFilesLocator._cache.get(directory)
+        if cached and cached[0] == modification_time:
+            return list(cached[1])
+
         script_files = [
             x
             for x in directory.iterdir()
@@ -42,34 +62,241 @@ class JobFilesLocator:
         ]
         script_files.sort(key=lambda x: x.name)
         log.debug(f"Script files of {directory} are {script_files}")
-        return script_files
+        JobFilesLocator._cache[directory] = (modification_time, script_files)
+        return list(script_files)
 
 
-class StepFuncFactory:
+@dataclass(frozen=True)
+class SqlStepFile:
     """
-    Implementations of runner_func for running steps
+    The content of a SQL step file.
     """
 
+    # the databases listed with [database] lines (before the query parameters are substituted)
+    databases: Tuple[str, ...]
+    # the query without the [database] lines
+    query: str
+
+
+class SqlStepFileReader:
+    """
+    Reads SQL step files.
+    The last read files are cached until they are modified, since the same files (e.g. of templates)
+    are often run many times.
+    """
+
+    @staticmethod
+    def read(file_path: pathlib.Path) -> SqlStepFile:
+        stat = file_path.stat()
+        return SqlStepFileReader._read(file_path, stat.st_mtime_ns, stat.st_size)
+
     @staticmethod
-    def run_sql_step(step: Step, job_input: IJobInput) -> bool:
-        """ """
+    @functools.lru_cache(maxsize=256)
+    def _read(
+        file_path: pathlib.Path, modification_time: int, size: int
+    ) -> SqlStepFile:
+        # the modification time and size are part of the cache key, so a modified file is read again
         databases = []
         query = []
-        with open(step.file_path, encoding="utf8") as sql_file:
+        with open(file_path, encoding="utf8") as sql_file:
             for line in sql_file.readlines():
                 if re.match(r"\[(.*?)\]", line.rstrip()):
-                    db_name = line.rstrip().replace("[", "").replace("]", "")
-                    db_name = job_input._substitute_query_params(db_name).rstrip()
-                    databases.append(db_name)
+                    databases.append(line.rstrip().replace("[", "").replace("]", ""))
                 else:
                     query.append(line)
-        if databases:
-            for database in databases:
-                job_input.execute_query(sql="".join(query), database=database)
+        return SqlStepFile(tuple(databases), "".join(query))
+
+
+@dataclass
+class DatabaseQueryResult:
+    """
+    The result of executing the query of a SQL step in one of its databases.
+    """
+
+    database: str
+    # how long the query took in seconds
+    duration: float
+    # the query result if it succeeded
+    result: Optional[list] = None
+    # the exception if it failed
+    exception: Optional[BaseException] = None
+
+    def __str__(self):
+        if self.exception is not None:
+            return (
+                f"{self.database}: failed with {self.exception.__class__.__name__}: {self.exception} "
+                f"in {self.duration:.3f} seconds"
+            )
+        outcome = f"{self.database}: succeeded in {self.duration:.3f} seconds"
+        if _is_statement_results(self.result):
+            outcome += f" ({_format_statement_durations(self.result)})"
+        return outcome
+
+
+def _is_statement_results(result: Any) -> bool:
+    return (
+        isinstance(result, list)
+        and len(result) > 0
+        and isinstance(result[0], StatementResult)
+    )
+
+
+def _format_statement_durations(results: List[StatementResult]) -> str:
+    return ", ".join(
+        f"statement {index + 1} took {result.duration:.3f} seconds"
+        for index, result in enumerate(results)
+    )
+
+
+class SqlStepDatabasesError(Exception):
+    """
+    The query of a SQL step failed in some of the databases it is executed in.
+    """
+
+    def __init__(self, step_name: str, results: List[DatabaseQueryResult]):
+        self.results = results
+        outcomes = "; ".join(str(r) for r in results)
+        super().__init__(
+            f"The query of step {step_name} failed in "
+            f"{sum(1 for r in results if r.exception is not None)} of {len(results)} databases. {outcomes}"
+        )
+
+
+class StepFuncFactory:
+    """
+    Implementations of runner_func for running steps
+    """
+
+    @staticmethod
+    def run_sql_step(
+        step: Step,
+        job_input: IJobInput,
+        max_parallel_databases: int = 1,
+        split_statements: bool = False,
+    ) -> bool:
+        """Runs a SQL step script.
+
+        The query is executed in the databases listed in the file with [database] lines
+        (or in the default database if there are none).
+        If max_parallel_databases is more than 1, it is executed in up to that many databases at the same time.
+        If split_statements is True, the statements of the query are executed and timed one by one.
+        The outcome (and duration) of the query in each database and the duration of each statement
+        are set in the step details.
+        """
+        sql_step_file = SqlStepFileReader.read(step.file_path)
+        databases = [
+            job_input._substitute_query_params(database).rstrip()
+            for database in sql_step_file.databases
+        ]
+
+        def execute(database: Optional[str]):
+            if split_statements:
+                return StepFuncFactory._execute_statements(
+                    step, job_input, sql_step_file.query, database
+                )
+            return job_input.execute_query(sql=sql_step_file.query, database=database)
+
+        if not databases:
+            result = execute(None)
+            if split_statements:
+                step.details = "Query results: " + _format_statement_durations(result)
+        elif max_parallel_databases <= 1 or len(databases) == 1:
+            results = []
+            try:
+                for database in databases:
+                    start = timer()
+                    try:
+                        result = execute(database)
+                    except Exception as e:
+                        results.append(
+                            DatabaseQueryResult(database, timer() - start, exception=e)
+                        )
+                        raise
+                    results.append(
+                        DatabaseQueryResult(database, timer() - start, result=result)
+                    )
+            finally:
+                step.details = StepFuncFactory._format_results(results)
         else:
-            job_input.execute_query(sql="".join(query))
+            results = StepFuncFactory._execute_query_in_databases(
+                step, job_input, execute, databases, max_parallel_databases
+            )
+            step.details = StepFuncFactory._format_results(results)
         return True
 
+    @staticmethod
+    def _format_results(results: List[DatabaseQueryResult]) -> str:
+        return "Query results by database: " + "; ".join(str(r) for r in results)
+
+    @staticmethod
+    def _execute_statements(
+        step: Step, job_input: IJobInput, query: str, database: Optional[str]
+    ) -> List[StatementResult]:
+        if not query or not query.strip():
+            raise errors.UserCodeError("Trying to execute an empty SQL query.")
+        connection = job_input.get_managed_connection(database)
+        results = connection.execute_statements(
+            job_input._substitute_query_params(query)
+        )
+        for index, result in enumerate(results):
+            log.info(
+                f"Statement {index + 1} of {len(results)} of step {step.name} "
+                f"took {result.duration:.3f} seconds."
+            )
+        return results
+
+    @staticmethod
+    def _execute_query_in_databases(
+        step: Step,
+        job_input: IJobInput,
+        execute: Callable[[str], Any],
+        databases: List[str],
+        max_parallel_databases: int,
+    ) -> List[DatabaseQueryResult]:
+        # Queries in the same database use the same connection, so they are executed one after another.
+        queries_by_database: Dict[str, List[int]] = {}
+        for index, database in enumerate(databases):
+            queries_by_database.setdefault(database.lower(), []).append(index)
+        results: List[Optional[DatabaseQueryResult]] = [None] * len(databases)
+
+        def execute_in_databases(indexes: List[int]):
+            for index in indexes:
+                start = timer()
+                try:
+                    result = execute(databases[index])
+                    results[index] = DatabaseQueryResult(
+                        databases[index], timer() - start, result=result
+                    )
+                except Exception as e:
+                    results[index] = DatabaseQueryResult(
+                        databases[index], timer() - start, exception=e
+                    )
+
+        # The managed connections are created (and cached) here, in the thread running the job, so the workers
+        # do not race to create them. They connect lazily, on the first query of each worker.
+        for indexes in queries_by_database.values():
+            job_input.get_managed_connection(databases[indexes[0]])
+        with ThreadPoolExecutor(
+            max_workers=min(max_parallel_databases, len(queries_by_database)),
+            thread_name_prefix=f"sql-step-{step.name}",
+        ) as executor:
+            list(executor.map(execute_in_databases, queries_by_database.values()))
+
+        for result in results:
+            log.info(
+                f"Query of step {step.name} in database {result.database} "
+                f"{'failed' if result.exception else 'succeeded'} in {result.duration:.3f} seconds."
+            )
+        failures = [result for result in results if result.exception is not None]
+        if failures:
+            error = SqlStepDatabasesError(step.name, results)
+            step.details = StepFuncFactory._format_results(results)
+            errors.report(
+                whom_to_blame(failures[0].exception, __file__, step.job_dir), error
+            )
+            raise error from failures[0].exception
+        return results
+
     @staticmethod
     def run_python_step(step: Step, job_input: IJobInput) -> bool:
         """Runs a Python step script.
@@ -3,6 +3,7 @@
 import logging
 import pathlib
 import textwrap
+from collections import ChainMap
 from typing import List
 from typing import Optional
 
@@ -61,6 +62,7 @@ class JobInput(IJobInput):
         self.__properties_router = properties_router
         self.__secrets_router = secrets_router
         self.__vdk_internal_telemetry = None
+        self.__substitution_args = None
 
     # Connections
 
@@ -81,6 +83,7 @@ class JobInput(IJobInput):
         return self.__properties_router.get_all_properties()
 
     def set_all_properties(self, properties):
+        self.__substitution_args = None
         return self.__properties_router.set_all_properties(properties)
 
     def get_secret(self, name, default_value=None):
@@ -92,31 +95,37 @@ class JobInput(IJobInput):
     def set_all_secrets(self, secrets):
         return self.__secrets_router.set_all_secrets(secrets)
 
+    def _get_substitution_args(self) -> ChainMap:
+        """
+        Build the arguments used for query substitution once and reuse them for all queries.
+        Job arguments take precedence over execution properties, which take precedence over job properties.
+        The result is rebuilt only after the properties are updated through set_all_properties.
+        """
+        if self.__substitution_args is None:
+            sql_substitute_args = ChainMap()
+            sql_args = self.get_arguments()
+            if not sql_args or type(sql_args) != dict:
+                logging.getLogger(__name__).debug(
+                    "No arguments are passed for Data Job, "
+                    "so I won't be able to provide query parameter substitution capabilities with job arguments."
+                )
+            else:
+                sql_substitute_args.maps.append(sql_args)
+            sql_substitute_args.maps.append(self.get_execution_properties())
+            if not self.__properties_router.has_properties_impl():
+                logging.getLogger(__name__).info(
+                    "Data Job Properties has not been initialized., "
+                    "so I won't be able to provide query properties substitution capabilities from job properties."
+                    "If passed job arguments will still be used"
+                )
+            else:
+                sql_substitute_args.maps.append(self.get_all_properties())
+            self.__substitution_args = sql_substitute_args
+        return self.__substitution_args
+
     def _substitute_query_params(self, sql: str):
         sql = textwrap.dedent(sql).strip("\n") + "\n"
-        query = sql
-        sql_susbstitute_args = {}
-        if not self.__properties_router.has_properties_impl():
-            logging.getLogger(__name__).info(
-                "Data Job Properties has not been initialized., "
-                "so I won't be able to provide query properties substitution capabilities from job properties."
-                "If passed job arguments will still be used"
-            )
-        else:
-            sql_susbstitute_args.update(self.get_all_properties())
-        sql_susbstitute_args.update(self.get_execution_properties())
-
-        sql_args = self.get_arguments()
-        if not sql_args or type(sql_args) != dict:
-            logging.getLogger(__name__).debug(
-                "No arguments are passed for Data Job, "
-                "so I won't be able to provide query parameter substitution capabilities with job arguments."
-            )
-        else:
-            sql_susbstitute_args.update(sql_args)
-        query = SqlArgumentSubstitutor(sql_susbstitute_args).substitute(query)
-
-        return query
+        return SqlArgumentSubstitutor(self._get_substitution_args()).substitute(sql)
 
     def execute_query(self, sql: str, database: str = None):
         if not sql or not sql.strip():
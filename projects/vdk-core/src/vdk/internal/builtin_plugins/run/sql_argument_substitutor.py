@@ -1,17 +1,32 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import functools
 import logging
-from typing import Dict
+import re
+from typing import Mapping
+from typing import Tuple
 
 log = logging.getLogger(__name__)
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^{}]+)\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(sql: str) -> Tuple[str, ...]:
+    """
+    Split the SQL into alternating literal text and placeholder names.
+    Even indexes are literal text, odd indexes are the names found between curly braces.
+    The result is cached per SQL text as the same queries are usually executed many times.
+    """
+    return tuple(_PLACEHOLDER_PATTERN.split(sql))
+
 
 class SqlArgumentSubstitutor:
     """
     Substitute text in provided SQL from provided dictory
     """
 
-    def __init__(self, dictionary: Dict):
+    def __init__(self, dictionary: Mapping):
         self.dictionary = dictionary
 
     def substitute(self, sql: str) -> str:
@@ -28,12 +43,22 @@ class SqlArgumentSubstitutor:
         "SELECT {col1}, {col2} FROM {table}" and dictionary like {'col1': 'xxxxxx'} will result in
         "SELECT xxxxxx, {col2} FROM {table}"
 
+        The SQL is scanned once and only the variables actually present in it are looked up in the dictionary,
+        so the cost does not depend on the size of the dictionary.
+        Substituted values are not scanned again for variables.
+
         :return: String containing all the given text with substituted variables.
         """
+        parts = _compile_template(sql)
+        if len(parts) == 1:
+            return sql
 
-        for key in self.dictionary:
-            property_name = "{" + key + "}"
-            if sql.find(property_name) != -1:
-                property_value = str(self.dictionary[key])
-                sql = sql.replace(property_name, property_value)
-        return sql
+        result = []
+        for index, part in enumerate(parts):
+            if index % 2 == 0:
+                result.append(part)
+            elif part in self.dictionary:
+                result.append(str(self.dictionary[part]))
+            else:
+                result.append("{" + part + "}")
+        return "".join(result)
@@ -37,6 +37,9 @@ class Step(ABC):
     job_dir: pathlib.Path
     # parent Step
     parent: Step | None = None
+    # details about the run of the step set by runner_func (e.g. the outcome in each database of a SQL step),
+    # passed to the step result
+    details: str | None = None
 
 
 @dataclass
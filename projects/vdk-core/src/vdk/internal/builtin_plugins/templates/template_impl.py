@@ -1,6 +1,5 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
-import copy
 import logging
 import pathlib
 from typing import Dict
@@ -58,7 +57,7 @@ class TemplatesImpl(ITemplateRegistry, ITemplate):
         if database != "default":
             core_context = CoreContext(
                 self._core_context.plugin_registry,
-                copy.deepcopy(self._core_context.configuration),
+                self._core_context.configuration.copy_on_write(),
                 self._core_context.state.clone(),
             )
             core_context.configuration.override_value(
@@ -8,7 +8,10 @@ import logging
 import re
 import urllib.request
 
-import pkg_resources
+try:  # importlib.metadata is used in 3.8+, importlib_metadata is used in 3.7
+    from importlib import metadata
+except ImportError:
+    import importlib_metadata as metadata
 
 log = logging.getLogger(__name__)
 
@@ -47,10 +50,8 @@ class Package:
 
     def _get_current(self) -> tuple:
         try:
-            current = self._ver_to_tuple(
-                pkg_resources.get_distribution(self.pkg).version
-            )
-        except pkg_resources.DistributionNotFound:
+            current = self._ver_to_tuple(metadata.version(self.pkg))
+        except metadata.PackageNotFoundError:
             current = (-1,)
         return current
 
@@ -4,8 +4,6 @@ import logging
 import os
 
 import click
-from pkg_resources import DistributionNotFound
-from pkg_resources import get_distribution
 from vdk.api.plugin.hook_markers import GROUP_NAME
 from vdk.internal import vdk_build_info
 from vdk.internal.builtin_plugins.run.execution_environment import ExecutionEnvironment
@@ -23,8 +21,8 @@ def get_version(
     dist_name="vdk-core",
 ):  # Change default value if project is renamed and does not equal the setuptools metadata.name
     try:
-        return get_distribution(dist_name).version
-    except DistributionNotFound:  # pragma: no cover
+        return metadata.version(dist_name)
+    except metadata.PackageNotFoundError:  # pragma: no cover
         return "unknown"
 
 
@@ -8,7 +8,6 @@ from typing import List
 import click
 import click_log
 from click_plugins import with_plugins
-from pkg_resources import iter_entry_points
 from vdk.api.plugin.core_hook_spec import CoreHookSpecs
 from vdk.api.plugin.hook_markers import hookimpl
 from vdk.api.plugin.plugin_registry import IPluginRegistry
@@ -21,13 +20,14 @@ from vdk.internal.core.config import Configuration
 from vdk.internal.core.config import ConfigurationBuilder
 from vdk.internal.core.context import CoreContext
 from vdk.internal.core.statestore import StateStore
+from vdk.internal.plugin.entry_points import get_entry_points
 from vdk.internal.plugin.plugin import PluginRegistry
 
 log = logging.getLogger(__name__)
 
 
 # TODO: perhaps we do not need click-plugins and we can use vdk_initialize hook (and cli.add_command)
-@with_plugins(iter_entry_points("vdk.plugin.cli"))
+@with_plugins(get_entry_points("vdk.plugin.cli"))
 @click.group(
     help="""Command line tool for Data Jobs management.
 
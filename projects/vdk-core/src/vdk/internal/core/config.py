@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import dataclasses
 import logging
 from dataclasses import dataclass
 from dataclasses import field
@@ -92,6 +93,22 @@ class Configuration:
             object.__setattr__(self, "_sections", sections)
         else:
             object.__setattr__(self, "_sections", {"vdk": {}})
+        # sections whose entries are shared with copies of the configuration (see copy_on_write)
+        object.__setattr__(self, "_shared_sections", set())
+
+    def copy_on_write(self) -> Configuration:
+        """
+        Create a copy of the configuration, which shares the configuration entries with this configuration.
+        A section is copied only when a value in it is overridden (in either configuration),
+        so creating the copy is much cheaper than a deep copy and overriding a value does not affect the other one.
+
+        Returns:
+            Configuration: The copy of the configuration.
+        """
+        copy = Configuration(dict(self._sections))
+        self._shared_sections.update(self._sections.keys())
+        copy._shared_sections.update(self._sections.keys())
+        return copy
 
     def get_value(self, key: str, section: str | None = None) -> Any | None:
         """
@@ -121,17 +138,26 @@ class Configuration:
         key = _normalize_config_string(key).replace(f"{section}_", "")
         if section is None:
             if key in self._sections["vdk"]:
-                self._sections["vdk"][key].value = value
+                self.__set_entry_value("vdk", key, value)
         else:
             section = _normalize_config_string(section)
             if section in self._sections and key in self._sections[section].keys():
-                self._sections[section][key].value = value
+                self.__set_entry_value(section, key, value)
             else:
                 raise VdkConfigurationError(
                     "The value you are trying to override is not existing. "
                     f"Check the {section} section and {key} key, again!"
                 )
 
+    def __set_entry_value(self, section: str, key: str, value: Any):
+        entries = self._sections[section]
+        if section in self._shared_sections:
+            entries = dict(entries)
+            self._sections[section] = entries
+            self._shared_sections.discard(section)
+        # entries may be shared with copies of the configuration, so they are replaced instead of modified
+        entries[key] = dataclasses.replace(entries[key], value=value)
+
     def get_required_value(self, key: str, section: str | None = None) -> Any:
         """
         Retrieve the required value of a configuration key, optionally from a specific section or
@@ -0,0 +1,145 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+"""
+Discovery of the entry points (e.g. plugins) of the installed distributions.
+
+Scanning all installed distributions for entry points is slow in environments with many packages installed.
+So the vdk entry points found are cached in a file and reused until the installed distributions change.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+try:  # importlib.metadata is used in 3.8+, importlib_metadata is used in 3.7
+    from importlib import metadata
+except ImportError:
+    import importlib_metadata as metadata
+
+log = logging.getLogger(__name__)
+
+# The file in which the entry points are cached. Set to empty string to disable the cache.
+ENTRY_POINTS_CACHE_FILE = "VDK_ENTRY_POINTS_CACHE_FILE"
+
+# only entry points of groups with this prefix are cached
+_GROUP_PREFIX = "vdk."
+_DISTRIBUTION_SUFFIXES = (".dist-info", ".egg-info", ".egg-link", ".pth")
+
+# group -> list of (name, value) in the order of discovery
+_EntryPoints = Dict[str, List[Tuple[str, str]]]
+
+
+def get_distributions_fingerprint() -> str:
+    """
+    Compute a fingerprint of the installed distributions.
+    It changes when a distribution is installed, removed or re-installed (in any of the directories in sys.path).
+    Only the metadata directories are listed (not read), so it is much faster than loading the distributions.
+    """
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode())
+    for path in sys.path:
+        digest.update(b"\0" + path.encode("utf-8", "surrogateescape") + b"\0")
+        try:
+            entries = [
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in os.scandir(path or ".")
+                if entry.name.endswith(_DISTRIBUTION_SUFFIXES)
+            ]
+        except OSError:
+            continue
+        for name, modification_time in sorted(entries):
+            digest.update(f"{name}:{modification_time};".encode())
+    return digest.hexdigest()
+
+
+def _get_cache_file() -> str:
+    cache_file = os.environ.get(ENTRY_POINTS_CACHE_FILE)
+    if cache_file is not None:
+        return cache_file
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    environment_hash = hashlib.sha256(sys.prefix.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, "vdk", f"entry-points-{environment_hash}.json")
+
+
+def _scan_entry_points() -> _EntryPoints:
+    entry_points: _EntryPoints = {}
+    for dist in list(metadata.distributions()):
+        for ep in dist.entry_points:
+            if ep.group.startswith(_GROUP_PREFIX):
+                entry_points.setdefault(ep.group, []).append((ep.name, ep.value))
+    return entry_points
+
+
+def _read_cache(cache_file: str, fingerprint: str) -> _EntryPoints | None:
+    try:
+        with open(cache_file) as f:
+            content = json.load(f)
+        if content.get("fingerprint") == fingerprint:
+            return {
+                group: [tuple(ep) for ep in entry_points]
+                for group, entry_points in content["entry_points"].items()
+            }
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        log.debug(f"Could not read entry points cache {cache_file}: {e}")
+    return None
+
+
+def _write_cache(cache_file: str, fingerprint: str, entry_points: _EntryPoints):
+    try:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as f:
+            json.dump(dict(fingerprint=fingerprint, entry_points=entry_points), f)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        log.debug(f"Could not write entry points cache {cache_file}: {e}")
+
+
+_entry_points: _EntryPoints | None = None
+
+
+def _load_entry_points() -> _EntryPoints:
+    global _entry_points
+    if _entry_points is None:
+        cache_file = _get_cache_file()
+        if not cache_file:
+            _entry_points = _scan_entry_points()
+        else:
+            fingerprint = get_distributions_fingerprint()
+            _entry_points = _read_cache(cache_file, fingerprint)
+            if _entry_points is None:
+                _entry_points = _scan_entry_points()
+                _write_cache(cache_file, fingerprint, _entry_points)
+    return _entry_points
+
+
+def clear_cache():
+    """
+    Forget the entry points loaded in the current process (e.g. after installing new plugins).
+    """
+    global _entry_points
+    _entry_points = None
+
+
+def get_entry_points(group: str) -> list[metadata.EntryPoint]:
+    """
+    Get the entry points of the installed distributions in the given group.
+    Only groups starting with "vdk." are supported.
+
+    :param group: the entry point group, e.g. vdk.plugin.run
+    :return: the entry points in the same order as they would be found in importlib.metadata.distributions()
+    """
+    return [
+        metadata.EntryPoint(name=name, value=value, group=group)
+        for name, value in _load_entry_points().get(group, [])
+    ]
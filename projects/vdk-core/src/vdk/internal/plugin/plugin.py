@@ -3,6 +3,7 @@
 import logging
 import os
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 from vdk.api.plugin import hook_markers
@@ -73,6 +74,13 @@ class PluginRegistry(IPluginRegistry):
     def list_plugins(self) -> List[Tuple[str, str]]:
         return self.__plugin_manager.list_name_plugin()
 
+    def get_plugins_version(self) -> Optional[int]:
+        """
+        The version of the registered plugins. It changes whenever a plugin or hook spec is added or removed.
+        None if the plugin manager does not track it.
+        """
+        return getattr(self.__plugin_manager, "plugins_version", None)
+
     def has_plugin(self, name: str) -> bool:
         return self.__plugin_manager.has_plugin(name)
 
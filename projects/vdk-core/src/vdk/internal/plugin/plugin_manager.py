@@ -1,11 +1,59 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 from pluggy import PluginManager
+from vdk.internal.plugin.entry_points import get_entry_points
 
 
 class VdkPluginManager(PluginManager):
     """
     Abstract away direct access (in terms of imports) to pluggy PluginManager.
+    It also keeps a version of the registered plugins which changes whenever a plugin or hook spec is added or removed,
+    so that anything derived from the registered hook implementations can be cached until then.
     """
 
-    pass
+    def __init__(self, project_name: str):
+        super().__init__(project_name)
+        self._plugins_version = 0
+
+    @property
+    def plugins_version(self) -> int:
+        return self._plugins_version
+
+    def register(self, plugin: object, name: str = None):
+        try:
+            return super().register(plugin, name)
+        finally:
+            self._plugins_version += 1
+
+    def unregister(self, plugin: object = None, name: str = None):
+        try:
+            return super().unregister(plugin, name)
+        finally:
+            self._plugins_version += 1
+
+    def add_hookspecs(self, module_or_class: object) -> None:
+        try:
+            super().add_hookspecs(module_or_class)
+        finally:
+            self._plugins_version += 1
+
+    def load_setuptools_entrypoints(self, group: str, name: str = None) -> int:
+        """
+        Load modules from querying the specified setuptools ``group``.
+        Same as the pluggy implementation but the entry points are discovered using the (cached) vdk entry points.
+
+        :return: The number of plugins loaded by this call.
+        """
+        count = 0
+        for ep in get_entry_points(group):
+            if (
+                (name is not None and ep.name != name)
+                # already registered
+                or self.get_plugin(ep.name)
+                or self.is_blocked(ep.name)
+            ):
+                continue
+            plugin = ep.load()
+            self.register(plugin, name=ep.name)
+            count += 1
+        return count
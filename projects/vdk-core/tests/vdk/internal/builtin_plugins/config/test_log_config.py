@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 import logging
 import pathlib
+import threading
 from unittest import mock
 from unittest.mock import patch
 
@@ -10,6 +11,7 @@ from vdk.api.plugin.plugin_registry import IPluginRegistry
 from vdk.internal.builtin_plugins.config import log_config
 from vdk.internal.builtin_plugins.config import vdk_config
 from vdk.internal.builtin_plugins.config.log_config import _parse_log_level_module
+from vdk.internal.builtin_plugins.config.log_config import BackgroundLogHandler
 from vdk.internal.builtin_plugins.config.log_config import configure_loggers
 from vdk.internal.builtin_plugins.config.log_config import LoggingPlugin
 from vdk.internal.builtin_plugins.config.log_config import SYSLOG_ENABLED
@@ -110,6 +112,51 @@ def test_configure_logger():
             assert configured_loggers["foo.bar"]["level"] == "ERROR"
 
 
+def test_background_log_handler():
+    records = []
+    threads = set()
+
+    class RecordingHandler(logging.Handler):
+        def emit(self, record):
+            records.append(self.format(record))
+            threads.add(threading.current_thread())
+
+    handler = BackgroundLogHandler([RecordingHandler()])
+    logger = logging.getLogger("test_background_log_handler")
+    logger.addHandler(handler)
+    try:
+        arguments = ["a"]
+        logger.warning("message %s", arguments)
+        # arguments changed after logging must not change the logged message
+        arguments.append("b")
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert records == ["message ['a']"]
+    assert threading.current_thread() not in threads
+
+
+def test_configure_logger_queue_enabled():
+    root_logger = logging.getLogger()
+    original_handlers = list(root_logger.handlers)
+    try:
+        with patch.object(log_config, "_set_already_configured"):
+            configure_loggers(
+                job_name="job-name", attempt_id="attempt-id", log_queue_enabled=True
+            )
+        assert [type(h) for h in root_logger.handlers] == [BackgroundLogHandler]
+        assert [type(h) for h in root_logger.handlers[0].target_handlers] == [
+            logging.StreamHandler
+        ]
+    finally:
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+            handler.close()
+        for handler in original_handlers:
+            root_logger.addHandler(handler)
+
+
 def test_log_plugin_exception():
     print("This")
     with mock.patch(
@@ -0,0 +1,140 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import timeit
+from typing import Container
+from typing import Optional
+
+import pytest
+from vdk.api.plugin.connection_hook_spec import ConnectionHookSpec
+from vdk.api.plugin.hook_markers import hookimpl
+from vdk.internal.builtin_plugins.connection.connection_hooks import (
+    ConnectionHookSpecFactory,
+)
+from vdk.internal.builtin_plugins.connection.decoration_cursor import ManagedOperation
+from vdk.internal.plugin.plugin import PluginRegistry
+
+log = logging.getLogger(__name__)
+
+
+class RecordingPlugin:
+    def __init__(self, name: str, calls: list):
+        self._name = name
+        self._calls = calls
+
+    @hookimpl
+    def db_connection_validate_operation(
+        self, operation: str, parameters: Optional[Container]
+    ) -> None:
+        self._calls.append((self._name, "validate", operation))
+
+    @hookimpl
+    def db_connection_before_operation(self, operation: ManagedOperation) -> None:
+        self._calls.append((self._name, "before", operation.get_operation()))
+
+
+class TryLastPlugin(RecordingPlugin):
+    @hookimpl(trylast=True)
+    def db_connection_before_operation(self, operation: ManagedOperation) -> None:
+        super().db_connection_before_operation(operation)
+
+
+class NoopPlugin:
+    @hookimpl
+    def db_connection_validate_operation(
+        self, operation: str, parameters: Optional[Container]
+    ) -> None:
+        pass
+
+    @hookimpl
+    def db_connection_before_operation(self, operation: ManagedOperation) -> None:
+        pass
+
+
+def _new_plugin_registry(
+    plugins_count: int, calls: list = None, plugin_class=RecordingPlugin
+) -> PluginRegistry:
+    plugin_registry = PluginRegistry()
+    plugin_registry.add_hook_specs(ConnectionHookSpec)
+    for i in range(plugins_count):
+        plugin = (
+            RecordingPlugin(f"plugin{i}", calls)
+            if plugin_class is RecordingPlugin
+            else plugin_class()
+        )
+        plugin_registry.load_plugin_with_hooks_impl(plugin, f"plugin{i}")
+    return plugin_registry
+
+
+def _invoke_hooks(hook_spec, operation: ManagedOperation):
+    # the same way ManagedCursor invokes them for each query
+    if hook_spec.db_connection_validate_operation.get_hookimpls():
+        hook_spec.db_connection_validate_operation(
+            operation=operation.get_operation(), parameters=None
+        )
+    if hook_spec.db_connection_before_operation.get_hookimpls():
+        hook_spec.db_connection_before_operation(operation=operation)
+
+
+def test_compiled_hooks_called_in_pluggy_order():
+    calls = []
+    plugin_registry = _new_plugin_registry(3, calls)
+    plugin_registry.load_plugin_with_hooks_impl(
+        TryLastPlugin("last", calls), "try-last"
+    )
+    operation = ManagedOperation("select 1", None)
+
+    _invoke_hooks(plugin_registry.hook(), operation)
+    expected_calls = list(calls)
+    calls.clear()
+    _invoke_hooks(
+        ConnectionHookSpecFactory(plugin_registry).get_connection_hook_spec(),
+        operation,
+    )
+
+    assert calls == expected_calls
+
+
+def test_compiled_hooks_invalidated_when_plugins_change():
+    calls = []
+    plugin_registry = _new_plugin_registry(1, calls)
+    factory = ConnectionHookSpecFactory(plugin_registry)
+    operation = ManagedOperation("select 1", None)
+
+    hook_spec = factory.get_connection_hook_spec()
+    assert factory.get_connection_hook_spec() is hook_spec
+
+    plugin_registry.load_plugin_with_hooks_impl(
+        RecordingPlugin("new", calls), "new-plugin"
+    )
+    _invoke_hooks(factory.get_connection_hook_spec(), operation)
+
+    assert ("new", "before", "select 1") in calls
+    assert ("plugin0", "before", "select 1") in calls
+
+
+@pytest.mark.parametrize("plugins_count", [0, 1, 5])
+def test_compiled_hooks_per_query_overhead(plugins_count):
+    plugin_registry = _new_plugin_registry(plugins_count, plugin_class=NoopPlugin)
+    factory = ConnectionHookSpecFactory(plugin_registry)
+    operation = ManagedOperation("select 1", None)
+    queries = 10000
+
+    def invoke_pluggy_hooks():
+        # what was done for each query before the hooks were compiled
+        plugin_registry.has_plugin("DefaultConnectionHookImpl")
+        _invoke_hooks(plugin_registry.hook(), operation)
+
+    pluggy_seconds = timeit.timeit(invoke_pluggy_hooks, number=queries)
+    compiled_seconds = timeit.timeit(
+        lambda: _invoke_hooks(factory.get_connection_hook_spec(), operation),
+        number=queries,
+    )
+
+    log.info(
+        f"Per query hooks overhead with {plugins_count} implementations: "
+        f"pluggy {pluggy_seconds / queries * 1e6:.2f}us, "
+        f"compiled {compiled_seconds / queries * 1e6:.2f}us"
+    )
+    # a generous margin so that the test is not flaky
+    assert compiled_seconds < pluggy_seconds * 1.5
@@ -1,6 +1,7 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 import logging
+import sqlite3
 from typing import Tuple
 from unittest.mock import MagicMock
 
@@ -50,6 +51,69 @@ def test_execute_query_fail_to_fetch():
         managed_conn.execute_query("select 1")
 
 
+def test_execute_statements():
+    class SqliteConnection(ManagedConnectionBase):
+        def _connect(self) -> PEP249Connection:
+            return sqlite3.connect(":memory:")
+
+    managed_conn = SqliteConnection(log)
+    results = managed_conn.execute_statements(
+        "create table t (a text); -- no results\n"
+        "insert into t values ('a;b');\n"
+        "select a from t;"
+    )
+
+    assert [r.statement for r in results] == [
+        "create table t (a text)",
+        "-- no results\ninsert into t values ('a;b')",
+        "select a from t",
+    ]
+    assert [r.result for r in results] == [[], [], [("a;b",)]]
+    assert all(r.duration >= 0 for r in results)
+
+
+def test_execute_statements_uses_execute_query_override():
+    class CommittingSqliteConnection(ManagedConnectionBase):
+        def __init__(self):
+            super().__init__(log)
+            self.executed_queries = []
+
+        def _connect(self) -> PEP249Connection:
+            return sqlite3.connect(":memory:")
+
+        def execute_query(self, query: str):
+            try:
+                self.executed_queries.append(query)
+                return super().execute_query(query)
+            finally:
+                self.commit()
+
+    managed_conn = CommittingSqliteConnection()
+    results = managed_conn.execute_statements(
+        "create table t (a text); insert into t values ('a');"
+    )
+
+    assert managed_conn.executed_queries == [
+        "create table t (a text)",
+        "insert into t values ('a')",
+    ]
+    assert len(results) == 2
+    # the override committed the insert, so it is visible after a rollback
+    managed_conn.connect().rollback()
+    assert managed_conn.execute_query("select a from t") == [("a",)]
+
+
+def test_execute_statements_with_multiple_statements_support():
+    managed_conn, mock_raw_conn = get_test_managed_and_raw_connection()
+    mock_cursor = MagicMock(spec=PEP249Cursor)
+    mock_raw_conn.cursor.return_value = mock_cursor
+    managed_conn._supports_multiple_statements = lambda: True
+
+    results = managed_conn.execute_statements("select 1; select 2;")
+
+    assert [r.statement for r in results] == ["select 1;\nselect 2"]
+
+
 def test_execute_close_reopen():
     managed_conn, mock_raw_conn = get_test_managed_and_raw_connection()
 
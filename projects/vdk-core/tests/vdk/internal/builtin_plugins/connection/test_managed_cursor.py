@@ -16,6 +16,8 @@ from vdk.internal.builtin_plugins.connection.execution_cursor import (
     ExecuteOperationResult,
 )
 from vdk.internal.builtin_plugins.connection.execution_cursor import ExecutionCursor
+from vdk.internal.builtin_plugins.connection.managed_cursor import ManagedCursor
+from vdk.internal.builtin_plugins.connection.managed_cursor import QueryLogging
 from vdk.internal.builtin_plugins.connection.recovery_cursor import RecoveryCursor
 from vdk.plugin.test_utils.util_funcs import create_mock_managed_cursor
 from vdk.plugin.test_utils.util_funcs import populate_mock_managed_cursor_no_hook
@@ -216,6 +218,39 @@ def test_query_timing_failed_query(caplog):
     assert "Failed query duration 00h:00m:" in str(caplog.records)
 
 
+def test_query_logging_truncates_long_queries(caplog):
+    caplog.set_level(logging.INFO)
+    mock_native_cursor = Mock()
+    managed_cursor = ManagedCursor(
+        mock_native_cursor,
+        logging.getLogger(),
+        managed_database_connection=Mock(spec=IDatabaseManagedConnection),
+        query_logging=QueryLogging(max_length=10),
+    )
+
+    managed_cursor.execute("select 1234567890 from some_table")
+
+    assert "Executing query:\nselect 123\n... (truncated 23 more characters)" in (
+        caplog.text
+    )
+    mock_native_cursor.execute.assert_not_called()  # executed by the managed connection
+
+
+def test_query_logging_sampled_out_queries_logged_on_debug(caplog):
+    caplog.set_level(logging.INFO)
+    managed_cursor = ManagedCursor(
+        Mock(),
+        logging.getLogger(),
+        managed_database_connection=Mock(spec=IDatabaseManagedConnection),
+        query_logging=QueryLogging(sampling_rate=0),
+    )
+
+    managed_cursor.execute("select 1")
+
+    assert "Executing query:" not in caplog.text
+    assert "Executing query SUCCEEDED" in caplog.text
+
+
 @pytest.fixture
 def managed_connection():
     return IDatabaseManagedConnection()
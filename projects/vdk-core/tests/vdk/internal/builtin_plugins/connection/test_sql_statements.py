@@ -0,0 +1,58 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+from vdk.internal.builtin_plugins.connection.sql_statements import DIALECT_IMPALA
+from vdk.internal.builtin_plugins.connection.sql_statements import DIALECT_POSTGRES
+from vdk.internal.builtin_plugins.connection.sql_statements import (
+    split_sql_statements,
+)
+
+
+@pytest.mark.parametrize(
+    "sql, statements",
+    [
+        ("select 1", ("select 1",)),
+        ("select 1;\n select 2 ;\n", ("select 1", "select 2")),
+        (";; select 1;;", ("select 1",)),
+        ("", ()),
+        ("-- only a comment;\n/* and; another */", ()),
+        (
+            "-- drop; it\ndrop table t; /* create; it */ create table t (a int)",
+            ("-- drop; it\ndrop table t", "/* create; it */ create table t (a int)"),
+        ),
+        ("select 'a;b', 'it''s;'; select 2", ("select 'a;b', 'it''s;'", "select 2")),
+        ('select "a;b" from t; select `c;d`', ('select "a;b" from t', "select `c;d`")),
+        ("select 'unterminated; select 2", ("select 'unterminated; select 2",)),
+        ("select 1 /* unterminated; select 2", ("select 1 /* unterminated; select 2",)),
+    ],
+)
+def test_split_sql_statements(sql, statements):
+    assert split_sql_statements(sql) == statements
+
+
+def test_split_sql_statements_with_dollar_quotes():
+    sql = (
+        "create function f() returns int as $$ begin; return 1; end; $$ language plpgsql;"
+        "create function g() returns int as $body$ select 'a;$$'; $body$ language sql;"
+        "select 1"
+    )
+    assert split_sql_statements(sql, DIALECT_POSTGRES) == (
+        "create function f() returns int as $$ begin; return 1; end; $$ language plpgsql",
+        "create function g() returns int as $body$ select 'a;$$'; $body$ language sql",
+        "select 1",
+    )
+    # dollar quotes are not special in ANSI SQL
+    assert len(split_sql_statements(sql)) > 3
+
+
+def test_split_sql_statements_with_backslash_escapes():
+    sql = r"select 'it\'s; quoted'; select 2"
+    assert split_sql_statements(sql, DIALECT_IMPALA) == (
+        r"select 'it\'s; quoted'",
+        "select 2",
+    )
+    # in ANSI SQL the backslash does not escape the quote
+    assert split_sql_statements(r"select 'a\'; select 2") == (
+        r"select 'a\'",
+        "select 2",
+    )
@@ -40,6 +40,18 @@ def test_run_when_step_succeeds():
     assert result.blamee is None
 
 
+def test_run_step_details_are_in_step_result():
+    def runner_func_with_details(step: Step, job_input: IJobInput) -> bool:
+        step.details = "some details"
+        return True
+
+    job_builder = DataJobBuilder()
+    job_builder.add_step_func(runner_func_with_details)
+    result = job_builder.build().run()
+    assert result.is_success()
+    assert result.steps_list[0].details == "some details"
+
+
 def test_run_job_with_default_hook():
     execution_result: ExecutionResult = None
 
@@ -0,0 +1,163 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import pathlib
+import threading
+import time
+
+import pytest
+from vdk.internal.builtin_plugins.connection.sql_statements import StatementResult
+from vdk.internal.builtin_plugins.run.file_based_step import SqlStepDatabasesError
+from vdk.internal.builtin_plugins.run.file_based_step import SqlStepFileReader
+from vdk.internal.builtin_plugins.run.file_based_step import StepFuncFactory
+from vdk.internal.builtin_plugins.run.file_based_step import TYPE_SQL
+from vdk.internal.builtin_plugins.run.step import Step
+
+
+class FakeConnection:
+    def __init__(self, job_input: "FakeJobInput", database: str):
+        self._job_input = job_input
+        self._database = database
+
+    def execute_statements(self, sql: str):
+        self._job_input.executed.append((self._database, sql))
+        return [StatementResult(s, 0.1) for s in sql.split(";")]
+
+
+class FakeJobInput:
+    def __init__(self, failing_databases=(), query_seconds=0.0):
+        self.executed = []
+        self.opened = []
+        self.max_concurrent_queries = 0
+        self._concurrent_queries = 0
+        self._lock = threading.Lock()
+        self._failing_databases = failing_databases
+        self._query_seconds = query_seconds
+
+    def _substitute_query_params(self, sql: str):
+        return sql.replace("{db}", "second")
+
+    def get_managed_connection(self, database=None):
+        self.opened.append(database)
+        return FakeConnection(self, database)
+
+    def execute_query(self, sql: str, database: str = None):
+        with self._lock:
+            self._concurrent_queries += 1
+            self.max_concurrent_queries = max(
+                self.max_concurrent_queries, self._concurrent_queries
+            )
+        try:
+            time.sleep(self._query_seconds)
+            self.executed.append((database, sql))
+            if database in self._failing_databases:
+                raise ValueError(f"query failed in {database}")
+            return [[database]]
+        finally:
+            with self._lock:
+                self._concurrent_queries -= 1
+
+
+def sql_step(tmp_path: pathlib.Path, content: str) -> Step:
+    file_path = tmp_path / "10_step.sql"
+    file_path.write_text(content)
+    return Step(
+        name=file_path.name,
+        type=TYPE_SQL,
+        runner_func=StepFuncFactory.run_sql_step,
+        file_path=file_path,
+        job_dir=tmp_path,
+    )
+
+
+def test_run_sql_step_sequentially(tmp_path):
+    step = sql_step(tmp_path, "[first]\n[{db}]\nselect 1\n")
+    job_input = FakeJobInput(failing_databases=["first"])
+
+    with pytest.raises(ValueError):
+        StepFuncFactory.run_sql_step(step, job_input)
+
+    # stops at the first failure
+    assert job_input.executed == [("first", "select 1\n")]
+    assert "first: failed with ValueError: query failed in first" in step.details
+
+
+def test_run_sql_step_in_parallel(tmp_path):
+    step = sql_step(tmp_path, "[first]\n[{db}]\n[third]\nselect 1\n")
+    job_input = FakeJobInput(query_seconds=0.1)
+
+    assert StepFuncFactory.run_sql_step(step, job_input, max_parallel_databases=2)
+
+    assert sorted(job_input.executed) == [
+        ("first", "select 1\n"),
+        ("second", "select 1\n"),
+        ("third", "select 1\n"),
+    ]
+    assert job_input.opened == ["first", "second", "third"]
+    assert job_input.max_concurrent_queries == 2
+    assert [outcome.split(" in ")[0] for outcome in step.details.split("; ")] == [
+        "Query results by database: first: succeeded",
+        "second: succeeded",
+        "third: succeeded",
+    ]
+
+
+def test_run_sql_step_in_parallel_with_failures(tmp_path):
+    step = sql_step(tmp_path, "[first]\n[{db}]\n[third]\nselect 1\n")
+    job_input = FakeJobInput(failing_databases=["first", "third"])
+
+    with pytest.raises(SqlStepDatabasesError) as error:
+        StepFuncFactory.run_sql_step(step, job_input, max_parallel_databases=4)
+
+    assert len(job_input.executed) == 3
+    assert [
+        (r.database, r.result, str(r.exception) if r.exception else None)
+        for r in error.value.results
+    ] == [
+        ("first", None, "query failed in first"),
+        ("second", [["second"]], None),
+        ("third", None, "query failed in third"),
+    ]
+    assert "failed in 2 of 3 databases" in str(error.value)
+    assert "second: succeeded" in step.details
+    assert "third: failed with ValueError" in step.details
+
+
+def test_sql_step_file_cached_until_modified(tmp_path):
+    step = sql_step(tmp_path, "[first]\nselect 1\n")
+    assert SqlStepFileReader.read(step.file_path) is SqlStepFileReader.read(
+        step.file_path
+    )
+
+    step.file_path.write_text("[first]\n[second]\nselect 2\n")
+    sql_step_file = SqlStepFileReader.read(step.file_path)
+    assert sql_step_file.databases == ("first", "second")
+    assert sql_step_file.query == "select 2\n"
+
+
+def test_run_sql_step_split_statements(tmp_path):
+    step = sql_step(tmp_path, "[first]\n[{db}]\nselect 1;select '{db}'\n")
+    job_input = FakeJobInput()
+
+    assert StepFuncFactory.run_sql_step(step, job_input, split_statements=True)
+
+    # the query parameters are substituted before the statements are split
+    assert job_input.executed == [
+        ("first", "select 1;select 'second'\n"),
+        ("second", "select 1;select 'second'\n"),
+    ]
+    # each statement is timed separately in the step details
+    assert step.details.count("statement 1 took 0.100 seconds") == 2
+    assert step.details.count("statement 2 took 0.100 seconds") == 2
+
+
+def test_run_sql_step_split_statements_in_default_database(tmp_path):
+    step = sql_step(tmp_path, "select 1;select 2")
+    job_input = FakeJobInput()
+
+    assert StepFuncFactory.run_sql_step(step, job_input, split_statements=True)
+
+    assert job_input.executed == [(None, "select 1;select 2")]
+    assert step.details == (
+        "Query results: statement 1 took 0.100 seconds, "
+        "statement 2 took 0.100 seconds"
+    )
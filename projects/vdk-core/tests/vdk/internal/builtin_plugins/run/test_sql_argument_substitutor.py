@@ -27,3 +27,22 @@ def test_sql_argument_substitutor_should_change_original_sql_length_after_substi
     substitutor, sql, expected_sql
 ):
     assert substitutor.substitute(sql) == expected_sql
+
+
+def test_sql_argument_substitutor_does_not_substitute_inside_substituted_values():
+    substitutor = SqlArgumentSubstitutor({"a": "{b}", "b": "value"})
+
+    assert substitutor.substitute("select {a}, {b}") == "select {b}, value"
+
+
+def test_sql_argument_substitutor_reuses_compiled_template_with_different_values():
+    sql = "select * from {db}.{table}"
+
+    assert (
+        SqlArgumentSubstitutor({"db": "one", "table": "t"}).substitute(sql)
+        == "select * from one.t"
+    )
+    assert (
+        SqlArgumentSubstitutor({"db": "two", "table": "t"}).substitute(sql)
+        == "select * from two.t"
+    )
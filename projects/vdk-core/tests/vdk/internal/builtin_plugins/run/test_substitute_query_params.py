@@ -1,6 +1,7 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from vdk.internal.builtin_plugins.job_properties.inmemproperties import (
     InMemPropertiesServiceClient,
@@ -279,3 +280,36 @@ def test_substitute_params_from_props_and_args():
     result = job_input._substitute_query_params(query).strip("\n")
 
     assert result == "select * from schema_name.table_name"
+
+
+def test_substitute_params_reuses_properties_until_set():
+    properties_router = _get_properties_in_memory()
+    job_input = JobInput(
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        JobArguments(dict(param_from_args="table_name")),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        properties_router,
+        MagicMock(),
+    )
+    job_input.set_all_properties(dict(param_from_props="schema_name"))
+    query = "select * from {param_from_props}.{param_from_args}"
+
+    with patch.object(
+        properties_router,
+        "get_all_properties",
+        wraps=properties_router.get_all_properties,
+    ) as get_all_properties:
+        for _ in range(3):
+            result = job_input._substitute_query_params(query).strip("\n")
+            assert result == "select * from schema_name.table_name"
+        assert get_all_properties.call_count == 1
+
+        job_input.set_all_properties(dict(param_from_props="other_schema"))
+        result = job_input._substitute_query_params(query).strip("\n")
+
+        assert result == "select * from other_schema.table_name"
+        assert get_all_properties.call_count == 2
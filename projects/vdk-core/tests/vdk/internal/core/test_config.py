@@ -173,6 +173,22 @@ def test_overwrite_values(section, key, initial_value, new_value, expected_defau
     assert config.is_default(key, section) == expected_default
 
 
+def test_copy_on_write_isolation():
+    builder = ConfigurationBuilder()
+    builder.add("db_default_type", "impala")
+    builder.add("key", "value", section="section1")
+    config = builder.build()
+
+    copy = config.copy_on_write()
+    copy.override_value("db_default_type", "trino", "vdk")
+    config.override_value("key", "new_value", "section1")
+
+    assert config.get_value("db_default_type") == "impala"
+    assert copy.get_value("db_default_type") == "trino"
+    assert config.get_value("key", "section1") == "new_value"
+    assert copy.get_value("key", "section1") == "value"
+
+
 def test_list_sections_and_keys():
     builder = ConfigurationBuilder()
     builder.add("key1", 100, section="section1")
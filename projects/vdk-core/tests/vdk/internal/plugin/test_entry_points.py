@@ -0,0 +1,74 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from vdk.internal.plugin import entry_points
+from vdk.internal.plugin.entry_points import ENTRY_POINTS_CACHE_FILE
+from vdk.internal.plugin.entry_points import get_distributions_fingerprint
+from vdk.internal.plugin.entry_points import get_entry_points
+from vdk.internal.plugin.entry_points import metadata
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    cache_file = str(tmp_path / "entry-points.json")
+    entry_points.clear_cache()
+    with patch.dict(os.environ, {ENTRY_POINTS_CACHE_FILE: cache_file}):
+        yield cache_file
+    entry_points.clear_cache()
+
+
+def _expected_entry_points(group):
+    return [
+        (ep.name, ep.value)
+        for dist in metadata.distributions()
+        for ep in dist.entry_points
+        if ep.group == group
+    ]
+
+
+def test_get_entry_points_same_as_installed(cache_file):
+    actual = [(ep.name, ep.value) for ep in get_entry_points("vdk.plugin.run")]
+
+    assert actual == _expected_entry_points("vdk.plugin.run")
+    assert os.path.exists(cache_file)
+
+
+def test_get_entry_points_from_cache(cache_file):
+    get_entry_points("vdk.plugin.run")
+    entry_points.clear_cache()
+
+    with patch.object(metadata, "distributions") as distributions:
+        actual = [(ep.name, ep.value) for ep in get_entry_points("vdk.plugin.run")]
+
+    distributions.assert_not_called()
+    assert actual == _expected_entry_points("vdk.plugin.run")
+
+
+def test_get_entry_points_cache_invalidated_on_fingerprint_change(cache_file):
+    with open(cache_file, "w") as f:
+        json.dump(
+            dict(
+                fingerprint="outdated",
+                entry_points={"vdk.plugin.run": [["stale", "stale.module"]]},
+            ),
+            f,
+        )
+
+    actual = [ep.name for ep in get_entry_points("vdk.plugin.run")]
+
+    assert "stale" not in actual
+    with open(cache_file) as f:
+        assert json.load(f)["fingerprint"] == get_distributions_fingerprint()
+
+
+def test_get_entry_points_corrupted_cache(cache_file):
+    with open(cache_file, "w") as f:
+        f.write("not json")
+
+    actual = [(ep.name, ep.value) for ep in get_entry_points("vdk.plugin.run")]
+
+    assert actual == _expected_entry_points("vdk.plugin.run")
@@ -0,0 +1,46 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+"""
+Startup benchmark of the vdk CLI based on "python -X importtime".
+"""
+import logging
+import subprocess
+import sys
+from typing import Dict
+
+log = logging.getLogger(__name__)
+
+# generous limit so that the test is not flaky on slow machines but still catches big regressions
+MAX_CLI_ENTRY_IMPORT_SECONDS = 3
+
+# modules which are slow to import and must not be imported on startup
+SLOW_MODULES = ["pkg_resources"]
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """
+    :return: the cumulative import time in microseconds for each module imported when importing the module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+def test_cli_entry_import_time():
+    import_times = _import_times("vdk.internal.cli_entry")
+
+    slowest = sorted(import_times.items(), key=lambda x: x[1], reverse=True)[:10]
+    log.info(f"Slowest imports (cumulative microseconds): {slowest}")
+    for module in SLOW_MODULES:
+        assert module not in import_times, f"{module} is imported on startup"
+    assert import_times["vdk.internal.cli_entry"] < MAX_CLI_ENTRY_IMPORT_SECONDS * 1e6
@@ -14,7 +14,7 @@ class TestImportErrors(unittest.TestCase):
         clear_intermediate_errors()
 
     @patch(
-        "pluggy._manager.PluginManager.load_setuptools_entrypoints",
+        "vdk.internal.plugin.plugin_manager.VdkPluginManager.load_setuptools_entrypoints",
         side_effect=ImportError("Test import error."),
     )
     @patch(
@@ -42,7 +42,7 @@ class TestImportErrors(unittest.TestCase):
             patched_exit.assert_called_once_with(1)
 
     @patch(
-        "pluggy._manager.PluginManager.load_setuptools_entrypoints",
+        "vdk.internal.plugin.plugin_manager.VdkPluginManager.load_setuptools_entrypoints",
         side_effect=Exception("Test general error."),
     )
     @patch(
@@ -73,7 +73,7 @@ class TestImportErrors(unittest.TestCase):
             patched_exit.assert_called_once_with(1)
 
     @patch(
-        "pluggy._manager.PluginManager.load_setuptools_entrypoints",
+        "vdk.internal.plugin.plugin_manager.VdkPluginManager.load_setuptools_entrypoints",
         side_effect=Exception("Test general error."),
     )
     @patch("vdk.internal.cli_entry.build_configuration")
@@ -203,6 +203,15 @@ class Config:
             self.get_value("CHECK_TEMPLATE_EXECUTION", "true", False)
         )
 
+        """
+        Flag is used to check the state of the job deployment and executions while waiting for them
+        with API calls made from the heartbeat process instead of running vdkcli for each check.
+        The job is still created, deployed and started with vdkcli. It defaults to False.
+        """
+        self.use_api_client = self._string_to_bool(
+            self.get_value("VDK_HEARTBEAT_USE_API_CLIENT", "false", False)
+        )
+
         """
         Set file path to the JUNIT XML Test report file. If left empty , the file will not be generated.
         The file does not need to exists but all parent directories must exist.
@@ -7,10 +7,20 @@ import os
 import shutil
 import subprocess
 import tempfile
-import time
 from datetime import datetime
+from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Optional
 
+from taurus_datajob_api import ApiException
+from vdk.internal.control.configuration.vdk_config import VDKConfig
+from vdk.internal.control.rest_lib.factory import ApiClientFactory
+from vdk.internal.control.rest_lib.response_cache import HTTP_NOT_MODIFIED
+from vdk.internal.control.utils import output_printer
+from vdk.internal.control.utils.polling import Backoff
+from vdk.internal.control.utils.polling import poll_until
+from vdk.internal.control.utils.polling import PollTimeoutError
 from vdk.internal.heartbeat.config import Config
 from vdk.internal.heartbeat.tracing import LogDecorator
 
@@ -21,10 +31,14 @@ class JobController:
     """
     Make sure to deploy data job.
     It uses vdkcli in order to test it as well.
+    If config.use_api_client is set, the state of the job is checked with API calls instead.
     """
 
     def __init__(self, config: Config):
         self.config = config
+        self.__api_client_factory: Optional[ApiClientFactory] = None
+        # the last response (ETag, data) of each API call, for conditional requests
+        self.__api_responses: Dict[str, tuple] = {}
         control_api_url_message = (
             config.control_api_url
             or "Not set (default from VDK's configuration will be used)"
@@ -63,6 +77,37 @@ class JobController:
         else:
             return []
 
+    def _get_api_client_factory(self) -> ApiClientFactory:
+        # created on first use, since it reads the access token saved by vdkcli login
+        if self.__api_client_factory is None:
+            self.__api_client_factory = ApiClientFactory(
+                self.config.control_api_url or VDKConfig().control_service_rest_api_url
+            )
+        return self.__api_client_factory
+
+    def _read_api(self, key: str, request: Callable[[Dict[str, str]], object]):
+        """
+        Sends a GET API request with If-None-Match header set to the ETag of its previous response (if any)
+        and returns the previous data if the server replies that it is not modified.
+        """
+        etag, data = self.__api_responses.get(key, (None, None))
+        try:
+            response = request({"If-None-Match": etag} if etag else {})
+        except ApiException as e:
+            if etag and e.status == HTTP_NOT_MODIFIED:
+                return data
+            raise
+        self.__api_responses[key] = (
+            (response.headers or {}).get("ETag"),
+            response.data,
+        )
+        return response.data
+
+    @staticmethod
+    def _to_json(data) -> List[dict]:
+        # the same values which vdkcli prints with -o json
+        return json.loads(output_printer.json_format(data))
+
     def _execute(self, command):
         # base_command = [f"python", "-m", "vdk.internal.control.main"]
         base_command = [self.config.vdk_command_name]
@@ -184,12 +229,33 @@ class JobController:
             f"Team {self.config.job_team}, Job: {self.config.job_name} Logs:\n {logs}"
         )
 
-    @LogDecorator(log)
-    def check_deployments(self, enabled=True, timeout_seconds=600):
-        start = time.time()
-        deployments = None
-        while not deployments and time.time() - start < timeout_seconds:
-            deployments = self._execute(
+    def _list_deployments(self) -> List[dict]:
+        if self.config.use_api_client:
+            deployments = self._read_api(
+                "deployment_list",
+                lambda headers: self._get_api_client_factory()
+                .get_deploy_api()
+                .deployment_list_with_http_info(
+                    team_name=self.config.job_team,
+                    job_name=self.config.job_name,
+                    _headers=headers,
+                ),
+            )
+            return self._to_json(
+                [
+                    dict(
+                        job_name=self.config.job_name,
+                        job_version=d.job_version,
+                        last_deployed_by=d.last_deployed_by,
+                        last_deployed_date=d.last_deployed_date,
+                        python_version=d.python_version,
+                        enabled=d.enabled,
+                    )
+                    for d in deployments or []
+                ]
+            )
+        return json.loads(
+            self._execute(
                 [
                     "deploy",
                     "--show",
@@ -202,16 +268,31 @@ class JobController:
                 ]
                 + self.__get_rest_api_url_arg()
             )
-            deployments = json.loads(deployments)
+        )
+
+    @LogDecorator(log)
+    def check_deployments(self, enabled=True, timeout_seconds=600):
+        def on_wait(deployments, delay):
             if not deployments:
-                log.info("No deployments so far. Will wait 30 seconds and try again.")
-                time.sleep(30)
-            elif deployments[0]["enabled"] != enabled:
                 log.info(
-                    "Job deployment should be disabled, but is still enabled. Will wait for 30 seconds and try again."
+                    f"No deployments so far. Will wait {delay:.0f} seconds and try again."
                 )
-                time.sleep(30)
-                deployments = None
+            else:
+                log.info(
+                    f"Job deployment enabled flag is not yet set to {enabled}. "
+                    f"Will wait for {delay:.0f} seconds and try again."
+                )
+
+        try:
+            deployments = poll_until(
+                self._list_deployments,
+                lambda d: bool(d) and d[0]["enabled"] == enabled,
+                timeout_seconds,
+                Backoff(initial_delay_seconds=5, max_delay_seconds=30),
+                on_wait=on_wait,
+            )
+        except PollTimeoutError as e:
+            deployments = e.last_value
         assert deployments, f"Job {self.config.job_name} deployment is missing"
         assert (
             deployments[0]["enabled"] == enabled
@@ -342,18 +423,21 @@ class JobController:
         ), "Failed to start data job execution."
         log.info("Execution started successfully.")
 
-    @LogDecorator(log)
-    def check_job_execution_finished(self) -> Optional[str]:
-        log.info("Checking if data job execution is still running.")
-        job_execution_running = True
-        execution_list = []
-        start = time.time()
-
-        while (
-            job_execution_running
-            and time.time() - start < self.config.RUN_TEST_TIMEOUT_SECONDS
-        ):
-            response = self._execute(
+    def _list_executions(self) -> List[dict]:
+        if self.config.use_api_client:
+            executions = self._read_api(
+                "data_job_execution_list",
+                lambda headers: self._get_api_client_factory()
+                .get_execution_api()
+                .data_job_execution_list_with_http_info(
+                    team_name=self.config.job_team,
+                    job_name=self.config.job_name,
+                    _headers=headers,
+                ),
+            )
+            return self._to_json([e.to_dict() for e in executions or []])
+        return json.loads(
+            self._execute(
                 [
                     "execute",
                     "--list",
@@ -365,18 +449,30 @@ class JobController:
                 ]
                 + self.__get_rest_api_url_arg()
             )
-            execution_list = json.loads(response)
-
-            if execution_list:
-                job_execution_running = False
-                for execution in execution_list:
-                    if str(execution["status"]) == "running":
-                        job_execution_running = True
-                        log.info(
-                            f"Data job execution is in state {execution['status']}. Will wait 10 seconds and check again."
-                        )
-                        break
-            time.sleep(10)
+        )
+
+    @staticmethod
+    def _is_any_execution_running(execution_list: List[dict]) -> bool:
+        return not execution_list or any(
+            str(execution["status"]) == "running" for execution in execution_list
+        )
+
+    @LogDecorator(log)
+    def check_job_execution_finished(self) -> Optional[str]:
+        log.info("Checking if data job execution is still running.")
+        try:
+            execution_list = poll_until(
+                self._list_executions,
+                lambda executions: not self._is_any_execution_running(executions),
+                self.config.RUN_TEST_TIMEOUT_SECONDS,
+                Backoff(initial_delay_seconds=2, max_delay_seconds=30),
+                on_wait=lambda executions, delay: log.info(
+                    f"Data job execution is running. Will wait {delay:.0f} seconds and check again."
+                ),
+            )
+        except PollTimeoutError as e:
+            execution_list = e.last_value
+        job_execution_running = self._is_any_execution_running(execution_list)
         log.info(f"Data job is running : {job_execution_running}")
         assert not job_execution_running, (
             f"VDK-heartbeat timed out. Job execution {self.config.job_name} "
@@ -1,7 +1,12 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+from datetime import datetime
 from unittest.mock import patch
 
+from taurus_datajob_api import ApiException
+from taurus_datajob_api import ApiResponse
+from taurus_datajob_api import DataJobDeployment
+from taurus_datajob_api import DataJobExecution
 from vdk.internal.heartbeat.config import Config
 from vdk.internal.heartbeat.job_controller import JobController
 
@@ -46,3 +51,91 @@ def test_check_job_execution_finished_no_exceptions_for_value_errors(patched_met
 
     res = test_controller.check_job_execution_finished()
     assert res == "finished"
+
+
+@patch("vdk.internal.control.utils.polling.time.sleep")
+@patch.object(JobController, "_execute")
+def test_check_job_execution_finished_waits_for_running_execution(
+    patched_method, patched_sleep
+):
+    test_config = Config()
+    test_config.control_api_url = None
+    test_config.vdkcli_oauth2_uri = None
+
+    patched_method.side_effect = [
+        '[{"status": "running", "end_time": null}]',
+        '[{"status": "running", "end_time": null}]',
+        '[{"status": "succeeded", "end_time": "2022-03-01"}]',
+    ]
+
+    test_controller = JobController(test_config)
+    res = test_controller.check_job_execution_finished()
+    assert res == "succeeded"
+    assert patched_sleep.call_count == 2
+
+
+@patch("vdk.internal.control.utils.polling.time.sleep")
+@patch.object(JobController, "_get_api_client_factory")
+@patch.object(JobController, "_execute")
+def test_check_job_execution_finished_using_api_client(
+    patched_execute, patched_factory, patched_sleep
+):
+    test_config = Config()
+    test_config.control_api_url = None
+    test_config.vdkcli_oauth2_uri = None
+    test_config.use_api_client = True
+
+    def execution(status, end_time):
+        return DataJobExecution(
+            id="1",
+            job_name=test_config.job_name,
+            status=status,
+            end_time=end_time,
+            deployment=DataJobDeployment(),
+        )
+
+    execution_api = patched_factory.return_value.get_execution_api.return_value
+    execution_api.data_job_execution_list_with_http_info.side_effect = [
+        ApiResponse(
+            status_code=200,
+            headers={"ETag": '"v1"'},
+            data=[execution("running", None)],
+            raw_data=b"",
+        ),
+        ApiException(status=304),
+        ApiResponse(
+            status_code=200,
+            headers={"ETag": '"v2"'},
+            data=[execution("succeeded", datetime(2022, 3, 1))],
+            raw_data=b"",
+        ),
+    ]
+
+    test_controller = JobController(test_config)
+    res = test_controller.check_job_execution_finished()
+
+    assert res == "succeeded"
+    patched_execute.assert_not_called()
+    request_headers = [
+        c.kwargs["_headers"]
+        for c in execution_api.data_job_execution_list_with_http_info.call_args_list
+    ]
+    assert request_headers == [{}, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+
+
+@patch("vdk.internal.control.utils.polling.time.sleep")
+@patch.object(JobController, "_execute")
+def test_check_deployments_waits_for_enabled_flag(patched_method, patched_sleep):
+    test_config = Config()
+    test_config.control_api_url = None
+    test_config.vdkcli_oauth2_uri = None
+
+    patched_method.side_effect = [
+        "[]",
+        '[{"enabled": true}]',
+        '[{"enabled": false}]',
+    ]
+
+    test_controller = JobController(test_config)
+    test_controller.check_deployments(enabled=False)
+    assert patched_sleep.call_count == 2
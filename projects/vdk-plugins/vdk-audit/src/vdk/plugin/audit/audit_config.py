@@ -6,6 +6,7 @@ AUDIT_HOOK_ENABLED = "AUDIT_HOOK_ENABLED"
 AUDIT_HOOK_FORBIDDEN_EVENTS_LIST = "FORBIDDEN_EVENTS_LIST"
 AUDIT_HOOK_EXIT_ON_FORBIDDEN_EVENT = "EXIT_ON_FORBIDDEN_EVENT"
 AUDIT_HOOK_EXIT_CODE = "EXIT_CODE"
+AUDIT_HOOK_COUNT_EVENTS = "AUDIT_HOOK_COUNT_EVENTS"
 AUDIT_HOOK_FORBIDDEN_EVENTS_LIST_DEFAULT = (
     "os.system;os.chdir;os.chflags;os.chown;os.fork;"
     "os.forkpty;os.getxattr;os.kill;os.killpg;os.link;os.listxattr;"
@@ -32,6 +33,9 @@ class AuditConfiguration:
     def exit_on_forbidden_event(self):
         return self.__config.get_value(AUDIT_HOOK_EXIT_ON_FORBIDDEN_EVENT)
 
+    def count_events(self):
+        return self.__config.get_value(AUDIT_HOOK_COUNT_EVENTS)
+
 
 def add_definitions(config_builder: ConfigurationBuilder) -> None:
     config_builder.add(
@@ -47,7 +51,10 @@ def add_definitions(config_builder: ConfigurationBuilder) -> None:
         "such as dynamic code compilation, module imports or OS command "
         "invocations. "
         "The field accepts semi-colon separated values. "
-        "Example: 'os.removexattr;os.rename;os.rmdir;os.scandir'",
+        "Example: 'os.removexattr;os.rename;os.rmdir;os.scandir'. "
+        "Glob patterns can be used to forbid multiple operations, e.g. 'subprocess.*'. "
+        "An operation can be forbidden only for some arguments with a glob pattern in brackets "
+        "(matched against each argument), e.g. 'open(/etc/*)'.",
     )
     config_builder.add(
         key=AUDIT_HOOK_EXIT_ON_FORBIDDEN_EVENT,
@@ -64,3 +71,9 @@ def add_definitions(config_builder: ConfigurationBuilder) -> None:
         "the data job will be fully terminated on forbidden operation "
         "with the exit code defined via this field.",
     )
+    config_builder.add(
+        key=AUDIT_HOOK_COUNT_EVENTS,
+        default_value=False,
+        description="If it is true, the number of times each operation is performed while the data job runs "
+        "is counted and logged at the end of the data job.",
+    )
@@ -0,0 +1,171 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+"""
+Python raises audit events for every file opened, module imported, socket connected, etc.
+so the audit hook is called very often and needs to be cheap in the common case of a permitted event.
+"""
+import fnmatch
+import logging
+import os
+import re
+import sys
+import threading
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+log = logging.getLogger(__name__)
+
+_GLOB_CHARACTERS = ("*", "?", "[")
+_ENTRY = re.compile(r"^(?P<event>[^(]+?)\s*(?:\((?P<argument>.*)\))?$")
+
+# For each rule of an event - the pattern one of the event arguments must match or None if any arguments match.
+_EventRules = Tuple[Optional[Pattern], ...]
+
+_auditor: Optional[Callable[[str, tuple], None]] = None
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _dispatch(event: str, args: tuple) -> None:
+    auditor = _auditor
+    if auditor is not None:
+        auditor(event, args)
+
+
+def set_auditor(auditor: Optional[Callable[[str, tuple], None]]) -> None:
+    """
+    Sets the function called for each audit event (or None to stop auditing).
+    Audit hooks cannot be removed once added, so a single hook is added per process
+    and it calls the auditor set last (e.g. by the data job run last in the process).
+    """
+    global _auditor, _installed
+    _auditor = auditor
+    if auditor is not None and not _installed:
+        with _install_lock:
+            if not _installed:
+                sys.addaudithook(_dispatch)
+                _installed = True
+
+
+class ForbiddenEvents:
+    """
+    The forbidden audit events compiled from a semicolon separated list. Each entry is one of:
+    * the name of an event, e.g. os.system
+    * a glob pattern matching the names of events, e.g. os.* or subprocess.*
+    * any of the above followed by a glob pattern in brackets - the event is forbidden only if
+      any of its arguments matches the pattern, e.g. open(/etc/*)
+    """
+
+    def __init__(self, events_list: str):
+        self._events: Dict[str, _EventRules] = {}
+        self._patterns: Tuple[Tuple[Pattern, Optional[Pattern]], ...] = ()
+        for entry in events_list.split(";"):
+            entry = entry.strip()
+            match = _ENTRY.match(entry)
+            if not match:
+                continue
+            event = match.group("event")
+            argument = match.group("argument")
+            argument_pattern = (
+                re.compile(fnmatch.translate(argument)) if argument else None
+            )
+            if any(c in event for c in _GLOB_CHARACTERS):
+                self._patterns += (
+                    (re.compile(fnmatch.translate(event)), argument_pattern),
+                )
+            else:
+                self._events[event] = self._events.get(event, ()) + (argument_pattern,)
+        # the events which are forbidden regardless of their arguments
+        self._unconditional_events = frozenset(
+            event for event, rules in self._events.items() if None in rules
+        )
+        if not self._patterns and len(self._unconditional_events) == len(self._events):
+            # the common case - a plain list of events needs just a set lookup
+            self.is_forbidden = self._is_forbidden_unconditional
+        # the rules of the events seen so far (the number of distinct audit events is small)
+        self._rules_cache: Dict[str, _EventRules] = {}
+
+    def is_forbidden(self, event: str, args: tuple) -> bool:
+        rules = self._rules_cache.get(event)
+        if rules is None:
+            rules = self._rules_cache[event] = self._get_rules(event)
+        if not rules:
+            return False
+        return any(
+            pattern is None or _any_argument_matches(pattern, args) for pattern in rules
+        )
+
+    def _is_forbidden_unconditional(self, event: str, args: tuple) -> bool:
+        return event in self._unconditional_events
+
+    def _get_rules(self, event: str) -> _EventRules:
+        rules = self._events.get(event, ())
+        for event_pattern, argument_pattern in self._patterns:
+            if event_pattern.match(event):
+                rules += (argument_pattern,)
+        return rules
+
+
+def _any_argument_matches(pattern: Pattern, args: tuple) -> bool:
+    for arg in args:
+        if isinstance(arg, (str, bytes, os.PathLike)):
+            value = os.fsdecode(arg)
+        elif arg is None:
+            continue
+        else:
+            value = str(arg)
+        if pattern.match(value):
+            return True
+    return False
+
+
+class JobAuditor:
+    """
+    Called for each audit event raised while the data job runs.
+    Forbidden events are logged and (optionally) terminate the process.
+    In counting mode, it also counts how many times each event was raised.
+    """
+
+    def __init__(
+        self,
+        forbidden_events: ForbiddenEvents,
+        exit_on_forbidden_event: bool,
+        exit_code: int,
+        count_events: bool = False,
+    ):
+        self._is_forbidden = forbidden_events.is_forbidden
+        self._exit_on_forbidden_event = exit_on_forbidden_event
+        self._exit_code = exit_code
+        self.events_count: Optional[Dict[str, int]] = {} if count_events else None
+
+    def __call__(self, event: str, args: tuple) -> None:
+        events_count = self.events_count
+        if events_count is not None:
+            events_count[event] = events_count.get(event, 0) + 1
+        if self._is_forbidden(event, args):
+            self._on_forbidden_event(event, args)
+
+    def stop_counting(self) -> Dict[str, int]:
+        """
+        Stops counting the events.
+
+        :return: the number of times each event was raised
+        """
+        events_count, self.events_count = self.events_count, None
+        return events_count or {}
+
+    def _on_forbidden_event(self, event: str, args: tuple) -> None:
+        log.warning(
+            f'[Audit] Detected FORBIDDEN operation "{event}" with '
+            f'arguments "{args}" '
+        )
+
+        if self._exit_on_forbidden_event:
+            log.error(
+                f"[Audit] Terminating the data job due to the FORBIDDEN "
+                f'operation "{event}" with arguments "{args}" '
+            )
+            os._exit(self._exit_code)
@@ -1,16 +1,18 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 import logging
-import os
-import sys
 from typing import List
+from typing import Optional
 
 from vdk.api.plugin.hook_markers import hookimpl
 from vdk.api.plugin.plugin_registry import IPluginRegistry
 from vdk.internal.builtin_plugins.run.job_context import JobContext
 from vdk.internal.core.config import ConfigurationBuilder
+from vdk.plugin.audit import audit_hook
 from vdk.plugin.audit.audit_config import add_definitions
 from vdk.plugin.audit.audit_config import AuditConfiguration
+from vdk.plugin.audit.audit_hook import ForbiddenEvents
+from vdk.plugin.audit.audit_hook import JobAuditor
 
 
 log = logging.getLogger(__name__)
@@ -22,33 +24,46 @@ class AuditPlugin:
     def vdk_configure(config_builder: ConfigurationBuilder) -> None:
         add_definitions(config_builder)
 
+    def __init__(self):
+        # Templates run as data jobs in the same process and call the same hooks,
+        # so the auditors of the running job and its templates are kept in a stack.
+        self._auditors: List[Optional[JobAuditor]] = []
+
     @hookimpl
     def initialize_job(self, context: JobContext) -> None:
-        self._config = AuditConfiguration(context.core_context.configuration)
+        config = AuditConfiguration(context.core_context.configuration)
 
-        if not self._config.enabled():
-            return
+        auditor = None
+        if config.enabled():
+            auditor = JobAuditor(
+                ForbiddenEvents(config.forbidden_events_list()),
+                config.exit_on_forbidden_event(),
+                config.exit_code(),
+                config.count_events(),
+            )
+        self._auditors.append(auditor)
+        audit_hook.set_auditor(auditor)
 
-        forbidden_events_list = self._config.forbidden_events_list().split(";")
+    @hookimpl
+    def finalize_job(self, context: JobContext) -> None:
+        if not self._auditors:
+            return
+        auditor = self._auditors.pop()
+        # The auditor of a template is replaced by the one of the job which ran it.
+        # The auditor of the job itself is kept until the process exits,
+        # so forbidden events are still detected in code run after the job.
+        if self._auditors:
+            audit_hook.set_auditor(self._auditors[-1])
 
-        def _audit(event, args):
-            if any(
-                event == not_permitted_event
-                for not_permitted_event in forbidden_events_list
-            ):
-                log.warning(
-                    f'[Audit] Detected FORBIDDEN operation "{event}" with '
-                    f'arguments "{args}" '
+        if auditor and auditor.events_count is not None:
+            events_count = auditor.stop_counting()
+            summary = ", ".join(
+                f"{event}: {count}"
+                for event, count in sorted(
+                    events_count.items(), key=lambda item: item[1], reverse=True
                 )
-
-                if self._config.exit_on_forbidden_event():
-                    log.error(
-                        f"[Audit] Terminating the data job due to the FORBIDDEN "
-                        f'operation "{event}" with arguments "{args}" '
-                    )
-                    os._exit(self._config.exit_code())
-
-        sys.addaudithook(_audit)
+            )
+            log.info(f"[Audit] Operations performed by the data job: {summary}")
 
 
 @hookimpl
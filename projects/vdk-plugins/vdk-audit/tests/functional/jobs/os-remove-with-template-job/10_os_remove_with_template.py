@@ -0,0 +1,18 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+from vdk.api.job_input import IJobInput
+
+
+def _create_and_remove_file():
+    with open("test_file.txt", "w") as f:
+        f.write("Some string")
+
+    os.remove("test_file.txt")
+
+
+def run(job_input: IJobInput):
+    _create_and_remove_file()
+    job_input.execute_template("os-listdir", {})
+    _create_and_remove_file()
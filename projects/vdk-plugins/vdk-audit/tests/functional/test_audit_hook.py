@@ -0,0 +1,106 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import os
+import timeit
+
+from vdk.plugin.audit import audit_hook
+from vdk.plugin.audit.audit_config import AUDIT_HOOK_FORBIDDEN_EVENTS_LIST_DEFAULT
+from vdk.plugin.audit.audit_hook import ForbiddenEvents
+from vdk.plugin.audit.audit_hook import JobAuditor
+
+log = logging.getLogger(__name__)
+
+
+def test_forbidden_events_exact():
+    forbidden_events = ForbiddenEvents("os.system;os.symlink;")
+
+    assert forbidden_events.is_forbidden("os.system", ("ls",))
+    assert forbidden_events.is_forbidden("os.symlink", ("a", "b"))
+    assert not forbidden_events.is_forbidden("os.systemx", ())
+    assert not forbidden_events.is_forbidden("open", ("a", "r", 0))
+
+
+def test_forbidden_events_glob():
+    forbidden_events = ForbiddenEvents("subprocess.*;os.spawn?")
+
+    assert forbidden_events.is_forbidden("subprocess.Popen", ())
+    assert forbidden_events.is_forbidden("os.spawnv", ())
+    assert not forbidden_events.is_forbidden("os.spawn", ())
+    assert not forbidden_events.is_forbidden("os.system", ())
+
+
+def test_forbidden_events_argument_filter():
+    forbidden_events = ForbiddenEvents("open(/etc/*);socket.*(*:443*)")
+
+    assert forbidden_events.is_forbidden("open", ("/etc/passwd", "r", 0))
+    assert forbidden_events.is_forbidden("open", (b"/etc/hosts", "r", 0))
+    assert not forbidden_events.is_forbidden("open", ("/tmp/file", "w", 0))
+    assert not forbidden_events.is_forbidden("open", (3, "r", 0))
+    assert forbidden_events.is_forbidden("socket.connect", (None, "example.com:443"))
+    assert not forbidden_events.is_forbidden("socket.connect", (None, "example.com:80"))
+
+
+def test_job_auditor_counts_events():
+    auditor = JobAuditor(ForbiddenEvents("os.system"), False, 0, count_events=True)
+
+    for _ in range(3):
+        auditor("open", ("file", "r", 0))
+    auditor("os.system", ("ls",))
+
+    assert auditor.stop_counting() == {"open": 3, "os.system": 1}
+    auditor("open", ("file", "r", 0))
+    assert auditor.events_count is None
+
+
+def _file_heavy_workload(directory):
+    for i in range(200):
+        file_path = os.path.join(directory, f"file-{i % 10}.txt")
+        with open(file_path, "w") as f:
+            f.write("data")
+        with open(file_path) as f:
+            f.read()
+        os.listdir(directory)
+
+
+def test_audit_hook_overhead_benchmark(tmpdir):
+    forbidden_events_list = AUDIT_HOOK_FORBIDDEN_EVENTS_LIST_DEFAULT.split(";")
+
+    def linear_auditor(event, args):
+        # how the forbidden events were checked before they were compiled
+        if any(event == forbidden_event for forbidden_event in forbidden_events_list):
+            raise AssertionError(event)
+
+    auditor = JobAuditor(
+        ForbiddenEvents(AUDIT_HOOK_FORBIDDEN_EVENTS_LIST_DEFAULT), True, 0
+    )
+    counting_auditor = JobAuditor(
+        ForbiddenEvents(AUDIT_HOOK_FORBIDDEN_EVENTS_LIST_DEFAULT),
+        True,
+        0,
+        count_events=True,
+    )
+
+    def measure(current_auditor):
+        audit_hook.set_auditor(current_auditor)
+        try:
+            return min(
+                timeit.repeat(
+                    lambda: _file_heavy_workload(str(tmpdir)), number=1, repeat=5
+                )
+            )
+        finally:
+            audit_hook.set_auditor(None)
+
+    linear_seconds = measure(linear_auditor)
+    compiled_seconds = measure(auditor)
+    counting_seconds = measure(counting_auditor)
+    no_audit_seconds = measure(None)
+
+    log.info(
+        f"File heavy workload: no audit {no_audit_seconds:.4f}s, "
+        f"linear {linear_seconds:.4f}s, compiled {compiled_seconds:.4f}s, "
+        f"compiled with counting {counting_seconds:.4f}s "
+        f"({sum(counting_auditor.stop_counting().values()) // 5} events per run)"
+    )
+    # the timings are only logged, since they vary too much on loaded machines to be asserted
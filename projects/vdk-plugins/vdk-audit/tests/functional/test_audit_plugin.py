@@ -1,10 +1,15 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
 import os
+import pathlib
 from unittest import mock
 
 from click.testing import Result
+from vdk.api.plugin.hook_markers import hookimpl
+from vdk.internal.builtin_plugins.run.job_context import JobContext
+from vdk.plugin.audit import audit_hook
 from vdk.plugin.audit import audit_plugin
+from vdk.plugin.audit.audit_hook import JobAuditor
 from vdk.plugin.test_utils.util_funcs import cli_assert_equal
 from vdk.plugin.test_utils.util_funcs import CliEntryBasedTestRunner
 from vdk.plugin.test_utils.util_funcs import jobs_path_from_caller_directory
@@ -148,3 +153,104 @@ def test_audit_single_event_enabled_and_not_misclassified_error():
         print(result.output)
         cli_assert_equal(0, result)
         assert not os._exit.called
+
+
+def test_audit_glob_event_enabled_and_forbidden_action():
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_AUDIT_HOOK_ENABLED": "True",
+            "VDK_FORBIDDEN_EVENTS_LIST": "os.sys*",
+            "VDK_EXIT_CODE": "0",
+        },
+    ):
+        os._exit = mock.MagicMock()
+        runner = CliEntryBasedTestRunner(audit_plugin)
+
+        result: Result = runner.invoke(
+            ["run", jobs_path_from_caller_directory("os-system-command-job")]
+        )
+
+        print(result.output)
+        os._exit.assert_called_with(0)
+
+
+def test_audit_event_with_argument_filter_and_permitted_action():
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_AUDIT_HOOK_ENABLED": "True",
+            "VDK_FORBIDDEN_EVENTS_LIST": "os.remove(/etc/*)",
+        },
+    ):
+        os._exit = mock.MagicMock()
+        runner = CliEntryBasedTestRunner(audit_plugin)
+
+        result: Result = runner.invoke(
+            ["run", jobs_path_from_caller_directory("os-remove-command-job")]
+        )
+
+        print(result.output)
+        cli_assert_equal(0, result)
+        assert not os._exit.called
+
+
+def test_audit_count_events():
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_AUDIT_HOOK_ENABLED": "True",
+            "VDK_AUDIT_HOOK_COUNT_EVENTS": "True",
+        },
+    ):
+        os._exit = mock.MagicMock()
+        runner = CliEntryBasedTestRunner(audit_plugin)
+
+        result: Result = runner.invoke(
+            ["run", jobs_path_from_caller_directory("os-remove-command-job")]
+        )
+
+        cli_assert_equal(0, result)
+        assert "[Audit] Operations performed by the data job" in result.output
+        assert "os.remove: 1" in result.output
+
+
+class TemplatePlugin:
+    @hookimpl
+    def initialize_job(self, context: JobContext) -> None:
+        context.templates.add_template(
+            "os-listdir",
+            pathlib.Path(jobs_path_from_caller_directory("template-os-listdir")),
+        )
+
+
+def test_audit_count_events_with_template():
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_AUDIT_HOOK_ENABLED": "True",
+            "VDK_AUDIT_HOOK_COUNT_EVENTS": "True",
+        },
+    ):
+        os._exit = mock.MagicMock()
+        runner = CliEntryBasedTestRunner(TemplatePlugin(), audit_plugin)
+
+        result: Result = runner.invoke(
+            ["run", jobs_path_from_caller_directory("os-remove-with-template-job")]
+        )
+
+        cli_assert_equal(0, result)
+        summaries = [
+            line
+            for line in result.output.splitlines()
+            if "[Audit] Operations performed by the data job" in line
+        ]
+        # one summary for the template and one for the data job
+        assert len(summaries) == 2
+        assert "os.listdir: 1" in summaries[0]
+        assert "os.remove" not in summaries[0]
+        # the data job counts the events raised both before and after the template
+        assert "os.remove: 2" in summaries[1]
+        # the auditor of the data job is kept after the job, but it no longer counts events
+        assert isinstance(audit_hook._auditor, JobAuditor)
+        assert audit_hook._auditor.events_count is None
@@ -21,6 +21,7 @@ class SingleJob:
     :param fail_dag_on_error: boolean flag indicating whether the job should be executed.
     :param arguments: JSON-serializable dictionary of arguments to be passed to the job.
     :param depends_on: list of names of jobs that this job depends on.
+    :param priority: jobs with higher priority are started first when several jobs are ready to start.
     """
 
     job_name: str
@@ -28,6 +29,7 @@ class SingleJob:
     fail_dag_on_error: bool = True
     arguments: dict = None
     depends_on: List[str] = field(default_factory=list)
+    priority: int = 0
 
 
 @dataclass
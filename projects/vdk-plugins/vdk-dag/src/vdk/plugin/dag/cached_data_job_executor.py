@@ -2,11 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 import json
 import logging
+import random
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
+from typing import List
 from typing import Optional
 
 import urllib3.exceptions as url_exception
+from taurus_datajob_api import DataJobExecution
 from vdk.api.job_input import IJobArguments
 from vdk.internal.core.errors import ErrorMessage
 from vdk.internal.core.errors import UserCodeError
@@ -29,16 +34,31 @@ class TrackingDataJobExecutor:
     """
 
     def __init__(
-        self, executor: IDataJobExecutor, time_between_status_check_seconds: int
+        self,
+        executor: IDataJobExecutor,
+        time_between_status_check_seconds: int,
+        status_check_max_workers: int = 1,
+        status_check_randomized_added_delay_seconds: int = 0,
+        status_check_batch_enabled: bool = False,
     ):
         """
 
         :param executor: the Data Job executor
         :param time_between_status_check_seconds: the number of seconds between status check
+        :param status_check_max_workers: the maximum number of status checks done in parallel
+        :param status_check_randomized_added_delay_seconds: added delay in seconds randomly between
+         [0, status_check_randomized_added_delay_seconds] to the time between status checks of each job
+        :param status_check_batch_enabled: whether to check the statuses of the jobs with a single batch call
+         if the executor supports it
         """
         self._executor = executor
         self._jobs_cache: Dict[str, TrackableJob] = dict()
         self._time_between_status_check_seconds = time_between_status_check_seconds
+        self._status_check_max_workers = max(1, status_check_max_workers)
+        self._status_check_randomized_added_delay_seconds = (
+            status_check_randomized_added_delay_seconds
+        )
+        self._status_check_batch_enabled = status_check_batch_enabled
 
     def register_job(self, job: TrackableJob):
         """
@@ -78,6 +98,18 @@ class TrackingDataJobExecutor:
             f"Started data job {job_name}:\n{self.__get_printable_details(job.details)}"
         )
 
+    def skip_job(self, job_name: str, details: dict) -> None:
+        """
+        Marks a Data Job as finished with status skipped without starting an execution.
+
+        :param job_name: the job to skip
+        :param details: the details explaining why the job is skipped
+        """
+        job = self.__get_job(job_name)
+        job.status = JobStatus.SKIPPED.value
+        job.details = {**(job.details or {}), **details}
+        log.info(f"Skipping data job {job_name}: {details}")
+
     def finalize_job(self, job_name):
         """
         Finalizes a finished job by updating its details and logging them or raising an error.
@@ -86,6 +118,9 @@ class TrackingDataJobExecutor:
         :return:
         """
         job = self.__get_job(job_name)
+        if job.execution_id is None and job.status == JobStatus.SKIPPED.value:
+            log.info(f"Finished data job {job_name}: skipped without execution.")
+            return
         details = self._executor.details_job(
             job.job_name, job.team_name, job.execution_id
         )
@@ -154,25 +189,114 @@ class TrackingDataJobExecutor:
         """
         :return: list of the names of all the finalized jobs
         """
-        finalized_jobs = []
-        # TODO: optimize
-        # Do not call the status every time (use TTL caching)
-        # Do not call all status at the same time - stagger them in time
-        # Or use GraphQL API to get status at once (batch)
-        for job in self._jobs_cache.values():
-            if (
-                self.__is_job_submitted(job)
-                and job.status in ACTIVE_JOB_STATUSES
-                and time.time() - job.last_status_time
-                > self._time_between_status_check_seconds
-            ):
-                job.last_status_time = time.time()
-                job.status = self.status(job.job_name)
-
-        for job in self._jobs_cache.values():
-            if self.__is_job_submitted(job) and job.status not in ACTIVE_JOB_STATUSES:
-                finalized_jobs.append(job.job_name)
-        return finalized_jobs
+        self._check_statuses_of_due_jobs()
+        return [
+            job.job_name
+            for job in self._jobs_cache.values()
+            if self.__is_job_submitted(job) and job.status not in ACTIVE_JOB_STATUSES
+        ]
+
+    def wait_for_finished_jobs(self, timeout_seconds: float) -> None:
+        """
+        Waits until any of the running jobs finishes or the timeout passes.
+        The status of each running job is checked as soon as it is due,
+        so the wait ends right after a finished job is detected instead of waiting the whole timeout.
+
+        :param timeout_seconds: the maximum number of seconds to wait
+        """
+        deadline = time.time() + timeout_seconds
+        while True:
+            now = time.time()
+            if now >= deadline:
+                return
+            due_jobs = self.__get_due_jobs(now)
+            if due_jobs:
+                if self.__check_statuses(due_jobs):
+                    return
+                continue
+            next_status_time = min(
+                (job.next_status_time for job in self.get_currently_running_jobs()),
+                default=deadline,
+            )
+            time.sleep(max(0.0, min(next_status_time, deadline) - now))
+
+    def _check_statuses_of_due_jobs(self) -> bool:
+        """
+        Checks the statuses of the running jobs which have not been checked in the last
+        time_between_status_check_seconds (plus randomized delay so the checks are staggered in time).
+
+        :return: True if any of the checked jobs has finished
+        """
+        return self.__check_statuses(self.__get_due_jobs(time.time()))
+
+    def __get_due_jobs(self, now: float) -> List[TrackableJob]:
+        return [
+            job
+            for job in self._jobs_cache.values()
+            if self.__is_job_submitted(job)
+            and job.status in ACTIVE_JOB_STATUSES
+            and job.next_status_time <= now
+        ]
+
+    def __check_statuses(self, jobs: List[TrackableJob]) -> bool:
+        if not jobs:
+            return False
+        for job in jobs:
+            job.last_status_time = time.time()
+            job.next_status_time = (
+                job.last_status_time
+                + self._time_between_status_check_seconds
+                + random.uniform(0, self._status_check_randomized_added_delay_seconds)
+            )
+
+        remaining_jobs = jobs
+        if self._status_check_batch_enabled and len(jobs) > 1:
+            remaining_jobs = self.__batch_check_statuses(jobs)
+
+        if len(remaining_jobs) > 1 and self._status_check_max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self._status_check_max_workers, len(remaining_jobs)),
+                thread_name_prefix="dag-status-check",
+            ) as pool:
+                list(pool.map(lambda j: self.status(j.job_name), remaining_jobs))
+        else:
+            for job in remaining_jobs:
+                self.status(job.job_name)
+
+        return any(job.status not in ACTIVE_JOB_STATUSES for job in jobs)
+
+    def __batch_check_statuses(self, jobs: List[TrackableJob]) -> List[TrackableJob]:
+        """
+        Checks the statuses of the jobs with one batch call per team.
+
+        :return: the jobs whose status could not be determined by the batch call
+        """
+        jobs_by_team = defaultdict(list)
+        for job in jobs:
+            jobs_by_team[job.team_name].append(job)
+
+        remaining_jobs = []
+        for team_name, team_jobs in jobs_by_team.items():
+            try:
+                statuses = self._executor.status_jobs(
+                    team_name, [(job.job_name, job.execution_id) for job in team_jobs]
+                )
+            except Exception as e:
+                log.warning(
+                    f"Batch status check of the jobs of team {team_name} failed. "
+                    f"Will check the status of each job separately. Error was: {e}"
+                )
+                statuses = None
+            if statuses is None:
+                remaining_jobs.extend(team_jobs)
+                continue
+            for job in team_jobs:
+                if job.execution_id in statuses:
+                    job.status = statuses[job.execution_id]
+                    log.debug(f"Job status: {job}")
+                else:
+                    remaining_jobs.append(job)
+        return remaining_jobs
 
     def get_all_jobs(self):
         """
@@ -247,6 +371,36 @@ class TrackingDataJobExecutor:
             "Bug, fix me! Something wrong has happened and I cannot recover!"
         )
 
+    def get_job_executions(
+        self, job_name: str, team_name: str
+    ) -> Optional[List[DataJobExecution]]:
+        """
+        Get the list of all recent executions of a data job.
+
+        :param job_name: name of the data job
+        :param team_name: name of the team owning the data job
+        :return: A list of DataJobExecution objects - the last element is the latest execution.
+        """
+        return self._executor.job_executions_list(
+            job_name=job_name, team_name=team_name
+        )
+
+    def get_job_source_version(self, job_name: str, team_name: str) -> Optional[str]:
+        """
+        Get the version of the source code of a data job.
+
+        :param job_name: name of the data job
+        :param team_name: name of the team owning the data job
+        :return: the version of the job source or None if it cannot be determined
+        """
+        return self._executor.job_source_version(job_name=job_name, team_name=team_name)
+
+    def shutdown(self) -> None:
+        """
+        Releases the resources of the underlying executor (e.g. worker processes).
+        """
+        self._executor.shutdown()
+
     def get_latest_available_execution_id(
         self, job_name: str, team: str
     ) -> Optional[str]:
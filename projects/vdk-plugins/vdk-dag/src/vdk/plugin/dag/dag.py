@@ -4,31 +4,44 @@ import json
 import logging
 import pprint
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from graphlib import TopologicalSorter
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from taurus_datajob_api import ApiException
 from vdk.plugin.dag.cached_data_job_executor import TrackingDataJobExecutor
 from vdk.plugin.dag.dag_plugin_configuration import DagPluginConfiguration
 from vdk.plugin.dag.dag_validator import DagValidator
 from vdk.plugin.dag.dags import TrackableJob
+from vdk.plugin.dag.job_fingerprint import get_job_fingerprint
+from vdk.plugin.dag.job_fingerprint import JobFingerprintsStore
+from vdk.plugin.dag.job_priority import get_critical_path_lengths
+from vdk.plugin.dag.job_priority import get_duration_from_executions
+from vdk.plugin.dag.job_priority import get_duration_seconds
+from vdk.plugin.dag.job_priority import JobDurationsCache
+from vdk.plugin.dag.job_priority import ReadyJobsQueue
 from vdk.plugin.dag.local_executor import LocalDataJobExecutor
+from vdk.plugin.dag.local_process_pool_executor import LocalProcessPoolDataJobExecutor
+from vdk.plugin.dag.remote_data_job import JobStatus
 from vdk.plugin.dag.remote_data_job_executor import RemoteDataJobExecutor
 from vdk.plugin.dag.time_based_queue import TimeBasedQueue
 
 log = logging.getLogger(__name__)
 
 
-def get_job_executor(executor_type: str):
+def get_job_executor(executor_type: str, local_process_pool_size: int = 0):
     if executor_type.lower() == "remote":
         return RemoteDataJobExecutor()
     if executor_type.lower() == "local":
         return LocalDataJobExecutor()
+    if executor_type.lower() == "local-process-pool":
+        return LocalProcessPoolDataJobExecutor(local_process_pool_size)
     raise ValueError(
-        f"Unsupported executor type: {executor_type}. Must be either remote or local."
+        f"Unsupported executor type: {executor_type}. "
+        f"Must be either remote, local or local-process-pool."
     )
 
 
@@ -48,6 +61,26 @@ class Dag:
         """
         self._team_name = team_name
         self._topological_sorter = TopologicalSorter()
+        self._jobs: Dict[str, TrackableJob] = dict()
+        self._job_dependencies: Dict[str, List[str]] = dict()
+        self._ready_jobs = ReadyJobsQueue()
+        self._critical_path_lengths: Dict[str, float] = dict()
+        self._job_durations_cache = JobDurationsCache(
+            dags_config.dags_job_durations_cache_file()
+        )
+        self._job_durations_from_executions_history = (
+            dags_config.dags_job_durations_from_executions_history()
+        )
+        self._status_check_max_workers = dags_config.dags_status_check_max_workers()
+        self._job_fingerprints: Dict[str, Optional[str]] = dict()
+        self._job_fingerprints_store = (
+            JobFingerprintsStore(
+                dags_config.dags_incremental_execution_state_file(),
+                job_name or "default",
+            )
+            if dags_config.dags_incremental_execution_enabled()
+            else None
+        )
         self._delayed_starting_jobs = TimeBasedQueue(
             min_ready_time_seconds=dags_config.dags_delayed_jobs_min_delay_seconds(),
             randomize_delay_seconds=dags_config.dags_delayed_jobs_randomized_added_delay_seconds(),
@@ -60,8 +93,14 @@ class Dag:
             dags_config.dags_dag_execution_check_time_period_seconds()
         )
         self._job_executor = TrackingDataJobExecutor(
-            executor=get_job_executor(dags_config.dags_job_executor_type()),
+            executor=get_job_executor(
+                dags_config.dags_job_executor_type(),
+                dags_config.dags_local_process_pool_size(),
+            ),
             time_between_status_check_seconds=dags_config.dags_time_between_status_check_seconds(),
+            status_check_max_workers=dags_config.dags_status_check_max_workers(),
+            status_check_randomized_added_delay_seconds=dags_config.dags_status_check_randomized_added_delay_seconds(),
+            status_check_batch_enabled=dags_config.dags_status_check_batch_enabled(),
         )
         self._dag_validator = DagValidator()
         if job_name is not None:
@@ -106,10 +145,13 @@ class Dag:
                 job.get("fail_dag_on_error", True),
                 job.get("arguments", None),
                 job.get("details", {}),
+                priority=job.get("priority", 0),
             )
             trackable_job.details = {"started_by": self._started_by}
             self._job_executor.register_job(trackable_job)
             self._topological_sorter.add(trackable_job.job_name, *job["depends_on"])
+            self._jobs[trackable_job.job_name] = trackable_job
+            self._job_dependencies[trackable_job.job_name] = job["depends_on"]
 
     def execute_dag(self):
         """
@@ -117,17 +159,33 @@ class Dag:
 
         :return:
         """
-        self._topological_sorter.prepare()
-        while self._topological_sorter.is_active():
-            for node in self._topological_sorter.get_ready():
-                self._start_job(node)
-            self._start_delayed_jobs()
-            finished_jobs = self._get_finished_jobs()
-            self._finalize_jobs(finished_jobs)
-            if not finished_jobs:
-                # No jobs are finished at this iteration so let's wait a bit to let them
-                # finish
-                time.sleep(self._dag_execution_check_time_period_seconds)
+        try:
+            self._topological_sorter.prepare()
+            self._critical_path_lengths = get_critical_path_lengths(
+                self._job_dependencies, self._get_job_durations()
+            )
+            while self._topological_sorter.is_active():
+                for node in self._topological_sorter.get_ready():
+                    if self._skip_if_up_to_date(node):
+                        continue
+                    self._ready_jobs.enqueue(
+                        node,
+                        self._jobs[node].priority if node in self._jobs else 0,
+                        self._critical_path_lengths.get(node, 0),
+                    )
+                self._start_ready_jobs()
+                self._start_delayed_jobs()
+                finished_jobs = self._get_finished_jobs()
+                self._finalize_jobs(finished_jobs)
+                if not finished_jobs:
+                    # No jobs are finished at this iteration so let's wait a bit to let them
+                    # finish. The wait ends as soon as a finished job is detected.
+                    self._job_executor.wait_for_finished_jobs(
+                        self._dag_execution_check_time_period_seconds
+                    )
+            self._clear_job_fingerprints_if_succeeded()
+        finally:
+            self._job_executor.shutdown()
 
     def _get_finished_jobs(self):
         return [
@@ -140,8 +198,134 @@ class Dag:
         for node in finalized_jobs:
             log.info(f"Data Job {node} has finished.")
             self._topological_sorter.done(node)
+            self._store_job_fingerprint(node)
             self._job_executor.finalize_job(node)
             self._finished_jobs.append(node)
+            self._cache_job_duration(node)
+
+    def _start_ready_jobs(self):
+        """
+        Starts the ready jobs in order of priority (the ones on the critical path first)
+        as long as there are free slots for running jobs.
+        The rest stay ready and are started as soon as a running job finishes.
+        """
+        while (
+            self._ready_jobs.size() > 0
+            and len(self._job_executor.get_currently_running_jobs())
+            < self._max_concurrent_running_jobs
+        ):
+            self._start_job(self._ready_jobs.dequeue())
+
+    def _get_job_durations(self) -> Dict[str, float]:
+        durations = dict()
+        missing_durations = []
+        for job_name in self._job_dependencies:
+            team_name = self._jobs[job_name].team_name
+            durations[job_name] = self._job_durations_cache.get(team_name, job_name)
+            if durations[job_name] is None:
+                missing_durations.append((job_name, team_name))
+
+        if self._job_durations_from_executions_history and missing_durations:
+
+            def get_duration_from_history(job_name_and_team):
+                try:
+                    return get_duration_from_executions(
+                        self._job_executor.get_job_executions(*job_name_and_team)
+                    )
+                except Exception as e:
+                    log.debug(
+                        f"Could not get the executions history of job {job_name_and_team[0]}: {e}"
+                    )
+                    return None
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, self._status_check_max_workers),
+                thread_name_prefix="dag-job-history",
+            ) as pool:
+                for (job_name, _), duration in zip(
+                    missing_durations,
+                    pool.map(get_duration_from_history, missing_durations),
+                ):
+                    durations[job_name] = duration
+        return durations
+
+    def _cache_job_duration(self, job_name: str):
+        try:
+            job = self._jobs[job_name]
+            if job.status != JobStatus.SUCCEEDED.value or not job.details:
+                return
+            duration = get_duration_seconds(
+                job.details.get("start_time"), job.details.get("end_time")
+            )
+            if duration is not None:
+                self._job_durations_cache.set(job.team_name, job_name, duration)
+        except Exception as e:
+            log.debug(f"Could not cache the duration of job {job_name}: {e}")
+
+    def _skip_if_up_to_date(self, job_name: str) -> bool:
+        """
+        In incremental execution, computes the fingerprint of a job which is ready to start
+        and skips the job if it matches the fingerprint of its last successful run.
+        All the jobs the job depends on are finished (and fingerprinted) at this point.
+
+        :return: True if the job is skipped
+        """
+        if self._job_fingerprints_store is None or job_name not in self._jobs:
+            return False
+        job = self._jobs[job_name]
+        try:
+            source_version = self._job_executor.get_job_source_version(
+                job_name, job.team_name
+            )
+        except Exception as e:
+            log.info(f"Could not get the source version of job {job_name}: {e}")
+            source_version = None
+        fingerprint = get_job_fingerprint(
+            job.team_name,
+            job_name,
+            source_version,
+            job.arguments,
+            (self._job_fingerprints.get(d) for d in self._job_dependencies[job_name]),
+        )
+        self._job_fingerprints[job_name] = fingerprint
+        if fingerprint is None or fingerprint != self._job_fingerprints_store.get(
+            job.team_name, job_name
+        ):
+            return False
+        self._job_executor.skip_job(
+            job_name,
+            {"message": "Job is up-to-date with its last successful run in the DAG."},
+        )
+        return True
+
+    def _store_job_fingerprint(self, job_name: str):
+        if self._job_fingerprints_store is None or job_name not in self._jobs:
+            return
+        job = self._jobs[job_name]
+        if job.execution_id is None and job.status == JobStatus.SKIPPED.value:
+            # skipped as up-to-date, the last successful run is still the same
+            return
+        if job.status == JobStatus.SUCCEEDED.value:
+            self._job_fingerprints_store.set(
+                job.team_name, job_name, self._job_fingerprints.get(job_name)
+            )
+        else:
+            # the job may have left partial results, so it must be re-run next time
+            self._job_fingerprints_store.set(job.team_name, job_name, None)
+            self._job_fingerprints[job_name] = None
+
+    def _clear_job_fingerprints_if_succeeded(self):
+        """
+        The fingerprints are kept only to resume a DAG run which has not succeeded,
+        so the next run of a successful DAG runs all of its jobs again.
+        """
+        if self._job_fingerprints_store is None:
+            return
+        if all(
+            job.status in (JobStatus.SUCCEEDED.value, JobStatus.SKIPPED.value)
+            for job in self._jobs.values()
+        ):
+            self._job_fingerprints_store.clear()
 
     def _start_delayed_jobs(self):
         while (
@@ -1,5 +1,8 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import os
+import tempfile
+
 from vdk.internal.core.config import Configuration
 from vdk.internal.core.config import ConfigurationBuilder
 
@@ -11,9 +14,22 @@ DAGS_DAG_EXECUTION_CHECK_TIME_PERIOD_SECONDS = (
     "DAGS_DAG_EXECUTION_CHECK_TIME_PERIOD_SECONDS"
 )
 DAGS_TIME_BETWEEN_STATUS_CHECK_SECONDS = "DAGS_TIME_BETWEEN_STATUS_CHECK_SECONDS"
+DAGS_STATUS_CHECK_RANDOMIZED_ADDED_DELAY_SECONDS = (
+    "DAGS_STATUS_CHECK_RANDOMIZED_ADDED_DELAY_SECONDS"
+)
+DAGS_STATUS_CHECK_MAX_WORKERS = "DAGS_STATUS_CHECK_MAX_WORKERS"
+DAGS_STATUS_CHECK_BATCH_ENABLED = "DAGS_STATUS_CHECK_BATCH_ENABLED"
 DAGS_MAX_CONCURRENT_RUNNING_JOBS = "DAGS_MAX_CONCURRENT_RUNNING_JOBS"
+DAGS_JOB_DURATIONS_CACHE_FILE = "DAGS_JOB_DURATIONS_CACHE_FILE"
+DAGS_JOB_DURATIONS_FROM_EXECUTIONS_HISTORY = (
+    "DAGS_JOB_DURATIONS_FROM_EXECUTIONS_HISTORY"
+)
+
+DAGS_INCREMENTAL_EXECUTION_ENABLED = "DAGS_INCREMENTAL_EXECUTION_ENABLED"
+DAGS_INCREMENTAL_EXECUTION_STATE_FILE = "DAGS_INCREMENTAL_EXECUTION_STATE_FILE"
 
 DAGS_JOB_EXECUTOR_TYPE = "DAGS_JOB_EXECUTOR_TYPE"
+DAGS_LOCAL_PROCESS_POOL_SIZE = "DAGS_LOCAL_PROCESS_POOL_SIZE"
 
 
 class DagPluginConfiguration:
@@ -60,6 +76,30 @@ class DagPluginConfiguration:
         """
         return self.__config.get_value(DAGS_TIME_BETWEEN_STATUS_CHECK_SECONDS)
 
+    def dags_status_check_randomized_added_delay_seconds(self):
+        """
+        Returns the additional randomized delay time in seconds to the time between status checks for a job.
+
+        :return: the number of seconds for the additional randomized delay between status checks
+        """
+        return self.__config.get_value(DAGS_STATUS_CHECK_RANDOMIZED_ADDED_DELAY_SECONDS)
+
+    def dags_status_check_max_workers(self):
+        """
+        Returns the maximum number of job status checks done in parallel.
+
+        :return: the number of maximum parallel status checks
+        """
+        return self.__config.get_value(DAGS_STATUS_CHECK_MAX_WORKERS)
+
+    def dags_status_check_batch_enabled(self):
+        """
+        Returns whether the statuses of the running jobs are checked with a single batch call.
+
+        :return: True if batch status checks are enabled
+        """
+        return self.__config.get_value(DAGS_STATUS_CHECK_BATCH_ENABLED)
+
     def dags_max_concurrent_running_jobs(self):
         """
         Returns the limit of concurrent running jobs.
@@ -70,9 +110,49 @@ class DagPluginConfiguration:
         """
         return self.__config.get_value(DAGS_MAX_CONCURRENT_RUNNING_JOBS)
 
+    def dags_job_durations_cache_file(self):
+        """
+        Returns the path to the file where the durations of the jobs of previous DAG executions are cached.
+
+        :return: the path to the job durations cache file
+        """
+        return self.__config.get_value(DAGS_JOB_DURATIONS_CACHE_FILE)
+
+    def dags_job_durations_from_executions_history(self):
+        """
+        Returns whether the durations of the jobs are estimated from their executions history.
+
+        :return: True if the executions history of the jobs is used
+        """
+        return self.__config.get_value(DAGS_JOB_DURATIONS_FROM_EXECUTIONS_HISTORY)
+
+    def dags_incremental_execution_enabled(self):
+        """
+        Returns whether jobs which are up-to-date with their last successful run are skipped.
+
+        :return: True if the incremental execution is enabled
+        """
+        return self.__config.get_value(DAGS_INCREMENTAL_EXECUTION_ENABLED)
+
+    def dags_incremental_execution_state_file(self):
+        """
+        Returns the path to the file where the fingerprints of the last successful job runs are stored.
+
+        :return: the path to the incremental execution state file
+        """
+        return self.__config.get_value(DAGS_INCREMENTAL_EXECUTION_STATE_FILE)
+
     def dags_job_executor_type(self):
         return self.__config.get_value(DAGS_JOB_EXECUTOR_TYPE)
 
+    def dags_local_process_pool_size(self):
+        """
+        Returns the number of worker processes used by the 'local-process-pool' job executor.
+
+        :return: the number of worker processes or 0 for the number of CPUs of the machine
+        """
+        return self.__config.get_value(DAGS_LOCAL_PROCESS_POOL_SIZE)
+
 
 def add_definitions(config_builder: ConfigurationBuilder):
     """
@@ -123,6 +203,35 @@ def add_definitions(config_builder: ConfigurationBuilder):
             "consuming too many resources. It's advisable to use the default value and avoid changing it."
         ),
     )
+    config_builder.add(
+        key=DAGS_STATUS_CHECK_RANDOMIZED_ADDED_DELAY_SECONDS,
+        default_value=5,
+        description=(
+            "This sets an additional randomized delay time in seconds to the time interval between status checks "
+            "for a job. For instance, setting this option to 5 seconds would mean the system adds a random delay of "
+            "up to 5 seconds before checking the job status again. The randomized delay staggers the status checks "
+            "of the jobs in time instead of checking all of them at once."
+        ),
+    )
+    config_builder.add(
+        key=DAGS_STATUS_CHECK_MAX_WORKERS,
+        default_value=8,
+        description=(
+            "This sets the maximum number of job status checks done in parallel. "
+            "Status checks of jobs which are due at the same time are done on a pool of that many threads "
+            "instead of one after another. Set to 1 to check the statuses sequentially."
+        ),
+    )
+    config_builder.add(
+        key=DAGS_STATUS_CHECK_BATCH_ENABLED,
+        default_value=False,
+        description=(
+            "If enabled, the statuses of the running jobs of a team are checked with a single batch call "
+            "(e.g. one GraphQL executions query to the Control Service for the 'remote' executor) "
+            "instead of one call per job. Jobs which status cannot be found this way are checked one by one. "
+            "It requires Control Service which supports the GraphQL executions query."
+        ),
+    )
     config_builder.add(
         key=DAGS_MAX_CONCURRENT_RUNNING_JOBS,
         default_value=15,
@@ -133,13 +242,65 @@ def add_definitions(config_builder: ConfigurationBuilder):
             "resources. It's advisable to use the default value for this variable."
         ),
     )
+    config_builder.add(
+        key=DAGS_JOB_DURATIONS_CACHE_FILE,
+        default_value=os.path.join(
+            tempfile.gettempdir(), "vdk-dags", "job-durations.json"
+        ),
+        description=(
+            "The path to the file where the durations of the successfully finished jobs are cached. "
+            "When several jobs are ready to start, the DAG starts first the ones with the longest remaining "
+            "(critical) path of jobs, which is computed from the jobs durations."
+        ),
+    )
+    config_builder.add(
+        key=DAGS_JOB_DURATIONS_FROM_EXECUTIONS_HISTORY,
+        default_value=False,
+        description=(
+            "If enabled, the durations of the jobs which are not in the job durations cache are estimated "
+            "from their recent successful executions (one executions list call per job before the DAG starts). "
+            "The durations are used to compute the critical path of the DAG and prioritize the jobs on it."
+        ),
+    )
+    config_builder.add(
+        key=DAGS_INCREMENTAL_EXECUTION_ENABLED,
+        default_value=False,
+        description=(
+            "If enabled, each job of the DAG is fingerprinted using its source (directory hash for local jobs, "
+            "deployed job version for remote jobs), its arguments and the fingerprints of the jobs it depends on. "
+            "A job whose fingerprint matches the one of its last successful run in the DAG is skipped. "
+            "This way a failed DAG can be re-run and continue from the point of failure. "
+            "The fingerprints are cleared when all jobs of the DAG succeed, so the next run runs all jobs."
+        ),
+    )
+    config_builder.add(
+        key=DAGS_INCREMENTAL_EXECUTION_STATE_FILE,
+        default_value=os.path.join(
+            tempfile.gettempdir(), "vdk-dags", "job-fingerprints.json"
+        ),
+        description=(
+            "The path to the file where the fingerprints of the successful job runs of DAGs which have not "
+            "completed successfully yet are stored when DAGS_INCREMENTAL_EXECUTION_ENABLED is set."
+        ),
+    )
     config_builder.add(
         key=DAGS_JOB_EXECUTOR_TYPE,
         default_value="remote",
         description=(
             "The job executor to use when running the jobs within the DAG"
-            "There are two possible values : 'remote' and 'local'."
+            "There are three possible values : 'remote', 'local' and 'local-process-pool'."
             "'remote' executor would run the jobs deployed in the control service."
             "'local' executor will try to find the jobs in the current working directory"
+            "'local-process-pool' executor will find the jobs the same way as 'local' but will run them "
+            "in a pool of reused worker processes instead of starting a new process for each job."
+        ),
+    )
+    config_builder.add(
+        key=DAGS_LOCAL_PROCESS_POOL_SIZE,
+        default_value=0,
+        description=(
+            "The number of worker processes used by the 'local-process-pool' job executor. "
+            "If 0, the number of CPUs of the machine is used. Jobs started when all workers are busy "
+            "wait (in submitted status) for a free worker."
         ),
     )
@@ -21,6 +21,7 @@ allowed_job_keys = {
     "fail_dag_on_error",
     "depends_on",
     "arguments",
+    "priority",
 }
 required_job_keys = {"job_name", "depends_on"}
 
@@ -67,6 +68,8 @@ class DagValidator:
             self._validate_fail_dag_on_error(job_name, job["fail_dag_on_error"])
         if "arguments" in job:
             self._validate_arguments(job_name, job["arguments"])
+        if "priority" in job:
+            self._validate_priority(job_name, job["priority"])
         log.debug(f"Successfully validated job: {job_name}")
 
     def _validate_job_type(self, job: Dict):
@@ -155,6 +158,17 @@ class DagValidator:
                 jobs,
             )
 
+    def _validate_priority(self, job_name: str, priority: int):
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            jobs = [job_name]
+            raise DagValidationException(
+                ERROR.TYPE,
+                "The type of the job dict key priority is not int.",
+                f"Change the Data Job Dict value of priority. "
+                f"Current type is {type(priority)}. Expected type is int.",
+                jobs,
+            )
+
     def _validate_arguments(self, job_name: str, job_args: dict):
         if not isinstance(job_args, dict):
             jobs = [job_name]
@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 import abc
 from dataclasses import dataclass
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from taurus_datajob_api import DataJobExecution
 from vdk.api.job_input import IJobArguments
@@ -68,6 +70,36 @@ class IDataJobExecutor(abc.ABC):
         """
         pass
 
+    def status_jobs(
+        self, team_name: str, executions: List[Tuple[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Get the current statuses of several data job executions of a team with a single (batch) call.
+        Executors which do not support batch status lookups should not override it.
+        :param team_name: Name of the team owning the data jobs.
+        :param executions: list of (job name, execution id) pairs.
+        :return: dictionary of execution id to status in string as defined by Control Service API.
+                 Executions missing from the dictionary will be checked one by one with status_job.
+                 None if batch status lookups are not supported.
+        """
+        return None
+
+    def job_source_version(self, job_name: str, team_name: str) -> Optional[str]:
+        """
+        Get the version of the source code of a data job which would be run by start_job.
+        It is used to detect if a job has changed since its last run.
+        :param job_name: Name of the data job.
+        :param team_name: Name of the team owning the data job.
+        :return: the version (e.g. hash or commit) of the job source or None if it cannot be determined.
+        """
+        return None
+
+    def shutdown(self) -> None:
+        """
+        Release the resources of the executor (e.g. worker processes). Called when the DAG finishes.
+        """
+        pass
+
 
 @dataclass
 class TrackableJob(dag.SingleJob):
@@ -80,3 +112,4 @@ class TrackableJob(dag.SingleJob):
     details: dict = None
     start_attempt = 0
     last_status_time = 0
+    next_status_time = 0
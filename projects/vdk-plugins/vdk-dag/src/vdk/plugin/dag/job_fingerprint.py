@@ -0,0 +1,137 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import json
+import logging
+import os
+import pathlib
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from vdk.plugin.dag.local_json_file import read_json_file
+from vdk.plugin.dag.local_json_file import update_json_file
+
+log = logging.getLogger(__name__)
+
+# files and directories which do not change the behaviour of a job
+_IGNORED_NAMES = {"__pycache__", ".git", ".ipynb_checkpoints", ".DS_Store"}
+_IGNORED_SUFFIXES = (".pyc", ".pyo")
+
+
+def get_directory_hash(directory: str) -> str:
+    """
+    Computes a hash of the content of a directory (e.g. the source of a data job).
+    The hash changes if any file is added, removed, renamed or modified.
+    """
+    digest = hashlib.sha256()
+    for root, dir_names, file_names in os.walk(directory):
+        dir_names[:] = sorted(d for d in dir_names if d not in _IGNORED_NAMES)
+        for file_name in sorted(file_names):
+            if file_name in _IGNORED_NAMES or file_name.endswith(_IGNORED_SUFFIXES):
+                continue
+            file_path = os.path.join(root, file_name)
+            relative_path = os.path.relpath(file_path, directory).replace(os.sep, "/")
+            digest.update(relative_path.encode("utf-8"))
+            digest.update(b"\0")
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_job_fingerprint(
+    team_name: str,
+    job_name: str,
+    source_version: Optional[str],
+    arguments: Optional[dict],
+    upstream_fingerprints: Iterable[Optional[str]],
+) -> Optional[str]:
+    """
+    Computes the fingerprint of a job run in a DAG - the job source, its arguments and
+    the fingerprints of the jobs it depends on.
+    Two runs of the job with the same fingerprint are expected to produce the same result.
+
+    :return: the fingerprint or None if the job source or any of the upstream fingerprints is unknown
+    """
+    upstream_fingerprints = list(upstream_fingerprints)
+    if source_version is None or None in upstream_fingerprints:
+        return None
+    data = dict(
+        team_name=team_name,
+        job_name=job_name,
+        source_version=source_version,
+        arguments=arguments or {},
+        upstream_fingerprints=sorted(upstream_fingerprints),
+    )
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class JobFingerprintsStore:
+    """
+    Local (file) store of the fingerprints of the successful job runs of a DAG run which has not completed yet.
+    The file is shared by all DAGs, so it is updated under a lock (see update_json_file).
+    The store is best effort - failures to read or write it are logged and ignored.
+    """
+
+    def __init__(self, file_path: str, dag_name: str):
+        self._file_path = pathlib.Path(file_path)
+        self._dag_name = dag_name
+        self._fingerprints: Optional[Dict[str, str]] = None
+
+    def _key(self, team_name: str, job_name: str) -> str:
+        return f"{self._dag_name}/{team_name}/{job_name}"
+
+    def get(self, team_name: str, job_name: str) -> Optional[str]:
+        return self._load().get(self._key(team_name, job_name))
+
+    def set(self, team_name: str, job_name: str, fingerprint: Optional[str]) -> None:
+        """
+        Records the fingerprint of a successful job run. Pass None to forget the last successful run.
+        """
+        key = self._key(team_name, job_name)
+        if self._load().get(key) == fingerprint:
+            return
+
+        def update(fingerprints: Dict[str, str]) -> None:
+            if fingerprint is None:
+                fingerprints.pop(key, None)
+            else:
+                fingerprints[key] = fingerprint
+
+        self._update(update)
+
+    def clear(self) -> None:
+        """
+        Forgets the fingerprints of all jobs of the DAG (e.g. when the DAG run completed successfully).
+        """
+        prefix = f"{self._dag_name}/"
+        if not any(key.startswith(prefix) for key in self._load()):
+            return
+
+        def update(fingerprints: Dict[str, str]) -> None:
+            for key in [key for key in fingerprints if key.startswith(prefix)]:
+                del fingerprints[key]
+
+        self._update(update)
+
+    def _update(self, update: Callable[[Dict[str, str]], None]) -> None:
+        try:
+            self._fingerprints = update_json_file(self._file_path, update)
+        except OSError as e:
+            log.warning(f"Could not write job fingerprints to {self._file_path}: {e}")
+
+    def _load(self) -> Dict[str, str]:
+        if self._fingerprints is None:
+            self._fingerprints = {}
+            try:
+                self._fingerprints = read_json_file(self._file_path)
+            except (OSError, ValueError) as e:
+                log.warning(
+                    f"Could not read job fingerprints from {self._file_path}: {e}"
+                )
+        return self._fingerprints
@@ -0,0 +1,165 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import heapq
+import itertools
+import logging
+import pathlib
+import statistics
+from datetime import datetime
+from graphlib import TopologicalSorter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from taurus_datajob_api import DataJobExecution
+from vdk.plugin.dag.local_json_file import read_json_file
+from vdk.plugin.dag.local_json_file import update_json_file
+from vdk.plugin.dag.remote_data_job import JobStatus
+
+log = logging.getLogger(__name__)
+
+# how many of the latest successful executions are used to estimate the duration of a job
+HISTORY_EXECUTIONS_COUNT = 5
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str) and value:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return None
+
+
+def get_duration_seconds(start_time, end_time) -> Optional[float]:
+    """
+    Returns the duration in seconds between start and end time (datetime or ISO 8601 string)
+    or None if any of them is missing.
+    """
+    start_time = _to_datetime(start_time)
+    end_time = _to_datetime(end_time)
+    if start_time is None or end_time is None:
+        return None
+    return max(0.0, (end_time - start_time).total_seconds())
+
+
+def get_duration_from_executions(
+    executions: Optional[List[DataJobExecution]],
+) -> Optional[float]:
+    """
+    Estimates the duration of a job as the median duration of its latest successful executions.
+
+    :param executions: the executions of the job - the last element is the latest execution
+    :return: the estimated duration in seconds or None if there are no successful executions
+    """
+    durations = []
+    for execution in reversed(executions or []):
+        if execution.status != JobStatus.SUCCEEDED.value:
+            continue
+        duration = get_duration_seconds(execution.start_time, execution.end_time)
+        if duration is not None:
+            durations.append(duration)
+        if len(durations) >= HISTORY_EXECUTIONS_COUNT:
+            break
+    return statistics.median(durations) if durations else None
+
+
+class JobDurationsCache:
+    """
+    Local (file) cache of the durations of the jobs of previous DAG executions.
+    The cache is best effort - failures to read or write it are logged and ignored.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = pathlib.Path(file_path)
+        self._durations: Optional[Dict[str, float]] = None
+
+    @staticmethod
+    def _key(team_name: str, job_name: str) -> str:
+        return f"{team_name}/{job_name}"
+
+    def get(self, team_name: str, job_name: str) -> Optional[float]:
+        return self._load().get(self._key(team_name, job_name))
+
+    def set(self, team_name: str, job_name: str, duration_seconds: float) -> None:
+        key = self._key(team_name, job_name)
+        try:
+            # the file is shared by all DAGs, so it is re-read to keep the durations written by the others
+            self._durations = update_json_file(
+                self._file_path,
+                lambda durations: durations.__setitem__(key, duration_seconds),
+            )
+        except OSError as e:
+            log.warning(f"Could not write job durations to {self._file_path}: {e}")
+
+    def _load(self) -> Dict[str, float]:
+        if self._durations is None:
+            self._durations = {}
+            try:
+                self._durations = read_json_file(self._file_path)
+            except (OSError, ValueError) as e:
+                log.warning(f"Could not read job durations from {self._file_path}: {e}")
+        return self._durations
+
+
+def get_critical_path_lengths(
+    dependencies: Dict[str, Iterable[str]], durations: Dict[str, float]
+) -> Dict[str, float]:
+    """
+    Computes for each job the length of the longest (critical) path from the job to the end of the DAG.
+    The length of a path is the sum of the durations of the jobs in it, including the job itself.
+    Jobs with unknown duration are assumed to take the average of the known durations.
+
+    :param dependencies: dictionary of job name to the names of the jobs it depends on
+    :param durations: dictionary of job name to its (estimated) duration in seconds
+    :return: dictionary of job name to its critical path length
+    """
+    known_durations = [d for d in durations.values() if d is not None]
+    default_duration = statistics.mean(known_durations) if known_durations else 1.0
+
+    dependants: Dict[str, List[str]] = {job_name: [] for job_name in dependencies}
+    for job_name, job_dependencies in dependencies.items():
+        for dependency in job_dependencies:
+            dependants.setdefault(dependency, []).append(job_name)
+
+    critical_path_lengths: Dict[str, float] = {}
+    # static_order returns each job before its dependants, so reversed each job comes after its dependants
+    for job_name in reversed(list(TopologicalSorter(dependencies).static_order())):
+        duration = durations.get(job_name)
+        critical_path_lengths[job_name] = (
+            default_duration if duration is None else duration
+        ) + max(
+            (critical_path_lengths[d] for d in dependants.get(job_name, [])),
+            default=0,
+        )
+    return critical_path_lengths
+
+
+class ReadyJobsQueue:
+    """
+    Priority queue of jobs ready to be started.
+    Jobs with higher explicit priority are dequeued first and
+    between jobs with the same explicit priority - the ones with longer critical path.
+    Jobs with the same priorities are dequeued in the order they were enqueued.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, float, int, str]] = []
+        self._counter = itertools.count()
+
+    def enqueue(
+        self, job_name: str, priority: float = 0, critical_path_length: float = 0
+    ) -> None:
+        heapq.heappush(
+            self._heap,
+            (-priority, -critical_path_length, next(self._counter), job_name),
+        )
+
+    def dequeue(self) -> Optional[str]:
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[-1]
+
+    def size(self) -> int:
+        return len(self._heap)
@@ -10,17 +10,35 @@ from datetime import datetime
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from taurus_datajob_api import DataJobExecution
 from vdk.internal.builtin_plugins.run.run_status import ExecutionStatus
 from vdk.internal.builtin_plugins.run.summary_output import JobSummaryParser
 from vdk.internal.core.error_classifiers import ResolvableBy
 from vdk.plugin.dag.dags import IDataJobExecutor
+from vdk.plugin.dag.job_fingerprint import get_directory_hash
 from vdk.plugin.dag.remote_data_job import JobStatus
 
 RUNNING_STATUSES = [JobStatus.RUNNING.value, JobStatus.SUBMITTED.value]
 
 
+def get_job_status(
+    execution_status: Optional[ExecutionStatus], blamee: Optional[ResolvableBy]
+) -> str:
+    """
+    Maps the status of a finished local data job run to the corresponding JobStatus value.
+    """
+    if execution_status == ExecutionStatus.SUCCESS:
+        return JobStatus.SUCCEEDED.value
+    elif execution_status == ExecutionStatus.SKIP_REQUESTED:
+        return JobStatus.SKIPPED.value
+    elif blamee in (ResolvableBy.USER_ERROR, ResolvableBy.CONFIG_ERROR):
+        return JobStatus.USER_ERROR.value
+    else:
+        return JobStatus.PLATFORM_ERROR.value
+
+
 class LocalDataJob:
     def __init__(self, job_path: str, job_name: str, team_name: str, arguments: dict):
         self._job_name = job_name
@@ -111,20 +129,11 @@ class LocalDataJob:
         content = pathlib.Path(self._summary_file).read_text()
         job_summary = JobSummaryParser.from_json(content)
 
-        if job_summary.status == ExecutionStatus.SUCCESS:
-            return JobStatus.SUCCEEDED.value
-        elif job_summary.status == ExecutionStatus.SKIP_REQUESTED:
-            return JobStatus.SKIPPED.value
-        else:
+        status = get_job_status(job_summary.status, job_summary.blamee)
+        if status not in (JobStatus.SUCCEEDED.value, JobStatus.SKIPPED.value):
             # update with summary only in case of failure
             self._update_message_with_summary(content)
-            if job_summary.blamee in (
-                ResolvableBy.USER_ERROR,
-                ResolvableBy.CONFIG_ERROR,
-            ):
-                return JobStatus.USER_ERROR.value
-            else:
-                return JobStatus.PLATFORM_ERROR.value
+        return status
 
     def _determine_status_without_summary(self, result: int) -> str:
         if result != 0:
@@ -155,7 +164,7 @@ class LocalDataJobExecutor(IDataJobExecutor):
         self._running_jobs: Dict[str, LocalDataJob] = dict()
 
     @staticmethod
-    def __find_job_path(job_name: str):
+    def _find_job_path(job_name: str):
         candidates = [
             os.getcwd(),
         ]
@@ -188,9 +197,9 @@ class LocalDataJobExecutor(IDataJobExecutor):
                 team_name,
                 f"Job run already has been started. Cannot start same job twice.",
             )
-        job_path = self.__find_job_path(job_name)
+        job_path = self._find_job_path(job_name)
 
-        job = LocalDataJob(
+        job = self._new_job(
             job_path,
             job_name,
             team_name,
@@ -199,6 +208,11 @@ class LocalDataJobExecutor(IDataJobExecutor):
         self._running_jobs[job_name] = job
         return job.start_run()
 
+    def _new_job(
+        self, job_path: str, job_name: str, team_name: str, arguments: dict
+    ) -> LocalDataJob:
+        return LocalDataJob(job_path, job_name, team_name, arguments)
+
     def status_job(self, job_name: str, team_name: str, execution_id: str) -> str:
         if job_name in self._running_jobs:
             return self._running_jobs.get(job_name).status()
@@ -215,3 +229,18 @@ class LocalDataJobExecutor(IDataJobExecutor):
         self, job_name: str, team_name: str
     ) -> Optional[List[DataJobExecution]]:
         return []
+
+    def status_jobs(
+        self, team_name: str, executions: List[Tuple[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        return {
+            execution_id: self._running_jobs[job_name].status()
+            for job_name, execution_id in executions
+            if job_name in self._running_jobs
+        }
+
+    def job_source_version(self, job_name: str, team_name: str) -> Optional[str]:
+        try:
+            return get_directory_hash(self._find_job_path(job_name))
+        except LocalDataJobRunException:
+            return None
@@ -0,0 +1,69 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+import pathlib
+import tempfile
+from contextlib import contextmanager
+from typing import Callable
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def _exclusive_lock(lock_path: pathlib.Path):
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def read_json_file(file_path: pathlib.Path) -> Dict:
+    """
+    :return: the content of the JSON file or an empty dict if the file does not exist
+    """
+    if not file_path.exists():
+        return {}
+    return json.loads(file_path.read_text())
+
+
+def update_json_file(file_path: pathlib.Path, update: Callable[[Dict], None]) -> Dict:
+    """
+    Reads the JSON file, changes its content in place with update and writes it back.
+    The file is updated under a lock (<file_path>.lock), so concurrent updates (e.g. of DAGs running at the same time)
+    are not lost, and is replaced by a temporary file, so readers never see a partially written file.
+
+    :return: the updated content
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with _exclusive_lock(file_path.with_name(f"{file_path.name}.lock")):
+        try:
+            content = read_json_file(file_path)
+        except ValueError:
+            # a corrupted file is overwritten
+            content = {}
+        update(content)
+        fd, temp_file_path = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                json.dump(content, temp_file)
+            os.replace(temp_file_path, file_path)
+        except BaseException:
+            os.remove(temp_file_path)
+            raise
+    return content
@@ -0,0 +1,331 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import contextlib
+import dataclasses
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+import uuid
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import cast
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from vdk.api.plugin.core_hook_spec import CoreHookSpecs
+from vdk.internal.builtin_plugins import builtin_hook_impl
+from vdk.internal.builtin_plugins.internal_hookspecs import InternalHookSpecs
+from vdk.internal.builtin_plugins.run.data_job import DataJobFactory
+from vdk.internal.builtin_plugins.run.execution_results import ExecutionResult
+from vdk.internal.builtin_plugins.run.execution_tracking import ExecutionTrackingPlugin
+from vdk.internal.builtin_plugins.run.run_status import ExecutionStatus
+from vdk.internal.core.config import ConfigurationBuilder
+from vdk.internal.core.context import CoreContext
+from vdk.internal.core.errors import find_whom_to_blame_from_exception
+from vdk.internal.core.statestore import StateStore
+from vdk.internal.plugin.plugin import PluginRegistry
+from vdk.plugin.dag.local_executor import get_job_status
+from vdk.plugin.dag.local_executor import LocalDataJobExecutor
+from vdk.plugin.dag.remote_data_job import JobStatus
+
+log = logging.getLogger(__name__)
+
+# The plugins discovered from the setuptools entry points when the worker process was started.
+# They are registered again in a new plugin registry for each job run by the worker.
+_worker_plugins: Optional[List[Tuple[str, object]]] = None
+
+
+def _initialize_worker() -> None:
+    """
+    Pre-warms a worker process: discovers and imports all installed vdk plugins once,
+    so that the jobs run by the worker do not pay for it.
+    """
+    global _worker_plugins
+    plugin_registry = PluginRegistry()
+    plugin_registry.load_plugins_from_setuptools_entrypoints()
+    _worker_plugins = plugin_registry.list_plugins()
+
+
+def _new_plugin_registry() -> PluginRegistry:
+    if _worker_plugins is None:
+        _initialize_worker()
+    plugin_registry = PluginRegistry()
+    plugin_registry.add_hook_specs(InternalHookSpecs)
+    for name, plugin in _worker_plugins:
+        plugin_registry.load_plugin_with_hooks_impl(plugin, name)
+    plugin_registry.add_hook_specs(CoreHookSpecs)
+    plugin_registry.load_plugin_with_hooks_impl(builtin_hook_impl, "core-plugin")
+    return plugin_registry
+
+
+def _to_transferable_exception(
+    exception: Optional[BaseException],
+) -> Optional[BaseException]:
+    if exception is None:
+        return None
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return Exception(f"{type(exception).__name__}: {exception}")
+
+
+def _to_transferable_result(execution_result: ExecutionResult) -> ExecutionResult:
+    """
+    Makes sure the execution result can be sent back to the DAG process.
+    Exceptions which cannot be pickled are replaced with their description.
+    """
+    blamee = execution_result.get_blamee() if execution_result.is_failed() else None
+    return ExecutionResult(
+        execution_result.data_job_name,
+        execution_result.execution_id,
+        execution_result.start_time,
+        execution_result.end_time,
+        execution_result.status,
+        [
+            dataclasses.replace(
+                step, exception=_to_transferable_exception(step.exception)
+            )
+            for step in execution_result.steps_list
+        ],
+        _to_transferable_exception(execution_result.exception),
+        blamee,
+    )
+
+
+def _close_root_log_handlers() -> None:
+    # The job configures the logging to write to its log file which is closed after the job finishes.
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+
+
+@contextlib.contextmanager
+def _restored_process_state():
+    """
+    Restores the state of the worker process changed by a job:
+    the environment variables, the working directory and the import path.
+    """
+    environ = dict(os.environ)
+    cwd = os.getcwd()
+    sys_path = list(sys.path)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(environ)
+        os.chdir(cwd)
+        sys.path[:] = sys_path
+
+
+def run_job_in_worker(
+    job_path: str, job_name: str, arguments: Optional[dict], log_file: str
+) -> ExecutionResult:
+    """
+    Runs a data job in the current (worker) process the same way "vdk run" would.
+
+    :return: the execution result of the job run
+    """
+    start_time = datetime.utcnow()
+    with _restored_process_state(), open(
+        log_file, "w"
+    ) as log_file_handle, contextlib.redirect_stdout(
+        log_file_handle
+    ), contextlib.redirect_stderr(
+        log_file_handle
+    ):
+        core_context = None
+        execution_result = None
+        try:
+            plugin_registry = _new_plugin_registry()
+            command_line_args = ["run", job_path] + (
+                ["--arguments", json.dumps(arguments)] if arguments else []
+            )
+            hook = cast(CoreHookSpecs, plugin_registry.hook())
+            hook.vdk_start.call_historic(
+                kwargs=dict(
+                    plugin_registry=plugin_registry,
+                    command_line_args=command_line_args,
+                )
+            )
+            config_builder = ConfigurationBuilder()
+            hook.vdk_configure(config_builder=config_builder)
+            core_context = CoreContext(
+                plugin_registry, config_builder.build(), StateStore()
+            )
+            plugin_registry.load_plugin_with_hooks_impl(ExecutionTrackingPlugin())
+            hook.vdk_initialize(context=core_context)
+
+            job = DataJobFactory.new_datajob(
+                pathlib.Path(job_path), core_context, job_name
+            )
+            execution_result = job.run(arguments)
+        except Exception as e:
+            log.exception(f"Failed to run data job {job_name}.")
+            execution_result = ExecutionResult(
+                job_name,
+                "",
+                start_time,
+                datetime.utcnow(),
+                ExecutionStatus.ERROR,
+                [],
+                e,
+                find_whom_to_blame_from_exception(e),
+            )
+        finally:
+            if core_context is not None:
+                exit_code = (
+                    1 if execution_result is None or execution_result.is_failed() else 0
+                )
+                cast(CoreHookSpecs, core_context.plugin_registry.hook()).vdk_exit(
+                    context=core_context, exit_code=exit_code
+                )
+            _close_root_log_handlers()
+    return _to_transferable_result(execution_result)
+
+
+class LocalProcessPoolDataJob:
+    """
+    A local data job run submitted to a pool of worker processes.
+    Exposes the same interface as LocalDataJob.
+    """
+
+    def __init__(
+        self,
+        pool: ProcessPoolExecutor,
+        job_path: str,
+        job_name: str,
+        team_name: str,
+        arguments: dict,
+    ):
+        self._pool = pool
+        self._job_name = job_name
+        self._team_name = team_name
+        self._job_path = job_path
+        self._arguments = arguments
+
+        self._temp_dir = os.path.join(tempfile.gettempdir(), "vdk-jobs", job_name)
+        pathlib.Path(self._temp_dir).mkdir(parents=True, exist_ok=True)
+        self._log_file = None
+        self._future: Optional[Future] = None
+        self._start_time = None
+        self._end_time = None
+        self._message = None
+
+    def start_run(self) -> str:
+        execution_id = f"{self._job_name}-{uuid.uuid4().hex[:8]}"
+        # each execution has its own log file, so concurrent DAGs running the job do not write to the same file
+        self._log_file = os.path.join(self._temp_dir, f"run-{execution_id}.log")
+        self._future = self._pool.submit(
+            run_job_in_worker,
+            self._job_path,
+            self._job_name,
+            self._arguments,
+            self._log_file,
+        )
+        self._start_time = datetime.now()
+        self._message = {"logs": self._log_file}
+        return execution_id
+
+    def details(self) -> Dict:
+        details = dict(
+            start_time=self._start_time,
+            end_time=self._end_time,
+            status=self.status(),
+            message=self._message,
+            started_by="",
+            type="local",
+            deployment=None,
+        )
+        return details
+
+    def status(self) -> str:
+        if not self._future:
+            return JobStatus.SUBMITTED.value
+        if not self._future.done():
+            # a job waiting for a free worker is reported as running too - future.running() does not tell
+            # queued from running jobs reliably and both are active for the DAG
+            return JobStatus.RUNNING.value
+
+        if not self._end_time:
+            self._end_time = datetime.now()
+
+        exception = self._future.exception()
+        if exception is not None:
+            # the worker process itself failed (e.g. it was killed)
+            self._message = {
+                "summary": {"details": f"{type(exception).__name__}: {exception}"},
+                "logs": self._log_file,
+            }
+            return JobStatus.PLATFORM_ERROR.value
+
+        execution_result: ExecutionResult = self._future.result()
+        status = get_job_status(execution_result.status, execution_result.blamee)
+        if status not in (JobStatus.SUCCEEDED.value, JobStatus.SKIPPED.value):
+            self._message = {
+                "summary": {
+                    "status": execution_result.status,
+                    "blamee": execution_result.blamee,
+                    "details": execution_result.get_details(),
+                },
+                "logs": self._log_file,
+            }
+        return status
+
+
+class LocalProcessPoolDataJobExecutor(LocalDataJobExecutor):
+    """
+    Executes local Data Jobs in a pool of pre-warmed worker processes
+    instead of starting a new "vdk run" process for each job.
+
+    Each worker runs a single job, so no state (imported modules, environment, global variables) leaks between jobs.
+    A new worker is started and pre-warmed (the interpreter is started and the plugins are imported)
+    as soon as one finishes its job, so the next job usually does not wait for it.
+    On Python versions before 3.11, which cannot replace the workers, the workers are reused and
+    the environment, working directory and import path are restored after each job
+    (but modules imported by a job stay imported).
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__()
+        self._max_workers = max_workers or None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            kwargs = {}
+            if sys.version_info >= (3, 11):
+                kwargs["max_tasks_per_child"] = 1
+            # spawn, since forking the DAG process (which uses threads) is not safe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                **kwargs,
+            )
+        return self._pool
+
+    def _new_job(
+        self, job_path: str, job_name: str, team_name: str, arguments: dict
+    ) -> LocalProcessPoolDataJob:
+        return LocalProcessPoolDataJob(
+            self._get_pool(), job_path, job_name, team_name, arguments
+        )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            kwargs = {}
+            if sys.version_info >= (3, 9):
+                # the jobs which have not started yet are not needed anymore (e.g. the DAG failed)
+                kwargs["cancel_futures"] = True
+            self._pool.shutdown(wait=True, **kwargs)
+            self._pool = None
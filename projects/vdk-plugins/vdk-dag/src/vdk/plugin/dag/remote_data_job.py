@@ -5,13 +5,18 @@ import os
 import time
 import uuid
 from enum import Enum
+from typing import Dict
 from typing import List
 from typing import Optional
 
 from taurus_datajob_api import ApiClient
 from taurus_datajob_api import Configuration
+from taurus_datajob_api import DataJobDeploymentStatus
 from taurus_datajob_api import DataJobExecution
 from taurus_datajob_api import DataJobExecutionRequest
+from taurus_datajob_api import DataJobQueryResponse
+from taurus_datajob_api import DataJobsApi
+from taurus_datajob_api import DataJobsDeploymentApi
 from taurus_datajob_api import DataJobsExecutionApi
 from urllib3 import Retry
 from vdk.api.job_input import IJobArguments
@@ -90,7 +95,10 @@ class RemoteDataJob:
         )
         self.http_read_retries = int(os.getenv("VDK_CONTROL_HTTP_READ_RETRIES", "6"))
 
-        self.__execution_api = self._get_execution_api()
+        self.__api_client = self._get_api_client()
+        self.__execution_api = DataJobsExecutionApi(self.__api_client)
+        self.__jobs_api = DataJobsApi(self.__api_client)
+        self.__deployment_api = DataJobsDeploymentApi(self.__api_client)
 
     def start_job_execution(self) -> str:
         """
@@ -166,6 +174,45 @@ class RemoteDataJob:
         )
         return job_execution_list
 
+    def get_job_deployment(self) -> DataJobDeploymentStatus:
+        """
+        Returns the deployment of the data job which is run by start_job_execution.
+
+        :return: The deployment status object with details like the deployed job version
+        """
+        return self.__deployment_api.deployment_read(
+            team_name=self.__team_name,
+            job_name=self.__job_name,
+            deployment_id=self.deployment_id,
+            _request_timeout=self.timeout,
+        )
+
+    def get_latest_team_job_executions(
+        self, job_names: List[str], page_size: int
+    ) -> List[Dict]:
+        """
+        Returns the latest executions of several data jobs of the team with a single GraphQL query.
+        The executions are sorted by start time - the latest are first.
+
+        :param job_names: the names of the data jobs (of the team) which executions to return
+        :param page_size: the maximum number of executions to return
+        :return: A list of dictionaries with the id, jobName and status of each execution.
+        """
+        job_names_filter = ", ".join(f'"{job_name}"' for job_name in job_names)
+        query = (
+            "query { executions("
+            f"pageNumber: 1, pageSize: {page_size}, "
+            f'filter: {{ teamNameIn: ["{self.__team_name}"], jobNameIn: [{job_names_filter}] }}, '
+            'order: { property: "startTime", direction: DESC }'
+            ") { content { id jobName status } } }"
+        )
+        response: DataJobQueryResponse = self.__jobs_api.jobs_query(
+            team_name=self.__team_name, query=query, _request_timeout=self.timeout
+        )
+        if response.errors:
+            raise ValueError(f"Failed to query job executions: {response.errors}")
+        return response.data.content if response.data and response.data.content else []
+
     def wait_for_job(
         self,
         execution_id,
@@ -217,7 +264,7 @@ class RemoteDataJob:
                 )
             return job_status
 
-    def _get_execution_api(self):
+    def _get_api_client(self):
         rest_api_url = self.__rest_api_url
 
         config = Configuration(host=rest_api_url, api_key=None)
@@ -239,7 +286,7 @@ class RemoteDataJob:
         # to troubleshoot and trace requests across different services
         api_client.set_default_header("X-OPID", self.op_id)
 
-        return DataJobsExecutionApi(api_client)
+        return api_client
 
     def _get_access_token(self) -> str:
         if self.auth:
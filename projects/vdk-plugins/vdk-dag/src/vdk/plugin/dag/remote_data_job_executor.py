@@ -1,7 +1,9 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from taurus_datajob_api import DataJobExecution
 from vdk.api.job_input import IJobArguments
@@ -52,3 +54,27 @@ class RemoteDataJobExecutor(IDataJobExecutor):
         job = RemoteDataJob(job_name, team_name, vdk_cfg.control_service_rest_api_url)
         executions_list = job.get_job_executions()
         return executions_list
+
+    def status_jobs(
+        self, team_name: str, executions: List[Tuple[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        vdk_cfg = VDKConfig()
+        job_names = sorted({job_name for job_name, _ in executions})
+        job = RemoteDataJob(
+            job_names[0], team_name, vdk_cfg.control_service_rest_api_url
+        )
+        # Few more than the number of executions we look for
+        # in case some of the jobs have been started again by somebody else since.
+        latest_executions = job.get_latest_team_job_executions(
+            job_names, page_size=len(executions) * 3
+        )
+        return {
+            execution["id"]: str(execution["status"]).lower()
+            for execution in latest_executions
+            if execution.get("id") and execution.get("status")
+        }
+
+    def job_source_version(self, job_name: str, team_name: str) -> Optional[str]:
+        vdk_cfg = VDKConfig()
+        job = RemoteDataJob(job_name, team_name, vdk_cfg.control_service_rest_api_url)
+        return job.get_job_deployment().job_version
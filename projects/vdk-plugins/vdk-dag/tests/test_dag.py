@@ -3,6 +3,7 @@
 import json
 import os
 import re
+import tempfile
 import time
 from datetime import date
 from datetime import datetime
@@ -38,6 +39,13 @@ class DummyDAGPluginConfiguration:
         self.dags_dag_execution_check_time_period_seconds_value = 10
         self.dags_time_between_status_check_seconds_value = 40
         self.dags_max_concurrent_running_jobs_value = 15
+        self.dags_status_check_randomized_added_delay_seconds_value = 0
+        self.dags_status_check_max_workers_value = 8
+        self.dags_status_check_batch_enabled_value = False
+        self.dags_job_durations_cache_file_value = os.path.join(
+            tempfile.mkdtemp(), "job-durations.json"
+        )
+        self.dags_job_durations_from_executions_history_value = False
 
     def dags_delayed_jobs_min_delay_seconds(self):
         return self.dags_delayed_jobs_min_delay_seconds_value
@@ -54,6 +62,21 @@ class DummyDAGPluginConfiguration:
     def dags_max_concurrent_running_jobs(self):
         return self.dags_max_concurrent_running_jobs_value
 
+    def dags_status_check_randomized_added_delay_seconds(self):
+        return self.dags_status_check_randomized_added_delay_seconds_value
+
+    def dags_status_check_max_workers(self):
+        return self.dags_status_check_max_workers_value
+
+    def dags_status_check_batch_enabled(self):
+        return self.dags_status_check_batch_enabled_value
+
+    def dags_job_durations_cache_file(self):
+        return self.dags_job_durations_cache_file_value
+
+    def dags_job_durations_from_executions_history(self):
+        return self.dags_job_durations_from_executions_history_value
+
 
 dummy_config = DummyDAGPluginConfiguration()
 
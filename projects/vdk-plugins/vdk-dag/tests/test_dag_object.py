@@ -1,11 +1,15 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import os
+import tempfile
 import time
 from unittest.mock import call
 from unittest.mock import MagicMock
 
+import pytest
 from vdk.plugin.dag.cached_data_job_executor import TrackingDataJobExecutor
 from vdk.plugin.dag.dag import Dag
+from vdk.plugin.dag.remote_data_job import JobStatus
 
 # We overall eschew unit tests in favor of functional tests in test_dag
 # Still some functionalities are more easily tested in unit tests so we add here some.
@@ -27,9 +31,33 @@ class DummyDAGPluginConfiguration:
     def dags_max_concurrent_running_jobs(self):
         return 15
 
+    def dags_status_check_randomized_added_delay_seconds(self):
+        return 0
+
+    def dags_status_check_max_workers(self):
+        return 8
+
+    def dags_status_check_batch_enabled(self):
+        return False
+
+    def dags_job_durations_cache_file(self):
+        return os.path.join(tempfile.mkdtemp(), "job-durations.json")
+
+    def dags_job_durations_from_executions_history(self):
+        return False
+
     def dags_job_executor_type(self):
         return "remote"
 
+    def dags_local_process_pool_size(self):
+        return 0
+
+    def dags_incremental_execution_enabled(self):
+        return False
+
+    def dags_incremental_execution_state_file(self):
+        return os.path.join(tempfile.mkdtemp(), "job-fingerprints.json")
+
 
 def test_execute_dag_happy_case():
     job1 = dict(job_name="job1", depends_on=[])
@@ -55,6 +83,19 @@ def test_execute_dag_happy_case():
         call("job3"),
         call("job4"),
     ] == dag._job_executor.start_job.call_args_list
+    dag._job_executor.shutdown.assert_called_once()
+
+
+def test_execute_dag_shuts_down_executor_on_failure():
+    dag = Dag("team", DummyDAGPluginConfiguration())
+    dag.build_dag([dict(job_name="job1", depends_on=[])])
+    dag._job_executor = MagicMock(spec=TrackingDataJobExecutor)
+    dag._job_executor.start_job.side_effect = RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        dag.execute_dag()
+
+    dag._job_executor.shutdown.assert_called_once()
 
 
 def test_execute_dag_busyloop():
@@ -82,8 +123,162 @@ def test_execute_dag_busyloop():
             return []
 
     dag._job_executor.get_finished_job_names.side_effect = mock_get_finished_job_names
+    # no job finishes while waiting
+    dag._job_executor.wait_for_finished_jobs.side_effect = time.sleep
 
     dag.execute_dag()
 
     # check for busyloop (this would have been called hundreds of times if there is busyloop bug)
     assert calls[0] <= 4
+
+
+class SingleRunningJobDAGPluginConfiguration(DummyDAGPluginConfiguration):
+    def dags_max_concurrent_running_jobs(self):
+        return 1
+
+
+def _execute_dag_one_job_at_a_time(jobs):
+    dag = Dag("team", SingleRunningJobDAGPluginConfiguration())
+    dag.build_dag(jobs)
+    dag._job_executor = MagicMock(spec=TrackingDataJobExecutor)
+
+    running = []
+    finished = []
+
+    def get_finished_job_names():
+        if running:
+            finished.append(running.pop(0))
+        return list(finished)
+
+    dag._job_executor.start_job.side_effect = running.append
+    dag._job_executor.get_currently_running_jobs.side_effect = lambda: list(running)
+    dag._job_executor.get_finished_job_names.side_effect = get_finished_job_names
+
+    dag.execute_dag()
+    return [c.args[0] for c in dag._job_executor.start_job.call_args_list]
+
+
+def test_execute_dag_starts_critical_path_first():
+    jobs = [
+        dict(job_name="a", depends_on=[]),
+        dict(job_name="b", depends_on=[]),
+        dict(job_name="c", depends_on=["b"]),
+        dict(job_name="d", depends_on=["c"]),
+    ]
+
+    assert _execute_dag_one_job_at_a_time(jobs) == ["b", "c", "a", "d"]
+
+
+def test_execute_dag_starts_explicit_priority_first():
+    jobs = [
+        dict(job_name="a", depends_on=[], priority=10),
+        dict(job_name="b", depends_on=[]),
+        dict(job_name="c", depends_on=["b"]),
+        dict(job_name="d", depends_on=["c"]),
+    ]
+
+    assert _execute_dag_one_job_at_a_time(jobs) == ["a", "b", "c", "d"]
+
+
+class IncrementalDAGPluginConfiguration(DummyDAGPluginConfiguration):
+    def __init__(self, state_file):
+        self._state_file = state_file
+
+    def dags_incremental_execution_enabled(self):
+        return True
+
+    def dags_incremental_execution_state_file(self):
+        return self._state_file
+
+
+def _execute_incremental_dag(state_file, source_versions, failing_jobs=()):
+    jobs = [
+        dict(job_name="job1", depends_on=[], fail_dag_on_error=False),
+        dict(job_name="job2", depends_on=["job1"], fail_dag_on_error=False),
+        dict(job_name="job3", depends_on=["job2"], fail_dag_on_error=False),
+        dict(job_name="job4", depends_on=[], fail_dag_on_error=False),
+    ]
+    dag = Dag("team", IncrementalDAGPluginConfiguration(state_file))
+    dag.build_dag(jobs)
+    dag._job_executor = MagicMock(spec=TrackingDataJobExecutor)
+
+    started = []
+    finished = []
+
+    def start_job(job_name):
+        started.append(job_name)
+        job = dag._jobs[job_name]
+        job.execution_id = f"{job_name}-execution"
+        job.status = (
+            JobStatus.USER_ERROR.value
+            if job_name in failing_jobs
+            else JobStatus.SUCCEEDED.value
+        )
+        finished.append(job_name)
+
+    def skip_job(job_name, details):
+        dag._jobs[job_name].status = JobStatus.SKIPPED.value
+        finished.append(job_name)
+
+    dag._job_executor.start_job.side_effect = start_job
+    dag._job_executor.skip_job.side_effect = skip_job
+    dag._job_executor.get_currently_running_jobs.return_value = []
+    dag._job_executor.get_finished_job_names.side_effect = lambda: list(finished)
+    dag._job_executor.get_job_source_version.side_effect = (
+        lambda job_name, team_name: source_versions.get(job_name)
+    )
+
+    dag.execute_dag()
+    return sorted(started)
+
+
+def test_execute_dag_incremental_resumes_from_failure(tmp_path):
+    state_file = str(tmp_path / "job-fingerprints.json")
+    source_versions = dict(job1="v1", job2="v1", job3="v1", job4="v1")
+
+    assert _execute_incremental_dag(
+        state_file, source_versions, failing_jobs=["job2"]
+    ) == ["job1", "job2", "job3", "job4"]
+    # job1 and job4 succeeded, job2 failed and job3 depends on it
+    assert _execute_incremental_dag(state_file, source_versions) == ["job2", "job3"]
+    # the DAG run completed successfully, so the next run runs all jobs
+    assert _execute_incremental_dag(state_file, source_versions) == [
+        "job1",
+        "job2",
+        "job3",
+        "job4",
+    ]
+
+
+def test_execute_dag_incremental_runs_all_jobs_after_success(tmp_path):
+    state_file = str(tmp_path / "job-fingerprints.json")
+    source_versions = dict(job1="v1", job2="v1", job3="v1", job4="v1")
+
+    for _ in range(2):
+        assert _execute_incremental_dag(state_file, source_versions) == [
+            "job1",
+            "job2",
+            "job3",
+            "job4",
+        ]
+
+
+def test_execute_dag_incremental_reruns_changed_jobs_and_dependants(tmp_path):
+    state_file = str(tmp_path / "job-fingerprints.json")
+    source_versions = dict(job1="v1", job2="v1", job3="v1", job4="v1")
+    _execute_incremental_dag(state_file, source_versions, failing_jobs=["job3"])
+
+    source_versions["job1"] = "v2"
+    assert _execute_incremental_dag(state_file, source_versions) == [
+        "job1",
+        "job2",
+        "job3",
+    ]
+
+
+def test_execute_dag_incremental_runs_jobs_with_unknown_source_version(tmp_path):
+    state_file = str(tmp_path / "job-fingerprints.json")
+    source_versions = dict(job1="v1", job2="v1", job3="v1")
+    _execute_incremental_dag(state_file, source_versions, failing_jobs=["job3"])
+
+    assert _execute_incremental_dag(state_file, source_versions) == ["job3", "job4"]
@@ -0,0 +1,65 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+from vdk.plugin.dag.job_fingerprint import get_directory_hash
+from vdk.plugin.dag.job_fingerprint import get_job_fingerprint
+from vdk.plugin.dag.job_fingerprint import JobFingerprintsStore
+
+
+def test_get_directory_hash(tmp_path):
+    (tmp_path / "10_step.py").write_text("def run(job_input): pass")
+    (tmp_path / "20_step.sql").write_text("select 1")
+    initial_hash = get_directory_hash(str(tmp_path))
+
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "10_step.cpython-311.pyc").write_bytes(b"123")
+    assert get_directory_hash(str(tmp_path)) == initial_hash
+
+    (tmp_path / "20_step.sql").write_text("select 2")
+    assert get_directory_hash(str(tmp_path)) != initial_hash
+
+    (tmp_path / "20_step.sql").write_text("select 1")
+    assert get_directory_hash(str(tmp_path)) == initial_hash
+
+    (tmp_path / "20_step.sql").rename(tmp_path / "30_step.sql")
+    assert get_directory_hash(str(tmp_path)) != initial_hash
+
+
+def test_get_job_fingerprint():
+    fingerprint = get_job_fingerprint("team", "job", "v1", {"a": 1, "b": 2}, ["x", "y"])
+
+    assert fingerprint == get_job_fingerprint(
+        "team", "job", "v1", {"b": 2, "a": 1}, ["y", "x"]
+    )
+    assert fingerprint != get_job_fingerprint("team", "job", "v2", {"a": 1, "b": 2}, [])
+    assert fingerprint != get_job_fingerprint("team", "job", "v1", {"a": 2}, ["x", "y"])
+    assert fingerprint != get_job_fingerprint("team", "job", "v1", {"a": 1}, ["x", "z"])
+    assert get_job_fingerprint("team", "job", None, {}, []) is None
+    assert get_job_fingerprint("team", "job", "v1", {}, ["x", None]) is None
+
+
+def test_job_fingerprints_store(tmp_path):
+    file_path = str(tmp_path / "dir" / "fingerprints.json")
+    store = JobFingerprintsStore(file_path, "dag")
+    assert store.get("team", "job") is None
+
+    store.set("team", "job", "fingerprint")
+    assert store.get("team", "job") == "fingerprint"
+    assert JobFingerprintsStore(file_path, "dag").get("team", "job") == "fingerprint"
+    assert JobFingerprintsStore(file_path, "other-dag").get("team", "job") is None
+
+    store.set("team", "job", None)
+    assert JobFingerprintsStore(file_path, "dag").get("team", "job") is None
+
+
+def test_job_fingerprints_store_clear(tmp_path):
+    file_path = str(tmp_path / "fingerprints.json")
+    JobFingerprintsStore(file_path, "other-dag").set("team", "job", "other")
+    store = JobFingerprintsStore(file_path, "dag")
+    store.set("team", "job1", "fingerprint1")
+    store.set("team", "job2", "fingerprint2")
+
+    store.clear()
+
+    assert store.get("team", "job1") is None
+    assert JobFingerprintsStore(file_path, "dag").get("team", "job2") is None
+    assert JobFingerprintsStore(file_path, "other-dag").get("team", "job") == "other"
@@ -0,0 +1,110 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+from taurus_datajob_api import DataJobExecution
+from vdk.plugin.dag.job_priority import get_critical_path_lengths
+from vdk.plugin.dag.job_priority import get_duration_from_executions
+from vdk.plugin.dag.job_priority import JobDurationsCache
+from vdk.plugin.dag.job_priority import ReadyJobsQueue
+
+
+def test_get_critical_path_lengths():
+    dependencies = {
+        "job1": [],
+        "job2": ["job1"],
+        "job3": ["job1"],
+        "job4": ["job2", "job3"],
+    }
+    durations = {"job1": 10, "job2": 100, "job3": 5, "job4": 1}
+
+    assert get_critical_path_lengths(dependencies, durations) == {
+        "job1": 111,
+        "job2": 101,
+        "job3": 6,
+        "job4": 1,
+    }
+
+
+def test_get_critical_path_lengths_unknown_durations():
+    dependencies = {"job1": [], "job2": ["job1"], "job3": []}
+
+    assert get_critical_path_lengths(dependencies, {"job3": 4}) == {
+        "job1": 8,
+        "job2": 4,
+        "job3": 4,
+    }
+    assert get_critical_path_lengths(dependencies, {}) == {
+        "job1": 2,
+        "job2": 1,
+        "job3": 1,
+    }
+
+
+def test_ready_jobs_queue_order():
+    queue = ReadyJobsQueue()
+    queue.enqueue("short", critical_path_length=1)
+    queue.enqueue("long", critical_path_length=10)
+    queue.enqueue("same-as-short", critical_path_length=1)
+    queue.enqueue("important", priority=1, critical_path_length=0)
+
+    assert queue.size() == 4
+    assert [queue.dequeue() for _ in range(4)] == [
+        "important",
+        "long",
+        "short",
+        "same-as-short",
+    ]
+    assert queue.dequeue() is None
+
+
+def _execution(status, start_time, end_time):
+    return DataJobExecution(
+        id="id",
+        job_name="job",
+        status=status,
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+
+def test_get_duration_from_executions():
+    executions = [
+        _execution("succeeded", "2023-01-01T10:00:00Z", "2023-01-01T10:01:00Z"),
+        _execution("user_error", "2023-01-01T11:00:00Z", "2023-01-01T11:00:01Z"),
+        _execution("succeeded", "2023-01-01T12:00:00Z", "2023-01-01T12:03:00Z"),
+        _execution("succeeded", "2023-01-01T13:00:00Z", "2023-01-01T13:02:00Z"),
+        _execution("running", "2023-01-01T14:00:00Z", None),
+    ]
+
+    assert get_duration_from_executions(executions) == 120
+    assert get_duration_from_executions([]) is None
+    assert get_duration_from_executions(None) is None
+
+
+def test_job_durations_cache(tmpdir):
+    file_path = os.path.join(tmpdir, "cache", "job-durations.json")
+    cache = JobDurationsCache(file_path)
+    assert cache.get("team", "job") is None
+
+    cache.set("team", "job", 12.5)
+
+    assert cache.get("team", "job") == 12.5
+    assert JobDurationsCache(file_path).get("team", "job") == 12.5
+    assert JobDurationsCache(file_path).get("other-team", "job") is None
+
+
+def test_job_durations_cache_keeps_concurrent_updates(tmpdir):
+    file_path = os.path.join(tmpdir, "job-durations.json")
+    first_dag_cache = JobDurationsCache(file_path)
+    second_dag_cache = JobDurationsCache(file_path)
+    assert first_dag_cache.get("team", "job1") is None
+    assert second_dag_cache.get("team", "job2") is None
+
+    first_dag_cache.set("team", "job1", 1)
+    second_dag_cache.set("team", "job2", 2)
+
+    cache = JobDurationsCache(file_path)
+    assert cache.get("team", "job1") == 1
+    assert cache.get("team", "job2") == 2
+    assert [f for f in os.listdir(tmpdir) if f.endswith(".tmp")] == []
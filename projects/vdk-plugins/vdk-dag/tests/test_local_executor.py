@@ -8,6 +8,7 @@ import pytest
 from click.testing import Result
 from vdk.plugin.dag import dag_plugin
 from vdk.plugin.dag.local_executor import LocalDataJobExecutor
+from vdk.plugin.dag.local_process_pool_executor import LocalProcessPoolDataJobExecutor
 from vdk.plugin.dag.remote_data_job import JobStatus
 from vdk.plugin.test_utils.util_funcs import cli_assert_equal
 from vdk.plugin.test_utils.util_funcs import CliEntryBasedTestRunner
@@ -91,3 +92,71 @@ def test_dag_local():
         )
 
         cli_assert_equal(0, result)
+
+
+def test_local_process_pool_run(tmp_path):
+    executor = LocalProcessPoolDataJobExecutor(max_workers=1)
+    try:
+        test_file = tmp_path / "file"
+        eid = executor.start_job("write-file-job", "", "", dict(path=str(test_file)))
+
+        assert executor.status_job("write-file-job", "", eid) in (
+            JobStatus.SUBMITTED.value,
+            JobStatus.RUNNING.value,
+        )
+
+        wait_for_result(
+            lambda: executor.status_job("write-file-job", "", eid),
+            JobStatus.SUCCEEDED.value,
+            60,
+        )
+        assert test_file.read_text() == "data"
+
+        first_log_file = executor.details_job("write-file-job", "", eid)["message"][
+            "logs"
+        ]
+
+        # the second job is run by an already warmed up worker
+        eid = executor.start_job("fail-job", "", "")
+        wait_for_result(
+            lambda: executor.status_job("fail-job", "", eid),
+            JobStatus.USER_ERROR.value,
+            60,
+        )
+        details = executor.details_job("fail-job", "", eid)
+        assert "cannot do math" in details["message"]["summary"]["details"]
+        assert details["message"]["logs"] != first_log_file
+        assert os.path.exists(first_log_file)
+    finally:
+        executor.shutdown()
+
+
+def test_dag_local_process_pool():
+    with mock.patch.dict(
+        os.environ,
+        {
+            "DAGS_JOB_EXECUTOR_TYPE": "local-process-pool",
+            "DAGS_LOCAL_PROCESS_POOL_SIZE": "2",
+        },
+    ):
+        runner = CliEntryBasedTestRunner(dag_plugin)
+
+        result: Result = runner.invoke(
+            [
+                "run",
+                jobs_path_from_caller_directory("local-dag"),
+            ]
+        )
+
+        cli_assert_equal(0, result)
+
+
+def test_local_job_source_version():
+    executor = LocalDataJobExecutor()
+
+    version = executor.job_source_version("write-file-job", "")
+
+    assert version
+    assert version == executor.job_source_version("write-file-job", "")
+    assert version != executor.job_source_version("read-file-job", "")
+    assert executor.job_source_version("no-such-job", "") is None
@@ -1,5 +1,6 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import time
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -7,6 +8,8 @@ from taurus_datajob_api import DataJobDeployment
 from taurus_datajob_api import DataJobExecution
 from urllib3.exceptions import ReadTimeoutError
 from vdk.plugin.dag.cached_data_job_executor import TrackingDataJobExecutor
+from vdk.plugin.dag.dags import TrackableJob
+from vdk.plugin.dag.remote_data_job import JobStatus
 from vdk.plugin.dag.remote_data_job_executor import RemoteDataJobExecutor
 
 
@@ -59,3 +62,154 @@ def test_start_new_job_execution_timeout_error(patched_timeout):
         job_name=test_job_id, team_name="awesome-team"
     )
     assert len(test_executor.method_calls) == 4
+
+
+def _tracking_executor_with_running_jobs(test_executor, job_names, **kwargs):
+    tracking_executor = TrackingDataJobExecutor(test_executor, 40, **kwargs)
+    for job_name in job_names:
+        tracking_executor.register_job(
+            TrackableJob(
+                job_name=job_name,
+                team_name="awesome-team",
+                status=JobStatus.RUNNING.value,
+                execution_id=f"{job_name}-execution",
+            )
+        )
+    return tracking_executor
+
+
+def test_get_finished_job_names_checks_statuses_in_parallel():
+    job_names = [f"job{i}" for i in range(5)]
+    test_executor = MagicMock(spec=RemoteDataJobExecutor)
+    test_executor.status_job.side_effect = lambda job_name, team_name, execution_id: (
+        JobStatus.SUCCEEDED.value if job_name == "job3" else JobStatus.RUNNING.value
+    )
+
+    tracking_executor = _tracking_executor_with_running_jobs(
+        test_executor, job_names, status_check_max_workers=3
+    )
+
+    assert tracking_executor.get_finished_job_names() == ["job3"]
+    assert test_executor.status_job.call_count == 5
+    # statuses are not checked again before time_between_status_check_seconds passes
+    assert tracking_executor.get_finished_job_names() == ["job3"]
+    assert test_executor.status_job.call_count == 5
+
+
+def test_get_finished_job_names_staggers_status_checks():
+    test_executor = MagicMock(spec=RemoteDataJobExecutor)
+    test_executor.status_job.return_value = JobStatus.RUNNING.value
+
+    tracking_executor = _tracking_executor_with_running_jobs(
+        test_executor,
+        ["job1", "job2"],
+        status_check_randomized_added_delay_seconds=20,
+    )
+    tracking_executor.get_finished_job_names()
+
+    for job in tracking_executor.get_all_jobs():
+        assert (
+            job.last_status_time + 40
+            <= job.next_status_time
+            <= job.last_status_time + 60
+        )
+
+
+def test_get_finished_job_names_uses_batch_status_check():
+    test_executor = MagicMock(spec=RemoteDataJobExecutor)
+    test_executor.status_jobs.return_value = {
+        "job1-execution": JobStatus.SUCCEEDED.value,
+        "job2-execution": JobStatus.RUNNING.value,
+    }
+    test_executor.status_job.return_value = JobStatus.USER_ERROR.value
+
+    tracking_executor = _tracking_executor_with_running_jobs(
+        test_executor, ["job1", "job2", "job3"], status_check_batch_enabled=True
+    )
+
+    assert sorted(tracking_executor.get_finished_job_names()) == ["job1", "job3"]
+    test_executor.status_jobs.assert_called_once_with(
+        "awesome-team",
+        [
+            ("job1", "job1-execution"),
+            ("job2", "job2-execution"),
+            ("job3", "job3-execution"),
+        ],
+    )
+    # only the job missing from the batch result is checked separately
+    test_executor.status_job.assert_called_once_with(
+        "job3", "awesome-team", "job3-execution"
+    )
+
+
+def test_get_finished_job_names_falls_back_when_batch_status_check_fails():
+    test_executor = MagicMock(spec=RemoteDataJobExecutor)
+    test_executor.status_jobs.side_effect = ValueError("not supported")
+    test_executor.status_job.return_value = JobStatus.SUCCEEDED.value
+
+    tracking_executor = _tracking_executor_with_running_jobs(
+        test_executor, ["job1", "job2"], status_check_batch_enabled=True
+    )
+
+    assert sorted(tracking_executor.get_finished_job_names()) == ["job1", "job2"]
+    assert test_executor.status_job.call_count == 2
+
+
+def test_wait_for_finished_jobs_returns_when_job_finishes():
+    test_executor = MagicMock(spec=RemoteDataJobExecutor)
+    test_executor.status_job.side_effect = [
+        JobStatus.RUNNING.value,
+        JobStatus.SUCCEEDED.value,
+    ]
+
+    tracking_executor = TrackingDataJobExecutor(test_executor, 1)
+    tracking_executor.register_job(
+        TrackableJob(
+            job_name="job1",
+            team_name="awesome-team",
+            status=JobStatus.RUNNING.value,
+            execution_id="job1-execution",
+        )
+    )
+
+    start = time.time()
+    tracking_executor.wait_for_finished_jobs(60)
+
+    assert time.time() - start < 10
+    assert tracking_executor.get_finished_job_names() == ["job1"]
+    assert test_executor.status_job.call_count == 2
+
+
+def test_wait_for_finished_jobs_times_out():
+    test_executor = MagicMock(spec=RemoteDataJobExecutor)
+    test_executor.status_job.return_value = JobStatus.RUNNING.value
+
+    tracking_executor = _tracking_executor_with_running_jobs(test_executor, ["job1"])
+
+    start = time.time()
+    tracking_executor.wait_for_finished_jobs(1)
+
+    assert 1 <= time.time() - start < 10
+    assert tracking_executor.get_finished_job_names() == []
+
+
+@patch("vdk.plugin.dag.remote_data_job_executor.VDKConfig")
+@patch("vdk.plugin.dag.remote_data_job_executor.RemoteDataJob")
+def test_remote_executor_status_jobs(patched_remote_data_job, patched_vdk_config):
+    remote_data_job = patched_remote_data_job.return_value
+    remote_data_job.get_latest_team_job_executions.return_value = [
+        {"id": "job2-execution", "jobName": "job2", "status": "RUNNING"},
+        {"id": "job1-execution", "jobName": "job1", "status": "USER_ERROR"},
+    ]
+
+    statuses = RemoteDataJobExecutor().status_jobs(
+        "awesome-team", [("job1", "job1-execution"), ("job2", "job2-execution")]
+    )
+
+    assert statuses == {
+        "job1-execution": JobStatus.USER_ERROR.value,
+        "job2-execution": JobStatus.RUNNING.value,
+    }
+    remote_data_job.get_latest_team_job_executions.assert_called_once_with(
+        ["job1", "job2"], page_size=6
+    )
@@ -48,12 +48,13 @@ class DataSourcePayload:
     """
     Encapsulates a single payload to be ingested coming from a data source.
 
-    :param data: The data to be ingested.
+    :param data: The data to be ingested. Either a single record or a batch (list) of records.
+        Sources producing many small records should prefer batches since each payload has a fixed processing cost.
     :param metadata: Additional metadata about the data.
     :param state: Optional state related to the data (for the timestamp or id of the payload) which will be peristed once the payload is sucessfully ingested
     """
 
-    data: Optional[Dict[str, Any]]
+    data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]
     metadata: Optional[Dict[str, Union[int, str, bool, float, datetime]]]
     state: Optional[Dict[str, Any]] = field(default_factory=dict)
     destination_table: Optional[str] = None
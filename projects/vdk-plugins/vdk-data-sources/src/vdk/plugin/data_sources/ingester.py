@@ -5,6 +5,7 @@ import os
 import queue
 import traceback
 from dataclasses import dataclass
+from itertools import groupby
 from queue import Queue
 from threading import Thread
 from typing import Callable
@@ -136,7 +137,8 @@ class DataSourceIngester:
 
     def _ingest_stream(self, ingest_entry: IngestQueueEntry):
         for payload in ingest_entry.stream.read():
-            log.debug(f"Ingest payload {payload}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Ingest payload {payload}")
             if not payload.data and not payload.state:
                 log.warning(
                     f"{ingest_entry.stream.name()} returned payload without any data or state. "
@@ -149,22 +151,32 @@ class DataSourceIngester:
                     destination_table = self._infer_destination_table(
                         ingest_entry, destination, payload
                     )
-
-                    payload_to_sent = DataSourcePayload(
-                        payload.data, payload.metadata, payload.state, destination_table
+                    if isinstance(payload.data, list) and not destination.map_function:
+                        self._ingest_records(
+                            payload.data, destination_table, destination
+                        )
+                        continue
+                    records = (
+                        payload.data
+                        if isinstance(payload.data, list)
+                        else [payload.data]
                     )
-                    if destination.map_function:
-                        payload_to_sent = destination.map_function(payload_to_sent)
-                        if not payload_to_sent:
-                            continue
+                    for record in records:
+                        payload_to_sent = DataSourcePayload(
+                            record, payload.metadata, payload.state, destination_table
+                        )
+                        if destination.map_function:
+                            payload_to_sent = destination.map_function(payload_to_sent)
+                            if not payload_to_sent:
+                                continue
 
-                    self.__actual_ingester.send_object_for_ingestion(
-                        payload=payload_to_sent.data,
-                        destination_table=payload_to_sent.destination_table,
-                        method=destination.method,
-                        target=destination.target,
-                        collection_id=destination.collection_id,
-                    )
+                        self.__actual_ingester.send_object_for_ingestion(
+                            payload=payload_to_sent.data,
+                            destination_table=payload_to_sent.destination_table,
+                            method=destination.method,
+                            target=destination.target,
+                            collection_id=destination.collection_id,
+                        )
 
             if payload.state:
                 # TODO: it would be better to update the state after the actual ingester
@@ -177,6 +189,36 @@ class DataSourceIngester:
                     ingest_entry.stream.name(), payload.state
                 )
 
+    def _ingest_records(
+        self, records: list, destination_table: str, destination: IngestDestination
+    ):
+        """
+        Sends a batch of records with as few ingestion calls as possible:
+        consecutive records with the same columns are sent together as tabular data.
+        """
+        for columns, group in groupby(
+            records,
+            key=lambda r: tuple(r.keys()) if isinstance(r, dict) else None,
+        ):
+            if columns is None:
+                for record in group:
+                    self.__actual_ingester.send_object_for_ingestion(
+                        payload=record,
+                        destination_table=destination_table,
+                        method=destination.method,
+                        target=destination.target,
+                        collection_id=destination.collection_id,
+                    )
+                continue
+            self.__actual_ingester.send_tabular_data_for_ingestion(
+                rows=[tuple(record.values()) for record in group],
+                column_names=list(columns),
+                destination_table=destination_table,
+                method=destination.method,
+                target=destination.target,
+                collection_id=destination.collection_id,
+            )
+
     @staticmethod
     def _infer_destination_table(
         ingest_entry: IngestQueueEntry, destination: IngestDestination, payload
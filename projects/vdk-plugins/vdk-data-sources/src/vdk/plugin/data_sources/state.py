@@ -1,5 +1,6 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import threading
 import typing
 from abc import abstractmethod
 from typing import Any
@@ -68,6 +69,10 @@ class IDataSourceState:
         pass
 
 
+# The streams of a data source are ingested in parallel, so their state updates (read-modify-write) are serialized.
+_update_lock = threading.RLock()
+
+
 class DataSourceState(IDataSourceState):
     def __init__(self, state_storage: IDataSourceStateStorage, source: str):
         self._state_storage = state_storage
@@ -84,14 +89,16 @@ class DataSourceState(IDataSourceState):
         return self.__read_source().get("others", {}).get(key, {})
 
     def update_stream(self, stream_name: str, state: Dict[str, typing.Any]):
-        source_state = self.__read_source()
-        source_state.setdefault("streams", {})[stream_name] = state
-        self._state_storage.write(self._source, source_state)
+        with _update_lock:
+            source_state = self.__read_source()
+            source_state.setdefault("streams", {})[stream_name] = state
+            self._state_storage.write(self._source, source_state)
 
     def update_others(self, key: str, state: Dict[str, typing.Any]):
-        source_state = self.__read_source()
-        source_state.setdefault("others", {})[key] = state
-        self._state_storage.write(self._source, source_state)
+        with _update_lock:
+            source_state = self.__read_source()
+            source_state.setdefault("others", {})[key] = state
+            self._state_storage.write(self._source, source_state)
 
 
 class InMemoryDataSourceStateStorage(IDataSourceStateStorage):
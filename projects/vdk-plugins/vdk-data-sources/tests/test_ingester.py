@@ -13,12 +13,17 @@ from vdk.plugin.data_sources.auto_generated import (
 from vdk.plugin.data_sources.auto_generated import (
     AutoGeneratedDataSourceConfiguration,
 )
+from vdk.plugin.data_sources.data_source import DataSourcePayload
+from vdk.plugin.data_sources.data_source import IDataSource
+from vdk.plugin.data_sources.data_source import IDataSourceStream
 from vdk.plugin.data_sources.ingester import DataSourceIngester
+from vdk.plugin.data_sources.ingester import IngestDestination
 
 
 class MockJobInput(IIngester, IProperties):
     def __init__(self):
         self.ingested_data = []
+        self.ingestion_calls = 0
         self.props = {}
 
     def send_object_for_ingestion(
@@ -30,6 +35,7 @@ class MockJobInput(IIngester, IProperties):
         collection_id: Optional[str] = None,
     ):
         self.ingested_data.append(payload)
+        self.ingestion_calls += 1
 
     def send_tabular_data_for_ingestion(
         self,
@@ -40,7 +46,8 @@ class MockJobInput(IIngester, IProperties):
         target: Optional[str],
         collection_id: Optional[str] = None,
     ):
-        raise NotImplemented("send_tabular_data_for_ingestion")
+        self.ingested_data.extend(dict(zip(column_names, row)) for row in rows)
+        self.ingestion_calls += 1
 
     def get_property(self, name: str, default_value: Any = None) -> str:
         return self.props.get(name, default_value)
@@ -132,6 +139,72 @@ def test_data_source_ingester_with_state(num_records, num_streams):
     )
 
 
+class BatchDataSourceStream(IDataSourceStream):
+    def name(self):
+        return "batches"
+
+    def read(self):
+        yield DataSourcePayload(data=[{"id": 1}, {"id": 2}], metadata={})
+        yield DataSourcePayload(
+            data=[{"id": 3}, {"id": 4, "name": "four"}],
+            metadata={},
+            state={"last_id": 4},
+        )
+
+
+class BatchDataSource(IDataSource):
+    def configure(self, config):
+        pass
+
+    def connect(self, state):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def streams(self):
+        return [BatchDataSourceStream()]
+
+
+def test_data_source_ingester_with_batch_payloads():
+    mock_job_input = MockJobInput()
+    data_source_ingester = DataSourceIngester(mock_job_input)
+
+    data_source_ingester.ingest_data_source("batches", BatchDataSource())
+    data_source_ingester.terminate_and_wait_to_finish()
+
+    assert mock_job_input.ingested_data == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 3},
+        {"id": 4, "name": "four"},
+    ]
+    # records with the same columns are sent in one call
+    assert mock_job_input.ingestion_calls == 3
+    assert mock_job_input.props[".vdk.data_sources.state"]["batches"]["streams"] == {
+        "batches": {"last_id": 4}
+    }
+
+
+def test_data_source_ingester_with_batch_payloads_and_map_function():
+    mock_job_input = MockJobInput()
+    data_source_ingester = DataSourceIngester(mock_job_input)
+
+    def map_function(payload: DataSourcePayload):
+        if payload.data["id"] % 2:
+            return DataSourcePayload({"id": payload.data["id"] * 10}, payload.metadata)
+        return None
+
+    data_source_ingester.start_ingestion(
+        "batches",
+        BatchDataSource(),
+        [IngestDestination(map_function=map_function)],
+    )
+    data_source_ingester.terminate_and_wait_to_finish()
+
+    assert mock_job_input.ingested_data == [{"id": 10}, {"id": 30}]
+
+
 def arrange(num_records, num_streams):
     mock_job_input = MockJobInput()
     data_source_ingester = DataSourceIngester(mock_job_input)
@@ -8,6 +8,7 @@ from typing import Optional
 from vdk.internal.builtin_plugins.connection.managed_connection_base import (
     ManagedConnectionBase,
 )
+from vdk.internal.builtin_plugins.connection.sql_statements import DIALECT_POSTGRES
 
 log = logging.getLogger(__name__)
 
@@ -112,3 +113,10 @@ class GreenplumConnection(ManagedConnectionBase):
             return super().execute_query(query)
         finally:
             self.commit()
+
+    def _sql_dialect(self) -> str:
+        return DIALECT_POSTGRES
+
+    def _supports_multiple_statements(self) -> bool:
+        # psycopg2 sends all statements of a query in one round trip
+        return True
@@ -1,5 +1,6 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+from vdk.internal.core import errors
 from vdk.internal.core.config import ConfigurationBuilder
 
 IMPALA_HOST = "IMPALA_HOST"
@@ -21,6 +22,7 @@ IMPALA_SYNC_DDL = "IMPALA_SYNC_DDL"
 IMPALA_QUERY_POOL = "IMPALA_QUERY_POOL"
 IMPALA_RETRIES_ON_ERROR = "IMPALA_RETRIES_ON_ERROR"
 IMPALA_RETRIES_ON_ERROR_BACKOFF_SECONDS = "IMPALA_RETRIES_ON_ERROR_BACKOFF_SECONDS"
+IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT = "IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT"
 
 
 class ImpalaPluginConfiguration:
@@ -84,6 +86,23 @@ class ImpalaPluginConfiguration:
     def error_backoff_seconds(self):
         return self.__config.get_value(IMPALA_RETRIES_ON_ERROR_BACKOFF_SECONDS)
 
+    def templates_stats_sample_percent(self) -> int:
+        value = self.__config.get_value(IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT)
+        try:
+            sample_percent = int(value or 0)
+            if not 0 <= sample_percent <= 100:
+                raise ValueError("the value must be between 0 and 100")
+        except ValueError as e:
+            errors.report_and_throw(
+                errors.VdkConfigurationError(
+                    f"Invalid configuration passed to {IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT}.",
+                    f"Error is: {e}. {IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT} was set to {value}.",
+                    "The data job will fail.",
+                    f"Set {IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT} to a whole number between 0 and 100.",
+                )
+            )
+        return sample_percent
+
 
 def add_definitions(config_builder: ConfigurationBuilder) -> None:
     """
@@ -204,3 +223,15 @@ def add_definitions(config_builder: ConfigurationBuilder) -> None:
             "be 30s, 60s, 2m, 4m, 8m"
         ),
     )
+    config_builder.add(
+        key=IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT,
+        default_value=0,
+        description=(
+            "The percent of the data of a target table that the load templates sample "
+            "to compute its statistics (using COMPUTE STATS ... TABLESAMPLE SYSTEM(percent)) "
+            "when the whole table is loaded or the loaded partitions are not known. "
+            "0 (the default) or 100 compute the statistics over the whole table. "
+            "When the loaded partitions of a partitioned target table are known, "
+            "incremental statistics are computed for them only."
+        ),
+    )
@@ -10,6 +10,7 @@ from vdk.internal.builtin_plugins.connection.managed_connection_base import (
     ManagedConnectionBase,
 )
 from vdk.internal.builtin_plugins.connection.recovery_cursor import RecoveryCursor
+from vdk.internal.builtin_plugins.connection.sql_statements import DIALECT_IMPALA
 from vdk.plugin.impala.impala_error_handler import ImpalaErrorHandler
 from vdk.plugin.impala.impala_lineage import ImpalaLineage
 
@@ -86,6 +87,9 @@ class ImpalaConnection(ManagedConnectionBase):
 
         return conn
 
+    def _sql_dialect(self) -> str:
+        return DIALECT_IMPALA
+
     def db_connection_recover_operation(self, recovery_cursor: RecoveryCursor) -> None:
         impala_error_handler = ImpalaErrorHandler(
             num_retries=self._retries_on_error,
@@ -91,6 +91,13 @@ class ImpalaPlugin:
         )
 
         self._impala_cfg = ImpalaPluginConfiguration(context.core_context.configuration)
+        # validated here, so an invalid value fails the job before any step is run
+        stats_sample_percent = self._impala_cfg.templates_stats_sample_percent()
+        if _is_template_directory(context.job_directory):
+            # the templates read it from their arguments, since they cannot access the configuration
+            context.job_args.get_arguments()[
+                "_vdk_template_stats_sample_percent"
+            ] = stats_sample_percent
         context.connections.add_open_connection_factory_method(
             "IMPALA",
             lambda: _connection_by_configuration(
@@ -169,6 +176,13 @@ def get_jobs_parent_directory() -> pathlib.Path:
     return jobs_dir
 
 
+def _is_template_directory(job_directory) -> bool:
+    if not job_directory:
+        return False
+    job_directory = pathlib.Path(os.path.abspath(job_directory))
+    return get_jobs_parent_directory() in job_directory.parents
+
+
 def get_job_path(job_name: str) -> str:
     """Get the path of the test data job returned as string so it can be passed easier as cmd line args"""
     return str(get_jobs_parent_directory().joinpath(job_name))
@@ -0,0 +1,12 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+from vdk.api.job_input import IJobInput
+from vdk.plugin.impala.templates.utility import compute_target_stats
+
+
+def run(job_input: IJobInput):
+    """
+    Compute the statistics of the target table - incrementally for the partitions written by the template
+    if the table is partitioned.
+    """
+    compute_target_stats(job_input)
@@ -6,6 +6,7 @@ from vdk.api.job_input import IJobInput
 from vdk.plugin.impala.templates.data_quality_exception import DataQualityException
 from vdk.plugin.impala.templates.utility import align_stg_table_with_target
 from vdk.plugin.impala.templates.utility import get_file_content
+from vdk.plugin.impala.templates.utility import get_partitions
 from vdk.plugin.impala.templates.utility import get_staging_table_name
 
 SQL_FILES_FOLDER = (
@@ -77,6 +78,7 @@ def run(job_input: IJobInput):
                 target_table=target_table,
             )
             job_input.execute_query(insert_into_target)
+            loaded_data = staging_table
         else:
             raise DataQualityException(
                 checked_object=view_full_name,
@@ -86,3 +88,11 @@ def run(job_input: IJobInput):
 
     else:
         job_input.execute_query(insert_query)
+        loaded_data = f"{source_schema}.{source_view}"
+
+    partition_columns = job_arguments["_vdk_template_partition_columns"]
+    if partition_columns:
+        # the dynamic partition insert writes only the partitions present in the loaded data
+        job_arguments["_vdk_template_loaded_partitions"] = get_partitions(
+            job_input, loaded_data, partition_columns
+        )
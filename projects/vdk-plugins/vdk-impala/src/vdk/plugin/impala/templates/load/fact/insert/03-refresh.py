@@ -0,0 +1,12 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+from vdk.api.job_input import IJobInput
+from vdk.plugin.impala.templates.utility import refresh_target
+
+
+def run(job_input: IJobInput):
+    """
+    Make sure metadata about the new blocks in the target table is propagated to the other impalad daemons.
+    Only the partitions written by the template are refreshed, if they are known.
+    """
+    refresh_target(job_input)
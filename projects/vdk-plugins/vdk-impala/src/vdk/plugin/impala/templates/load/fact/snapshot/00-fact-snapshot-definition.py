@@ -18,6 +18,7 @@ class FactDailySnapshotParams(BaseModel):
     last_arrival_ts: str
     check: Optional[Callable[[str], bool]] = None
     staging_schema: Optional[str] = None
+    partition_overwrite: bool = False
 
 
 class FactDailySnapshot(TemplateArgumentsValidator):
@@ -1,13 +1,17 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import logging
 import os
 
 from vdk.api.job_input import IJobInput
 from vdk.plugin.impala.templates.data_quality_exception import DataQualityException
 from vdk.plugin.impala.templates.utility import align_stg_table_with_target
 from vdk.plugin.impala.templates.utility import get_file_content
+from vdk.plugin.impala.templates.utility import get_partition_spec
 from vdk.plugin.impala.templates.utility import get_staging_table_name
 
+log = logging.getLogger(__name__)
+
 SQL_FILES_FOLDER = (
     os.path.dirname(os.path.abspath(__file__)) + "/02-requisite-sql-scripts"
 )
@@ -22,6 +26,15 @@ Otherwise the data will be directly processed according to the used template typ
 def run(job_input: IJobInput):
     job_arguments = job_input.get_arguments()
 
+    if job_arguments.get("partition_overwrite"):
+        if job_arguments["_vdk_template_partition_columns"]:
+            overwrite_affected_partitions(job_input)
+            return
+        log.info(
+            "Target table is not partitioned. "
+            "The whole target table will be overwritten instead of the affected partitions only."
+        )
+
     check = job_arguments.get("check")
     partition_clause = job_arguments["_vdk_template_insert_partition_clause"]
     source_schema = job_arguments.get("source_schema")
@@ -79,3 +92,100 @@ def run(job_input: IJobInput):
             f"{target_schema}.{target_table}",
         )
         job_input.execute_query(insert_query)
+
+
+def overwrite_affected_partitions(job_input: IJobInput):
+    """
+    Loads the snapshot by overwriting only the partitions of the target table it changes:
+    the partitions of the source view and the partitions with rows later than the earliest row of the source view.
+    The new content of those partitions is staged (and checked if a check is provided) before it is moved to target.
+    Affected partitions which have no rows after the load are dropped.
+    """
+    job_arguments = job_input.get_arguments()
+
+    check = job_arguments.get("check")
+    partition_clause = job_arguments["_vdk_template_insert_partition_clause"]
+    partition_columns = job_arguments["_vdk_template_partition_columns"]
+    source_schema = job_arguments.get("source_schema")
+    source_view = job_arguments.get("source_view")
+    target_schema = job_arguments.get("target_schema")
+    target_table = job_arguments.get("target_table")
+    last_arrival_ts = job_arguments.get("last_arrival_ts")
+    staging_schema = job_arguments.get("staging_schema") or target_schema
+    staging_table_name = get_staging_table_name(target_schema, target_table)
+
+    staging_table = f"{staging_schema}.{staging_table_name}"
+    target_table_full_name = f"{target_schema}.{target_table}"
+    partition_columns_list = ", ".join(f"`{p}`" for p in partition_columns)
+
+    affected_partitions_query = get_file_content(
+        SQL_FILES_FOLDER, "02-select-affected-partitions.sql"
+    ).format(
+        partition_columns=partition_columns_list,
+        source_schema=source_schema,
+        source_view=source_view,
+        target_schema=target_schema,
+        target_table=target_table,
+        last_arrival_ts=last_arrival_ts,
+    )
+    affected_partitions = job_input.execute_query(affected_partitions_query)
+    log.info(
+        f"Snapshot will overwrite {len(affected_partitions)} partitions of {target_table_full_name}."
+    )
+
+    # the staging table must contain only the affected partitions, so it is recreated
+    job_input.execute_query(f"DROP TABLE IF EXISTS {staging_table}")
+    align_stg_table_with_target(target_table_full_name, staging_table, job_input)
+    insert_into_staging = get_file_content(
+        SQL_FILES_FOLDER, "02-insert-affected-partitions-into-staging.sql"
+    ).format(
+        staging_schema=staging_schema,
+        staging_table_name=staging_table_name,
+        _vdk_template_insert_partition_clause=partition_clause,
+        target_schema=target_schema,
+        target_table=target_table,
+        affected_partitions_query=affected_partitions_query,
+        affected_partitions_join_condition=" AND ".join(
+            f"target.`{p}` IS NOT DISTINCT FROM affected.`{p}`"
+            for p in partition_columns
+        ),
+        source_schema=source_schema,
+        source_view=source_view,
+        last_arrival_ts=last_arrival_ts,
+    )
+    job_input.execute_query(insert_into_staging)
+
+    if check and not check(staging_table):
+        raise DataQualityException(
+            checked_object=staging_table,
+            source_view=f"{source_schema}.{source_view}",
+            target_table=target_table_full_name,
+        )
+
+    job_input.execute_query(f"COMPUTE STATS {staging_table}")
+    staged_partitions = {
+        tuple(row)
+        for row in job_input.execute_query(
+            f"SELECT DISTINCT {partition_columns_list} FROM {staging_table}"
+        )
+    }
+
+    # dynamic partition INSERT OVERWRITE replaces only the partitions present in the staging table
+    insert_into_target = get_file_content(
+        SQL_FILES_FOLDER, "02-overwrite-target.sql"
+    ).format(
+        staging_schema=staging_schema,
+        staging_table_name=staging_table_name,
+        _vdk_template_insert_partition_clause=partition_clause,
+        target_schema=target_schema,
+        target_table=target_table,
+    )
+    job_input.execute_query(insert_into_target)
+    job_arguments["_vdk_template_loaded_partitions"] = list(staged_partitions)
+
+    for partition in affected_partitions:
+        if tuple(partition) not in staged_partitions:
+            job_input.execute_query(
+                f"ALTER TABLE {target_table_full_name} DROP IF EXISTS "
+                f"PARTITION ({get_partition_spec(partition_columns, partition)})"
+            )
@@ -0,0 +1,16 @@
+-- /* +SHUFFLE */ below is a query hint to Impala.
+-- Do not remove! https://www.cloudera.com/documentation/enterprise/5-9-x/topics/impala_hints.html
+INSERT OVERWRITE TABLE {staging_schema}.{staging_table_name} {_vdk_template_insert_partition_clause} /* +SHUFFLE */
+(
+  SELECT target.*
+  FROM   {target_schema}.{target_table} target
+  LEFT SEMI JOIN (
+    {affected_partitions_query}
+  ) affected ON {affected_partitions_join_condition}
+  WHERE  target.{last_arrival_ts} < (SELECT MIN({last_arrival_ts}) FROM {source_schema}.{source_view})
+)
+UNION ALL
+(
+  SELECT *
+  FROM   {source_schema}.{source_view}
+);
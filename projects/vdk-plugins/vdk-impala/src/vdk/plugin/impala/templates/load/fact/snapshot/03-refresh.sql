@@ -1 +0,0 @@
-REFRESH {target_schema}.{target_table};
@@ -1 +0,0 @@
-COMPUTE STATS {target_schema}.{target_table};
@@ -1,5 +1,6 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import decimal
 import os
 import re
 
@@ -27,6 +28,137 @@ def get_file_content(sql_files_folder, sql_file_name):
         return content
 
 
+def to_sql_literal(value):
+    """
+    Converts a value returned by a query (e.g. a partition value) to an Impala SQL literal.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return str(value)
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def get_partition_spec(partition_columns, partition_values):
+    """
+    Builds partition specification (e.g. for ALTER TABLE ... DROP PARTITION) by given partition columns and values.
+    """
+    return ", ".join(
+        (
+            f"`{column}` IS NULL"
+            if value is None
+            else f"`{column}` = {to_sql_literal(value)}"
+        )
+        for column, value in zip(partition_columns, partition_values)
+    )
+
+
+def get_partitions(job_input, table_name, partition_columns):
+    """
+    Returns the distinct values of the partition columns of a given table (or view) - one tuple per partition.
+    """
+    partition_columns_list = ", ".join(f"`{p}`" for p in partition_columns)
+    return [
+        tuple(row)
+        for row in job_input.execute_query(
+            f"SELECT DISTINCT {partition_columns_list} FROM {table_name}"
+        )
+    ]
+
+
+def _get_target_loaded_partitions(job_arguments):
+    """
+    Returns the partitions of the target table written by the template
+    or None if they are not known and the whole target table should be considered changed.
+    """
+    partition_columns = job_arguments.get("_vdk_template_partition_columns")
+    partitions = job_arguments.get("_vdk_template_loaded_partitions")
+    if not partition_columns or partitions is None:
+        return None
+    # NULL partitions cannot be specified by equality in a partition clause
+    if any(value is None for partition in partitions for value in partition):
+        return None
+    return partitions
+
+
+def get_partitions_filter(partition_columns, partitions):
+    """
+    Builds a predicate matching any of the given partitions (e.g. for a COMPUTE INCREMENTAL STATS ... PARTITION clause).
+    """
+    if len(partition_columns) == 1:
+        values = ", ".join(to_sql_literal(partition[0]) for partition in partitions)
+        return f"`{partition_columns[0]}` IN ({values})"
+    return " OR ".join(
+        "("
+        + " AND ".join(
+            f"`{column}` = {to_sql_literal(value)}"
+            for column, value in zip(partition_columns, partition)
+        )
+        + ")"
+        for partition in partitions
+    )
+
+
+# the maximum number of partitions in the PARTITION clause of a single statement
+PARTITIONS_BATCH_SIZE = 100
+# above this number of loaded partitions a single table-level REFRESH is cheaper than one round trip per partition
+PARTITIONS_REFRESH_THRESHOLD = 10
+
+
+def refresh_target(job_input):
+    """
+    Makes sure metadata about the new blocks in the target table is propagated to the other impalad daemons.
+    Only the partitions written by the template are refreshed if they are known.
+    REFRESH accepts a single partition, so they are refreshed one by one, unless there are more than
+    PARTITIONS_REFRESH_THRESHOLD of them, in which case the whole table is refreshed at once.
+    """
+    job_arguments = job_input.get_arguments()
+    target_table = "{target_schema}.{target_table}".format(**job_arguments)
+    partitions = _get_target_loaded_partitions(job_arguments)
+    if partitions is None or len(partitions) > PARTITIONS_REFRESH_THRESHOLD:
+        job_input.execute_query(f"REFRESH {target_table}")
+        return
+    for partition in partitions:
+        job_input.execute_query(
+            f"REFRESH {target_table} PARTITION "
+            f"({get_partition_spec(job_arguments['_vdk_template_partition_columns'], partition)})"
+        )
+
+
+def compute_target_stats(job_input):
+    """
+    Computes the statistics of the target table after it is loaded.
+    If the partitions written by the template are known, incremental statistics are computed for them only
+    (up to PARTITIONS_BATCH_SIZE partitions per statement).
+    Otherwise (e.g. the whole table was rewritten) the statistics of the whole table are computed,
+    over a sample of the table if IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT is set.
+    """
+    job_arguments = job_input.get_arguments()
+    target_table = "{target_schema}.{target_table}".format(**job_arguments)
+    partitions = _get_target_loaded_partitions(job_arguments)
+    if partitions is None:
+        sample_percent = job_arguments.get("_vdk_template_stats_sample_percent", 0)
+        if 0 < sample_percent < 100:
+            job_input.execute_query(
+                f"COMPUTE STATS {target_table} TABLESAMPLE SYSTEM({sample_percent})"
+            )
+        else:
+            job_input.execute_query(f"COMPUTE STATS {target_table}")
+        return
+
+    partition_columns = job_arguments["_vdk_template_partition_columns"]
+    for start in range(0, len(partitions), PARTITIONS_BATCH_SIZE):
+        partitions_filter = get_partitions_filter(
+            partition_columns, partitions[start : start + PARTITIONS_BATCH_SIZE]
+        )
+        job_input.execute_query(
+            f"COMPUTE INCREMENTAL STATS {target_table} PARTITION ({partitions_filter})"
+        )
+
+
 def align_stg_table_with_target(target_table, stg_table, job_input):
     """
     Aligns structure of a given staging table with the structure of a given target table.
@@ -524,6 +524,38 @@ class TestTemplateRegression(unittest.TestCase):
             actual, expected, f"Elements in {expect_table} and {target_table} differ."
         )
 
+    def test_load_fact_snapshot_partition_overwrite(self) -> None:
+        test_schema = "vdkprototypes"
+        source_view = "vw_fact_sddc_daily_partition_overwrite"
+        target_table = "dw_fact_sddc_daily_partition_overwrite"
+        expect_table = "ex_fact_sddc_daily_partition_overwrite"
+
+        res = self._run_job(
+            "load_fact_snapshot_template_partition_job",
+            {
+                "source_schema": test_schema,
+                "source_view": source_view,
+                "target_schema": test_schema,
+                "target_table": target_table,
+                "expect_schema": test_schema,
+                "expect_table": expect_table,
+                "last_arrival_ts": "updated_at",
+                "partition_overwrite": True,
+            },
+        )
+        cli_assert(not res.exception, res)
+
+        actual_rs = self._run_query(f"SELECT * FROM {test_schema}.{target_table}")
+        expected_rs = self._run_query(f"SELECT * FROM {test_schema}.{expect_table}")
+        assert actual_rs.output and expected_rs.output
+
+        actual = {x for x in actual_rs.output.split("\n")}
+        expected = {x for x in expected_rs.output.split("\n")}
+
+        self.assertSetEqual(
+            actual, expected, f"Elements in {expect_table} and {target_table} differ."
+        )
+
     def test_load_fact_snapshot_parameter_validation(self) -> None:
         self._run_template_with_bad_arguments(
             template_name="load_fact_snapshot_template_only",
@@ -0,0 +1,108 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import unittest
+from unittest.mock import MagicMock
+
+from vdk.internal.core.config import ConfigurationBuilder
+from vdk.internal.core.errors import VdkConfigurationError
+from vdk.plugin.impala.impala_configuration import add_definitions
+from vdk.plugin.impala.impala_configuration import (
+    IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT,
+)
+from vdk.plugin.impala.impala_configuration import ImpalaPluginConfiguration
+from vdk.plugin.impala.templates.utility import compute_target_stats
+from vdk.plugin.impala.templates.utility import refresh_target
+
+
+def _job_input(partition_columns, loaded_partitions):
+    job_input = MagicMock()
+    job_input.get_arguments.return_value = {
+        "target_schema": "db",
+        "target_table": "tbl",
+        "_vdk_template_partition_columns": partition_columns,
+        "_vdk_template_loaded_partitions": loaded_partitions,
+    }
+    return job_input
+
+
+def _executed_queries(job_input):
+    return [c.args[0] for c in job_input.execute_query.call_args_list]
+
+
+class TemplatesStatisticsTest(unittest.TestCase):
+    """Tests refreshing and computing the statistics of the target table of the load templates."""
+
+    def test_loaded_partitions_only(self):
+        job_input = _job_input(["day", "org"], [("2023-01-01", 1), ("2023-01-02", 2)])
+
+        refresh_target(job_input)
+        compute_target_stats(job_input)
+
+        self.assertEqual(
+            [
+                "REFRESH db.tbl PARTITION (`day` = '2023-01-01', `org` = 1)",
+                "REFRESH db.tbl PARTITION (`day` = '2023-01-02', `org` = 2)",
+                "COMPUTE INCREMENTAL STATS db.tbl PARTITION "
+                "((`day` = '2023-01-01' AND `org` = 1) OR (`day` = '2023-01-02' AND `org` = 2))",
+            ],
+            _executed_queries(job_input),
+        )
+
+    def test_loaded_partitions_of_single_column_in_batches(self):
+        job_input = _job_input(["day"], [(f"2023-01-{d:02}",) for d in range(1, 151)])
+
+        refresh_target(job_input)
+        compute_target_stats(job_input)
+
+        queries = _executed_queries(job_input)
+        self.assertEqual(3, len(queries))
+        self.assertEqual("REFRESH db.tbl", queries.pop(0))
+        self.assertTrue(
+            queries[0].startswith(
+                "COMPUTE INCREMENTAL STATS db.tbl PARTITION (`day` IN ('2023-01-01', '2023-01-02', "
+            )
+        )
+        self.assertEqual(100, queries[0].count("'2023-"))
+        self.assertEqual(50, queries[1].count("'2023-"))
+
+    def test_unknown_or_null_partitions(self):
+        for loaded_partitions in (None, [("2023-01-01",), (None,)]):
+            job_input = _job_input(["day"], loaded_partitions)
+
+            refresh_target(job_input)
+            compute_target_stats(job_input)
+
+            self.assertEqual(
+                ["REFRESH db.tbl", "COMPUTE STATS db.tbl"],
+                _executed_queries(job_input),
+            )
+
+    def test_unpartitioned(self):
+        job_input = _job_input([], None)
+
+        compute_target_stats(job_input)
+        job_input.get_arguments.return_value["_vdk_template_stats_sample_percent"] = 10
+        compute_target_stats(job_input)
+
+        self.assertEqual(
+            ["COMPUTE STATS db.tbl", "COMPUTE STATS db.tbl TABLESAMPLE SYSTEM(10)"],
+            _executed_queries(job_input),
+        )
+
+    def test_stats_sample_percent_validation(self):
+        for value, expected in ((None, 0), ("10", 10), (100, 100)):
+            self.assertEqual(
+                expected, _impala_configuration(value).templates_stats_sample_percent()
+            )
+        for value in (-1, 101, "ten"):
+            with self.assertRaises(VdkConfigurationError):
+                _impala_configuration(value).templates_stats_sample_percent()
+
+
+def _impala_configuration(stats_sample_percent):
+    config_builder = ConfigurationBuilder()
+    add_definitions(config_builder)
+    config_builder.set_value(
+        IMPALA_TEMPLATES_STATS_SAMPLE_PERCENT, stats_sample_percent
+    )
+    return ImpalaPluginConfiguration(config_builder.build())
@@ -5,6 +5,8 @@ from vdk.internal.core.config import ConfigurationBuilder
 
 OPENLINEAGE_API_KEY = "OPENLINEAGE_API_KEY"
 OPENLINEAGE_URL = "OPENLINEAGE_URL"
+OPENLINEAGE_SQL_PARSE_MAX_SYNC_QUERY_SIZE = "OPENLINEAGE_SQL_PARSE_MAX_SYNC_QUERY_SIZE"
+OPENLINEAGE_EMIT_BATCH_SIZE = "OPENLINEAGE_EMIT_BATCH_SIZE"
 
 
 class OpenLineageConfiguration:
@@ -17,6 +19,12 @@ class OpenLineageConfiguration:
     def api_key(self):
         return self.__config.get_value(OPENLINEAGE_API_KEY)
 
+    def sql_parse_max_sync_query_size(self) -> int:
+        return int(self.__config.get_value(OPENLINEAGE_SQL_PARSE_MAX_SYNC_QUERY_SIZE))
+
+    def emit_batch_size(self) -> int:
+        return max(1, int(self.__config.get_value(OPENLINEAGE_EMIT_BATCH_SIZE)))
+
 
 def add_definitions(config_builder: ConfigurationBuilder):
     config_builder.add(
@@ -29,3 +37,16 @@ def add_definitions(config_builder: ConfigurationBuilder):
         default_value=None,
         description="The `Bearer` authentication key used if required by consumer service of OpenLineage events.",
     )
+    config_builder.add(
+        key=OPENLINEAGE_SQL_PARSE_MAX_SYNC_QUERY_SIZE,
+        default_value=10000,
+        description="Queries up to this size (in characters) are parsed for lineage before they are executed. "
+        "Parsing larger queries is slow, so they are parsed in a background thread instead "
+        "and their lineage events are sent later (with the time of the query).",
+    )
+    config_builder.add(
+        key=OPENLINEAGE_EMIT_BATCH_SIZE,
+        default_value=20,
+        description="The lineage events of queries are sent in a background thread in batches of this size. "
+        "The remaining events are sent when the job run finishes.",
+    )
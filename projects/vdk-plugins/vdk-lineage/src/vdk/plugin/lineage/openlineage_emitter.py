@@ -0,0 +1,65 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Union
+
+from openlineage.client.run import RunEvent
+
+log = logging.getLogger(__name__)
+
+# an event or a function which creates it (e.g. by parsing a large query)
+EventOrFactory = Union[RunEvent, Callable[[], Optional[RunEvent]]]
+
+
+class BatchingEventEmitter:
+    """
+    Sends OpenLineage events with a client in a background thread, so sending them does not delay the queries.
+    Events are buffered and sent in batches of batch_size. They are sent in the order they are added.
+    Failures to create or send an event are logged and the event is skipped.
+    """
+
+    def __init__(self, client, batch_size: int):
+        self._client = client
+        self._batch_size = batch_size
+        self._buffer: List[EventOrFactory] = []
+        self._lock = threading.Lock()
+        # single worker so that the events are sent in order
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="openlineage-emitter"
+        )
+
+    def emit(self, event: EventOrFactory) -> None:
+        """
+        Adds an event to be sent. If it is a function, it is called in the background thread to create the event.
+        """
+        with self._lock:
+            self._buffer.append(event)
+            if len(self._buffer) < self._batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self._executor.submit(self._emit_batch, batch)
+
+    def flush(self) -> None:
+        """
+        Sends all added events and waits until they are sent.
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        self._executor.submit(self._emit_batch, batch).result()
+
+    def _emit_batch(self, batch: List[EventOrFactory]) -> None:
+        for event in batch:
+            try:
+                if callable(event):
+                    event = event()
+                if event is not None:
+                    self._client.emit(event)
+            except Exception as e:
+                log.warning(
+                    f"Failed to send lineage data. Will continue without it. Error was {e}"
+                )
@@ -66,6 +66,7 @@ def sql_event(
     job_namespace: str,
     run_id: str,
     parent: Optional[ParentRunFacet] = None,
+    event_time: Optional[str] = None,
 ):
     lineage_data = sql_lineage_parser.get_table_lineage_from_query(sql, None, None)
     inputs = [Dataset(job_namespace, str(t)) for t in lineage_data.input_tables]
@@ -77,7 +78,7 @@ def sql_event(
 
     return RunEvent(
         eventType=state,
-        eventTime=datetime.now().isoformat(),
+        eventTime=event_time or datetime.now().isoformat(),
         run=Run(runId=run_id, facets={"parent": parent} if parent else {}),
         job=Job(
             namespace=job_namespace,
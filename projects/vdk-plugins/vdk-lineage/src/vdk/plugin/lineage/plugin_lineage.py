@@ -1,8 +1,10 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import functools
 import logging
 import uuid
 from abc import abstractmethod
+from datetime import datetime
 from typing import List
 from typing import Optional
 
@@ -24,6 +26,7 @@ from vdk.internal.core.statestore import StoreKey
 from vdk.internal.plugin.plugin import PluginRegistry
 from vdk.plugin.lineage import openlineage_config
 from vdk.plugin.lineage.openlineage_config import OpenLineageConfiguration
+from vdk.plugin.lineage.openlineage_emitter import BatchingEventEmitter
 from vdk.plugin.lineage.openlineage_utils import run_event
 from vdk.plugin.lineage.openlineage_utils import setup_client
 from vdk.plugin.lineage.openlineage_utils import sql_event
@@ -44,6 +47,8 @@ OPENLINEAGE_LOGGER_KEY = StoreKey[IOpenLineageClient]("open-lineage-logger")
 class OpenLineagePlugin:
     def __init__(self):
         self.__client: Optional[OpenLineageClient] = None
+        self.__emitter: Optional[BatchingEventEmitter] = None
+        self.__max_sync_query_size = 0
         self.__op_id = None
         self.__execution_id = None
         self.__job_version = None
@@ -74,6 +79,11 @@ class OpenLineagePlugin:
             log.debug(
                 "No OpenLineage url set. Collecting openlineage data is disabled."
             )
+        if self.__client:
+            self.__emitter = BatchingEventEmitter(
+                self.__client, config.emit_batch_size()
+            )
+            self.__max_sync_query_size = config.sql_parse_max_sync_query_size()
 
     @hookimpl
     def initialize_job(self, context: JobContext) -> None:
@@ -97,6 +107,7 @@ class OpenLineagePlugin:
         out: HookCallResult
         out = yield
         if self.__client:
+            self.__emitter.flush()
             result: ExecutionResult = out.get_result()
             self.__execution_id = context.core_context.state.get(
                 CommonStoreKeys.EXECUTION_ID
@@ -116,25 +127,36 @@ class OpenLineagePlugin:
             #  and the actual connection (e.g connection URI - be impala-1.foo.com impala-2.foo.com)
             # and record them either as facet or OpenLinage Source
             query = operation.get_operation()
+            #  TODO: abstract away so there could be multiple lineage loggers (nit just openlineage)
+            event_factory = functools.partial(
+                sql_event,
+                RunState.OTHER,
+                query,
+                self.__namespace,
+                self.__job_run_id,
+                ParentRunFacet.create(
+                    self.__job_run_id, self.__namespace, self.__job_name
+                ),
+                datetime.now().isoformat(),
+            )
+            if len(query) > self.__max_sync_query_size:
+                # parsing large queries is slow, so it is done in the background
+                self.__emitter.emit(event_factory)
+                return
             try:
-                #  TODO: abstract away so there could be multiple lineage loggers (nit just openlineage)
-                self.__client.emit(
-                    sql_event(
-                        RunState.OTHER,
-                        query,
-                        self.__namespace,
-                        self.__job_run_id,
-                        ParentRunFacet.create(
-                            self.__job_run_id, self.__namespace, self.__job_name
-                        ),
-                    )
-                )
+                self.__emitter.emit(event_factory())
             except Exception as e:
                 log.exception(
-                    f"Failed to send lineage data for query {query}. Will continue without it. Errors was {e}"
+                    f"Failed to collect lineage data for query {query}. Will continue without it. Errors was {e}"
                 )
                 raise e
 
+    @hookimpl
+    def vdk_exit(self, context: CoreContext, exit_code: int) -> None:
+        if self.__emitter:
+            # send the lineage of queries executed after the job run (if any)
+            self.__emitter.flush()
+
     def __emit_run_event(self, state: RunState):
         try:
             run_details = VdkJobFacet(
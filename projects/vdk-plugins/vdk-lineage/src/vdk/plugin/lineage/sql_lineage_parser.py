@@ -1,14 +1,36 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import dataclasses
 import logging
+import re
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Optional
+from typing import Tuple
 
 from vdk.api.lineage.model.sql.model import LineageData
 from vdk.api.lineage.model.sql.model import LineageTable
 
 log = logging.getLogger(__name__)
 
+# literals, comments and quoted identifiers - in the order they are matched when scanning the query
+_QUERY_TOKENS = re.compile(
+    r"(?P<literal>'(?:[^']|'')*')"
+    r"|(?P<comment>--[^\n]*|/\*.*?\*/)"
+    r'|(?P<identifier>"(?:[^"]|"")*"|`[^`]*`)'
+    r"|(?P<number>\b\d+(?:\.\d+)?(?:e[+-]?\d+)?\b)",
+    re.DOTALL | re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# the number of query shapes whose lineage is cached
+_CACHE_MAX_SIZE = 1024
+_cache: "OrderedDict[Tuple[str, Optional[str], Optional[str]], LineageData]" = (
+    OrderedDict()
+)
+_cache_lock = threading.Lock()
+
 
 @contextmanager
 def no_op_dict_config():
@@ -31,18 +53,63 @@ with no_op_dict_config():
     from sqllineage.runner import LineageRunner
 
 
+def _replace_query_token(match: re.Match) -> str:
+    if match.lastgroup == "comment":
+        return " "
+    if match.lastgroup == "identifier":
+        return match.group()
+    return "?"
+
+
+def get_query_shape(query: str) -> str:
+    """
+    Normalizes the query - literals are replaced with "?", comments are removed and whitespace is collapsed.
+    Queries with the same shape (e.g. the same template run with different arguments) have the same lineage.
+    """
+    query = _QUERY_TOKENS.sub(_replace_query_token, query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+def clear_cache() -> None:
+    """
+    Clears the cached lineage of the parsed queries.
+    """
+    with _cache_lock:
+        _cache.clear()
+
+
 def get_table_lineage_from_query(
     query: str, schema: Optional[str], catalog: Optional[str]
 ) -> LineageData:
     """
     This method parses the sql query. If and only if it is a rename table query,
     the method returns the names of the source and destination table.
+    The lineage is cached by the shape of the query (see get_query_shape),
+    so queries which differ only in their literals are parsed once.
     :param query: The SQL query potentially containing a RENAME TABLE operation
     :param schema: The schema which is queried
     :param catalog: The catalog which is queried
     :return: A tuple with (table_from, table_to) if it is a RENAME TABLE query, None otherwise.
     """
-
+    key = (get_query_shape(query), schema, catalog)
+    with _cache_lock:
+        lineage_data = _cache.get(key)
+        if lineage_data is not None:
+            _cache.move_to_end(key)
+    if lineage_data is None:
+        lineage_data = _parse_table_lineage(query, schema, catalog)
+        if lineage_data is None:
+            return None
+        with _cache_lock:
+            _cache[key] = lineage_data
+            if len(_cache) > _CACHE_MAX_SIZE:
+                _cache.popitem(last=False)
+    return dataclasses.replace(lineage_data, query=query)
+
+
+def _parse_table_lineage(
+    query: str, schema: Optional[str], catalog: Optional[str]
+) -> Optional[LineageData]:
     runner = LineageRunner(query)
 
     if len(runner.statements()) == 0:
@@ -5,7 +5,10 @@ import os
 from unittest import mock
 
 from click.testing import Result
+from openlineage.client.run import RunState
 from pytest_httpserver.pytest_plugin import PluginHTTPServer
+from vdk.api.plugin.hook_markers import hookimpl
+from vdk.internal.core.context import CoreContext
 from vdk.plugin.lineage import plugin_lineage
 from vdk.plugin.sqlite import sqlite_plugin
 from vdk.plugin.test_utils.util_funcs import cli_assert_equal
@@ -62,3 +65,39 @@ def test_job_lineage(tmpdir, httpserver: PluginHTTPServer):
 
         cli_assert_equal(0, result)
         assert len(sent_data) == 7
+
+
+def test_job_lineage_parsed_in_background(tmpdir):
+    sent_events = []
+
+    class TestClient(plugin_lineage.IOpenLineageClient):
+        def emit(self, event):
+            sent_events.append(event)
+
+    class TestClientPlugin:
+        @hookimpl(tryfirst=True)
+        def vdk_initialize(self, context: CoreContext):
+            context.state.set(plugin_lineage.OPENLINEAGE_LOGGER_KEY, TestClient())
+
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_DB_DEFAULT_TYPE": "SQLITE",
+            "VDK_SQLITE_FILE": str(tmpdir) + "vdk-sqlite.db",
+            "VDK_OPENLINEAGE_SQL_PARSE_MAX_SYNC_QUERY_SIZE": "0",
+            "VDK_OPENLINEAGE_EMIT_BATCH_SIZE": "2",
+        },
+    ):
+        runner = CliEntryBasedTestRunner(
+            sqlite_plugin, plugin_lineage, TestClientPlugin()
+        )
+
+        result: Result = runner.invoke(
+            ["run", jobs_path_from_caller_directory("sql-job")]
+        )
+
+        cli_assert_equal(0, result)
+        assert len(sent_events) == 7
+        assert sent_events[0].eventType == RunState.START
+        assert sent_events[-1].eventType == RunState.COMPLETE
+        assert [str(o.name) for o in sent_events[-2].outputs] == ["stocks2"]
@@ -1,6 +1,11 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+from unittest import mock
+
 from vdk.api.lineage.model.sql.model import LineageTable
+from vdk.plugin.lineage import sql_lineage_parser
+from vdk.plugin.lineage.sql_lineage_parser import clear_cache
+from vdk.plugin.lineage.sql_lineage_parser import get_query_shape
 from vdk.plugin.lineage.sql_lineage_parser import get_table_lineage_from_query
 
 
@@ -102,3 +107,32 @@ def test_get_select_table_lineage_from_query_complex():
         LineageTable("history", "production", "query_details"),
     ]
     assert set(lineage_data.input_tables) == set(expected_input_tables)
+
+
+def test_get_query_shape():
+    assert get_query_shape(
+        "INSERT INTO t_1 -- it's a comment\n VALUES ('a', 1)"
+    ) == get_query_shape("INSERT INTO t_1  VALUES ('it''s', 2.5) /* hint */")
+    assert get_query_shape('select "column 1" from t') != get_query_shape(
+        'select "column 2" from t'
+    )
+    assert get_query_shape("select * from t1") != get_query_shape("select * from t2")
+
+
+def test_get_table_lineage_from_query_cached():
+    clear_cache()
+    with mock.patch(
+        "vdk.plugin.lineage.sql_lineage_parser.LineageRunner",
+        wraps=sql_lineage_parser.LineageRunner,
+    ) as runner:
+        first = get_table_lineage_from_query(
+            "insert into t2 select * from t1 where id = 1", "s", "c"
+        )
+        second = get_table_lineage_from_query(
+            "insert into t2 select * from t1 where id = 2", "s", "c"
+        )
+
+    assert runner.call_count == 1
+    assert second.query == "insert into t2 select * from t1 where id = 2"
+    assert second.input_tables == first.input_tables == [LineageTable("c", "s", "t1")]
+    assert second.output_table == LineageTable("c", "s", "t2")
@@ -6,13 +6,14 @@ import logging
 import pathlib
 from pathlib import Path
 from typing import List
+from typing import Optional
 
 from vdk.internal.builtin_plugins.run.job_context import JobContext
 from vdk.internal.core import errors
 from vdk.internal.core.errors import UserCodeError
-from vdk.plugin.notebook.cell import Cell
 from vdk.plugin.notebook.notebook_based_step import NotebookCellStep
 from vdk.plugin.notebook.notebook_based_step import NotebookStepFuncFactory
+from vdk.plugin.notebook.notebook_reader import NotebookReader
 
 log = logging.getLogger(__name__)
 
@@ -46,7 +47,10 @@ class Notebook:
     """
 
     @staticmethod
-    def register_notebook_steps(file_path: Path, context: JobContext):
+    def register_notebook_steps(
+        file_path: Path, context: JobContext, reader: Optional[NotebookReader] = None
+    ):
+        reader = reader or NotebookReader()
         try:
             # see https://docs.python.org/3/library/importlib.html#importlib.util.module_from_spec
             spec = importlib.util.spec_from_loader("notebook", loader=None)
@@ -56,34 +60,27 @@ class Notebook:
             # Used to pass the real vdk job_input variable in run_python_step (module.job_input = job_input
             exec("job_input = 1", python_module.__dict__)
             notebook_steps = []
-            # see Jupyter json schema here:
-            # https://github.com/jupyter/nbformat/blob/main/nbformat/v4/nbformat.v4.schema.json
-            content = json.loads(file_path.read_text())
-            index = 0
-            for jupyter_cell in content["cells"]:
-                if jupyter_cell["cell_type"] == "code":
-                    cell = Cell(jupyter_cell)
-                    if "vdk" in cell.tags:
-                        index += 1
-                        step = NotebookCellStep(
-                            name="".join(
-                                [
-                                    file_path.name.replace(".ipynb", "_"),
-                                    str(index),
-                                ]
-                            ),
-                            type=cell.source_type,
-                            runner_func=NotebookStepFuncFactory.get_run_function(
-                                cell.source_type
-                            ),
-                            file_path=file_path,
-                            job_dir=context.job_directory,
-                            source=cell.source,
-                            cell_id=cell.id,
-                            module=python_module,
-                        )
-                        notebook_steps.append(step)
-                        context.step_builder.add_step(step)
+            for index, cell in enumerate(reader.read_vdk_cells(file_path), start=1):
+                step = NotebookCellStep(
+                    name="".join(
+                        [
+                            file_path.name.replace(".ipynb", "_"),
+                            str(index),
+                        ]
+                    ),
+                    type=cell.source_type,
+                    runner_func=NotebookStepFuncFactory.get_run_function(
+                        cell.source_type
+                    ),
+                    file_path=file_path,
+                    job_dir=context.job_directory,
+                    source=cell.source,
+                    cell_id=cell.id,
+                    module=python_module,
+                    code=cell.code,
+                )
+                notebook_steps.append(step)
+                context.step_builder.add_step(step)
             context.step_builder._StepBuilder__steps.sort(key=lambda step: step.name)
             log.debug(f"{len(notebook_steps)} " f"cells with vdk tag were detected!")
         except json.JSONDecodeError as e:
@@ -44,6 +44,7 @@ class NotebookCellStep(Step):
     ::source: str - the code string retrieved from Jupyter code cell
     ::module: module object - the module the code belongs to
     (see imp.new_module in https://docs.python.org/3/library/imp.html)
+    ::code: code object | None - the source already compiled (only for python steps)
     """
 
     def __init__(
@@ -57,12 +58,14 @@ class NotebookCellStep(Step):
         cell_id,
         module=None,
         parent=None,
+        code=None,
     ):
         super().__init__(name, type, runner_func, file_path, job_dir, parent)
         self.runner_func = runner_func
         self.source = source
         self.module = module
         self.cell_id = cell_id
+        self.code = code
 
 
 class NotebookStepFuncFactory:
@@ -97,7 +100,10 @@ class NotebookStepFuncFactory:
             try:
                 log.debug("Loading %s ..." % step.name)
                 step.module.job_input = job_input
-                exec(step.source, step.module.__dict__)
+                exec(
+                    step.code if step.code is not None else step.source,
+                    step.module.__dict__,
+                )
                 log.debug("Loading %s SUCCESS" % step.name)
                 success = True
             except SyntaxError as e:
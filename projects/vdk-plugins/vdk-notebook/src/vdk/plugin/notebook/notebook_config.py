@@ -0,0 +1,40 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+from vdk.internal.core.config import Configuration
+from vdk.internal.core.config import ConfigurationBuilder
+
+NOTEBOOK_CACHE_DIRECTORY = "NOTEBOOK_CACHE_DIRECTORY"
+
+
+def _get_default_cache_directory() -> str:
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_dir, "vdk", "notebook")
+
+
+class NotebookConfiguration:
+    """
+    The configuration of the vdk-notebook plugin.
+    """
+
+    def __init__(self, config: Configuration):
+        self.__config = config
+
+    def cache_directory(self) -> str:
+        return self.__config.get_value(NOTEBOOK_CACHE_DIRECTORY)
+
+
+def add_definitions(config_builder: ConfigurationBuilder) -> None:
+    """
+    Defines the configuration of the vdk-notebook plugin.
+    """
+    config_builder.add(
+        key=NOTEBOOK_CACHE_DIRECTORY,
+        default_value=_get_default_cache_directory(),
+        description="The directory in which the vdk cells of the job notebooks (with their Python code compiled) "
+        "are cached, so notebooks are not parsed and compiled again on each run unless they change. "
+        "Set to empty string to disable the cache.",
+    )
@@ -7,20 +7,34 @@ import logging
 from vdk.api.plugin.hook_markers import hookimpl
 from vdk.api.plugin.plugin_registry import IPluginRegistry
 from vdk.internal.builtin_plugins.run.job_context import JobContext
+from vdk.internal.core.config import ConfigurationBuilder
+from vdk.plugin.notebook import notebook_config
 from vdk.plugin.notebook.notebook import JobNotebookLocator
 from vdk.plugin.notebook.notebook import Notebook
+from vdk.plugin.notebook.notebook_config import NotebookConfiguration
+from vdk.plugin.notebook.notebook_reader import NotebookReader
 
 log = logging.getLogger(__name__)
 
 
 class NotebookPlugin:
+    @staticmethod
+    @hookimpl
+    def vdk_configure(config_builder: ConfigurationBuilder) -> None:
+        notebook_config.add_definitions(config_builder)
+
     @hookimpl(trylast=True)
     def initialize_job(self, context: JobContext):
         file_locator: JobNotebookLocator = JobNotebookLocator()
         notebook_files = file_locator.get_notebook_files(context.job_directory)
         if len(notebook_files) >= 1:
+            reader = NotebookReader(
+                NotebookConfiguration(
+                    context.core_context.configuration
+                ).cache_directory()
+            )
             for file_path in notebook_files:
-                Notebook.register_notebook_steps(file_path, context)
+                Notebook.register_notebook_steps(file_path, context, reader)
 
 
 @hookimpl
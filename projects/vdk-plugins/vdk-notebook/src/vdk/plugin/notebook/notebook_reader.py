@@ -0,0 +1,167 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+"""
+Reading the VDK cells of notebooks.
+
+Notebooks often embed large outputs (e.g. images) which are irrelevant for running them,
+yet the whole file has to be parsed to find the VDK cells. So the VDK cells of each notebook
+(with their Python code already compiled) are cached in a file and reused until the notebook changes.
+"""
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import List
+from typing import Optional
+
+from vdk.internal.builtin_plugins.run.file_based_step import TYPE_PYTHON
+from vdk.plugin.notebook.cell import Cell
+
+log = logging.getLogger(__name__)
+
+# incremented when the format of the cache files changes
+_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class VdkCell:
+    """
+    A code cell tagged with "vdk".
+
+    ::id: str - the id of the Jupyter cell
+    ::source: str - the source of the cell without the vdk magic (e.g. %%vdksql)
+    ::source_type: str - the type of the source (python, sql or ingest)
+    ::code: CodeType | None - the compiled source of python cells or None if it is not compiled
+    """
+
+    id: Optional[str]
+    source: str
+    source_type: str
+    code: Optional[CodeType] = None
+
+
+def compile_cell(source: str) -> Optional[CodeType]:
+    """
+    Compiles the source of a python cell. Returns None if it has syntax errors,
+    so that they are reported when the cell is run.
+    """
+    try:
+        return compile(source, "<string>", "exec")
+    except (SyntaxError, ValueError):
+        return None
+
+
+def parse_vdk_cells(content: bytes) -> List[VdkCell]:
+    """
+    Parses a notebook and returns its code cells tagged with "vdk".
+    See Jupyter json schema here: https://github.com/jupyter/nbformat/blob/main/nbformat/v4/nbformat.v4.schema.json
+
+    :raises json.JSONDecodeError: if the content is not a valid notebook
+    """
+    vdk_cells = []
+    for jupyter_cell in json.loads(content)["cells"]:
+        if jupyter_cell["cell_type"] == "code":
+            cell = Cell(jupyter_cell)
+            if "vdk" in cell.tags:
+                vdk_cells.append(VdkCell(cell.id, cell.source, cell.source_type))
+    return vdk_cells
+
+
+class NotebookReader:
+    """
+    Reads the VDK cells of notebooks and compiles their Python code.
+
+    If cache_directory is set, the result is cached in a file per notebook.
+    The cache is used as is while the size and the modification time of the notebook are the same.
+    Otherwise, the notebook content hash is compared, so copies of the same notebook
+    (e.g. in a newly deployed job) are not parsed and compiled again.
+    """
+
+    def __init__(self, cache_directory: Optional[str] = None):
+        self._cache_directory = cache_directory
+
+    def read_vdk_cells(self, file_path: Path) -> List[VdkCell]:
+        """
+        :raises json.JSONDecodeError: if the file is not a valid notebook
+        """
+        if not self._cache_directory:
+            return self._compile(parse_vdk_cells(file_path.read_bytes()))
+
+        stat = file_path.stat()
+        cache_file = self._get_cache_file(file_path)
+        cached = self._read_cache(cache_file)
+        if cached and (cached["size"], cached["mtime_ns"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return self._to_vdk_cells(cached["cells"])
+
+        content = file_path.read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        if cached and cached["content_hash"] == content_hash:
+            vdk_cells = self._to_vdk_cells(cached["cells"])
+        else:
+            vdk_cells = self._compile(parse_vdk_cells(content))
+        self._write_cache(
+            cache_file,
+            dict(
+                version=_CACHE_FORMAT_VERSION,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                content_hash=content_hash,
+                cells=[
+                    (cell.id, cell.source, cell.source_type, cell.code)
+                    for cell in vdk_cells
+                ],
+            ),
+        )
+        return vdk_cells
+
+    @staticmethod
+    def _compile(vdk_cells: List[VdkCell]) -> List[VdkCell]:
+        for cell in vdk_cells:
+            if cell.source_type == TYPE_PYTHON:
+                cell.code = compile_cell(cell.source)
+        return vdk_cells
+
+    @staticmethod
+    def _to_vdk_cells(cells: list) -> List[VdkCell]:
+        return [VdkCell(*cell) for cell in cells]
+
+    def _get_cache_file(self, file_path: Path) -> str:
+        path_hash = hashlib.sha256(
+            str(file_path.resolve()).encode("utf-8", "surrogateescape")
+        ).hexdigest()[:32]
+        # code objects can be loaded only by the same python version
+        return os.path.join(
+            self._cache_directory, f"{path_hash}.{sys.implementation.cache_tag}.cells"
+        )
+
+    @staticmethod
+    def _read_cache(cache_file: str) -> Optional[dict]:
+        try:
+            with open(cache_file, "rb") as f:
+                cached = marshal.load(f)
+            if cached.get("version") == _CACHE_FORMAT_VERSION:
+                return cached
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, EOFError, TypeError, AttributeError) as e:
+            log.debug(f"Could not read notebook cache {cache_file}: {e}")
+        return None
+
+    @staticmethod
+    def _write_cache(cache_file: str, content: dict):
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, "wb") as f:
+                marshal.dump(content, f)
+            os.replace(temp_file, cache_file)
+        except (OSError, ValueError) as e:
+            log.debug(f"Could not write notebook cache {cache_file}: {e}")
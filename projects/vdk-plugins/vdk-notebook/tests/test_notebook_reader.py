@@ -0,0 +1,92 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import base64
+import json
+import logging
+import os
+import timeit
+from unittest import mock
+
+from vdk.plugin.notebook import notebook_reader
+from vdk.plugin.notebook.notebook_reader import NotebookReader
+
+log = logging.getLogger(__name__)
+
+
+def write_notebook(path, sources, output_size=0):
+    cells = [
+        dict(
+            cell_type="code",
+            id=f"cell-{i}",
+            metadata=dict(tags=["vdk"]),
+            source=source.splitlines(keepends=True),
+            outputs=[
+                dict(
+                    output_type="display_data",
+                    data={"image/png": base64.b64encode(os.urandom(output_size))},
+                    metadata={},
+                )
+            ]
+            if output_size
+            else [],
+        )
+        for i, source in enumerate(sources)
+    ]
+    cells.append(dict(cell_type="code", id="untagged", metadata={}, source=["x = 1"]))
+    path.write_text(json.dumps(dict(cells=cells), default=bytes.decode))
+
+
+def test_read_vdk_cells(tmp_path):
+    notebook = tmp_path / "steps.ipynb"
+    write_notebook(notebook, ["x = 1\n", "%%vdksql\nselect 1", "def broken(:\n"])
+
+    cells = NotebookReader().read_vdk_cells(notebook)
+
+    assert [(c.id, c.source, c.source_type) for c in cells] == [
+        ("cell-0", "x = 1\n", "python"),
+        ("cell-1", "select 1", "sql"),
+        ("cell-2", "def broken(:\n", "python"),
+    ]
+    namespace = {}
+    exec(cells[0].code, namespace)
+    assert namespace["x"] == 1
+    # not compiled - the syntax error is reported when the cell is run
+    assert cells[1].code is None and cells[2].code is None
+
+
+def test_read_vdk_cells_cached(tmp_path):
+    notebook = tmp_path / "steps.ipynb"
+    write_notebook(notebook, ["x = 1\n"])
+    reader = NotebookReader(str(tmp_path / "cache"))
+    assert reader.read_vdk_cells(notebook)[0].source == "x = 1\n"
+
+    with mock.patch.object(
+        notebook_reader, "parse_vdk_cells", side_effect=AssertionError
+    ):
+        assert reader.read_vdk_cells(notebook)[0].source == "x = 1\n"
+        # same content with different modification time
+        os.utime(notebook, ns=(0, 0))
+        assert reader.read_vdk_cells(notebook)[0].source == "x = 1\n"
+
+    write_notebook(notebook, ["x = 2\n"])
+    assert reader.read_vdk_cells(notebook)[0].source == "x = 2\n"
+
+
+def test_read_vdk_cells_with_large_outputs_benchmark(tmp_path):
+    notebook = tmp_path / "steps.ipynb"
+    write_notebook(notebook, ["x = 1\n"] * 20, output_size=500_000)
+    cached_reader = NotebookReader(str(tmp_path / "cache"))
+    cached_reader.read_vdk_cells(notebook)
+
+    not_cached_seconds = min(
+        timeit.repeat(lambda: NotebookReader().read_vdk_cells(notebook), number=5)
+    )
+    cached_seconds = min(
+        timeit.repeat(lambda: cached_reader.read_vdk_cells(notebook), number=5)
+    )
+    log.info(
+        f"Reading notebook of {notebook.stat().st_size} bytes 5 times took {not_cached_seconds:.4f}s, "
+        f"with cache {cached_seconds:.4f}s"
+    )
+
+    assert cached_seconds < not_cached_seconds
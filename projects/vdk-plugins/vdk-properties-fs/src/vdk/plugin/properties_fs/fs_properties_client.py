@@ -3,34 +3,104 @@
 import json
 import logging
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
 from typing import Dict
 from typing import Optional
+from typing import Tuple
+from urllib.parse import quote
 
 from vdk.api.plugin.plugin_input import IPropertiesServiceClient
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 log = logging.getLogger(__name__)
 
+# absolute file path -> ((modification time, size, inode) of the file, its parsed content)
+_read_cache: Dict[str, Tuple[tuple, Optional[Dict]]] = {}
+_read_cache_lock = threading.Lock()
+
+
+def _file_signature(stat: os.stat_result) -> tuple:
+    # files are replaced (not modified in place) so the inode changes even if the modification time does not
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _read_json_file(file_path: str) -> Optional[Dict]:
+    """
+    Reads a JSON file, parsing it again only if it changed since it was last read.
+    :return: a copy of the content of the file or None if the file does not exist or is empty
+    """
+    file_path = os.path.abspath(file_path)
+    try:
+        signature = _file_signature(os.stat(file_path))
+    except FileNotFoundError:
+        return None
+    cached = _read_cache.get(file_path)
+    if cached is None or cached[0] != signature:
+        try:
+            with open(file_path) as json_file:
+                signature = _file_signature(os.fstat(json_file.fileno()))
+                content = json.load(json_file) if signature[1] != 0 else None
+        except FileNotFoundError:
+            return None
+        cached = (signature, content)
+        with _read_cache_lock:
+            _read_cache[file_path] = cached
+    return deepcopy(cached[1])
+
+
+@contextmanager
+def _exclusive_lock(lock_path: str):
+    with open(lock_path, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
 
 class FileSystemPropertiesServiceClient(IPropertiesServiceClient):
     """
     Implementation of IProperties that are kept on local FS only. Stateless.
-    A single JSON file store, supporting multiple teams and data jobs properties,
-    via nesting the key-values under a dedicated team and job name key to deduplicate.
+    The properties of each team and data job are kept in a separate JSON file
+    (<directory>/<filename>.d/<team name>/<job name>.json), so that jobs running at the same time do not
+    rewrite each other's properties. A file is written under a lock to a temporary file which then replaces it,
+    so readers never see a partially written file and do not need to lock it.
+    Parsed files are cached until they change.
+
+    The single JSON file (<directory>/<filename>) with the properties of all teams and data jobs
+    (nested under a dedicated team and job name key), used by earlier versions, is still read
+    for jobs which have not written their properties since.
     """
 
     def __init__(self, directory: str, filename: str):
         self._file_path = os.path.join(directory, filename)
+        self._jobs_directory = f"{self._file_path}.d"
 
     def read_properties(self, job_name: str, team_name: str) -> Dict:
-        if os.path.isfile(self._file_path) and os.stat(self._file_path).st_size != 0:
-            props: Dict
-            with open(self._file_path) as props_file:
-                props = json.load(props_file)
+        props = _read_json_file(self._get_job_file_path(team_name, job_name))
+        if props is not None:
+            return props
 
+        all_props = _read_json_file(self._file_path)
+        if all_props:
             # filter properties by prefix for this particular team and data job
             prefix = FileSystemPropertiesServiceClient._prefix(team_name, job_name)
-            if props.keys().__contains__(prefix):
-                return props.get(prefix)
+            if prefix in all_props:
+                return all_props[prefix]
         return {}
 
     def write_properties(self, job_name: str, team_name: str, properties: Dict) -> Dict:
@@ -40,27 +110,35 @@ class FileSystemPropertiesServiceClient(IPropertiesServiceClient):
             "all properties data will survive VDK process restarts."
             "The properties will be read and written to the local file system only."
         )
-        props: Optional[Dict] = None
-
-        # init storage file
-        if not os.path.isfile(self._file_path) or os.stat(self._file_path).st_size == 0:
-            with open(self._file_path, "w+") as props_file:
-                props = {}
-                json.dump(props, props_file)
-
-        with open(self._file_path, "r+") as props_file:
-            props = json.load(props_file) if props is None else props
+        job_file_path = self._get_job_file_path(team_name, job_name)
+        job_directory = os.path.dirname(job_file_path)
+        os.makedirs(job_directory, exist_ok=True)
 
-            # filter properties by prefix for this particular team and data job
-            prefix = FileSystemPropertiesServiceClient._prefix(team_name, job_name)
-            # overwrite properties
-            props_file.seek(0)
-            props.update({prefix: properties})
-            props_file.truncate()
-            # store
-            json.dump(props, props_file)
+        with _exclusive_lock(f"{job_file_path}.lock"):
+            fd, temp_file_path = tempfile.mkstemp(
+                dir=job_directory, prefix=".properties-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as props_file:
+                    json.dump(properties, props_file)
+                os.replace(temp_file_path, job_file_path)
+            except BaseException:
+                os.remove(temp_file_path)
+                raise
+            finally:
+                # the freed inode of the replaced file may be reused by the next write,
+                # so it is not relied on for the writes of this process
+                with _read_cache_lock:
+                    _read_cache.pop(os.path.abspath(job_file_path), None)
         return properties
 
+    def _get_job_file_path(self, team_name: str, job_name: str) -> str:
+        return os.path.join(
+            self._jobs_directory,
+            quote(str(team_name), safe=""),
+            f"{quote(str(job_name), safe='')}.json",
+        )
+
     @staticmethod
     def _prefix(team_name: str, job_name: str):
         return f"{team_name}_{job_name}__"
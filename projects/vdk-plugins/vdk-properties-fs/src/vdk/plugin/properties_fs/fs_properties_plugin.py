@@ -21,13 +21,16 @@ def vdk_configure(config_builder: ConfigurationBuilder) -> None:
     config_builder.add(
         key=FS_PROPERTIES_DIRECTORY,
         default_value=tempfile.gettempdir(),
-        description="FS directory path where the JSON file is to be stored.",
+        description="FS directory path where the JSON files are to be stored.",
     )
     config_builder.add(
         key=FS_PROPERTIES_FILENAME,
         default_value="vdk_data_jobs.json",
-        description="JSON file name to be used. Placed within the FS_PROPERTIES_DIRECTORY. "
-        "Supports properties storage of multiple teams and data jobs.",
+        description="Name of the properties storage within the FS_PROPERTIES_DIRECTORY. "
+        "The properties of each team and data job are stored in a separate JSON file "
+        "in directory <FS_PROPERTIES_FILENAME>.d, so that data jobs can run at the same time. "
+        "A JSON file with this name with the properties of multiple teams and data jobs "
+        "(written by earlier versions) is still read for data jobs without their own file.",
     )
 
 
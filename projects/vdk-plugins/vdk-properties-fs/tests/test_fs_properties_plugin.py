@@ -5,7 +5,7 @@ import os
 import shutil
 import tempfile
 import uuid
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from click.testing import Result
@@ -47,24 +47,17 @@ def test_multiple_properties_read_write_config_default():
     )
     cli_assert_equal(0, result)
 
-    props: Dict
-    with open(file_path) as props_file:
-        props = json.load(props_file)
-
     # verify properties stored per job
-    job_prefix_0 = FileSystemPropertiesServiceClient._prefix(
-        None, "write-read-properties-job"
-    )
-    job_prefix_1 = FileSystemPropertiesServiceClient._prefix(
-        None, "write-read-properties-job-1"
+    client = FileSystemPropertiesServiceClient(
+        tempfile.gettempdir(), "vdk_data_jobs.json"
     )
-    assert props.keys().__contains__(job_prefix_0)
-    assert props.get(job_prefix_0) == {
+    for job_name in ["write-read-properties-job", "write-read-properties-job-1"]:
+        assert os.path.isfile(client._get_job_file_path(None, job_name))
+    assert client.read_properties("write-read-properties-job", None) == {
         "key": "new_value0",
         "another_key": "value0",
     }
-    assert props.keys().__contains__(job_prefix_1)
-    assert props.get(job_prefix_1) == {
+    assert client.read_properties("write-read-properties-job-1", None) == {
         "key": "new_value1",
         "another_key": "value1",
     }
@@ -84,7 +77,10 @@ def test_properties_read_write_config_custom_directory_filename():
     # create unique dir in temp
     os.mkdir(directory)
     try:
-        file_path = os.path.join(directory, filename)
+        file_path = FileSystemPropertiesServiceClient(
+            directory, filename
+        )._get_job_file_path(None, "write-read-properties-job")
+        assert file_path.startswith(os.path.join(directory, filename))
         assert not os.path.isfile(file_path)
 
         result: Result = runner.invoke(
@@ -95,3 +91,53 @@ def test_properties_read_write_config_custom_directory_filename():
         assert os.path.isfile(file_path)
     finally:
         shutil.rmtree(directory)
+
+
+def test_read_properties_written_by_earlier_versions(tmp_path):
+    with open(tmp_path / "props.json", "w") as props_file:
+        json.dump(
+            {
+                FileSystemPropertiesServiceClient._prefix("team", "job"): {"a": "b"},
+                FileSystemPropertiesServiceClient._prefix("team", "other"): {"c": "d"},
+            },
+            props_file,
+        )
+    client = FileSystemPropertiesServiceClient(str(tmp_path), "props.json")
+
+    assert client.read_properties("job", "team") == {"a": "b"}
+    assert client.read_properties("missing", "team") == {}
+
+    client.write_properties("job", "team", {"a": "new"})
+    assert client.read_properties("job", "team") == {"a": "new"}
+    assert client.read_properties("other", "team") == {"c": "d"}
+
+
+def test_read_properties_parses_file_only_when_changed(tmp_path):
+    client = FileSystemPropertiesServiceClient(str(tmp_path), "props.json")
+    client.write_properties("job", "team", {"key": "value"})
+
+    with patch("json.load", wraps=json.load) as patched_load:
+        props = client.read_properties("job", "team")
+        props["key"] = "changed by caller"
+        assert client.read_properties("job", "team") == {"key": "value"}
+        assert patched_load.call_count == 1
+
+        client.write_properties("job", "team", {"key": "new value"})
+        assert client.read_properties("job", "team") == {"key": "new value"}
+        assert patched_load.call_count == 2
+
+
+def test_write_properties_concurrently(tmp_path):
+    client = FileSystemPropertiesServiceClient(str(tmp_path), "props.json")
+
+    def write(i):
+        client.write_properties(f"job-{i % 4}", "team", {"value": i})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(40)))
+
+    for job in range(4):
+        assert client.read_properties(f"job-{job}", "team")["value"] % 4 == job
+    assert not [
+        f for f in os.listdir(tmp_path / "props.json.d" / "team") if f.endswith(".tmp")
+    ]
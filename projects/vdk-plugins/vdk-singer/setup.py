@@ -24,6 +24,7 @@ setuptools.setup(
         "vdk-control-cli",
         "vdk-data-sources",
     ],
+    extras_require={"orjson": ["orjson"]},
     package_dir={"": "src"},
     packages=setuptools.find_namespace_packages(where="src"),
     # This is the only vdk plugin specifc part
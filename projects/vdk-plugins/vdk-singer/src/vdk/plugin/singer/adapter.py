@@ -1,16 +1,27 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import re
 from datetime import datetime
 
 import pytz
 import simplejson as json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Due to conflicts with different versions of singer-python and taps and singer-python logger complexity
 # it's better to adapt necessary singer classes here.
 # Changes from original
 # Logging is changed/removed
 # For parsing dates we are using datetime.isofomat and fromisoformat instead singer custom solution
 
+# JSON numbers with a fraction or an exponent or integers which may not fit in 64 bits
+# (or something looking like them inside a string).
+# orjson parses such numbers as (lossy) floats, so the messages containing them are parsed with Decimals instead.
+_NOT_INT64_NUMBER = re.compile(r"[:,\[]\s*-?(?:\d+[.eE]|\d{19})")
+
 # These are standard keys defined in the JSON Schema spec
 STANDARD_KEYS = [
     "selected",
@@ -371,6 +382,21 @@ class Catalog:
         return None
 
 
+def loads_message(msg: str):
+    """
+    Deserialize a JSON message line. Numbers with a fraction or an exponent are parsed as Decimals
+    so that no precision is lost.
+    Most messages are records without such numbers, so they are parsed with orjson (if installed) which is much faster.
+    """
+    if orjson is not None and not _NOT_INT64_NUMBER.search(msg):
+        try:
+            return orjson.loads(msg)
+        except ValueError:
+            # e.g. NaN which simplejson accepts
+            pass
+    return json.loads(msg, use_decimal=True)
+
+
 def parse_message(msg):
     """Parse a message string into a Message object."""
 
@@ -380,12 +406,7 @@ def parse_message(msg):
 
         return msg[k]
 
-    # We are not using Decimals for parsing here.
-    # We recognize that exposes data to potentially
-    # lossy conversions.  However, this will affect
-    # very few data points and we have chosen to
-    # leave conversion as is for now.
-    obj = json.loads(msg, use_decimal=True)
+    obj = loads_message(msg)
     msg_type = _required_key(obj, "type")
 
     if msg_type == "RECORD":
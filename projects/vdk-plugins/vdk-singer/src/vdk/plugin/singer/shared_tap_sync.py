@@ -0,0 +1,181 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import deque
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+from vdk.plugin.singer.adapter import Message
+from vdk.plugin.singer.adapter import RecordMessage
+from vdk.plugin.singer.adapter import StateMessage
+from vdk.plugin.singer.tap_command import TapCommandRunner
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_BUFFERED_MESSAGES = 10000
+
+
+class _StreamBuffer:
+    """
+    Passes the messages of a stream from the thread reading the tap output to the stream reader.
+
+    Up to max_in_memory messages are kept in memory. If the reader falls further behind (or has not started yet),
+    the next messages are appended to a temporary file and read back from it,
+    so the tap output is never blocked and the memory used does not grow with the number of unread messages.
+    """
+
+    def __init__(self, max_in_memory: int):
+        self._max_in_memory = max_in_memory
+        self._messages: Deque[Message] = deque()
+        self._spill_file = None
+        self._spilled_count = 0
+        self._spill_read_offset = 0
+        self._ended = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+
+    def put(self, message: Message) -> None:
+        with self._condition:
+            if self._spilled_count == 0 and len(self._messages) < self._max_in_memory:
+                self._messages.append(message)
+            else:
+                if self._spill_file is None:
+                    self._spill_file = tempfile.TemporaryFile(prefix="vdk-singer-")
+                self._spill_file.seek(0, os.SEEK_END)
+                pickle.dump(message, self._spill_file)
+                self._spilled_count += 1
+            self._condition.notify()
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            self._ended = True
+            self._error = error
+            self._condition.notify()
+
+    def __iter__(self) -> Iterator[Message]:
+        while True:
+            with self._condition:
+                while not self._messages and not self._spilled_count:
+                    if self._ended:
+                        self.__close_spill_file()
+                        if self._error is not None:
+                            raise self._error
+                        return
+                    self._condition.wait()
+                if self._messages:
+                    message = self._messages.popleft()
+                else:
+                    message = self.__read_spilled()
+            yield message
+
+    def __read_spilled(self) -> Message:
+        # the in-memory messages are older than the spilled ones, so the order is kept
+        self._spill_file.seek(self._spill_read_offset)
+        message = pickle.load(self._spill_file)
+        self._spill_read_offset = self._spill_file.tell()
+        self._spilled_count -= 1
+        if self._spilled_count == 0:
+            # the reader caught up, the file is reused for the next spilled messages
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+            self._spill_read_offset = 0
+        return message
+
+    def __close_spill_file(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+class SharedTapSync:
+    """
+    Syncs all streams of a catalog with a single tap process and splits its output by stream.
+
+    The process is started when the first stream is read. Its output is read in a background thread
+    and the messages of each stream are put in a separate buffer, read by the stream.
+    The tap output is read as fast as the tap produces it, even if some streams are not read yet
+    (e.g. there are more streams than ingestion threads). Up to max_buffered_messages of each stream are
+    kept in memory and the rest are buffered in a temporary file.
+    Singer state is common for all streams, so state messages are put in the buffers of all streams.
+
+    Each stream can be read once - the output of the tap process is not kept after it is read.
+    """
+
+    def __init__(
+        self,
+        tap_name: str,
+        config: dict,
+        catalog: dict,
+        max_buffered_messages: int = DEFAULT_MAX_BUFFERED_MESSAGES,
+    ):
+        self._tap_name = tap_name
+        self._config = config
+        self._catalog = catalog
+        self._buffers: Dict[str, _StreamBuffer] = {}
+        # record messages refer to the stream name, streams are identified by tap_stream_id
+        self._stream_ids: Dict[str, str] = {}
+        for entry in catalog["streams"]:
+            tap_stream_id = entry["tap_stream_id"]
+            self._buffers[tap_stream_id] = _StreamBuffer(max_buffered_messages)
+            self._stream_ids[entry.get("stream") or tap_stream_id] = tap_stream_id
+        self._read_streams = set()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def messages(self, tap_stream_id: str) -> Iterator[Message]:
+        """
+        Returns the messages of a stream in the order the tap produced them. Starts the tap if needed.
+
+        :raises RuntimeError: if the stream was already read (e.g. its ingestion is retried)
+        """
+        with self._lock:
+            if tap_stream_id in self._read_streams:
+                raise RuntimeError(
+                    f"Stream {tap_stream_id} of {self._tap_name} was already read by the tap process "
+                    f"shared by all streams and cannot be read again. "
+                    f"Use the per-stream sync mode to be able to retry the ingestion of a single stream."
+                )
+            self._read_streams.add(tap_stream_id)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._sync, name=f"singer-{self._tap_name}", daemon=True
+                )
+                self._thread.start()
+        yield from self._buffers[tap_stream_id]
+
+    def _sync(self):
+        log.debug(
+            f"Starting to sync {len(self._buffers)} streams of {self._tap_name} in a single process."
+        )
+        error = None
+        try:
+            with TapCommandRunner() as tap_command:
+                for message in tap_command.sync(
+                    self._tap_name, config=self._config, catalog=self._catalog
+                ):
+                    if isinstance(message, RecordMessage):
+                        self._put_record(message)
+                    elif isinstance(message, StateMessage):
+                        for stream_buffer in self._buffers.values():
+                            stream_buffer.put(message)
+        except BaseException as e:
+            log.warning(f"Syncing streams of {self._tap_name} failed: {e}")
+            error = e
+        for stream_buffer in self._buffers.values():
+            stream_buffer.end(error)
+
+    def _put_record(self, message: RecordMessage):
+        tap_stream_id = self._stream_ids.get(message.stream, message.stream)
+        stream_buffer = self._buffers.get(tap_stream_id)
+        if stream_buffer is not None:
+            stream_buffer.put(message)
+        else:
+            log.debug(
+                f"Skipping record of stream {message.stream} of {self._tap_name} which is not in the catalog."
+            )
@@ -1,6 +1,10 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import hashlib
+import json
 import logging
+import threading
+from contextlib import nullcontext
 from typing import Iterable
 from typing import List
 from typing import Optional
@@ -18,7 +22,11 @@ from vdk.plugin.data_sources.state import IDataSourceState
 from vdk.plugin.singer import message_utils
 from vdk.plugin.singer.adapter import Catalog
 from vdk.plugin.singer.adapter import CatalogEntry
+from vdk.plugin.singer.adapter import RecordMessage
 from vdk.plugin.singer.adapter import Schema
+from vdk.plugin.singer.adapter import StateMessage
+from vdk.plugin.singer.shared_tap_sync import DEFAULT_MAX_BUFFERED_MESSAGES
+from vdk.plugin.singer.shared_tap_sync import SharedTapSync
 from vdk.plugin.singer.tap_command import TapCommandRunner
 
 log = logging.getLogger(__name__)
@@ -29,6 +37,10 @@ For more check documentation at https://github.com/vmware/versatile-data-kit/tre
 """
 
 
+SYNC_MODE_PER_STREAM = "per-stream"
+SYNC_MODE_SHARED = "shared"
+
+
 @config_class("singer-tap", DESCRIPTION)
 class SingerDataSourceConfiguration(IDataSourceConfiguration):
     tap_name: str = config_field(
@@ -41,6 +53,45 @@ class SingerDataSourceConfiguration(IDataSourceConfiguration):
         description="On run it will automatically discover the schema if the tap supports",
         default=True,
     )
+    tap_catalog_cache_enabled: bool = config_field(
+        description="Keep the discovered schema (catalog) in the data source state and reuse it on the next runs "
+        "instead of discovering it again. It is discovered again when the tap name or configuration change. "
+        "Disable it to discover the schema on every run (e.g. if the schema of the source changes often).",
+        default=True,
+    )
+    records_batch_size: int = config_field(
+        description="The maximum number of records sent for ingestion together as a single payload. "
+        "Larger batches reduce the per-record overhead. Set to 1 to send each record separately.",
+        default=1000,
+    )
+    tap_sync_mode: str = config_field(
+        description=f"How the streams of the tap are synced. "
+        f"'{SYNC_MODE_PER_STREAM}' - each stream is synced by a separate tap process. "
+        f"'{SYNC_MODE_SHARED}' - all streams are synced by a single tap process and its output is split by stream. "
+        f"It is better for taps which can sync many streams in one run or whose streams share a rate limited API.",
+        default=SYNC_MODE_PER_STREAM,
+    )
+    tap_shared_max_buffered_messages: int = config_field(
+        description=f"The maximum number of messages of each stream kept in memory in '{SYNC_MODE_SHARED}' sync mode "
+        "until the stream is read. The rest are buffered in a temporary file.",
+        default=DEFAULT_MAX_BUFFERED_MESSAGES,
+    )
+    tap_max_parallel_streams: int = config_field(
+        description=f"The maximum number of tap processes run at the same time in '{SYNC_MODE_PER_STREAM}' sync mode. "
+        "0 means no limit (other than the number of streams ingested in parallel).",
+        default=0,
+    )
+
+
+CATALOG_STATE_KEY = "singer-catalog"
+
+
+def get_tap_config_hash(tap_name: str, tap_config: dict) -> str:
+    """
+    The hash of the tap name and configuration used to detect if the catalog discovered by the tap may be different.
+    """
+    content = json.dumps([tap_name, tap_config], sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
 class SingerDataSourceStream(IDataSourceStream):
@@ -51,12 +102,22 @@ class SingerDataSourceStream(IDataSourceStream):
         config: dict,
         catalog: Optional[dict] = None,
         state: Optional[dict] = None,
+        records_batch_size: int = 1,
+        shared_sync: Optional[SharedTapSync] = None,
+        processes_limit: Optional[threading.BoundedSemaphore] = None,
     ):
+        """
+        :param shared_sync: if set, the records are read from the tap process shared with the other streams
+        :param processes_limit: limits how many (not shared) tap processes are run at the same time
+        """
         self._tap_name = tap_name
         self._stream_name = stream_name
         self._config = config
         self._catalog = catalog
         self._state = state
+        self._records_batch_size = records_batch_size
+        self._shared_sync = shared_sync
+        self._processes_limit = processes_limit
 
     def name(self) -> str:
         return self._stream_name
@@ -65,7 +126,11 @@ class SingerDataSourceStream(IDataSourceStream):
         log.debug(
             f"Starting to read data source {self._tap_name} stream {self._stream_name}."
         )
-        with TapCommandRunner() as tap_command:
+        if self._shared_sync is not None:
+            yield from self._to_payloads(self._shared_sync.messages(self._stream_name))
+            return
+
+        with self._processes_limit or nullcontext(), TapCommandRunner() as tap_command:
             tap_command: TapCommandRunner
             messages = tap_command.sync(
                 self._tap_name,
@@ -73,11 +138,47 @@ class SingerDataSourceStream(IDataSourceStream):
                 catalog=self._catalog,
                 state=self._state,
             )
+            yield from self._to_payloads(messages)
+
+    def _to_payloads(self, messages) -> Iterable[DataSourcePayload]:
+        if self._records_batch_size > 1:
+            yield from self._batch_messages(messages)
+        else:
             for msg in messages:
                 payload = message_utils.convert_message_to_payload(msg)
                 if payload:
                     yield payload
 
+    def _batch_messages(self, messages) -> Iterable[DataSourcePayload]:
+        """
+        Groups the records in payloads of up to records_batch_size records.
+        A state message means all records before it are read, so the batch is sent together with the state.
+        """
+        records = []
+        time_extracted = None
+        for msg in messages:
+            if isinstance(msg, RecordMessage):
+                records.append(msg.record)
+                time_extracted = msg.time_extracted or time_extracted
+                if len(records) >= self._records_batch_size:
+                    yield DataSourcePayload(
+                        data=records, metadata={"time_extracted": time_extracted}
+                    )
+                    records = []
+            elif isinstance(msg, StateMessage):
+                yield DataSourcePayload(
+                    data=records or None,
+                    metadata={"time_extracted": time_extracted},
+                    state=msg.value,
+                )
+                records = []
+            elif msg is not None:
+                log.warning(f"Unexpected message type: {msg}")
+        if records:
+            yield DataSourcePayload(
+                data=records, metadata={"time_extracted": time_extracted}
+            )
+
 
 @data_source(name="singer-tap", config_class=SingerDataSourceConfiguration)
 class SingerDataSource(IDataSource):
@@ -96,10 +197,27 @@ class SingerDataSource(IDataSource):
             return None
 
         catalog = Catalog([])
-        # TODO get catalog from state
         if self._config.tap_auto_discover_schema:
-            catalog = self.__discover_schema(self._config)
-            # save catalog in state
+            catalog = self.__get_catalog(self._config, state)
+
+        shared_sync = None
+        processes_limit = None
+        if self._config.tap_sync_mode == SYNC_MODE_SHARED:
+            shared_sync = SharedTapSync(
+                self._config.tap_name,
+                self._config.tap_config,
+                catalog.to_dict(),
+                self._config.tap_shared_max_buffered_messages,
+            )
+        elif self._config.tap_sync_mode != SYNC_MODE_PER_STREAM:
+            raise ValueError(
+                f"Unsupported tap_sync_mode {self._config.tap_sync_mode}. "
+                f"Supported values are {SYNC_MODE_PER_STREAM} and {SYNC_MODE_SHARED}."
+            )
+        elif self._config.tap_max_parallel_streams > 0:
+            processes_limit = threading.BoundedSemaphore(
+                self._config.tap_max_parallel_streams
+            )
 
         for stream in catalog.streams:
             data_stream = SingerDataSourceStream(
@@ -107,9 +225,38 @@ class SingerDataSource(IDataSource):
                 stream_name=stream.tap_stream_id,
                 config=self._config.tap_config,
                 catalog={"streams": [stream.to_dict()]},
+                records_batch_size=self._config.records_batch_size,
+                shared_sync=shared_sync,
+                processes_limit=processes_limit,
             )
             self._streams.append(data_stream)
 
+    @classmethod
+    def __get_catalog(
+        cls, config: SingerDataSourceConfiguration, state: Optional[IDataSourceState]
+    ) -> Catalog:
+        if not config.tap_catalog_cache_enabled or state is None:
+            return cls.__discover_schema(config)
+
+        config_hash = get_tap_config_hash(config.tap_name, config.tap_config)
+        cached = state.read_others(CATALOG_STATE_KEY)
+        if cached.get("config_hash") == config_hash and "catalog" in cached:
+            log.debug(f"Using the catalog of tap {config.tap_name} from the state.")
+            try:
+                return Catalog.from_dict(cached["catalog"])
+            except Exception as e:
+                log.info(
+                    f"Could not load the catalog of tap {config.tap_name} from the state. "
+                    f"It will be discovered again. Error was: {e}"
+                )
+
+        catalog = cls.__discover_schema(config)
+        state.update_others(
+            CATALOG_STATE_KEY,
+            dict(config_hash=config_hash, catalog=catalog.to_dict()),
+        )
+        return catalog
+
     @staticmethod
     def __discover_schema(config: SingerDataSourceConfiguration) -> Catalog:
         with TapCommandRunner() as runner:
@@ -0,0 +1,97 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+from decimal import Decimal
+from unittest import mock
+
+from vdk.plugin.data_sources.state import DataSourceState
+from vdk.plugin.data_sources.state import InMemoryDataSourceStateStorage
+from vdk.plugin.singer.adapter import Catalog
+from vdk.plugin.singer.adapter import CatalogEntry
+from vdk.plugin.singer.adapter import loads_message
+from vdk.plugin.singer.adapter import parse_message
+from vdk.plugin.singer.adapter import RecordMessage
+from vdk.plugin.singer.adapter import Schema
+from vdk.plugin.singer.adapter import StateMessage
+from vdk.plugin.singer.singer_data_source import SingerDataSource
+from vdk.plugin.singer.singer_data_source import SingerDataSourceConfiguration
+from vdk.plugin.singer.singer_data_source import SingerDataSourceStream
+from vdk.plugin.singer.tap_command import TapCommandRunner
+
+
+def test_loads_message_keeps_decimal_precision():
+    assert loads_message('{"a": 1, "b": "x.5", "c": [1, 2]}') == {
+        "a": 1,
+        "b": "x.5",
+        "c": [1, 2],
+    }
+    assert loads_message('{"a": 0.1, "b": [1, 2.5e3]}') == {
+        "a": Decimal("0.1"),
+        "b": [1, Decimal("2.5e3")],
+    }
+    assert loads_message('{"a": 123456789012345678901234567890}') == {
+        "a": 123456789012345678901234567890
+    }
+    assert isinstance(
+        parse_message('{"type": "RECORD", "stream": "s", "record": {"price": 1.10}}'),
+        RecordMessage,
+    )
+
+
+def _record(i):
+    return RecordMessage(stream="s", record={"id": i})
+
+
+def test_stream_read_batches_records():
+    messages = [
+        _record(1),
+        _record(2),
+        _record(3),
+        StateMessage(value={"bookmark": 3}),
+        _record(4),
+    ]
+    stream = SingerDataSourceStream("tap-test", "s", {}, records_batch_size=2)
+    with mock.patch.object(TapCommandRunner, "sync", return_value=iter(messages)):
+        payloads = list(stream.read())
+
+    assert [(p.data, p.state) for p in payloads] == [
+        ([{"id": 1}, {"id": 2}], {}),
+        ([{"id": 3}], {"bookmark": 3}),
+        ([{"id": 4}], {}),
+    ]
+
+
+def test_stream_read_without_batching():
+    messages = [_record(1), _record(2)]
+    stream = SingerDataSourceStream("tap-test", "s", {})
+    with mock.patch.object(TapCommandRunner, "sync", return_value=iter(messages)):
+        payloads = list(stream.read())
+
+    assert [p.data for p in payloads] == [{"id": 1}, {"id": 2}]
+
+
+def _connect(state, tap_config):
+    data_source = SingerDataSource()
+    data_source.configure(
+        SingerDataSourceConfiguration(tap_name="tap-test", tap_config=tap_config)
+    )
+    data_source.connect(state)
+    return [stream.name() for stream in data_source.streams()]
+
+
+def test_catalog_cached_in_state():
+    entry = CatalogEntry(
+        tap_stream_id="users",
+        stream="users",
+        schema=Schema.from_dict({"type": "object"}),
+    )
+    state = DataSourceState(InMemoryDataSourceStateStorage(), "source")
+
+    with mock.patch.object(
+        TapCommandRunner, "discover", return_value=Catalog([entry])
+    ) as discover:
+        assert _connect(state, {"url": "a"}) == ["users"]
+        assert _connect(state, {"url": "a"}) == ["users"]
+        assert discover.call_count == 1
+
+        assert _connect(state, {"url": "b"}) == ["users"]
+        assert discover.call_count == 2
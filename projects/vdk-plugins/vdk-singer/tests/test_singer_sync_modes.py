@@ -0,0 +1,199 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import logging
+import os
+import stat
+import sys
+import textwrap
+import timeit
+from copy import deepcopy
+from typing import Any
+
+import pytest
+from vdk.plugin.data_sources.auto_generated import AutoGeneratedDataSource
+from vdk.plugin.data_sources.auto_generated import (
+    AutoGeneratedDataSourceConfiguration,
+)
+from vdk.plugin.data_sources.ingester import DataSourceIngester
+from vdk.plugin.singer.adapter import RecordMessage
+from vdk.plugin.singer.shared_tap_sync import SharedTapSync
+from vdk.plugin.singer.singer_data_source import SingerDataSource
+from vdk.plugin.singer.singer_data_source import SingerDataSourceConfiguration
+
+log = logging.getLogger(__name__)
+
+NUM_STREAMS = 4
+NUM_RECORDS = 500
+TAP_STARTUP_SECONDS = 0.2
+
+
+class MockJobInput:
+    def __init__(self):
+        self.ingested_data = []
+        self.props = {}
+
+    def send_object_for_ingestion(self, payload: dict, destination_table, **kwargs):
+        self.ingested_data.append((destination_table, payload))
+
+    def send_tabular_data_for_ingestion(
+        self, rows, column_names, destination_table, **kwargs
+    ):
+        self.ingested_data.extend(
+            (destination_table, dict(zip(column_names, row))) for row in rows
+        )
+
+    def get_property(self, name: str, default_value: Any = None):
+        return self.props.get(name, default_value)
+
+    def get_all_properties(self) -> dict:
+        return self.props
+
+    def set_all_properties(self, properties: dict):
+        self.props = deepcopy(properties)
+
+
+@pytest.fixture
+def fake_tap(tmp_path):
+    """
+    A tap with NUM_STREAMS streams with NUM_RECORDS records each, which takes TAP_STARTUP_SECONDS to start.
+    """
+    tap = tmp_path / "tap-fake"
+    tap.write_text(
+        textwrap.dedent(
+            f"""\
+            #!{sys.executable}
+            import json
+            import sys
+            import time
+
+            time.sleep({TAP_STARTUP_SECONDS})
+            if "--discover" in sys.argv:
+                streams = [
+                    dict(tap_stream_id=f"stream_{{i}}", stream=f"stream_{{i}}", schema={{"type": "object"}})
+                    for i in range({NUM_STREAMS})
+                ]
+                print(json.dumps(dict(streams=streams)))
+                sys.exit(0)
+            with open(sys.argv[sys.argv.index("--catalog") + 1]) as f:
+                catalog = json.load(f)
+            for entry in catalog["streams"]:
+                for i in range({NUM_RECORDS}):
+                    record = dict(id=i, name=f"name_{{i}}")
+                    print(json.dumps(dict(type="RECORD", stream=entry["stream"], record=record)))
+                print(json.dumps(dict(type="STATE", value=dict(last_stream=entry["stream"]))))
+            """
+        )
+    )
+    tap.chmod(tap.stat().st_mode | stat.S_IEXEC)
+    return str(tap)
+
+
+def ingest(data_source, data_source_id="source") -> MockJobInput:
+    job_input = MockJobInput()
+    ingester = DataSourceIngester(job_input)
+    ingester.ingest_data_source(data_source_id, data_source)
+    ingester.terminate_and_wait_to_finish()
+    ingester.raise_on_error()
+    return job_input
+
+
+def singer_data_source(tap: str, **config) -> SingerDataSource:
+    data_source = SingerDataSource()
+    data_source.configure(
+        SingerDataSourceConfiguration(
+            tap_name=tap, tap_config={}, tap_catalog_cache_enabled=False, **config
+        )
+    )
+    return data_source
+
+
+def assert_all_records_ingested(job_input: MockJobInput):
+    assert len(job_input.ingested_data) == NUM_STREAMS * NUM_RECORDS
+    for i in range(NUM_STREAMS):
+        stream_records = [
+            payload
+            for table, payload in job_input.ingested_data
+            if table == f"stream_{i}"
+        ]
+        assert [r["id"] for r in stream_records] == list(range(NUM_RECORDS))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the fake tap is a script with shebang")
+@pytest.mark.parametrize(
+    "config",
+    [
+        dict(tap_sync_mode="per-stream"),
+        dict(tap_sync_mode="per-stream", tap_max_parallel_streams=1),
+        dict(tap_sync_mode="shared"),
+        dict(tap_sync_mode="shared", records_batch_size=1),
+        dict(tap_sync_mode="shared", tap_shared_max_buffered_messages=10),
+    ],
+)
+def test_sync_modes_ingest_all_records(fake_tap, config):
+    assert_all_records_ingested(ingest(singer_data_source(fake_tap, **config)))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the fake tap is a script with shebang")
+def test_shared_sync_buffers_unread_streams(fake_tap):
+    catalog = dict(
+        streams=[
+            dict(tap_stream_id=f"stream_{i}", stream=f"stream_{i}")
+            for i in range(NUM_STREAMS)
+        ]
+    )
+    shared_sync = SharedTapSync(fake_tap, {}, catalog, max_buffered_messages=10)
+
+    # the last stream is read first, so the messages of the others are buffered meanwhile
+    for i in reversed(range(NUM_STREAMS)):
+        records = [
+            message.record["id"]
+            for message in shared_sync.messages(f"stream_{i}")
+            if isinstance(message, RecordMessage)
+        ]
+        assert records == list(range(NUM_RECORDS))
+
+    with pytest.raises(RuntimeError):
+        list(shared_sync.messages("stream_0"))
+
+
+def test_unknown_sync_mode(fake_tap):
+    with pytest.raises(ValueError):
+        ingest(singer_data_source(fake_tap, tap_sync_mode="unknown"))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the fake tap is a script with shebang")
+def test_sync_modes_benchmark(fake_tap):
+    def timed(create_data_source):
+        return min(
+            timeit.repeat(lambda: ingest(create_data_source()), repeat=2, number=1)
+        )
+
+    auto_generated_seconds = timed(
+        lambda: auto_generated_data_source(NUM_STREAMS, NUM_RECORDS)
+    )
+    sequential_seconds = timed(
+        lambda: singer_data_source(fake_tap, tap_max_parallel_streams=1)
+    )
+    parallel_seconds = timed(lambda: singer_data_source(fake_tap))
+    shared_seconds = timed(lambda: singer_data_source(fake_tap, tap_sync_mode="shared"))
+    log.info(
+        f"Ingesting {NUM_STREAMS} streams with {NUM_RECORDS} records each took: "
+        f"auto-generated source {auto_generated_seconds:.3f}s, "
+        f"per-stream sequential {sequential_seconds:.3f}s, "
+        f"per-stream parallel {parallel_seconds:.3f}s, "
+        f"shared {shared_seconds:.3f}s"
+    )
+
+    # the shared process starts once and the per-stream ones start sequentially
+    assert shared_seconds < sequential_seconds
+    assert parallel_seconds < sequential_seconds
+
+
+def auto_generated_data_source(num_streams, num_records):
+    data_source = AutoGeneratedDataSource()
+    data_source.configure(
+        AutoGeneratedDataSourceConfiguration(
+            num_records=num_records, num_streams=num_streams
+        )
+    )
+    return data_source
@@ -20,6 +20,7 @@ setuptools.setup(
     long_description=pathlib.Path("README.md").read_text(),
     long_description_content_type="text/markdown",
     install_requires=["vdk-core", "sqlalchemy"],
+    extras_require={"zstd": ["zstandard"]},
     package_dir={"": "src"},
     packages=setuptools.find_namespace_packages(where="src"),
     entry_points={"vdk.plugin.run": ["vdk-storage = vdk.plugin.storage.plugin_entry"]},
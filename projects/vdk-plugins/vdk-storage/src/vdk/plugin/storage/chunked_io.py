@@ -0,0 +1,170 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import io
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+COMPRESSION_ZSTD = "zstd"
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstandard is not installed. zstd compression is not available without it. "
+            "Install it with: pip install vdk-storage[zstd]"
+        )
+    return zstandard
+
+
+def validate_compression(compression: Optional[str]) -> None:
+    """Raises an error if the compression is not supported or its library is not installed."""
+    if compression is None:
+        return
+    if compression != COMPRESSION_ZSTD:
+        raise ValueError(
+            f"Unsupported compression {compression}. Supported are: {COMPRESSION_ZSTD}"
+        )
+    _zstandard()
+
+
+def decompress_chunks(
+    chunks: Iterator[bytes], compression: Optional[str]
+) -> Iterator[bytes]:
+    """Decompresses chunks compressed with the given compression (or returns them as they are if None)."""
+    if not compression:
+        yield from chunks
+        return
+    validate_compression(compression)
+    decompressor = _zstandard().ZstdDecompressor().decompressobj()
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+
+
+class ChunkReader(io.RawIOBase):
+    """
+    Reads an iterator of chunks of bytes as a file. Only one chunk is kept in memory at a time.
+    Closing the reader closes the iterator (if it is a generator) so it can release its resources.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk:
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            close_chunks = getattr(self._chunks, "close", None)
+            if close_chunks:
+                close_chunks()
+        super().close()
+
+
+class ChunkWriter(io.RawIOBase):
+    """
+    Splits the content written to it into chunks of chunk_size bytes (optionally compressed)
+    and passes each chunk to write_chunk as soon as it is full, so the content is never kept in memory.
+
+    The content is committed when the writer is closed (or its with-block exits without an error)
+    by calling commit with the SHA-256 hash and the size of the (uncompressed) content.
+    If the with-block exits with an error or the writer is aborted or garbage collected before closing,
+    abort is called instead.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        write_chunk: Callable[[int, bytes], None],
+        commit: Callable[[str, int], None],
+        abort: Callable[[], None],
+        compression: Optional[str] = None,
+    ):
+        self._write_chunk = write_chunk
+        self._commit = commit
+        self._abort = abort
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive but is {chunk_size}")
+        validate_compression(compression)
+        self._chunk_size = chunk_size
+        self._compressor = (
+            _zstandard().ZstdCompressor().compressobj() if compression else None
+        )
+        self._buffer = bytearray()
+        self._chunk_no = 0
+        self._size = 0
+        self._hash = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        view = memoryview(data).cast("B")
+        # large writes are processed in slices so that no more than a chunk is copied at a time
+        for start in range(0, len(view), self._chunk_size):
+            piece = view[start : start + self._chunk_size]
+            self._hash.update(piece)
+            if self._compressor:
+                piece = self._compressor.compress(piece)
+            self.__append(piece)
+        self._size += len(view)
+        return len(view)
+
+    def __append(self, data) -> None:
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self.__flush_chunk(self._chunk_size)
+
+    def __flush_chunk(self, size: int) -> None:
+        self._write_chunk(self._chunk_no, bytes(self._buffer[:size]))
+        del self._buffer[:size]
+        self._chunk_no += 1
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._compressor:
+                self.__append(self._compressor.flush())
+            if self._buffer:
+                self.__flush_chunk(len(self._buffer))
+            self._commit(self._hash.hexdigest(), self._size)
+        except BaseException:
+            self._abort()
+            raise
+        finally:
+            super().close()
+
+    def abort(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._abort()
+        finally:
+            super().close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __del__(self):
+        self.abort()
@@ -2,94 +2,372 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2021-2024 VMware, Inc.
 # SPDX-License-Identifier: Apache-2.0
+import io
+import itertools
 import pickle
+import uuid
 from typing import Any
+from typing import BinaryIO
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
+from sqlalchemy import and_
+from sqlalchemy import BigInteger
 from sqlalchemy import Column
 from sqlalchemy import create_engine
+from sqlalchemy import inspect
+from sqlalchemy import Integer
 from sqlalchemy import LargeBinary
 from sqlalchemy import MetaData
 from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from vdk.plugin.storage.chunked_io import ChunkReader
+from vdk.plugin.storage.chunked_io import ChunkWriter
+from vdk.plugin.storage.chunked_io import decompress_chunks
+from vdk.plugin.storage.chunked_io import validate_compression
 from vdk.plugin.storage.storage import IStorage
 
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+LEGACY_TABLE_NAME = "vdk_storage"
+
 
 class DatabaseStorage(IStorage):
-    def __init__(self, connection_string: str):
+    """
+    Stores contents in a database split in chunks of chunk_size bytes,
+    so that large contents are written and read as streams without keeping them in memory.
+
+    The chunks (vdk_storage_chunks table) are keyed by the hash of the content,
+    so the same content stored under different names is stored once.
+    The number of names referring to each content is counted (vdk_storage_contents table)
+    and its chunks are deleted in the transaction removing the last reference to it.
+    The chunks can be compressed with zstd (requires zstandard package).
+    Contents stored by earlier versions (in vdk_storage table) can still be retrieved and removed.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compression: Optional[str] = None,
+    ):
+        validate_compression(compression)
+        self.chunk_size = chunk_size
+        self.compression = compression
         self.engine = create_engine(connection_string)
         self.metadata = MetaData()
         self.table = Table(
-            "vdk_storage",
+            "vdk_storage_objects",
             self.metadata,
             Column("name", String, primary_key=True),
-            Column("content", LargeBinary),
             Column("content_type", String),
+            Column("content_key", String),
+            Column("size", BigInteger),
+            Column("compression", String),
+        )
+        self.chunks_table = Table(
+            "vdk_storage_chunks",
+            self.metadata,
+            Column("content_key", String, primary_key=True),
+            Column("chunk_no", Integer, primary_key=True),
+            Column("content", LargeBinary),
+        )
+        self.contents_table = Table(
+            "vdk_storage_contents",
+            self.metadata,
+            Column("content_key", String, primary_key=True),
+            Column("ref_count", Integer),
         )
         self.metadata.create_all(self.engine)
+        self.legacy_table = None
+        if inspect(self.engine).has_table(LEGACY_TABLE_NAME):
+            self.legacy_table = Table(
+                LEGACY_TABLE_NAME,
+                MetaData(),
+                Column("name", String, primary_key=True),
+                Column("content", LargeBinary),
+                Column("content_type", String),
+            )
 
     def store(self, name: str, content: Union[str, bytes, Any]) -> None:
-        self.__insert_content(name, content)
-
-    def __insert_content(self, name: str, content: Any):
-        serialized_content, content_type = self._serialize_content(content)
-        ins = self.table.insert().values(
-            name=name, content=serialized_content, content_type=content_type
-        )
-        try:
-            with self.engine.connect() as conn:
-                conn.execute(ins)
-                conn.commit()
-        except IntegrityError:
-            # Handle duplicate name by updating existing content
-            upd = (
-                self.table.update()
-                .where(self.table.c.name == name)
-                .values(content=serialized_content, content_type=content_type)
-            )
-            with self.engine.connect() as conn:
-                conn.execute(upd)
-                conn.commit()
+        if isinstance(content, bytes):
+            with self._open_writer(name, "bytes") as writer:
+                writer.write(content)
+        elif isinstance(content, str):
+            with self._open_writer(name, "string") as writer:
+                writer.write(content.encode())
+        else:
+            # Fallback to pickle for other types
+            with self._open_writer(name, "pickle") as writer:
+                pickle.dump(content, writer)
 
     def retrieve(self, name: str) -> Optional[Union[str, bytes, List, Any]]:
-        sel = self.table.select().where(self.table.c.name == name)
-        with self.engine.connect() as conn:
-            result = conn.execute(sel).fetchone()
-            if result:
-                return self._deserialize_content(result.content, result.content_type)
-        return None
+        opened = self._open_reader(name)
+        if opened is None:
+            return None
+        reader, content_type = opened
+        with reader:
+            if content_type == "pickle":
+                return pickle.load(reader)
+            if content_type == "string":
+                return reader.read().decode()
+            return reader.read()
+
+    def open_writer(self, name: str) -> BinaryIO:
+        return self._open_writer(name, "bytes")
+
+    def open_reader(self, name: str) -> Optional[BinaryIO]:
+        opened = self._open_reader(name)
+        return opened[0] if opened else None
 
     def list_contents(self) -> List[str]:
-        sel = select(self.table.c.name)
         with self.engine.connect() as conn:
-            result = conn.execute(sel).fetchall()
-            return [row[0] for row in result]
+            names = [row[0] for row in conn.execute(select(self.table.c.name))]
+            if self.legacy_table is not None:
+                names += [
+                    row[0] for row in conn.execute(select(self.legacy_table.c.name))
+                ]
+            return names
 
     def remove(self, name: str) -> bool:
-        del_stmt = self.table.delete().where(self.table.c.name == name)
         with self.engine.connect() as conn:
-            result = conn.execute(del_stmt)
+            content_key = self.__get_content_key(conn, name)
+            removed = 0
+            if content_key is not None:
+                removed += conn.execute(
+                    self.table.delete().where(self.table.c.name == name)
+                ).rowcount
+                self.__remove_reference(conn, content_key)
+            if self.legacy_table is not None:
+                removed += conn.execute(
+                    self.legacy_table.delete().where(self.legacy_table.c.name == name)
+                ).rowcount
             conn.commit()
-            return result.rowcount > 0
+            return removed > 0
 
-    @staticmethod
-    def _serialize_content(content: Union[str, bytes, Any]) -> tuple[bytes, str]:
-        if isinstance(content, bytes):
-            return content, "bytes"
-        elif isinstance(content, str):
-            return content.encode(), "string"
+    def _open_writer(self, name: str, content_type: str) -> ChunkWriter:
+        # all chunks are written in one transaction,
+        # so a content is replaced only when it is written completely
+        conn = self.engine.connect()
+        transaction = conn.begin()
+        temp_key = f"tmp-{uuid.uuid4().hex}"
+
+        def write_chunk(chunk_no: int, chunk: bytes) -> None:
+            conn.execute(
+                self.chunks_table.insert().values(
+                    content_key=temp_key, chunk_no=chunk_no, content=chunk
+                )
+            )
+
+        def commit(content_hash: str, size: int) -> None:
+            content_key = content_hash
+            if self.compression:
+                content_key += f".{self.compression}"
+            # the content row stays locked until the end of the transaction,
+            # so concurrent writers and removers of the same content are serialized
+            if self.__add_reference(conn, content_key) > 1:
+                # the same content is already stored, possibly under another name
+                conn.execute(
+                    self.chunks_table.delete().where(
+                        self.chunks_table.c.content_key == temp_key
+                    )
+                )
+            else:
+                conn.execute(
+                    self.chunks_table.update()
+                    .where(self.chunks_table.c.content_key == temp_key)
+                    .values(content_key=content_key)
+                )
+            previous_content_key = self.__get_content_key(conn, name)
+            self.__upsert(
+                conn,
+                self.table,
+                dict(
+                    name=name,
+                    content_type=content_type,
+                    content_key=content_key,
+                    size=size,
+                    compression=self.compression,
+                ),
+                dict(
+                    content_type=content_type,
+                    content_key=content_key,
+                    size=size,
+                    compression=self.compression,
+                ),
+            )
+            if previous_content_key is not None:
+                self.__remove_reference(conn, previous_content_key)
+            if self.legacy_table is not None:
+                conn.execute(
+                    self.legacy_table.delete().where(self.legacy_table.c.name == name)
+                )
+            transaction.commit()
+            conn.close()
+
+        def abort() -> None:
+            try:
+                transaction.rollback()
+            finally:
+                conn.close()
+
+        return ChunkWriter(
+            self.chunk_size, write_chunk, commit, abort, self.compression
+        )
+
+    def _open_reader(self, name: str) -> Optional[Tuple[BinaryIO, Optional[str]]]:
+        rows = self.__read_content_rows(name)
+        row = next(rows, None)
+        if row is None:
+            rows.close()
+            with self.engine.connect() as conn:
+                return self.__open_legacy_reader(conn, name)
+
+        def chunks() -> Iterator[bytes]:
+            expected_chunk_no = 0
+            for chunk_row in itertools.chain([row], rows):
+                if chunk_row.chunk_no is None:
+                    break
+                if chunk_row.chunk_no != expected_chunk_no:
+                    break
+                expected_chunk_no += 1
+                yield chunk_row.content
+
+        content = decompress_chunks(chunks(), row.compression)
+        return (
+            io.BufferedReader(ChunkReader(_verify_size(content, row.size, name))),
+            row.content_type,
+        )
+
+    def __read_content_rows(self, name: str) -> Iterator:
+        """
+        Reads the metadata of the content together with its chunks in one statement,
+        so they are consistent even if the content is overwritten or removed meanwhile.
+        Contents without chunks (empty) are returned as one row with NULL chunk.
+        """
+        sel = (
+            select(
+                self.table.c.content_type,
+                self.table.c.compression,
+                self.table.c.size,
+                self.chunks_table.c.chunk_no,
+                self.chunks_table.c.content,
+            )
+            .select_from(
+                self.table.outerjoin(
+                    self.chunks_table,
+                    self.chunks_table.c.content_key == self.table.c.content_key,
+                )
+            )
+            .where(self.table.c.name == name)
+            .order_by(self.chunks_table.c.chunk_no)
+        )
+        # the chunks are fetched from the database a few at a time, as they are read
+        with self.engine.connect().execution_options(yield_per=2) as conn:
+            yield from conn.execute(sel)
+
+    def __open_legacy_reader(
+        self, conn, name: str
+    ) -> Optional[Tuple[BinaryIO, Optional[str]]]:
+        if self.legacy_table is None:
+            return None
+        row = conn.execute(
+            select(self.legacy_table.c.content, self.legacy_table.c.content_type).where(
+                self.legacy_table.c.name == name
+            )
+        ).fetchone()
+        if row is None:
+            return None
+        return io.BytesIO(row.content), row.content_type
+
+    def __get_content_key(self, conn, name: str) -> Optional[str]:
+        return conn.execute(
+            select(self.table.c.content_key).where(self.table.c.name == name)
+        ).scalar()
+
+    def __add_reference(self, conn, content_key: str) -> int:
+        """
+        :return: the number of references to the content, including the added one
+        """
+        self.__upsert(
+            conn,
+            self.contents_table,
+            dict(content_key=content_key, ref_count=1),
+            dict(ref_count=self.contents_table.c.ref_count + 1),
+        )
+        return self.__get_ref_count(conn, content_key)
+
+    def __remove_reference(self, conn, content_key: str) -> None:
+        conn.execute(
+            self.contents_table.update()
+            .where(self.contents_table.c.content_key == content_key)
+            .values(ref_count=self.contents_table.c.ref_count - 1)
+        )
+        if self.__get_ref_count(conn, content_key) <= 0:
+            conn.execute(
+                self.chunks_table.delete().where(
+                    self.chunks_table.c.content_key == content_key
+                )
+            )
+            conn.execute(
+                self.contents_table.delete().where(
+                    self.contents_table.c.content_key == content_key
+                )
+            )
+
+    def __get_ref_count(self, conn, content_key: str) -> int:
+        return (
+            conn.execute(
+                select(self.contents_table.c.ref_count).where(
+                    self.contents_table.c.content_key == content_key
+                )
+            ).scalar()
+            or 0
+        )
+
+    def __upsert(self, conn, table: Table, values: dict, update_values: dict) -> None:
+        """
+        Inserts the row with values or updates the existing row with the same primary key with update_values
+        in one statement (if the dialect supports it).
+        """
+        dialect_name = self.engine.dialect.name
+        if dialect_name in ("postgresql", "sqlite"):
+            dialect = postgresql if dialect_name == "postgresql" else sqlite
+            ins = dialect.insert(table).values(**values)
+            ins = ins.on_conflict_do_update(
+                index_elements=list(table.primary_key.columns),
+                set_=update_values,
+            )
+            conn.execute(ins)
+        elif dialect_name in ("mysql", "mariadb"):
+            ins = mysql.insert(table).values(**values)
+            ins = ins.on_duplicate_key_update(**update_values)
+            conn.execute(ins)
         else:
-            # Fallback to pickle for other types
-            return pickle.dumps(content), "pickle"
-
-    @staticmethod
-    def _deserialize_content(content: bytes, content_type: Optional[str]) -> Any:
-        if content_type == "pickle":
-            return pickle.loads(content)
-        if content_type == "string":
-            return content.decode()
-        return content
+            # no upsert statement in the dialect, but it is still in the same transaction
+            primary_key_condition = and_(
+                *(column == values[column.name] for column in table.primary_key.columns)
+            )
+            updated = conn.execute(
+                table.update().where(primary_key_condition).values(**update_values)
+            )
+            if updated.rowcount == 0:
+                conn.execute(table.insert().values(**values))
+
+
+def _verify_size(chunks: Iterator[bytes], size: int, name: str) -> Iterator[bytes]:
+    read_size = 0
+    for chunk in chunks:
+        read_size += len(chunk)
+        yield chunk
+    if read_size != size:
+        raise OSError(
+            f"Content {name} is incomplete: read {read_size} bytes but {size} bytes were stored."
+        )
@@ -2,9 +2,12 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2021-2024 VMware, Inc.
 # SPDX-License-Identifier: Apache-2.0
+import io
 import json
 import os
+import tempfile
 from typing import Any
+from typing import BinaryIO
 from typing import List
 from typing import Optional
 from typing import Union
@@ -12,6 +15,47 @@ from typing import Union
 from vdk.plugin.storage.storage import IStorage
 
 
+_TEMP_FILE_SUFFIX = ".vdk-storage-tmp"
+
+
+class _AtomicFileWriter(io.FileIO):
+    """
+    Writes to a temporary file next to the target file and replaces the target with it on close,
+    so readers never see partially written content.
+    If the with-block exits with an error, the temporary file is removed instead.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        fd, self._temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path) or None,
+            prefix=f".{os.path.basename(file_path)}.",
+            suffix=_TEMP_FILE_SUFFIX,
+        )
+        super().__init__(fd, "wb")
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        os.replace(self._temp_path, self._file_path)
+
+    def abort(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        os.remove(self._temp_path)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __del__(self):
+        self.abort()
+
+
 class FileStorage(IStorage):
     def __init__(self, base_path: str):
         self.base_path = base_path
@@ -27,14 +71,19 @@ class FileStorage(IStorage):
         content: Union[str, bytes, Any],
         content_type: Optional[str] = None,
     ) -> None:
-        file_path = self._get_file_path(name)
-        with open(file_path, "w") as file:
-            if isinstance(content, (str, bytes)):
-                # Directly save strings and bytes
-                file.write(content if isinstance(content, str) else content.decode())
+        with self.open_writer(name) as writer:
+            if isinstance(content, bytes):
+                writer.write(content)
             else:
-                # Assume JSON serializable for other types
-                json.dump(content, file)
+                text = io.TextIOWrapper(writer)
+                if isinstance(content, str):
+                    text.write(content)
+                else:
+                    # Assume JSON serializable for other types
+                    json.dump(content, text)
+                text.flush()
+                # keep the writer open, so that it is committed only if everything was written
+                text.detach()
 
     def retrieve(self, name: str) -> Optional[Union[str, bytes, Any]]:
         file_path = self._get_file_path(name)
@@ -48,8 +97,21 @@ class FileStorage(IStorage):
                 file.seek(0)
                 return file.read()
 
+    def open_writer(self, name: str) -> BinaryIO:
+        return _AtomicFileWriter(self._get_file_path(name))
+
+    def open_reader(self, name: str) -> Optional[BinaryIO]:
+        file_path = self._get_file_path(name)
+        if not os.path.exists(file_path):
+            return None
+        return open(file_path, "rb")
+
     def list_contents(self) -> List[str]:
-        return os.listdir(self.base_path)
+        return [
+            name
+            for name in os.listdir(self.base_path)
+            if not name.endswith(_TEMP_FILE_SUFFIX)
+        ]
 
     def remove(self, name: str) -> bool:
         file_path = self._get_file_path(name)
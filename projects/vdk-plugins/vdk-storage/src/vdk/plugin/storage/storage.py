@@ -3,6 +3,7 @@
 # Copyright 2021-2024 VMware, Inc.
 # SPDX-License-Identifier: Apache-2.0
 from typing import Any
+from typing import BinaryIO
 from typing import List
 from typing import Optional
 from typing import Union
@@ -30,6 +31,29 @@ class IStorage:
         """
         pass
 
+    def open_writer(self, name: str) -> BinaryIO:
+        """
+        Opens a binary file-like object to write content under the specified name piece by piece,
+        so that large contents do not need to be kept in memory.
+        The content replaces the one stored under the name when the writer is closed
+        (or when its with-block exits without an error).
+
+        :param name: The unique name to store the content under.
+        :return: A writable binary file-like object.
+        """
+        pass
+
+    def open_reader(self, name: str) -> Optional[BinaryIO]:
+        """
+        Opens the content stored under the specified name as a binary file-like object,
+        so that large contents can be read piece by piece.
+
+        :param name: The name of the content to read.
+        :return: A readable binary file-like object, which should be closed after use.
+                 Returns None if the content does not exist.
+        """
+        pass
+
     def list_contents(self) -> List[str]:
         """
         Lists the names of all stored contents.
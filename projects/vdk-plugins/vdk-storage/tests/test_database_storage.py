@@ -0,0 +1,159 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import text
+from vdk.plugin.storage.database_storage import DatabaseStorage
+
+
+@pytest.fixture
+def connection_string(tmp_path):
+    return f"sqlite:///{tmp_path}/storage.db"
+
+
+def _count_chunks(storage: DatabaseStorage) -> int:
+    with storage.engine.connect() as conn:
+        return conn.execute(
+            select(func.count()).select_from(storage.chunks_table)
+        ).scalar()
+
+
+def test_store_and_retrieve(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=8)
+
+    storage.store("bytes", b"0123456789abcdefghij")
+    storage.store("string", "some string content")
+    storage.store("object", {"key": [1, 2, 3]})
+
+    assert storage.retrieve("bytes") == b"0123456789abcdefghij"
+    assert storage.retrieve("string") == "some string content"
+    assert storage.retrieve("object") == {"key": [1, 2, 3]}
+    assert storage.retrieve("missing") is None
+    assert sorted(storage.list_contents()) == ["bytes", "object", "string"]
+
+    storage.store("bytes", b"replaced")
+    assert storage.retrieve("bytes") == b"replaced"
+
+    assert storage.remove("bytes")
+    assert not storage.remove("bytes")
+    assert storage.retrieve("bytes") is None
+
+
+def test_stream_in_chunks(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=10)
+    parts = [f"{i:05}".encode() for i in range(10)]
+
+    with storage.open_writer("stream") as writer:
+        for part in parts:
+            writer.write(part)
+
+    assert _count_chunks(storage) == 5
+    content = b"".join(parts)
+    with storage.open_reader("stream") as reader:
+        assert reader.read(7) == content[:7]
+        assert reader.read() == content[7:]
+    assert storage.open_reader("missing") is None
+
+
+def test_failed_write_is_not_stored(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=4)
+    storage.store("name", b"original")
+
+    with pytest.raises(RuntimeError):
+        with storage.open_writer("name") as writer:
+            writer.write(b"partially written content")
+            raise RuntimeError("failed")
+
+    assert storage.retrieve("name") == b"original"
+    assert _count_chunks(storage) == 2
+
+
+def test_same_content_is_stored_once(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=4)
+
+    storage.store("first", b"duplicated content")
+    storage.store("second", b"duplicated content")
+    assert _count_chunks(storage) == 5
+
+    storage.remove("first")
+    assert storage.retrieve("second") == b"duplicated content"
+    storage.store("second", b"other")
+    assert _count_chunks(storage) == 2
+
+
+def test_references_to_same_content_are_counted(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=4)
+
+    def ref_counts():
+        with storage.engine.connect() as conn:
+            return dict(
+                conn.execute(
+                    select(
+                        storage.contents_table.c.content_key,
+                        storage.contents_table.c.ref_count,
+                    )
+                ).all()
+            )
+
+    storage.store("first", b"duplicated content")
+    storage.store("second", b"duplicated content")
+    storage.store("second", b"duplicated content")
+    assert list(ref_counts().values()) == [2]
+
+    storage.remove("first")
+    assert list(ref_counts().values()) == [1]
+    storage.remove("second")
+    assert ref_counts() == {}
+    assert _count_chunks(storage) == 0
+
+
+def test_retrieve_incomplete_content_fails(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=4)
+    storage.store("name", b"0123456789")
+    with storage.engine.connect() as conn:
+        conn.execute(
+            storage.chunks_table.delete().where(storage.chunks_table.c.chunk_no == 1)
+        )
+        conn.commit()
+
+    with pytest.raises(OSError):
+        storage.retrieve("name")
+
+
+def test_zstd_compression(connection_string):
+    storage = DatabaseStorage(connection_string, chunk_size=1024, compression="zstd")
+    content = b"compressible content " * 10000
+
+    storage.store("compressed", content)
+
+    assert _count_chunks(storage) == 1
+    assert storage.retrieve("compressed") == content
+    # the compression is stored with the content, so it is read with any configuration
+    assert DatabaseStorage(connection_string).retrieve("compressed") == content
+
+    with pytest.raises(ValueError):
+        DatabaseStorage(connection_string, compression="unknown")
+
+
+def test_retrieve_legacy_content(connection_string):
+    legacy_storage = DatabaseStorage(connection_string)
+    with legacy_storage.engine.connect() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE vdk_storage (name VARCHAR PRIMARY KEY, content BLOB, content_type VARCHAR)"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO vdk_storage VALUES ('legacy', :content, 'string')"),
+            dict(content=b"legacy content"),
+        )
+        conn.commit()
+
+    storage = DatabaseStorage(connection_string)
+    assert storage.list_contents() == ["legacy"]
+    assert storage.retrieve("legacy") == "legacy content"
+
+    storage.store("legacy", "new content")
+    assert storage.list_contents() == ["legacy"]
+    assert storage.retrieve("legacy") == "new content"
@@ -0,0 +1,41 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+from vdk.plugin.storage.file_storage import FileStorage
+
+
+def test_store_and_retrieve(tmp_path):
+    storage = FileStorage(str(tmp_path))
+
+    storage.store("string", "some string content")
+    storage.store("object", {"key": [1, 2, 3]})
+
+    assert storage.retrieve("string") == "some string content"
+    assert storage.retrieve("object") == {"key": [1, 2, 3]}
+    assert storage.retrieve("missing") is None
+    assert sorted(storage.list_contents()) == ["object", "string"]
+    assert storage.remove("string")
+    assert not storage.remove("string")
+
+
+def test_stream(tmp_path):
+    storage = FileStorage(str(tmp_path))
+
+    with storage.open_writer("stream") as writer:
+        for i in range(3):
+            writer.write(bytes([i]) * 3)
+
+    with storage.open_reader("stream") as reader:
+        assert reader.read() == b"\x00\x00\x00\x01\x01\x01\x02\x02\x02"
+    assert storage.open_reader("missing") is None
+
+
+def test_failed_write_is_not_stored(tmp_path):
+    storage = FileStorage(str(tmp_path))
+    storage.store("name", "original")
+
+    with pytest.raises(TypeError):
+        storage.store("name", {"not serializable": object()})
+
+    assert storage.retrieve("name") == "original"
+    assert storage.list_contents() == ["name"]
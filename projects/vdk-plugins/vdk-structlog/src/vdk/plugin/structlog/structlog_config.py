@@ -51,6 +51,9 @@ class StructlogConfig:
                 vdk_config.LOG_LEVEL_MODULE.lower(): configuration.get_value(
                     vdk_config.LOG_LEVEL_MODULE.lower()
                 ),
+                vdk_config.LOG_QUEUE_ENABLED.lower(): configuration.get_value(
+                    vdk_config.LOG_QUEUE_ENABLED.lower()
+                ),
                 STRUCTLOG_FORMAT_INIT_LOGS: False,
             },
             "CLOUD": {
@@ -73,6 +76,9 @@ class StructlogConfig:
                 vdk_config.LOG_LEVEL_MODULE.lower(): configuration.get_value(
                     vdk_config.LOG_LEVEL_MODULE.lower()
                 ),
+                vdk_config.LOG_QUEUE_ENABLED.lower(): configuration.get_value(
+                    vdk_config.LOG_QUEUE_ENABLED.lower()
+                ),
                 STRUCTLOG_FORMAT_INIT_LOGS: True,
             },
         }
@@ -116,6 +122,9 @@ class StructlogConfig:
     def get_log_level_module(self) -> str:
         return self._config[vdk_config.LOG_LEVEL_MODULE.lower()]
 
+    def get_log_queue_enabled(self) -> bool:
+        return bool(self._config[vdk_config.LOG_QUEUE_ENABLED.lower()])
+
     def get_format_init_logs(self) -> str:
         return self._config[STRUCTLOG_FORMAT_INIT_LOGS]
 
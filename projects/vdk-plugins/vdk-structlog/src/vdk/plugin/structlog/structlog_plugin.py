@@ -9,6 +9,7 @@ from vdk.api.plugin.hook_markers import hookimpl
 from vdk.api.plugin.plugin_registry import HookCallResult
 from vdk.api.plugin.plugin_registry import IPluginRegistry
 from vdk.internal.builtin_plugins.config import vdk_config
+from vdk.internal.builtin_plugins.config.log_config import BackgroundLogHandler
 from vdk.internal.builtin_plugins.run.execution_results import ExecutionResult
 from vdk.internal.builtin_plugins.run.execution_results import StepResult
 from vdk.internal.builtin_plugins.run.job_context import JobContext
@@ -94,9 +95,12 @@ class StructlogPlugin:
 
     def _clear_root_logger_handlers(self):
         root_logger = logging.getLogger()
-        handlers_to_remove = root_logger.handlers
+        handlers_to_remove = list(root_logger.handlers)
         for handler in handlers_to_remove:
             root_logger.removeHandler(handler)
+            if isinstance(handler, BackgroundLogHandler):
+                # writes the queued logs
+                handler.close()
 
     def _configure_root_logger(self, formatter, *filters):
         self._clear_root_logger_handlers()
@@ -109,6 +113,22 @@ class StructlogPlugin:
         if syslog_handler:
             handlers.append(syslog_handler)
 
+        if self._config.get_log_queue_enabled():
+            # The metadata filter and the formatter run in the background thread.
+            # The filters adding attributes run in the logging thread since the attributes (e.g. step name)
+            # may change before the record is formatted.
+            for handler in handlers:
+                for f in filters:
+                    if f.name == "metadata_filter":
+                        handler.addFilter(f)
+                handler.setFormatter(formatter)
+            background_handler = BackgroundLogHandler(handlers)
+            for f in filters:
+                if f.name != "metadata_filter":
+                    background_handler.addFilter(f)
+            root_logger.addHandler(background_handler)
+            return
+
         for handler in handlers:
             for f in filters:
                 handler.addFilter(f)
@@ -130,6 +130,26 @@ def test_structlog(log_format):
         )
 
 
+@pytest.mark.parametrize("log_format", ["console", "ltsv", "json"])
+def test_structlog_log_queue_enabled(log_format):
+    stock_field_reps = STOCK_FIELD_REPRESENTATIONS[log_format]
+    with mock.patch.dict(
+        os.environ,
+        {
+            "VDK_STRUCTLOG_METADATA": f"vdk_job_name,vdk_step_name,{BOUND_TEST_KEY}",
+            "VDK_STRUCTLOG_FORMAT": log_format,
+            "VDK_LOG_QUEUE_ENABLED": "True",
+        },
+    ):
+        logs = _run_job_and_get_logs()
+
+        test_log = _get_log_containing_s(logs, "Log statement with bound context")
+        assert test_log is not None
+        assert re.search(stock_field_reps["vdk_job_name"], test_log) is not None
+        assert re.search(stock_field_reps["vdk_step_name"], test_log) is not None
+        assert BOUND_TEST_VALUE in test_log
+
+
 def test_structlog_syslog():
     with mock.patch.dict(
         os.environ,
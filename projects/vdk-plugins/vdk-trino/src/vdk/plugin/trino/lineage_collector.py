@@ -0,0 +1,311 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import dataclasses
+import logging
+import random
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer as timer
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from vdk.api.lineage.model.logger.lineage_logger import ILineageLogger
+from vdk.api.lineage.model.sql.model import LineageData
+from vdk.internal.util.decorators import closing_noexcept_on_close
+
+log = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_CREATE_TABLE = re.compile(r"^\s*create\s+(?:or\s+replace\s+)?table\b", re.IGNORECASE)
+_DDL = re.compile(r"^\s*(?:alter|create|drop|truncate)\b", re.IGNORECASE)
+
+# the number of query fingerprints whose lineage is cached
+_CACHE_MAX_SIZE = 1024
+
+# all collectors which may have lineage pending to be sent
+_collectors = weakref.WeakSet()
+
+
+def get_query_fingerprint(query: str) -> str:
+    """
+    Normalizes the query so that the same queries with different literals (or formatting) have the same fingerprint.
+    Their lineage is the same since it depends only on the tables used in the query.
+    """
+    query = _STRING_LITERAL.sub("?", query)
+    query = _NUMBER_LITERAL.sub("?", query)
+    return _WHITESPACE.sub(" ", query).strip().lower()
+
+
+def flush_all(timeout_seconds: Optional[float] = None) -> None:
+    """
+    Waits until the lineage of all executed queries is collected and sent.
+    """
+    for collector in list(_collectors):
+        collector.flush(timeout_seconds)
+
+
+class TrinoLineageCollector:
+    """
+    Collects the lineage of Trino queries and sends it to the lineage logger.
+
+    Queries are explained (using EXPLAIN (TYPE IO, FORMAT JSON)) in a background worker with its own connection,
+    concurrently with the query itself, so it does not wait for it.
+    The lineage is sent only after the query has succeeded.
+    The lineage is cached by query fingerprint, so the same queries (with different literals) are explained once.
+    DDL statements wait until the queries executed before them are explained, since they may drop or rename
+    the tables used by those queries (e.g. the staging tables of the templates).
+    How many queries are explained is capped by sampling rate and time budget.
+    """
+
+    def __init__(
+        self,
+        lineage_logger: ILineageLogger,
+        connect: Callable[[], Any],
+        catalog: str,
+        schema: str,
+        asynchronous: bool = True,
+        sampling_rate: float = 1.0,
+        budget_milliseconds: int = 0,
+    ):
+        """
+        :param lineage_logger: the logger to send the lineage to
+        :param connect: function which opens a new (PEP249) connection to explain the queries with
+        :param catalog: the default catalog of the queries
+        :param schema: the default schema of the queries
+        :param asynchronous: if False queries are explained before they are executed
+        :param sampling_rate: the fraction of (not yet explained) queries which are explained
+        :param budget_milliseconds: the maximum time spent on explaining queries. 0 means no limit.
+        """
+        self._lineage_logger = lineage_logger
+        self._connect = connect
+        self._catalog = catalog
+        self._schema = schema
+        self._asynchronous = asynchronous
+        self._sampling_rate = sampling_rate
+        self._budget_milliseconds = budget_milliseconds
+        self._spent_milliseconds = 0.0
+        self._budget_exceeded_logged = False
+        # query fingerprint -> lineage of the query (without the query itself) or None if there is no lineage.
+        # The least recently used fingerprints are evicted.
+        self._cache: "OrderedDict[str, Optional[LineageData]]" = OrderedDict()
+        # guards the cache and the spent time which are updated by the worker
+        self._lock = threading.Lock()
+        # the last query submitted to the worker
+        self._last_future: Optional[Future] = None
+        self._connection = None
+        # single worker so that queries are explained (and lineage is sent) in the order they are executed.
+        # It is created when the first query is explained and shut down when the collector is closed.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # the number of succeeded queries whose lineage is not sent yet
+        self._pending_count = 0
+        self._pending_condition = threading.Condition()
+        _collectors.add(self)
+
+    def before_query(self, query: str) -> Optional[Future]:
+        """
+        Starts collecting the lineage of a query which is about to be executed.
+
+        :return: future with the lineage data or None if lineage is not collected for the query
+        """
+        if _DDL.match(query):
+            # DDL (e.g. of the templates) may drop or rename the tables used by the queries being explained,
+            # so they are explained before it is executed
+            self._wait_for_explained_queries()
+        fingerprint = get_query_fingerprint(query)
+        with self._lock:
+            cached = fingerprint in self._cache
+            if cached:
+                self._cache.move_to_end(fingerprint)
+                lineage_data = self._cache[fingerprint]
+        if cached:
+            future = Future()
+            future.set_result(self._with_query(lineage_data, query))
+            return future
+        if self._is_budget_exceeded() or random.random() >= self._sampling_rate:
+            return None
+
+        try:
+            future = self._get_executor().submit(self._collect, query, fingerprint)
+        except RuntimeError as e:
+            # e.g. the interpreter is shutting down
+            log.debug(f"Will not collect lineage: {e}")
+            return None
+        self._last_future = future
+        if not self._asynchronous or (
+            _CREATE_TABLE.match(query) and "select" in query.lower()
+        ):
+            # explain create table as select fails once the table is created, so it is explained before the query
+            future.result()
+        return future
+
+    def after_query_success(self, future: Optional[Future]) -> None:
+        """
+        Sends the lineage of a query once it is collected. Call it after the query has succeeded.
+        """
+        if future is None:
+            return
+        with self._pending_condition:
+            self._pending_count += 1
+        future.add_done_callback(self._send)
+
+    def flush(self, timeout_seconds: Optional[float] = None) -> None:
+        """
+        Waits until the lineage of all executed queries is collected and sent.
+        """
+        with self._pending_condition:
+            self._pending_condition.wait_for(
+                lambda: self._pending_count == 0, timeout_seconds
+            )
+
+    def close(self) -> None:
+        """
+        Sends the pending lineage, stops the background worker and closes the connection used for explaining queries.
+        The collector can still be used after that - a new worker and connection are started when needed.
+        """
+        if self._executor is None and self._connection is None:
+            # no query has been explained since the collector was last closed
+            return
+        self.flush()
+        self.shutdown(wait=True)
+        self._close_connection()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the background worker explaining the queries.
+
+        :param wait: if True waits until the queries which are already being explained are done
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="trino-lineage"
+                )
+            return self._executor
+
+    def _send(self, future: Future) -> None:
+        try:
+            lineage_data = future.result()
+            if lineage_data:
+                self._lineage_logger.send(lineage_data)
+        except Exception as e:
+            log.info(f"Failed to send lineage data: {e}. Will continue.")
+        finally:
+            with self._pending_condition:
+                self._pending_count -= 1
+                self._pending_condition.notify_all()
+
+    def _wait_for_explained_queries(self) -> None:
+        # the worker explains the queries in order, so they are all explained once the last one is
+        future = self._last_future
+        if future is not None:
+            future.result()
+
+    def _is_budget_exceeded(self) -> bool:
+        with self._lock:
+            spent_milliseconds = self._spent_milliseconds
+        exceeded = 0 < self._budget_milliseconds <= spent_milliseconds
+        if exceeded and not self._budget_exceeded_logged:
+            log.info(
+                f"Time spent on collecting lineage exceeded the budget of {self._budget_milliseconds} ms. "
+                f"Lineage will be collected only for queries which have already been explained."
+            )
+            self._budget_exceeded_logged = True
+        return exceeded
+
+    def _collect(self, query: str, fingerprint: str) -> Optional[LineageData]:
+        start = timer()
+        try:
+            lineage_data = self._get_lineage_data(query)
+        except Exception as e:
+            log.info(
+                f"Failed to get query io details for telemetry: {e}. Will continue with query execution"
+            )
+            # the failure may be transient, so the query is not cached
+            self._close_connection()
+            return None
+        finally:
+            with self._lock:
+                self._spent_milliseconds += (timer() - start) * 1000
+        with self._lock:
+            self._cache[fingerprint] = lineage_data
+            if len(self._cache) > _CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+        return lineage_data
+
+    @staticmethod
+    def _with_query(
+        lineage_data: Optional[LineageData], query: str
+    ) -> Optional[LineageData]:
+        if lineage_data is None:
+            return None
+        return dataclasses.replace(lineage_data, query=query)
+
+    def _close_connection(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception as e:
+                log.debug(f"Failed to close lineage connection: {e}")
+            self._connection = None
+
+    def _explain(self, query: str):
+        if self._connection is None:
+            self._connection = self._connect()
+        with closing_noexcept_on_close(self._connection.cursor()) as cur:
+            cur.execute(f"EXPLAIN (TYPE IO, FORMAT JSON) {query}")
+            return cur.fetchall()
+
+    def _get_lineage_data(self, query: str) -> Optional[LineageData]:
+        from vdk.plugin.trino import lineage_utils
+        import sqlparse
+
+        statement = sqlparse.parse(query)[0]
+
+        if statement.get_type() == "ALTER":
+            rename_table_lineage = lineage_utils.get_rename_table_lineage_from_query(
+                query, self._schema, self._catalog
+            )
+            if rename_table_lineage:
+                log.debug("Collecting lineage for rename table operation ...")
+                return rename_table_lineage
+            else:
+                log.debug(
+                    "ALTER operation not a RENAME TABLE operation. No lineage will be collected."
+                )
+
+        elif (
+            statement.get_type() == "SELECT"
+            or statement.get_type() == "INSERT"
+            or (
+                statement.get_type() == "CREATE" and "select" in statement.value.lower()
+            )
+        ):
+            if lineage_utils.is_heartbeat_query(query):
+                return None
+            log.debug("Collecting lineage for SELECT/INSERT query ...")
+            result = self._explain(query)
+            if result:
+                return lineage_utils.get_lineage_data_from_io_explain(
+                    query, result[0][0]
+                )
+        else:
+            log.debug(
+                "Unsupported query type for lineage collection. Will not collect lineage."
+            )
+            return None
+
+        return None
@@ -7,6 +7,7 @@ import re
 from vdk.api.job_input import IJobInput
 from vdk.plugin.trino.templates.data_quality_exception import DataQualityException
 from vdk.plugin.trino.trino_utils import CommonUtilities
+from vdk.plugin.trino.trino_utils import TrinoTemplateQueries
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +36,7 @@ def run(job_input: IJobInput):
         - copy the data from staging to target table
     3. Copying the data:
         - truncate target table and insert the data from staging table
+    With MERGE strategy the source view is checked directly and merged into the target table instead.
     """
 
     job_arguments = job_input.get_arguments()
@@ -46,6 +48,10 @@ def run(job_input: IJobInput):
     target_table = job_arguments.get("target_table")
     id_column = job_arguments.get("id_column")
 
+    if TrinoTemplateQueries(job_input).get_move_data_to_table_strategy() == "MERGE":
+        merge_source_view_into_target(job_input)
+        return
+
     staging_schema = job_arguments.get("staging_schema", target_schema)
     staging_table = CommonUtilities.get_staging_table_name(target_schema, target_table)
 
@@ -151,3 +157,33 @@ def remove_external_location(sql_statement):
     cleaned_sql = re.sub(pattern, "", sql_statement, flags=re.IGNORECASE)
 
     return cleaned_sql
+
+
+def merge_source_view_into_target(job_input: IJobInput):
+    """
+    Checks the source view directly (if check is provided) and merges it into the target table,
+    so no staging table is needed and only the changed rows of the target are rewritten.
+    """
+    job_arguments = job_input.get_arguments()
+
+    check = job_arguments.get("check")
+    source_schema = job_arguments.get("source_schema")
+    source_view = job_arguments.get("source_view")
+    target_schema = job_arguments.get("target_schema")
+    target_table = job_arguments.get("target_table")
+
+    source_view_full_name = f"{source_schema}.{source_view}"
+    if check and not check(source_view_full_name):
+        raise DataQualityException(
+            checked_object=source_view_full_name,
+            source_view=source_view_full_name,
+            target_table=f"{target_schema}.{target_table}",
+        )
+
+    TrinoTemplateQueries(job_input).merge_into_table(
+        from_db=source_schema,
+        from_table_name=source_view,
+        to_db=target_schema,
+        to_table_name=target_table,
+        key_column=job_arguments.get("id_column"),
+    )
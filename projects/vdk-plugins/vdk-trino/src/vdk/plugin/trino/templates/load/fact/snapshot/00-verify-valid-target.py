@@ -17,6 +17,7 @@ def run(job_input: IJobInput):
     target table is no longer present. Fortunately it has a backup.
     So when the job is retried, this first step should recover the target (if the reason for the previous fail
     is no longer present).
+    The same applies to the backup of the target partitions when only the affected partitions are overwritten.
     """
 
     args = job_input.get_arguments()
@@ -25,3 +26,7 @@ def run(job_input: IJobInput):
     trino_queries = TrinoTemplateQueries(job_input)
 
     trino_queries.ensure_target_exists_step(db=target_schema, target_name=target_table)
+    if args.get("partition_overwrite"):
+        trino_queries.ensure_partitions_restored_step(
+            db=target_schema, target_name=target_table
+        )
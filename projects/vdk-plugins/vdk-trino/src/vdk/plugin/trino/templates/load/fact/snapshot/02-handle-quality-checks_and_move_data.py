@@ -6,6 +6,7 @@ import os
 from vdk.api.job_input import IJobInput
 from vdk.plugin.trino.templates.data_quality_exception import DataQualityException
 from vdk.plugin.trino.trino_utils import CommonUtilities
+from vdk.plugin.trino.trino_utils import TrinoTemplateQueries
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +38,18 @@ def run(job_input: IJobInput):
 
     job_arguments = job_input.get_arguments()
 
+    if job_arguments.get("partition_overwrite"):
+        partition_columns = TrinoTemplateQueries(job_input).get_partition_columns(
+            job_arguments.get("target_schema"), job_arguments.get("target_table")
+        )
+        if partition_columns:
+            overwrite_affected_partitions(job_input, partition_columns)
+            return
+        log.info(
+            "Target table is not partitioned or its partitions are not supported. "
+            "The whole target table will be overwritten instead of the affected partitions only."
+        )
+
     check = job_arguments.get("check")
     source_schema = job_arguments.get("source_schema")
     source_view = job_arguments.get("source_view")
@@ -121,3 +134,89 @@ def run(job_input: IJobInput):
                 f"Target table {target_schema}.{target_table} remains unchanged "
                 f"because source table {target_schema}.{source_view} was empty."
             )
+
+
+def overwrite_affected_partitions(job_input: IJobInput, partition_columns):
+    """
+    Loads the snapshot by overwriting only the partitions of the target table it changes:
+    the partitions of the source view and the partitions with rows later than the earliest row of the source view.
+    The new content of those partitions is staged (and checked if a check is provided) before it is moved to target.
+    """
+    job_arguments = job_input.get_arguments()
+
+    check = job_arguments.get("check")
+    source_schema = job_arguments.get("source_schema")
+    source_view = job_arguments.get("source_view")
+    target_schema = job_arguments.get("target_schema")
+    target_table = job_arguments.get("target_table")
+    last_arrival_ts = job_arguments.get("last_arrival_ts")
+    staging_schema = job_arguments.get("staging_schema", target_schema)
+    staging_table = CommonUtilities.get_staging_table_name(target_schema, target_table)
+
+    staging_table_full_name = f"{staging_schema}.{staging_table}"
+    target_table_full_name = f"{target_schema}.{target_table}"
+
+    affected_partitions_query = CommonUtilities.get_file_content(
+        SQL_FILES_FOLDER, "02-select-affected-partitions.sql"
+    ).format(
+        partition_columns=", ".join(f'"{p}"' for p in partition_columns),
+        source_schema=source_schema,
+        source_view=source_view,
+        target_schema=target_schema,
+        target_table=target_table,
+        last_arrival_ts=last_arrival_ts,
+    )
+    affected_partitions = job_input.execute_query(affected_partitions_query)
+    log.info(
+        f"Snapshot will overwrite {len(affected_partitions)} partitions of {target_table_full_name}."
+    )
+
+    job_input.execute_query(
+        CommonUtilities.get_file_content(SQL_FILES_FOLDER, "02-drop-table.sql").format(
+            target_schema=staging_schema, target_table=staging_table
+        )
+    )
+    job_input.execute_query(
+        CommonUtilities.get_file_content(
+            SQL_FILES_FOLDER, "02-create-table.sql"
+        ).format(
+            table_schema=staging_schema,
+            table_name=staging_table,
+            target_schema=target_schema,
+            target_table=target_table,
+        )
+    )
+    job_input.execute_query(
+        CommonUtilities.get_file_content(
+            SQL_FILES_FOLDER, "02-insert-affected-partitions-snapshot-data.sql"
+        ).format(
+            staging_schema=staging_schema,
+            staging_table=staging_table,
+            target_schema=target_schema,
+            target_table=target_table,
+            affected_partitions_query=affected_partitions_query,
+            affected_partitions_join_condition=" AND ".join(
+                f'target."{p}" IS NOT DISTINCT FROM affected."{p}"'
+                for p in partition_columns
+            ),
+            source_schema=source_schema,
+            source_view=source_view,
+            last_arrival_ts=last_arrival_ts,
+        )
+    )
+
+    if check and not check(staging_table_full_name):
+        raise DataQualityException(
+            checked_object=staging_table_full_name,
+            source_view=f"{source_schema}.{source_view}",
+            target_table=target_table_full_name,
+        )
+
+    TrinoTemplateQueries(job_input).perform_safe_overwrite_partitions_step(
+        from_db=staging_schema,
+        from_table_name=staging_table,
+        to_db=target_schema,
+        to_table_name=target_table,
+        partition_columns=partition_columns,
+        partitions=affected_partitions,
+    )
@@ -0,0 +1,14 @@
+INSERT INTO "{staging_schema}"."{staging_table}"
+(
+  SELECT target.*
+  FROM   "{target_schema}"."{target_table}" target
+  JOIN   (
+    {affected_partitions_query}
+  ) affected ON {affected_partitions_join_condition}
+  WHERE  target."{last_arrival_ts}" < (SELECT MIN("{last_arrival_ts}") FROM "{source_schema}"."{source_view}")
+)
+UNION ALL
+(
+  SELECT *
+  FROM   "{source_schema}"."{source_view}"
+)
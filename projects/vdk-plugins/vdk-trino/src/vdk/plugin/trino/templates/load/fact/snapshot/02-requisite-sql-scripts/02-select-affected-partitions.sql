@@ -0,0 +1,8 @@
+-- The partitions which contain rows with {last_arrival_ts} later than the earliest one in the source view
+-- and the partitions of the source view. Only those partitions change after the snapshot is loaded.
+SELECT DISTINCT {partition_columns}
+FROM   "{source_schema}"."{source_view}"
+UNION
+SELECT DISTINCT {partition_columns}
+FROM   "{target_schema}"."{target_table}"
+WHERE  "{last_arrival_ts}" >= (SELECT MIN("{last_arrival_ts}") FROM "{source_schema}"."{source_view}")
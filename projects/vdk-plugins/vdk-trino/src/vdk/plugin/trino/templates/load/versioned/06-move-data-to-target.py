@@ -0,0 +1,45 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import os
+
+from vdk.api.job_input import IJobInput
+from vdk.plugin.trino.trino_utils import CommonUtilities
+from vdk.plugin.trino.trino_utils import TrinoTemplateQueries
+
+SQL_FILES_FOLDER = (
+    os.path.dirname(os.path.abspath(__file__)) + "/06-requisite-sql-scripts"
+)
+
+
+def run(job_input: IJobInput):
+    """
+    Moves the new state of the dimension from the vdk_tmp target table to the target table.
+    With MERGE strategy the new state is merged into the target table by surrogate key,
+    so only the new and changed versions are written and the target table is not recreated.
+    Otherwise the target table is dropped and created again from the vdk_tmp target table.
+    """
+    args = job_input.get_arguments()
+    target_schema = args.get("target_schema")
+    target_table = args.get("target_table")
+    trino_queries = TrinoTemplateQueries(job_input)
+
+    if trino_queries.get_move_data_to_table_strategy() == "MERGE":
+        trino_queries.merge_into_table(
+            from_db=target_schema,
+            from_table_name=f"vdk_tmp_{target_table}",
+            to_db=target_schema,
+            to_table_name=target_table,
+            key_column=args.get("sk_column"),
+            delete_missing=True,
+        )
+    else:
+        job_input.execute_query(
+            CommonUtilities.get_file_content(
+                SQL_FILES_FOLDER, "06-drop-target-table.sql"
+            )
+        )
+        job_input.execute_query(
+            CommonUtilities.get_file_content(
+                SQL_FILES_FOLDER, "06-create-and-insert-into-target.sql"
+            )
+        )
@@ -21,6 +21,9 @@ TRINO_TEMPLATES_DATA_TO_TARGET_STRATEGY = "TRINO_TEMPLATES_DATA_TO_TARGET_STRATE
 TRINO_USE_TEAM_OAUTH = "TRINO_USE_TEAM_OAUTH"
 TRINO_RETRIES_ON_ERROR = "TRINO_RETRIES_ON_ERROR"
 TRINO_RETRIES_BACKOFF_SECONDS = "TRINO_RETRIES_BACKOFF_SECONDS"
+TRINO_LINEAGE_ASYNC_ENABLED = "TRINO_LINEAGE_ASYNC_ENABLED"
+TRINO_LINEAGE_SAMPLING_RATE = "TRINO_LINEAGE_SAMPLING_RATE"
+TRINO_LINEAGE_BUDGET_MILLISECONDS = "TRINO_LINEAGE_BUDGET_MILLISECONDS"
 
 trino_templates_data_to_target_strategy: str = ""
 
@@ -150,6 +153,54 @@ class TrinoConfiguration:
             self.__config.get_value(key=TRINO_RETRIES_BACKOFF_SECONDS, section=section),
         )
 
+    def lineage_async_enabled(self, section: Optional[str]) -> bool:
+        return (
+            parse_boolean(
+                self.__config.get_value(
+                    key=TRINO_LINEAGE_ASYNC_ENABLED, section=section
+                )
+            )
+            if (
+                self.__config.get_value(
+                    key=TRINO_LINEAGE_ASYNC_ENABLED, section=section
+                )
+                is not None
+            )
+            else True
+        )
+
+    def lineage_sampling_rate(self, section: Optional[str]) -> float:
+        return (
+            float(
+                self.__config.get_value(
+                    key=TRINO_LINEAGE_SAMPLING_RATE, section=section
+                )
+            )
+            if (
+                self.__config.get_value(
+                    key=TRINO_LINEAGE_SAMPLING_RATE, section=section
+                )
+                is not None
+            )
+            else 1.0
+        )
+
+    def lineage_budget_milliseconds(self, section: Optional[str]) -> int:
+        return (
+            int(
+                self.__config.get_value(
+                    key=TRINO_LINEAGE_BUDGET_MILLISECONDS, section=section
+                )
+            )
+            if (
+                self.__config.get_value(
+                    key=TRINO_LINEAGE_BUDGET_MILLISECONDS, section=section
+                )
+                is not None
+            )
+            else 0
+        )
+
     def team_client_id(self) -> str:
         return (
             cast(str, self.__config.get_value(key=TEAM_CLIENT_ID))
@@ -215,7 +266,9 @@ class TrinoConfiguration:
             "Possible values are:\n"
             "INSERT_SELECT - target is created, data from source is inserted into target, source is "
             "dropped;\n"
-            "RENAME - source is renamed to target;\n",
+            "RENAME - source is renamed to target;\n"
+            "MERGE - the SCD1 and SCD2 templates merge the changed rows into target using MERGE INTO "
+            "(requires a connector supporting MERGE, e.g. Iceberg or Delta Lake), other templates use INSERT_SELECT;\n",
         )
         config_builder.add(
             key=TRINO_TIMEOUT_SECONDS,
@@ -237,3 +290,26 @@ class TrinoConfiguration:
             default_value=30,
             description="The backoff time in seconds between retries of a failed operation",
         )
+        config_builder.add(
+            key=TRINO_LINEAGE_ASYNC_ENABLED,
+            default_value=True,
+            description="If lineage is collected (a lineage logger is provided), "
+            "collect it in a background worker with its own connection "
+            "instead of before each query. "
+            "The lineage of CREATE TABLE AS SELECT queries is always collected before the query, "
+            "since it cannot be explained after the table is created.",
+        )
+        config_builder.add(
+            key=TRINO_LINEAGE_SAMPLING_RATE,
+            default_value=1.0,
+            description="The fraction (between 0 and 1) of queries for which lineage is collected. "
+            "Queries for which lineage has already been collected (the same query with different literals) "
+            "are not explained again and their lineage is always sent.",
+        )
+        config_builder.add(
+            key=TRINO_LINEAGE_BUDGET_MILLISECONDS,
+            default_value=0,
+            description="The maximum time in milliseconds spent on collecting lineage for a connection "
+            "(usually once per data job). Once exceeded only the lineage of already explained queries is sent. "
+            "0 means no limit.",
+        )
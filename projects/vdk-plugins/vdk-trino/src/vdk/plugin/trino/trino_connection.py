@@ -20,7 +20,7 @@ from vdk.internal.builtin_plugins.connection.managed_connection_base import (
     ManagedConnectionBase,
 )
 from vdk.internal.builtin_plugins.connection.recovery_cursor import RecoveryCursor
-from vdk.internal.util.decorators import closing_noexcept_on_close
+from vdk.plugin.trino.lineage_collector import TrinoLineageCollector
 from vdk.plugin.trino.trino_config import TrinoConfiguration
 from vdk.plugin.trino.trino_error_handler import TrinoErrorHandler
 
@@ -58,6 +58,19 @@ class TrinoConnection(ManagedConnectionBase):
         self._error_backoff_seconds = configuration.backoff_interval_seconds(section)
 
         self._lineage_logger = lineage_logger
+        self._lineage_collector = (
+            TrinoLineageCollector(
+                lineage_logger,
+                self._connect,
+                self._catalog,
+                self._schema,
+                asynchronous=configuration.lineage_async_enabled(section),
+                sampling_rate=configuration.lineage_sampling_rate(section),
+                budget_milliseconds=configuration.lineage_budget_milliseconds(section),
+            )
+            if lineage_logger
+            else None
+        )
 
         self._use_team_oauth = configuration.use_team_oauth(section)
 
@@ -159,15 +172,21 @@ class TrinoConnection(ManagedConnectionBase):
             raise recovery_cursor.get_exception()
 
     def execute_query(self, query):
-        # first evaluate lineage because current behavior of 'explain create as select' fails if the table exists
-        if self._lineage_logger:
-            lineage_data = self._get_lineage_data(query)
+        # lineage is collected concurrently with the query (see TrinoLineageCollector) and sent if the query succeeds
+        lineage_future = None
+        if self._lineage_collector:
+            lineage_future = self._lineage_collector.before_query(query)
         res = self.execute_query_with_retries(query)
-        if self._lineage_logger and lineage_data:
-            self._lineage_logger.send(lineage_data)
+        if self._lineage_collector:
+            self._lineage_collector.after_query_success(lineage_future)
         #  TODO: collect lineage for failed query
         return res
 
+    def close(self, *args, **kwargs) -> None:
+        if self._lineage_collector:
+            self._lineage_collector.close()
+        super().close(*args, **kwargs)
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=30, min=30, max=240),
@@ -179,55 +198,6 @@ class TrinoConnection(ManagedConnectionBase):
         res = super().execute_query(query)
         return res
 
-    def _get_lineage_data(self, query):
-        from vdk.plugin.trino import lineage_utils
-        import sqlparse
-
-        statement = sqlparse.parse(query)[0]
-
-        if statement.get_type() == "ALTER":
-            rename_table_lineage = lineage_utils.get_rename_table_lineage_from_query(
-                query, self._schema, self._catalog
-            )
-            if rename_table_lineage:
-                log.debug("Collecting lineage for rename table operation ...")
-                return rename_table_lineage
-            else:
-                log.debug(
-                    "ALTER operation not a RENAME TABLE operation. No lineage will be collected."
-                )
-
-        elif (
-            statement.get_type() == "SELECT"
-            or statement.get_type() == "INSERT"
-            or (
-                statement.get_type() == "CREATE" and "select" in statement.value.lower()
-            )
-        ):
-            if lineage_utils.is_heartbeat_query(query):
-                return None
-            log.debug("Collecting lineage for SELECT/INSERT query ...")
-            try:
-                with closing_noexcept_on_close(self._cursor()) as cur:
-                    cur.execute(f"EXPLAIN (TYPE IO, FORMAT JSON) {query}")
-                    result = cur.fetchall()
-                    if result:
-                        return lineage_utils.get_lineage_data_from_io_explain(
-                            query, result[0][0]
-                        )
-            except Exception as e:
-                log.info(
-                    f"Failed to get query io details for telemetry: {e}. Will continue with query execution"
-                )
-                return None
-        else:
-            log.debug(
-                "Unsupported query type for lineage collection. Will not collect lineage."
-            )
-            return None
-
-        return None
-
 
 # Define a custom requests session to add the OAuth token to the headers
 class OAuthSession(requests.Session):
@@ -21,6 +21,7 @@ from vdk.internal.core.context import CoreContext
 from vdk.internal.core.errors import UserCodeError
 from vdk.internal.core.errors import VdkConfigurationError
 from vdk.internal.core.statestore import StoreKey
+from vdk.plugin.trino import lineage_collector
 from vdk.plugin.trino import trino_config
 from vdk.plugin.trino.ingest_to_trino import IngestToTrino
 from vdk.plugin.trino.trino_config import TRINO_CATALOG
@@ -187,6 +188,11 @@ class TrinoPlugin:
                         "Please fix the error and try again.",
                     ) from step_result.exception
 
+    @hookimpl
+    def finalize_job(self, context: JobContext) -> None:
+        # the lineage of the queries of the job is sent before the job completes
+        lineage_collector.flush_all()
+
 
 @hookimpl
 def vdk_start(plugin_registry: IPluginRegistry, command_line_args: List):
@@ -1,7 +1,11 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import datetime
+import decimal
 import logging
 import os
+from typing import List
+from typing import Sequence
 
 from trino.exceptions import TrinoUserError
 from vdk.api.job_input import IJobInput
@@ -12,6 +16,8 @@ from vdk.plugin.trino import trino_config
 
 log = logging.getLogger(__name__)
 
+_MERGE_DELETE_MARKER = "__vdk_merge_delete"
+
 
 class TrinoTemplateQueries:
     """
@@ -63,7 +69,8 @@ class TrinoTemplateQueries:
         strategy = self.get_move_data_to_table_strategy()
         if strategy == "RENAME":
             return self.rename_table(from_db, from_table_name, to_db, to_table_name)
-        elif strategy == "INSERT_SELECT":
+        # MERGE applies only to templates loading data by key, whole tables are moved with INSERT_SELECT
+        elif strategy in ("INSERT_SELECT", "MERGE"):
             self.__job_input.execute_query(
                 f"""
                 CREATE TABLE "{to_db}"."{to_table_name}" (LIKE "{from_db}"."{from_table_name}")
@@ -213,6 +220,313 @@ class TrinoTemplateQueries:
             log.debug("Target table was successfully created, and we can drop backup")
             self.drop_table(to_db, backup_table_name)
 
+    def get_table_columns(self, db: str, table_name: str) -> List[str]:
+        """
+        This method returns the names of the columns of a table in their order in the table.
+        :param db: The name of the schema in which the table is
+        :param table_name: The name of the table
+        :return: The names of the columns
+        """
+        description = self.__job_input.execute_query(
+            f"""
+            DESCRIBE "{db}"."{table_name}"
+            """
+        )
+        return [row[0] for row in description]
+
+    def merge_into_table(
+        self,
+        from_db: str,
+        from_table_name: str,
+        to_db: str,
+        to_table_name: str,
+        key_column: str,
+        delete_missing: bool = False,
+    ):
+        """
+        This method merges the data of the source table into the target table using a single MERGE INTO statement,
+        so only the changed rows of the target are rewritten and the target is never left partially updated.
+        Target rows are matched to source rows by the key column - matched rows with changed values are updated
+        and source rows without a match are inserted. Requires a connector supporting MERGE (e.g. Iceberg, Delta Lake).
+        :param from_db: Schema of the source table (or view)
+        :param from_table_name: Name of the source table (or view)
+        :param to_db: Schema of the target table
+        :param to_table_name: Name of the target table
+        :param key_column: The column uniquely identifying a row in both tables. It must not be NULL in the source.
+        :param delete_missing: If True, target rows which keys are not in the source are deleted
+        (by the same MERGE statement), so that the target ends up with the same content as the source
+        :return: None
+        """
+        columns = self.get_table_columns(to_db, to_table_name)
+        self.__validate_merge_key_column(
+            from_db, from_table_name, to_db, to_table_name, columns, key_column
+        )
+        value_columns = [c for c in columns if c != key_column]
+        source_columns = ", ".join(f'"{c}"' for c in columns)
+
+        when_delete = ""
+        join_condition = f'target."{key_column}" = source."{key_column}"'
+        source = f'"{from_db}"."{from_table_name}"'
+        if delete_missing:
+            # the keys of the target rows missing in the source are added to the source marked for deletion,
+            # since MERGE has no WHEN NOT MATCHED BY SOURCE clause in Trino
+            missing_key_columns = ", ".join(
+                f'"{c}"' if c == key_column else f'NULL AS "{c}"' for c in columns
+            )
+            source = f"""(
+                SELECT {source_columns}, false AS "{_MERGE_DELETE_MARKER}" FROM "{from_db}"."{from_table_name}"
+                UNION ALL
+                SELECT {missing_key_columns}, true AS "{_MERGE_DELETE_MARKER}" FROM (
+                    SELECT DISTINCT t."{key_column}" FROM "{to_db}"."{to_table_name}" t
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM "{from_db}"."{from_table_name}" s WHERE s."{key_column}" = t."{key_column}"
+                    )
+                )
+            )"""
+            # source keys are validated not to be NULL, so only the target rows with NULL keys match the NULL marker
+            join_condition = (
+                f'target."{key_column}" IS NOT DISTINCT FROM source."{key_column}"'
+            )
+            when_delete = (
+                f'WHEN MATCHED AND source."{_MERGE_DELETE_MARKER}" THEN DELETE'
+            )
+
+        when_matched = ""
+        if value_columns:
+            values_unchanged = " AND ".join(
+                f'target."{c}" IS NOT DISTINCT FROM source."{c}"' for c in value_columns
+            )
+            update_set = ", ".join(f'"{c}" = source."{c}"' for c in value_columns)
+            when_matched = f"WHEN MATCHED AND NOT ({values_unchanged}) THEN UPDATE SET {update_set}"
+        insert_values = ", ".join(f'source."{c}"' for c in columns)
+        when_not_matched = "WHEN NOT MATCHED"
+        if delete_missing:
+            when_not_matched += f' AND NOT source."{_MERGE_DELETE_MARKER}"'
+        return self.__job_input.execute_query(
+            f"""
+            MERGE INTO "{to_db}"."{to_table_name}" target
+            USING {source} source
+            ON {join_condition}
+            {when_delete}
+            {when_matched}
+            {when_not_matched} THEN INSERT ({source_columns}) VALUES ({insert_values})
+            """
+        )
+
+    def __validate_merge_key_column(
+        self,
+        from_db: str,
+        from_table_name: str,
+        to_db: str,
+        to_table_name: str,
+        target_columns: List[str],
+        key_column: str,
+    ):
+        source_columns = self.get_table_columns(from_db, from_table_name)
+        if key_column not in target_columns or key_column not in source_columns:
+            errors.report_and_throw(
+                UserCodeError(
+                    "Cannot merge data into target",
+                    f"Key column {key_column} is missing in source {from_db}.{from_table_name} "
+                    f"or target {to_db}.{to_table_name}.",
+                    "Current Step (python file) will fail, and as a result the whole Data Job will fail.",
+                    "Provide a key column which exists in both the source and the target.",
+                )
+            )
+        null_keys = self.__job_input.execute_query(
+            f"""
+            SELECT count(*) FROM "{from_db}"."{from_table_name}" WHERE "{key_column}" IS NULL
+            """
+        )
+        if null_keys and null_keys[0][0]:
+            errors.report_and_throw(
+                UserCodeError(
+                    "Cannot merge data into target",
+                    f"Key column {key_column} is NULL in {null_keys[0][0]} rows of source "
+                    f"{from_db}.{from_table_name}, so they cannot be matched to target rows.",
+                    "Current Step (python file) will fail, and as a result the whole Data Job will fail.",
+                    "Make sure the key column identifies every row of the source.",
+                )
+            )
+
+    def get_partition_columns(self, db: str, table_name: str) -> List[str]:
+        """
+        This method returns the partition columns of a table using its hidden "$partitions" table.
+        Only tables of connectors exposing the partition values as columns of "$partitions" (e.g. Hive) are supported.
+        :param db: The name of the schema in which the table is
+        :param table_name: The name of the table
+        :return: The names of the partition columns or empty list if the table is not partitioned or not supported
+        """
+        try:
+            description = self.__job_input.execute_query(
+                f"""
+                DESCRIBE "{db}"."{table_name}$partitions"
+                """
+            )
+        except TrinoUserError as e:
+            log.debug(f"Cannot get partitions of {db}.{table_name}: {e}")
+            return []
+        columns = [row[0] for row in description]
+        # Iceberg and Delta Lake describe partitions as a single row type column along with statistics columns
+        if "partition" in columns or "record_count" in columns:
+            return []
+        return columns
+
+    def ensure_partitions_restored_step(self, db: str, target_name: str):
+        """
+        This method checks if there is a backup of target partitions left from a failed partitions overwrite.
+        If there is, the partitions are restored from it.
+        :param db: Schema of the target table
+        :param target_name: Name of the target table
+        :return: None
+        """
+        backup_name = self.__get_partitions_backup_table_name(target_name)
+        if not self.table_exists(db, backup_name):
+            return
+        log.debug("Try to recover target partitions from backup")
+        partition_columns = self.get_partition_columns(db, target_name)
+        partition_columns_list = ", ".join(f'"{p}"' for p in partition_columns)
+        partitions = self.__job_input.execute_query(
+            f"""
+            SELECT DISTINCT {partition_columns_list} FROM "{db}"."{backup_name}"
+            """
+        )
+        try:
+            self.__restore_partitions_from_backup(
+                db, target_name, backup_name, partition_columns, partitions
+            )
+            log.info(
+                f"""Successfully recovered partitions of {db}.{target_name} from {db}.{backup_name}"""
+            )
+        except Exception as e:
+            errors.report_and_throw(
+                PlatformServiceError(
+                    f"Recovering partitions of {db}.{target_name} from backup table failed with exception: {e}",
+                    f"One of the previous job retries failed while overwriting partitions of {db}.{target_name}.",
+                    "Current Step (python file) will fail, and as a result the whole Data Job will fail.",
+                    f"You could try to recover the partitions of {db}.{target_name} from "
+                    f"{db}.{backup_name} by hand and then rerun the job.",
+                )
+            )
+
+    def perform_safe_overwrite_partitions_step(
+        self,
+        from_db: str,
+        from_table_name: str,
+        to_db: str,
+        to_table_name: str,
+        partition_columns: List[str],
+        partitions: List[Sequence],
+    ):
+        """
+        This method replaces the given partitions of the target with the content of the source table.
+        Only the given partitions of the target are backed up and rewritten, the rest of the target stays untouched.
+        If moving data fails, an attempt to recover the partitions from the backup is initiated.
+        :param from_db: Schema of the table with the new content of the partitions
+        :param from_table_name: Name of the table with the new content of the partitions
+        :param to_db: Schema of the target table
+        :param to_table_name: Name of the target table
+        :param partition_columns: The partition columns of the target table
+        :param partitions: The values of the partition columns of each partition to be replaced
+        :return: None
+        """
+        if not partitions:
+            return
+        log.debug("Create backup of the target partitions")
+        backup_table_name = self.__get_partitions_backup_table_name(to_table_name)
+        partitions_condition = " OR ".join(
+            f"({self.__get_partition_condition(partition_columns, partition)})"
+            for partition in partitions
+        )
+        self.__job_input.execute_query(
+            f"""
+            CREATE TABLE "{to_db}"."{backup_table_name}" AS
+            SELECT * FROM "{to_db}"."{to_table_name}" WHERE {partitions_condition}
+            """
+        )
+        try:
+            log.debug("Replace target partitions")
+            self.__delete_partitions(
+                to_db, to_table_name, partition_columns, partitions
+            )
+            self.__job_input.execute_query(
+                f"""
+                INSERT INTO "{to_db}"."{to_table_name}" SELECT * FROM "{from_db}"."{from_table_name}"
+                """
+            )
+        except Exception as e:
+            try:
+                self.__restore_partitions_from_backup(
+                    to_db,
+                    to_table_name,
+                    backup_table_name,
+                    partition_columns,
+                    partitions,
+                )
+            except Exception:
+                errors.report_and_throw(
+                    PlatformServiceError(
+                        f"Recovering partitions of {to_db}.{to_table_name} from backup table failed. "
+                        f"Data in the partitions is lost!",
+                        f"Step with overwriting partitions of target table failed, so recovery from "
+                        f"backup was initiated, but it also failed with error: {e}",
+                        "Current Step (python file) will fail, and as a result the whole Data Job will fail.",
+                        f"Please, rerun the data job - it will try to recover the partitions of "
+                        f"{to_db}.{to_table_name} from {to_db}.{backup_table_name} on start. "
+                        f"If it fails again, report the issue to support team.",
+                    )
+                )
+            raise
+        log.debug(
+            "Target partitions were successfully replaced, and we can drop backup"
+        )
+        self.drop_table(to_db, backup_table_name)
+
+    def __restore_partitions_from_backup(
+        self,
+        db: str,
+        target_table: str,
+        backup_table: str,
+        partition_columns: List[str],
+        partitions: List[Sequence],
+    ):
+        self.__delete_partitions(db, target_table, partition_columns, partitions)
+        self.__job_input.execute_query(
+            f"""
+            INSERT INTO "{db}"."{target_table}" SELECT * FROM "{db}"."{backup_table}"
+            """
+        )
+        self.drop_table(db, backup_table)
+
+    def __delete_partitions(
+        self,
+        db: str,
+        table_name: str,
+        partition_columns: List[str],
+        partitions: List[Sequence],
+    ):
+        # connectors like Hive support only deletes of whole partitions, so each partition is deleted separately
+        for partition in partitions:
+            self.__job_input.execute_query(
+                f"""
+                DELETE FROM "{db}"."{table_name}"
+                WHERE {self.__get_partition_condition(partition_columns, partition)}
+                """
+            )
+
+    @staticmethod
+    def __get_partition_condition(
+        partition_columns: List[str], partition: Sequence
+    ) -> str:
+        return " AND ".join(
+            (
+                f'"{column}" IS NULL'
+                if value is None
+                else f'"{column}" = {CommonUtilities.to_sql_literal(value)}'
+            )
+            for column, value in zip(partition_columns, partition)
+        )
+
     def __try_recover_target_from_backup(
         self, db: str, target_table: str, backup_table: str
     ):
@@ -241,6 +555,10 @@ class TrinoTemplateQueries:
     def __get_backup_table_name(table_name):
         return "backup_" + table_name
 
+    @staticmethod
+    def __get_partitions_backup_table_name(table_name):
+        return "backup_partitions_" + table_name
+
 
 class CommonUtilities:
     def __init__(self):
@@ -258,6 +576,25 @@ class CommonUtilities:
             )
         return staging_table_name
 
+    def to_sql_literal(value):
+        """
+        Converts a value returned by a query (e.g. a partition value) to a Trino SQL literal.
+        """
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, (int, float)):
+            return str(value)
+        if isinstance(value, decimal.Decimal):
+            return f"DECIMAL '{value}'"
+        if isinstance(value, datetime.datetime):
+            return f"TIMESTAMP '{value.isoformat(sep=' ')}'"
+        if isinstance(value, datetime.date):
+            return f"DATE '{value.isoformat()}'"
+        escaped = str(value).replace("'", "''")
+        return f"'{escaped}'"
+
     def get_file_content(sql_files_folder, sql_file_name):
         """
         Reads and returns file content by given path and file name.
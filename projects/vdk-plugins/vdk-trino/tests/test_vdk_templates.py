@@ -345,6 +345,31 @@ class TestTemplates(unittest.TestCase):
             test_schema, target_table, expect_table
         )
 
+    def test_fact_periodic_snapshot_template_partition_overwrite_unpartitioned_target(
+        self,
+    ) -> None:
+        test_schema = self.__schema
+        source_view = "vw_fact_sddc_daily_partition_overwrite"
+        target_table = "dw_fact_sddc_daily_partition_overwrite"
+        expect_table = "ex_fact_sddc_daily_partition_overwrite"
+
+        result: Result = self.__fact_periodic_snapshot_template_execute(
+            test_schema,
+            source_view,
+            target_table,
+            expect_table,
+            partition_overwrite=True,
+        )
+        cli_assert_equal(0, result)
+
+        assert (
+            "The whole target table will be overwritten" in result.output
+        ), "Missing log for falling back to overwriting the whole target."
+
+        self.__fact_periodic_snapshot_template_check_expected_res(
+            test_schema, target_table, expect_table
+        )
+
     def __fact_periodic_snapshot_template_execute(
         self,
         test_schema,
@@ -352,6 +377,7 @@ class TestTemplates(unittest.TestCase):
         target_table,
         expect_table,
         restore_from_backup=False,
+        partition_overwrite=False,
     ):
         return self.__runner.invoke(
             [
@@ -371,6 +397,7 @@ class TestTemplates(unittest.TestCase):
                         "expect_table": expect_table,
                         "last_arrival_ts": "updated_at",
                         "test_restore_from_backup": f"{restore_from_backup}",
+                        "partition_overwrite": partition_overwrite,
                     }
                 ),
             ]
@@ -0,0 +1,225 @@
+# Copyright 2023-2025 Broadcom
+# SPDX-License-Identifier: Apache-2.0
+import json
+import threading
+from unittest import mock
+
+from vdk.api.lineage.model.logger.lineage_logger import ILineageLogger
+from vdk.plugin.trino.lineage_collector import get_query_fingerprint
+from vdk.plugin.trino.lineage_collector import TrinoLineageCollector
+
+EXPLAIN_RESULT = json.dumps(
+    {
+        "inputTableColumnInfos": [
+            {
+                "table": {
+                    "catalog": "memory",
+                    "schemaTable": {"schema": "default", "table": "source"},
+                }
+            }
+        ],
+        "outputTable": {
+            "catalog": "memory",
+            "schemaTable": {"schema": "default", "table": "target"},
+        },
+    }
+)
+
+
+def _new_collector(lineage_logger, **kwargs):
+    connection = mock.MagicMock()
+    cursor = connection.cursor.return_value
+    cursor.fetchall.return_value = [[EXPLAIN_RESULT]]
+    collector = TrinoLineageCollector(
+        lineage_logger, lambda: connection, "memory", "default", **kwargs
+    )
+    return collector, cursor
+
+
+def test_query_fingerprint():
+    assert get_query_fingerprint(
+        "INSERT INTO t_1 VALUES ('a', 1)"
+    ) == get_query_fingerprint("insert into t_1\n values ('it''s', 2.5)")
+    assert get_query_fingerprint("select * from t_1") != get_query_fingerprint(
+        "select * from t_2"
+    )
+
+
+def test_lineage_sent_after_query_succeeds():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+    query = "insert into target select * from source"
+
+    future = collector.before_query(query)
+    collector.after_query_success(future)
+    collector.flush()
+
+    cursor.execute.assert_called_once_with(f"EXPLAIN (TYPE IO, FORMAT JSON) {query}")
+    lineage_data = lineage_logger.send.call_args[0][0]
+    assert lineage_data.query == query
+    assert lineage_data.query_type == "insert_select"
+    assert lineage_data.input_tables[0].table == "source"
+    assert lineage_data.output_table.table == "target"
+
+
+def test_lineage_not_sent_for_failed_query():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, _ = _new_collector(lineage_logger)
+
+    collector.before_query("insert into target select * from source")
+    collector.flush()
+
+    lineage_logger.send.assert_not_called()
+
+
+def test_lineage_cached_by_fingerprint():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+
+    for i in range(3):
+        collector.after_query_success(
+            collector.before_query(
+                f"insert into target select * from source where id = {i}"
+            )
+        )
+    collector.flush()
+
+    assert cursor.execute.call_count == 1
+    sent_queries = [c[0][0].query for c in lineage_logger.send.call_args_list]
+    assert sent_queries == [
+        f"insert into target select * from source where id = {i}" for i in range(3)
+    ]
+
+
+def test_lineage_sampling():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger, sampling_rate=0)
+
+    assert collector.before_query("insert into target select * from source") is None
+    cursor.execute.assert_not_called()
+
+
+def test_lineage_budget():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger, budget_milliseconds=1)
+    collector._spent_milliseconds = 1
+
+    assert collector.before_query("insert into target select * from source") is None
+    cursor.execute.assert_not_called()
+
+
+def test_lineage_collected_concurrently_with_query():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+    explain_started = threading.Event()
+    query_done = threading.Event()
+
+    def explain(*args):
+        explain_started.set()
+        assert query_done.wait(10)
+
+    cursor.execute.side_effect = explain
+
+    future = collector.before_query("insert into target select * from source")
+    # the query is not blocked by the explain
+    assert explain_started.wait(10)
+    query_done.set()
+    collector.after_query_success(future)
+    collector.flush()
+
+    lineage_logger.send.assert_called_once()
+
+
+def test_lineage_of_create_table_as_select_collected_before_query():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+
+    future = collector.before_query("create table target as select * from source")
+
+    assert future.done()
+    cursor.execute.assert_called_once()
+
+
+def test_close_without_explained_queries():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+
+    collector.close()
+
+    assert collector._executor is None
+    cursor.execute.assert_not_called()
+
+
+def test_close_sends_pending_lineage_and_stops_worker():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    connection = mock.MagicMock()
+    connection.cursor.return_value.fetchall.return_value = [[EXPLAIN_RESULT]]
+    collector = TrinoLineageCollector(
+        lineage_logger, lambda: connection, "memory", "default"
+    )
+
+    collector.after_query_success(
+        collector.before_query("insert into target select * from source")
+    )
+    executor = collector._executor
+    collector.close()
+
+    lineage_logger.send.assert_called_once()
+    connection.close.assert_called_once()
+    assert collector._executor is None
+    assert executor._shutdown
+
+    # the collector can still be used after it is closed
+    collector.after_query_success(
+        collector.before_query("insert into target2 select * from source")
+    )
+    collector.close()
+    assert lineage_logger.send.call_count == 2
+
+
+def test_lineage_not_collected_after_worker_cannot_start():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+
+    with mock.patch.object(
+        collector,
+        "_get_executor",
+        side_effect=RuntimeError("cannot schedule new futures after shutdown"),
+    ):
+        assert collector.before_query("insert into target select * from source") is None
+    cursor.execute.assert_not_called()
+
+
+def test_ddl_waits_for_queries_to_be_explained():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger)
+    explain_started = threading.Event()
+    finish_explain = threading.Event()
+
+    def explain(*args):
+        explain_started.set()
+        assert finish_explain.wait(10)
+
+    cursor.execute.side_effect = explain
+
+    future = collector.before_query("insert into target select * from staging")
+    assert explain_started.wait(10)
+    threading.Timer(0.1, finish_explain.set).start()
+    collector.before_query("drop table staging")
+
+    assert future.done()
+
+
+def test_lineage_cache_is_bounded():
+    lineage_logger = mock.MagicMock(ILineageLogger)
+    collector, cursor = _new_collector(lineage_logger, asynchronous=False)
+
+    with mock.patch("vdk.plugin.trino.lineage_collector._CACHE_MAX_SIZE", 2):
+        for table in ("t1", "t2", "t1", "t3"):
+            collector.before_query(f"insert into {table} select * from source")
+
+    assert cursor.execute.call_count == 3
+    assert list(collector._cache) == [
+        get_query_fingerprint("insert into t1 select * from source"),
+        get_query_fingerprint("insert into t3 select * from source"),
+    ]
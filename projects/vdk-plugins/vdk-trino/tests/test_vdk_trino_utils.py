@@ -1,5 +1,7 @@
 # Copyright 2023-2025 Broadcom
 # SPDX-License-Identifier: Apache-2.0
+import datetime
+import importlib.util
 import json
 import os
 import pathlib
@@ -12,6 +14,7 @@ from vdk.plugin.test_utils.util_funcs import cli_assert_equal
 from vdk.plugin.test_utils.util_funcs import CliEntryBasedTestRunner
 from vdk.plugin.test_utils.util_funcs import get_test_job_path
 from vdk.plugin.trino import trino_plugin
+from vdk.plugin.trino import trino_utils
 from vdk.plugin.trino.trino_utils import TrinoTemplateQueries
 
 VDK_DB_DEFAULT_TYPE = "VDK_DB_DEFAULT_TYPE"
@@ -48,6 +51,14 @@ class TrinoUtilsTests(unittest.TestCase):
         ) as patched:
             self.check_move_data_to_table_for_current_strategy()
 
+    def test_move_data_to_table_merge_strategy(self) -> None:
+        with mock.patch.object(
+            TrinoTemplateQueries,
+            "get_move_data_to_table_strategy",
+            return_value="MERGE",
+        ) as patched:
+            self.check_move_data_to_table_for_current_strategy()
+
     def test_move_data_to_table_invalid_strategy(self) -> None:
         with mock.patch.object(
             TrinoTemplateQueries,
@@ -80,3 +91,241 @@ class TrinoUtilsTests(unittest.TestCase):
             ]
         )
         cli_assert_equal(0, result)
+
+
+def test_merge_into_table():
+    job_input = mock.MagicMock()
+    job_input.execute_query.side_effect = [
+        [["id", "integer"], ["name", "varchar"], ["size", "bigint"]],
+        [["id", "integer"], ["name", "varchar"], ["size", "bigint"]],
+        [[0]],
+        [],
+    ]
+
+    TrinoTemplateQueries(job_input).merge_into_table(
+        "src_db", "src", "target_db", "target", "id"
+    )
+
+    queries = [
+        " ".join(c.args[0].split()) for c in job_input.execute_query.call_args_list
+    ]
+    assert queries[2] == 'SELECT count(*) FROM "src_db"."src" WHERE "id" IS NULL'
+    assert queries[3] == (
+        'MERGE INTO "target_db"."target" target USING "src_db"."src" source '
+        'ON target."id" = source."id" '
+        'WHEN MATCHED AND NOT (target."name" IS NOT DISTINCT FROM source."name" '
+        'AND target."size" IS NOT DISTINCT FROM source."size") '
+        'THEN UPDATE SET "name" = source."name", "size" = source."size" '
+        'WHEN NOT MATCHED THEN INSERT ("id", "name", "size") '
+        'VALUES (source."id", source."name", source."size")'
+    )
+
+
+def test_merge_into_table_delete_missing_in_one_statement():
+    job_input = mock.MagicMock()
+    job_input.execute_query.side_effect = [
+        [["id", "integer"], ["name", "varchar"]],
+        [["id", "integer"], ["name", "varchar"]],
+        [[0]],
+        [],
+    ]
+
+    TrinoTemplateQueries(job_input).merge_into_table(
+        "src_db", "src", "target_db", "target", "id", delete_missing=True
+    )
+
+    queries = [
+        " ".join(c.args[0].split()) for c in job_input.execute_query.call_args_list
+    ]
+    assert len(queries) == 4
+    assert not any(q.startswith("DELETE") for q in queries)
+    assert queries[3] == (
+        'MERGE INTO "target_db"."target" target USING ( '
+        'SELECT "id", "name", false AS "__vdk_merge_delete" FROM "src_db"."src" '
+        "UNION ALL "
+        'SELECT "id", NULL AS "name", true AS "__vdk_merge_delete" FROM ( '
+        'SELECT DISTINCT t."id" FROM "target_db"."target" t WHERE NOT EXISTS ( '
+        'SELECT 1 FROM "src_db"."src" s WHERE s."id" = t."id" ) ) ) source '
+        'ON target."id" IS NOT DISTINCT FROM source."id" '
+        'WHEN MATCHED AND source."__vdk_merge_delete" THEN DELETE '
+        'WHEN MATCHED AND NOT (target."name" IS NOT DISTINCT FROM source."name") '
+        'THEN UPDATE SET "name" = source."name" '
+        'WHEN NOT MATCHED AND NOT source."__vdk_merge_delete" '
+        'THEN INSERT ("id", "name") VALUES (source."id", source."name")'
+    )
+
+
+@pytest.mark.parametrize(
+    "source_columns, null_keys",
+    [([["name", "varchar"]], [[0]]), ([["id", "integer"]], [[3]])],
+)
+def test_merge_into_table_validates_key_column(source_columns, null_keys):
+    job_input = mock.MagicMock()
+    job_input.execute_query.side_effect = [
+        [["id", "integer"], ["name", "varchar"]],
+        source_columns,
+        null_keys,
+    ]
+
+    with pytest.raises(Exception):
+        TrinoTemplateQueries(job_input).merge_into_table(
+            "src_db", "src", "target_db", "target", "id", delete_missing=True
+        )
+
+    queries = [c.args[0] for c in job_input.execute_query.call_args_list]
+    assert not any("MERGE" in q for q in queries)
+
+
+def _executed_queries(job_input):
+    return [" ".join(c.args[0].split()) for c in job_input.execute_query.call_args_list]
+
+
+def test_perform_safe_overwrite_partitions_step():
+    job_input = mock.MagicMock()
+    job_input.execute_query.return_value = []
+
+    TrinoTemplateQueries(job_input).perform_safe_overwrite_partitions_step(
+        "staging_db",
+        "staging",
+        "target_db",
+        "target",
+        ["day", "region"],
+        [[datetime.date(2024, 1, 1), "eu"], [datetime.date(2024, 1, 2), None]],
+    )
+
+    assert _executed_queries(job_input) == [
+        'CREATE TABLE "target_db"."backup_partitions_target" AS '
+        'SELECT * FROM "target_db"."target" WHERE '
+        "(\"day\" = DATE '2024-01-01' AND \"region\" = 'eu') OR "
+        '("day" = DATE \'2024-01-02\' AND "region" IS NULL)',
+        'DELETE FROM "target_db"."target" '
+        "WHERE \"day\" = DATE '2024-01-01' AND \"region\" = 'eu'",
+        'DELETE FROM "target_db"."target" '
+        'WHERE "day" = DATE \'2024-01-02\' AND "region" IS NULL',
+        'INSERT INTO "target_db"."target" SELECT * FROM "staging_db"."staging"',
+        'DROP TABLE IF EXISTS "target_db"."backup_partitions_target"',
+    ]
+
+
+def test_perform_safe_overwrite_partitions_step_restores_partitions_on_failure():
+    job_input = mock.MagicMock()
+    job_input.execute_query.side_effect = [
+        [],
+        [],
+        Exception("insert failed"),
+        [],
+        [],
+        [],
+    ]
+
+    with pytest.raises(Exception, match="insert failed"):
+        TrinoTemplateQueries(job_input).perform_safe_overwrite_partitions_step(
+            "staging_db", "staging", "target_db", "target", ["day"], [["2024-01-01"]]
+        )
+
+    assert _executed_queries(job_input)[3:] == [
+        'DELETE FROM "target_db"."target" WHERE "day" = \'2024-01-01\'',
+        'INSERT INTO "target_db"."target" '
+        'SELECT * FROM "target_db"."backup_partitions_target"',
+        'DROP TABLE IF EXISTS "target_db"."backup_partitions_target"',
+    ]
+
+
+def test_perform_safe_overwrite_partitions_step_without_partitions():
+    job_input = mock.MagicMock()
+
+    TrinoTemplateQueries(job_input).perform_safe_overwrite_partitions_step(
+        "staging_db", "staging", "target_db", "target", ["day"], []
+    )
+
+    job_input.execute_query.assert_not_called()
+
+
+def test_ensure_partitions_restored_step():
+    job_input = mock.MagicMock()
+    job_input.execute_query.side_effect = [
+        [["day", "varchar"]],
+        [["day", "varchar", "", ""]],
+        [["2024-01-01"], [None]],
+        [],
+        [],
+        [],
+        [],
+    ]
+
+    TrinoTemplateQueries(job_input).ensure_partitions_restored_step(
+        "target_db", "target"
+    )
+
+    assert _executed_queries(job_input) == [
+        'DESCRIBE "target_db"."backup_partitions_target"',
+        'DESCRIBE "target_db"."target$partitions"',
+        'SELECT DISTINCT "day" FROM "target_db"."backup_partitions_target"',
+        'DELETE FROM "target_db"."target" WHERE "day" = \'2024-01-01\'',
+        'DELETE FROM "target_db"."target" WHERE "day" IS NULL',
+        'INSERT INTO "target_db"."target" '
+        'SELECT * FROM "target_db"."backup_partitions_target"',
+        'DROP TABLE IF EXISTS "target_db"."backup_partitions_target"',
+    ]
+
+
+def test_ensure_partitions_restored_step_without_backup():
+    job_input = mock.MagicMock()
+
+    with mock.patch.object(TrinoTemplateQueries, "table_exists", return_value=False):
+        TrinoTemplateQueries(job_input).ensure_partitions_restored_step(
+            "target_db", "target"
+        )
+
+    job_input.execute_query.assert_not_called()
+
+
+def _load_fact_snapshot_move_data_step():
+    step_path = (
+        pathlib.Path(trino_utils.__file__).parent
+        / "templates/load/fact/snapshot/02-handle-quality-checks_and_move_data.py"
+    )
+    spec = importlib.util.spec_from_file_location("move_data_step", step_path)
+    step = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(step)
+    return step
+
+
+def test_fact_snapshot_overwrites_affected_partitions():
+    job_input = mock.MagicMock()
+    job_input.get_arguments.return_value = {
+        "source_schema": "src_db",
+        "source_view": "src_view",
+        "target_schema": "target_db",
+        "target_table": "target",
+        "last_arrival_ts": "updated_at",
+        "partition_overwrite": True,
+    }
+
+    def execute_query(query):
+        if "$partitions" in query:
+            return [["day", "date", "", ""]]
+        if query.lstrip().startswith("-- The partitions"):
+            return [[datetime.date(2024, 1, 2)], [None]]
+        return []
+
+    job_input.execute_query.side_effect = execute_query
+
+    _load_fact_snapshot_move_data_step().run(job_input)
+
+    queries = _executed_queries(job_input)
+    staging = '"target_db"."trino_vdk_check_target_db_target"'
+    assert queries[2] == f"DROP TABLE IF EXISTS {staging}"
+    assert queries[3].endswith(f'CREATE TABLE {staging}( LIKE "target_db"."target" )')
+    assert queries[4].startswith(f"INSERT INTO {staging}")
+    assert 'target."day" IS NOT DISTINCT FROM affected."day"' in queries[4]
+    # only the affected partitions are backed up and replaced
+    assert queries[5:] == [
+        'CREATE TABLE "target_db"."backup_partitions_target" AS '
+        'SELECT * FROM "target_db"."target" WHERE '
+        '("day" = DATE \'2024-01-02\') OR ("day" IS NULL)',
+        'DELETE FROM "target_db"."target" WHERE "day" = DATE \'2024-01-02\'',
+        'DELETE FROM "target_db"."target" WHERE "day" IS NULL',
+        f'INSERT INTO "target_db"."target" SELECT * FROM {staging}',
+        'DROP TABLE IF EXISTS "target_db"."backup_partitions_target"',
+    ]